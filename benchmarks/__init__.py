@@ -0,0 +1 @@
+# Benchmarks reproducibles (python -m benchmarks)
@@ -0,0 +1,162 @@
+"""
+Ejecuta los benchmarks, guarda los resultados en JSON y los compara con una línea base.
+
+Uso:
+    python -m benchmarks
+    python -m benchmarks --quick --scenarios headless_ticks render
+    python -m benchmarks --output resultados.json --baseline benchmarks/baseline.json
+    python -m benchmarks --save-baseline benchmarks/baseline.json
+
+Sale con código 1 si alguna métrica empeora más que su umbral respecto a la
+línea base (REGRESSION_THRESHOLDS, o --threshold para el resto).
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import subprocess
+import sys
+
+import numpy as np
+import pygame
+
+from .scenarios import SCENARIOS, INFORMATIVE_SUFFIXES, cold_construction_ms
+
+DEFAULT_BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+DEFAULT_THRESHOLD = 0.10
+
+# Umbrales propios de las métricas más ruidosas (parte del nombre de la métrica)
+REGRESSION_THRESHOLDS = {
+    'construction.': 0.25,   # Disco y caché del sistema de ficheros
+    '.p99_': 0.30,           # Colas: dependen de pausas del sistema
+}
+
+# Configuración reducida para comprobaciones rápidas (--quick)
+QUICK_SETTINGS = {'headless_ticks': 1000, 'stress_ticks': 600, 'render_frames': 300, 'repeats': 1}
+
+
+def machine_info():
+    """Datos de la máquina y del árbol con los que se tomaron los resultados."""
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                                cwd=os.path.dirname(DEFAULT_BASELINE_PATH), timeout=10).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        commit = ''
+    return {
+        'platform': platform.platform(),
+        'processor': platform.processor() or platform.machine(),
+        'cpu_count': os.cpu_count(),
+        'python': platform.python_version(),
+        'pygame': pygame.version.ver,
+        'sdl': '.'.join(map(str, pygame.get_sdl_version())),
+        'numpy': np.__version__,
+        'video_driver': os.environ.get('SDL_VIDEODRIVER', ''),
+        'commit': commit,
+    }
+
+
+def run(scenario_names, settings, report=None):
+    """
+    Ejecuta los escenarios indicados.
+
+    Returns:
+        dict: machine, settings, fecha y métricas "escenario.métrica" -> valor
+    """
+    metrics = {}
+    for name in scenario_names:
+        for metric, value in SCENARIOS[name](settings).items():
+            metrics[f'{name}.{metric}'] = value
+            if report:
+                report(f'{name}.{metric}', value)
+    return {
+        'machine': machine_info(),
+        'settings': settings,
+        'date': datetime.datetime.now().isoformat(timespec='seconds'),
+        'metrics': metrics,
+    }
+
+
+def threshold_for(metric, default_threshold):
+    for fragment, threshold in REGRESSION_THRESHOLDS.items():
+        if fragment in metric:
+            return threshold
+    return default_threshold
+
+
+def compare(results, baseline, default_threshold=DEFAULT_THRESHOLD):
+    """
+    Compara las métricas de tiempo comunes con la línea base.
+
+    Returns:
+        list: (métrica, base, actual, cambio relativo, umbral, es regresión)
+    """
+    rows = []
+    for metric, value in results['metrics'].items():
+        base = baseline['metrics'].get(metric)
+        if base is None or metric.endswith(INFORMATIVE_SUFFIXES) or base <= 0:
+            continue
+        change = value / base - 1.0
+        threshold = threshold_for(metric, default_threshold)
+        rows.append((metric, base, value, change, threshold, change > threshold))
+    return rows
+
+
+def _write_json(path, data):
+    temp_path = path + '.tmp'
+    with open(temp_path, 'w', encoding='utf-8') as output_file:
+        json.dump(data, output_file, indent=2, sort_keys=True)
+    os.replace(temp_path, path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks de carga, simulación y dibujo")
+    parser.add_argument('--scenarios', nargs='+', choices=list(SCENARIOS), default=list(SCENARIOS))
+    parser.add_argument('--quick', action='store_true', help="Menos ticks y frames (comprobación rápida)")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', default=None, help="Guardar los resultados en JSON")
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE_PATH, help="Línea base con la que comparar")
+    parser.add_argument('--save-baseline', nargs='?', const=DEFAULT_BASELINE_PATH, default=None, metavar='RUTA',
+                        help="Guardar los resultados como nueva línea base")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help="Empeoramiento relativo máximo (0.10 = 10%%)")
+    parser.add_argument('--cold-construction', metavar='CLASE', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.cold_construction:
+        print(cold_construction_ms(args.cold_construction))
+        return
+
+    settings = {'seed': args.seed, **(QUICK_SETTINGS if args.quick else {})}
+    results = run(args.scenarios, settings, report=lambda metric, value: print(f"{metric:<60} {value:12.3f}"))
+    if args.output:
+        _write_json(args.output, results)
+    if args.save_baseline:
+        _write_json(args.save_baseline, results)
+        print(f"Línea base guardada en {args.save_baseline}")
+        return
+
+    if not os.path.exists(args.baseline):
+        print(f"Sin línea base en {args.baseline} (usa --save-baseline)")
+        return
+    with open(args.baseline, 'r', encoding='utf-8') as baseline_file:
+        baseline = json.load(baseline_file)
+    if baseline['settings'] != settings:
+        print(f"Aviso: la línea base usa otra configuración ({baseline['settings']})")
+    if baseline['machine'].get('processor') != results['machine']['processor'] or \
+            baseline['machine'].get('cpu_count') != results['machine']['cpu_count']:
+        print("Aviso: la línea base se tomó en otra máquina; las diferencias pueden no ser regresiones")
+
+    rows = compare(results, baseline, args.threshold)
+    regressions = [row for row in rows if row[5]]
+    print(f"\nComparación con {args.baseline} ({baseline['machine'].get('commit') or 'sin commit'}):")
+    for metric, base, value, change, threshold, regressed in rows:
+        mark = "REGRESIÓN" if regressed else ("mejora" if change < -threshold else "")
+        print(f"  {metric:<58} {base:12.3f} -> {value:12.3f} {change:+7.1%} {mark}")
+    print(f"{len(regressions)} regresiones de {len(rows)} métricas")
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,295 @@
+"""
+Escenarios reproducibles de los benchmarks.
+
+Cada escenario devuelve un dict plano "nombre de métrica" -> valor; todas
+las métricas son tiempos (menos es mejor) salvo las que terminan en
+INFORMATIVE_SUFFIXES, que describen la carga (proyectiles, combates) y no
+cuentan para las regresiones.
+
+- construction: construcción en frío (un proceso nuevo por clase, primera
+  carga de sprites y tablas) y en caliente (mediana de varias construcciones en el
+  mismo proceso) de cada clase de luchador
+- headless_ticks: N ticks por enfrentamiento con la política aleatoria; al
+  terminar un combate se restaura el snapshot inicial en lugar de volver a
+  construir los luchadores, así que solo se mide la simulación
+- projectile_stress: SlimeDemon encadenando la lluvia de lava (ataque 2) y
+  Trapper con sus 3 trampas puestas disparando flechas (ataque 3) sin parar
+- render: dibujo de un combate a 1400x600 sobre una superficie fuera de
+  pantalla (driver de video "dummy"), con un blit por sprite (frame.*) y con
+  la cola de dibujo que vuelca un Surface.blits por capa (queued.*); los
+  mismos frames en los dos casos, así que la diferencia es el coste de Python
+"""
+
+import contextlib
+import io
+import os
+import random
+import statistics
+import subprocess
+import sys
+import time
+
+import pygame
+
+from fighters import sim_clock
+from fighters.controls import INPUT_NONE, INPUT_ATTACK2, INPUT_ATTACK3
+from fighters.render_queue import RenderQueue, LAYER_FIGHTERS, LAYER_PROJECTILES
+from simulation.headless import (init_headless, HeadlessMatch, FIGHTER_CLASSES, CHARACTER_NAMES,
+                                 SCREEN_WIDTH, SCREEN_HEIGHT, INITIAL_X_P1, INITIAL_Y)
+from simulation.policies import RandomPolicyInput
+
+INFORMATIVE_SUFFIXES = ('_matches', '_projectiles', '_calls')
+
+WARM_CONSTRUCTIONS = 3
+DEFAULT_HEADLESS_TICKS = 10000
+DEFAULT_STRESS_TICKS = 3000
+DEFAULT_RENDER_FRAMES = 1800
+DEFAULT_REPEATS = 3         # Repeticiones de los escenarios cortos (estrés y dibujo)
+RENDER_MATCHUP = ('SlimeDemonFighter', 'TrapperFighter')
+COLOR_BACKGROUND = (50, 50, 100)
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def _construct(class_name, player_number=1):
+    """Construye un luchador sin la salida de la carga de sprites."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        return FIGHTER_CLASSES[class_name](player_number, INITIAL_X_P1, INITIAL_Y, False, None)
+
+
+# Raíz del proyecto (para lanzar las construcciones en frío como módulo)
+_REPOSITORY_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def cold_construction_ms(class_name):
+    """Construcción en este proceso, que debe ser nuevo (python -m benchmarks --cold-construction)."""
+    init_headless()
+    start = time.perf_counter()
+    _construct(class_name)
+    return (time.perf_counter() - start) * 1000
+
+
+def _measure_cold_construction(class_name):
+    environment = dict(os.environ, SDL_VIDEODRIVER='dummy', SDL_AUDIODRIVER='dummy')
+    output = subprocess.run([sys.executable, '-m', 'benchmarks', '--cold-construction', class_name],
+                            capture_output=True, text=True, check=True, cwd=_REPOSITORY_ROOT,
+                            env=environment).stdout
+    return float(output.split()[-1])
+
+
+def run_construction(settings):
+    """Construcción en frío y en caliente de cada clase de luchador (ms)."""
+    init_headless()
+    metrics = {}
+    for class_name in CHARACTER_NAMES:
+        metrics[f'{class_name}.cold_ms'] = _measure_cold_construction(class_name)
+        _construct(class_name)  # Primera construcción del proceso (no se mide)
+        samples = []
+        for _ in range(WARM_CONSTRUCTIONS):
+            start = time.perf_counter()
+            _construct(class_name)
+            samples.append((time.perf_counter() - start) * 1000)
+        metrics[f'{class_name}.warm_ms'] = statistics.median(samples)
+    return metrics
+
+
+def _restart(match, initial_snapshot, seed, match_id):
+    """Vuelve al estado inicial del combate con las entradas de otro combate."""
+    random.seed(seed * 1000003 + match_id)
+    sim_clock.use_simulated_time(0)
+    match.arena.restore(initial_snapshot)
+    match.fighter_1.input_source = RandomPolicyInput(seed, match_id, 0)
+    match.fighter_2.input_source = RandomPolicyInput(seed, match_id, 1)
+
+
+def _run_ticks(match, ticks, seed):
+    """
+    Avanza `ticks` ticks encadenando combates desde el snapshot inicial.
+
+    Returns:
+        tuple: (segundos de cada tick, combates jugados)
+    """
+    arena = match.arena
+    initial_snapshot = arena.snapshot()
+    match_id = 0
+    samples = []
+    for _ in range(ticks):
+        start = time.perf_counter()
+        arena.step(SCREEN_WIDTH, SCREEN_HEIGHT)
+        samples.append(time.perf_counter() - start)
+        sim_clock.advance_tick()
+        if arena.winner() is not None:
+            match_id += 1
+            _restart(match, initial_snapshot, seed, match_id)
+    return samples, match_id + 1
+
+
+def run_headless_ticks(settings):
+    """Ticks headless por enfrentamiento (µs por tick, media y p99)."""
+    ticks = settings.get('headless_ticks', DEFAULT_HEADLESS_TICKS)
+    seed = settings.get('seed', 0)
+    metrics = {}
+    all_samples = []
+    for p1_name in CHARACTER_NAMES:
+        for p2_name in CHARACTER_NAMES:
+            with contextlib.redirect_stdout(io.StringIO()):
+                match = HeadlessMatch(p1_name, p2_name, seed, 0)
+            samples, matches = _run_ticks(match, ticks, seed)
+            match.arena.clear()
+            all_samples.extend(samples)
+            key = f'{p1_name}_vs_{p2_name}'
+            metrics[f'{key}.mean_us'] = sum(samples) / len(samples) * 1e6
+            metrics[f'{key}.p99_us'] = percentile(samples, 0.99) * 1e6
+            metrics[f'{key}.played_matches'] = matches
+    metrics['all.mean_us'] = sum(all_samples) / len(all_samples) * 1e6
+    metrics['all.p99_us'] = percentile(all_samples, 0.99) * 1e6
+    sim_clock.use_real_time()
+    return metrics
+
+
+class _StressInput:
+    """Entrada de estrés: la máscara que decide `choose(fighter)` en cada tick."""
+    def __init__(self, choose):
+        self.choose = choose
+
+    def __call__(self, fighter, target):
+        return self.choose(fighter)
+
+
+def _trapper_choice(fighter):
+    # Reponer trampas hasta tener las max_traps puestas y, con ellas, disparar flechas
+    live_traps = sum(1 for trap, serial in fighter.trap_slots
+                     if trap is not None and fighter.projectiles.is_live(trap, serial))
+    return INPUT_ATTACK2 if live_traps < fighter.max_traps else INPUT_ATTACK3
+
+
+STRESS_SCENARIOS = {
+    'slime_rain': ('SlimeDemonFighter', lambda fighter: INPUT_ATTACK2),
+    'trapper_traps_arrows': ('TrapperFighter', _trapper_choice),
+}
+
+
+def _best_of(repeats, run_once):
+    """
+    Repite una medición y se queda con la media más baja (como timeit) y la
+    mediana de los p99: el ruido de la máquina solo puede sumar tiempo.
+
+    Returns:
+        tuple: (media en segundos, p99 en segundos, último resultado de run_once)
+    """
+    means, p99s = [], []
+    for _ in range(repeats):
+        samples, extra = run_once()
+        means.append(sum(samples) / len(samples))
+        p99s.append(percentile(samples, 0.99))
+    return min(means), statistics.median(p99s), extra
+
+
+def run_projectile_stress(settings):
+    """Proyectiles en masa contra un Tank quieto al otro lado (µs por tick)."""
+    ticks = settings.get('stress_ticks', DEFAULT_STRESS_TICKS)
+    repeats = settings.get('repeats', DEFAULT_REPEATS)
+    seed = settings.get('seed', 0)
+    metrics = {}
+    for name, (class_name, choose) in STRESS_SCENARIOS.items():
+        with contextlib.redirect_stdout(io.StringIO()):
+            match = HeadlessMatch(class_name, 'TankFighter', seed, 0)
+        match.fighter_1.input_source = _StressInput(choose)
+        match.fighter_2.input_source = _StressInput(lambda fighter: INPUT_NONE)
+        # Vida de sobra para que el estrés dure todos los ticks
+        match.fighter_2.current_health = match.fighter_2.max_health = 10 ** 9
+        initial_snapshot = match.arena.snapshot()
+
+        def run_once():
+            random.seed(seed)
+            sim_clock.use_simulated_time(0)
+            match.arena.restore(initial_snapshot)
+            samples = []
+            peak_projectiles = 0
+            for _ in range(ticks):
+                start = time.perf_counter()
+                match.arena.step(SCREEN_WIDTH, SCREEN_HEIGHT)
+                samples.append(time.perf_counter() - start)
+                sim_clock.advance_tick()
+                peak_projectiles = max(peak_projectiles, len(match.arena.projectiles))
+            return samples, peak_projectiles
+
+        mean, p99, peak_projectiles = _best_of(repeats, run_once)
+        match.arena.clear()
+        metrics[f'{name}.mean_us'] = mean * 1e6
+        metrics[f'{name}.p99_us'] = p99 * 1e6
+        metrics[f'{name}.peak_projectiles'] = peak_projectiles
+    sim_clock.use_real_time()
+    return metrics
+
+
+def _draw_direct(match, surface, queue):
+    for fighter in match.arena.fighters:
+        fighter.draw(surface, 0)
+    match.arena.projectiles.draw(surface, 0)
+
+
+def _draw_queued(match, surface, queue):
+    queue.set_layer(LAYER_FIGHTERS)
+    for fighter in match.arena.fighters:
+        fighter.draw(queue, 0)
+    queue.set_layer(LAYER_PROJECTILES)
+    match.arena.projectiles.draw(queue, 0)
+    queue.flush()
+
+
+def run_render(settings):
+    """Dibujo fuera de pantalla de un combate a 1400x600, directo y con cola (ms por frame)."""
+    frames = settings.get('render_frames', DEFAULT_RENDER_FRAMES)
+    repeats = settings.get('repeats', DEFAULT_REPEATS)
+    seed = settings.get('seed', 0)
+    init_headless()
+    surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+    queue = RenderQueue(surface)  # Misma configuración que main.py
+    with contextlib.redirect_stdout(io.StringIO()):
+        match = HeadlessMatch(*RENDER_MATCHUP, seed, 0)
+    initial_snapshot = match.arena.snapshot()
+
+    def run_once(draw):
+        match_id = 0
+        _restart(match, initial_snapshot, seed, match_id)
+        samples = []
+        blits = calls = 0
+        for _ in range(frames):
+            match.arena.step(SCREEN_WIDTH, SCREEN_HEIGHT)
+            sim_clock.advance_tick()
+            start = time.perf_counter()
+            surface.fill(COLOR_BACKGROUND)
+            draw(match, surface, queue)
+            samples.append(time.perf_counter() - start)
+            blits += queue.last_flush_blits
+            calls += queue.last_flush_calls
+            if match.arena.winner() is not None:
+                match_id += 1
+                _restart(match, initial_snapshot, seed, match_id)
+        return samples, (match_id + 1, blits / frames, calls / frames)
+
+    mean, p99, (matches, _, _) = _best_of(repeats, lambda: run_once(_draw_direct))
+    queued_mean, queued_p99, (_, blits, calls) = _best_of(repeats, lambda: run_once(_draw_queued))
+    match.arena.clear()
+    sim_clock.use_real_time()
+    return {
+        'frame.mean_ms': mean * 1000,
+        'frame.p99_ms': p99 * 1000,
+        'frame.played_matches': matches,
+        'frame.blit_calls': blits,
+        'queued.mean_ms': queued_mean * 1000,
+        'queued.p99_ms': queued_p99 * 1000,
+        'queued.blit_calls': calls,
+    }
+
+
+SCENARIOS = {
+    'construction': run_construction,
+    'headless_ticks': run_headless_ticks,
+    'projectile_stress': run_projectile_stress,
+    'render': run_render,
+}
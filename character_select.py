@@ -4,7 +4,10 @@ Maneja la interfaz de selección de personajes antes y después de cada ronda.
 """
 
 import pygame
+import math
 import os
+from fighters.cpu import CPU_DIFFICULTIES, CPU_DIFFICULTY_ORDER, CPU_SEARCH, CPU_SEARCH_NAME
+from fighters import registry, render_quality
 
 class CharacterSelectScreen:
     """
@@ -51,38 +54,16 @@ class CharacterSelectScreen:
             self.character_font = pygame.font.Font(None, 24)
             self.instruction_font = pygame.font.Font(None, 16)
         
-        # Lista de personajes disponibles
+        # Lista de personajes disponibles (registro de personajes, characters.json)
         self.available_characters = [
             {
-                'name': 'Warrior',
-                'class_name': 'WarriorFighter',
-                'description': 'Guerrero resistente con ataques poderosos',
-                'preview_image': None  # Se cargará dinámicamente
-            },
-            {
-                'name': 'Slime Demon',
-                'class_name': 'SlimeDemonFighter', 
-                'description': 'Demonio ágil con ataques especiales',
-                'preview_image': None  # Se cargará dinámicamente
-            },
-            {
-                'name': 'Assassin',
-                'class_name': 'AssassinFighter',
-                'description': 'Asesino rápido con ataques consecutivos',
-                'preview_image': None  # Se cargará dinámicamente
-            },
-            {
-                'name': 'Tank',
-                'class_name': 'TankFighter',
-                'description': 'Tanque resistente con ataques de gran empuje',
-                'preview_image': None  # Se cargará dinámicamente
-            },
-            {
-                'name': 'Trapper',
-                'class_name': 'TrapperFighter',
-                'description': 'Cazador ágil con trampas y ataques a distancia',
+                'name': entry.display_name,
+                'class_name': entry.class_name,
+                'description': entry.description,
+                'preview_path': entry.preview_path,
                 'preview_image': None  # Se cargará dinámicamente
             }
+            for entry in registry.character_entries()
         ]
         
         # Cargar imágenes de preview de personajes
@@ -93,6 +74,11 @@ class CharacterSelectScreen:
         self.player_2_selection = 1  # Índice del personaje seleccionado (SlimeDemon por defecto)
         self.active_player = 1       # Qué jugador está seleccionando actualmente
         
+        # Control del jugador 2: None = humano, clave de dificultad de la CPU o
+        # CPU_SEARCH para la IA de búsqueda (TAB para cambiar)
+        self.p2_control_options = (None,) + CPU_DIFFICULTY_ORDER + (CPU_SEARCH,)
+        self.p2_control_index = 0
+        
         # Estados de selección
         self.selection_confirmed = [False, False]  # [P1_confirmed, P2_confirmed]
         self.selection_complete = False
@@ -101,7 +87,7 @@ class CharacterSelectScreen:
         self.last_blink_time = 0
         self.blink_state = True
         self.animation_time = 0
-        self.character_hover_scale = [1.0, 1.0, 1.0, 1.0, 1.0]  # Escala de hover para cada personaje
+        self.character_hover_scale = [1.0] * len(self.available_characters)  # Escala de hover para cada personaje
         self.last_particle_spawn = 0
         
         # Inicializar partículas de fondo
@@ -110,22 +96,12 @@ class CharacterSelectScreen:
     def load_character_previews(self):
         """
         Carga las imágenes de preview de cada personaje.
-        Utiliza el primer frame de la animación idle como preview.
+        Cada personaje indica la suya ("preview" en characters.json), normalmente
+        el primer frame de su animación idle.
         """
         for character_data in self.available_characters:
-            character_name = character_data['name'].lower().replace(' ', '_')
-            
-            if character_name == 'warrior':
-                preview_path = "assets/images/warrior/Sprites/idle/idle_1.png"
-            elif character_name == 'slime_demon':
-                preview_path = "assets/images/slime_demon/Sprites/idle/1.png"
-            elif character_name == 'assassin':
-                preview_path = "assets/images/assasin/Sprites/idle/idle_1.png"  # Ruta corregida
-            elif character_name == 'tank':
-                preview_path = "assets/images/tank/Sprites/idle/idle_1.png"  # Ruta corregida
-            elif character_name == 'trapper':
-                preview_path = "assets/images/trapper/Sprites/01_idle/01_idle_1.png"  # Ruta del Trapper
-            else:
+            preview_path = character_data['preview_path']
+            if not preview_path:
                 continue
                 
             try:
@@ -278,15 +254,21 @@ class CharacterSelectScreen:
                     self.active_player = 2  # Cambiar al jugador 2
                     
             elif self.active_player == 2 and not self.selection_confirmed[1]:
-                # Controles del Jugador 2 (Flechas para navegar, 1 para confirmar)
-                if event.key == pygame.K_LEFT:  # Mover selección a la izquierda
+                # Controles del Jugador 2 (Flechas para navegar, 1 para confirmar);
+                # si P2 es la CPU, el jugador 1 también puede elegir por ella con A/D y R
+                cpu_opponent = self.get_cpu_difficulty() is not None
+                if event.key == pygame.K_LEFT or cpu_opponent and event.key == pygame.K_a:
                     self.player_2_selection = (self.player_2_selection - 1) % len(self.available_characters)
-                elif event.key == pygame.K_RIGHT:  # Mover selección a la derecha
+                elif event.key == pygame.K_RIGHT or cpu_opponent and event.key == pygame.K_d:
                     self.player_2_selection = (self.player_2_selection + 1) % len(self.available_characters)
-                elif event.key == pygame.K_KP1:  # Confirmar selección
+                elif event.key == pygame.K_KP1 or cpu_opponent and event.key == pygame.K_r:  # Confirmar selección
                     self.selection_confirmed[1] = True
                     self.selection_complete = True  # Ambos jugadores han seleccionado
             
+            # TAB alterna el control del jugador 2: humano o CPU fácil / normal / difícil
+            if event.key == pygame.K_TAB and not self.selection_complete:
+                self.p2_control_index = (self.p2_control_index + 1) % len(self.p2_control_options)
+            
             # Permitir cancelar selección con ESC
             if event.key == pygame.K_ESCAPE:
                 if self.selection_confirmed[1]:
@@ -329,8 +311,9 @@ class CharacterSelectScreen:
             # Suavizar transición de escala
             self.character_hover_scale[i] += (target_scale - self.character_hover_scale[i]) * 0.1
         
-        # Actualizar partículas
-        self.update_particles()
+        # Actualizar partículas (se omiten cuando la calidad de render baja)
+        if render_quality.menu_particles:
+            self.update_particles()
     
     def draw(self, surface):
         """
@@ -343,7 +326,8 @@ class CharacterSelectScreen:
         self.draw_gradient_background(surface)
         
         # Dibujar partículas de fondo
-        self.draw_particles(surface)
+        if render_quality.menu_particles:
+            self.draw_particles(surface)
         
         # Dibujar título con efectos
         title_text = self.title_font.render("SELECCI0N DE PERSONAJES", True, self.title_color)
@@ -417,7 +401,14 @@ class CharacterSelectScreen:
         p2_char = self.available_characters[self.player_2_selection]['name']
         p2_color = self.confirmed_color if self.selection_confirmed[1] else self.player2_color
         
-        p2_title = self.character_font.render("JUGADOR 2", True, self.player2_color)
+        cpu_difficulty = self.get_cpu_difficulty()
+        if cpu_difficulty is None:
+            p2_label = "JUGADOR 2"
+        elif cpu_difficulty == CPU_SEARCH:
+            p2_label = f"CPU ({CPU_SEARCH_NAME})"
+        else:
+            p2_label = f"CPU ({CPU_DIFFICULTIES[cpu_difficulty]['name']})"
+        p2_title = self.character_font.render(p2_label, True, self.player2_color)
         p2_character = self.character_font.render(f"Personaje: {p2_char}", True, self.text_color)
         p2_status_text = self.character_font.render(p2_status, True, p2_color)
         
@@ -434,8 +425,11 @@ class CharacterSelectScreen:
             
         if not self.selection_confirmed[1]:
             controls_p2 = "P2: </> - Navegar | 1 - Confirmar"
+            if cpu_difficulty is not None:
+                controls_p2 = "CPU: A/D o </> - Navegar | R o 1 - Confirmar"
         else:
             controls_p2 = "P2: ESC - Cambiar selección"
+        controls_p2 += " | TAB - Humano / CPU"
         
         controls1_text = self.instruction_font.render(controls_p1, True, self.text_color)
         controls2_text = self.instruction_font.render(controls_p2, True, self.text_color)
@@ -446,14 +440,14 @@ class CharacterSelectScreen:
         # Mensaje final animado cuando ambos han seleccionado
         if self.selection_complete:
             # Efecto de resplandor en el mensaje final
-            glow_intensity = int(50 + 30 * abs(pygame.math.cos(self.animation_time * 0.005)))
+            glow_intensity = int(50 + 30 * abs(math.cos(self.animation_time * 0.005)))
             final_color = (*self.title_color, glow_intensity)
             
             final_text = self.title_font.render("¡PREPARADOS PARA LA BATALLA!", True, self.title_color)
             final_rect = final_text.get_rect(center=(self.screen_width // 2, 150))
             
             # Sombra animada
-            shadow_offset = int(3 + 2 * pygame.math.sin(self.animation_time * 0.01))
+            shadow_offset = int(3 + 2 * math.sin(self.animation_time * 0.01))
             final_shadow = self.title_font.render("¡PREPARADOS PARA LA BATALLA!", True, (0, 0, 0))
             shadow_rect = final_shadow.get_rect(center=(self.screen_width // 2 + shadow_offset, 150 + shadow_offset))
             
@@ -471,6 +465,15 @@ class CharacterSelectScreen:
         p2_character = self.available_characters[self.player_2_selection]['class_name']
         return p1_character, p2_character
     
+    def get_cpu_difficulty(self):
+        """
+        Obtiene la dificultad de la CPU que controla al jugador 2.
+        
+        Returns:
+            str: Clave de CPU_DIFFICULTIES, CPU_SEARCH o None si el jugador 2 es humano
+        """
+        return self.p2_control_options[self.p2_control_index]
+    
     def reset_selection(self):
         """
         Reinicia la pantalla de selección para una nueva ronda.
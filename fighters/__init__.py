@@ -1,9 +1,12 @@
 # Fighters module
 from .base_fighter import Fighter
-from .warrior_fighter import WarriorFighter
-from .slime_demon_fighter import SlimeDemonFighter
-from .assassin_fighter import AssassinFighter
-from .tank_fighter import TankFighter
-from .trapper_fighter import TrapperFighter
+from . import registry
 
-__all__ = ['Fighter', 'WarriorFighter', 'SlimeDemonFighter', 'AssassinFighter', 'TankFighter', 'TrapperFighter']
\ No newline at end of file
+__all__ = ['Fighter', 'WarriorFighter', 'SlimeDemonFighter', 'AssassinFighter', 'TankFighter', 'TrapperFighter']
+
+
+def __getattr__(name):
+    # Las clases de personaje se importan la primera vez que se piden (ver registry)
+    if name in registry.FighterClasses():
+        return registry.fighter_class(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
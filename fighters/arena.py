@@ -0,0 +1,181 @@
+"""
+Arena de N luchadores: 1 contra 1, equipos (2v2) y todos contra todos.
+
+La arena reúne los objetos compartidos de un combate (bus de eventos,
+CollisionWorld y ProjectileManager), se los asigna a sus luchadores y los
+avanza en el mismo orden que el bucle original de dos jugadores:
+
+    elegir objetivos -> move() de todos -> begin_tick() -> update() de todos
+    -> ProjectileManager.update() -> end_tick()
+
+El objetivo de cada luchador (orientación, ataques, política de entrada) es
+el enemigo más cercano según CollisionWorld.nearest_enemy, y los proyectiles
+golpean a cualquier luchador de otro equipo que toquen. Con dos luchadores
+el resultado es idéntico al bucle de dos jugadores.
+
+Con un FrameProfiler en Arena.profiler, step() mide por separado la
+elección de objetivos, move() y update() de cada luchador, el broadphase y
+los proyectiles; sin él (None) el paso no tiene ninguna medición.
+"""
+
+from . import sim_clock
+from .combat_events import CombatEventBus
+from .projectiles import ProjectileManager
+from .spatial_hash import CollisionWorld
+
+# Equipo de cada jugador (índice = player_number - 1) en cada modo
+ARENA_MODES = {
+    '1v1': (1, 2),
+    '2v2': (1, 2, 1, 2),
+    'ffa4': (1, 2, 3, 4),
+    'ffa8': (1, 2, 3, 4, 5, 6, 7, 8),
+}
+
+# Franja de aparición (la misma que las posiciones iniciales de 1 contra 1)
+SPAWN_LEFT_X = 300
+SPAWN_RIGHT_X = 1100
+STAGE_CENTER_X = 700
+
+
+def spawn_layout(teams):
+    """
+    Posiciones iniciales de una arena: los compañeros aparecen juntos y los
+    equipos se reparten de izquierda a derecha.
+
+    Args:
+        teams: Equipo de cada luchador, en orden de player_number
+
+    Returns:
+        list: (x inicial, flip_sprite) de cada luchador
+    """
+    count = len(teams)
+    order = sorted(range(count), key=lambda index: (teams[index], index))
+    layout = [None] * count
+    for slot, index in enumerate(order):
+        x = SPAWN_LEFT_X + (SPAWN_RIGHT_X - SPAWN_LEFT_X) * slot // max(count - 1, 1)
+        layout[index] = (x, x > STAGE_CENTER_X)
+    return layout
+
+
+class Arena:
+    """
+    Combate entre N luchadores de al menos dos equipos (Fighter.team).
+
+    Args:
+        fighters: Luchadores en orden de player_number
+        event_bus (CombatEventBus): Bus del combate (por defecto uno nuevo)
+        world (CollisionWorld): Broadphase del combate (por defecto uno nuevo)
+        projectiles (ProjectileManager): Proyectiles del combate (por defecto uno nuevo)
+    """
+    def __init__(self, fighters, event_bus=None, world=None, projectiles=None):
+        self.fighters = tuple(fighters)
+        if len({fighter.team for fighter in self.fighters}) < 2:
+            raise ValueError("La arena necesita luchadores de al menos dos equipos")
+        self.event_bus = event_bus or CombatEventBus()
+        self.world = world or CollisionWorld()
+        self.projectiles = projectiles or ProjectileManager(world=self.world)
+        for fighter in self.fighters:
+            fighter.event_bus = self.event_bus
+            fighter.collision_world = self.world
+            fighter.projectiles = self.projectiles
+        self.targets = [None] * len(self.fighters)
+        self.profiler = None  # FrameProfiler opcional (overlay de main.py)
+        # Nombres de las secciones de step_profiled (fijos: sin cadenas nuevas en cada tick)
+        self.move_sections = tuple(f"P{fighter.player_number} move" for fighter in self.fighters)
+        self.update_sections = tuple(f"P{fighter.player_number} update" for fighter in self.fighters)
+
+    def choose_targets(self):
+        """Asigna a cada luchador el enemigo más cercano."""
+        nearest_enemy = self.world.nearest_enemy
+        fighters = self.fighters
+        targets = self.targets
+        for index, fighter in enumerate(fighters):
+            targets[index] = nearest_enemy(fighter, fighters)
+
+    def step(self, screen_width, screen_height, surface=None, round_over=False):
+        """Avanza un tick a todos los luchadores y proyectiles."""
+        if self.profiler is not None:
+            self.step_profiled(screen_width, screen_height, surface, round_over)
+            return
+        self.choose_targets()
+        fighters = self.fighters
+        targets = self.targets
+        for fighter, target in zip(fighters, targets):
+            fighter.move(screen_width, screen_height, surface, target, round_over)
+        self.world.begin_tick(fighters)
+        for fighter, target in zip(fighters, targets):
+            fighter.update(target)
+        self.projectiles.update()
+        self.world.end_tick()
+
+    def step_profiled(self, screen_width, screen_height, surface=None, round_over=False):
+        """step() con cada fase medida en self.profiler."""
+        profiler = self.profiler
+        profiler.push('objetivos')
+        self.choose_targets()
+        profiler.pop()
+        fighters = self.fighters
+        targets = self.targets
+        for fighter, target, section in zip(fighters, targets, self.move_sections):
+            profiler.push(section)
+            fighter.move(screen_width, screen_height, surface, target, round_over)
+            profiler.pop()
+        profiler.push('broadphase')
+        self.world.begin_tick(fighters)
+        profiler.pop()
+        for fighter, target, section in zip(fighters, targets, self.update_sections):
+            profiler.push(section)
+            fighter.update(target)
+            profiler.pop()
+        profiler.push('proyectiles')
+        self.projectiles.update()
+        profiler.pop()
+        self.world.end_tick()
+
+    def standing_teams(self):
+        """Equipos con algún luchador que no ha terminado su animación de muerte."""
+        return {fighter.team for fighter in self.fighters
+                if fighter.is_alive or not fighter.death_animation_done}
+
+    def winner(self):
+        """
+        Equipo ganador, 0 si todos cayeron a la vez o None si el combate sigue.
+        Como en 1 contra 1, un luchador cuenta como caído cuando su animación de muerte terminó.
+        """
+        teams = self.standing_teams()
+        if len(teams) > 1:
+            return None
+        return teams.pop() if teams else 0
+
+    def focus_x(self):
+        """Punto medio horizontal entre los luchadores más alejados (seguimiento de cámara)."""
+        centers = [fighter.collision_rect.centerx for fighter in self.fighters]
+        return (min(centers) + max(centers)) // 2
+
+    def snapshot(self):
+        """
+        Estado de simulación del combate: reloj, proyectiles y luchadores.
+        Se puede serializar con pickle y restaurar en otra arena con los mismos
+        personajes (por ejemplo en otro proceso).
+        """
+        return {
+            'time_ms': sim_clock.get_ticks(),
+            'projectiles': self.projectiles.snapshot(),
+            'fighters': tuple(fighter.snapshot() for fighter in self.fighters),
+        }
+
+    def restore(self, snapshot):
+        """
+        Restaura un snapshot() sobre los luchadores de esta arena. El reloj no
+        se toca: quien simula decide desde qué tick continuar (ver snapshot['time_ms']).
+        """
+        fighters_by_number = {fighter.player_number: fighter for fighter in self.fighters}
+        self.projectiles.restore(snapshot['projectiles'], fighters_by_number)
+        for fighter, fighter_snapshot in zip(self.fighters, snapshot['fighters']):
+            fighter.restore(fighter_snapshot)
+        self.world.clear()
+
+    def clear(self):
+        """Suelta proyectiles y referencias indexadas (fin del combate)."""
+        self.projectiles.clear()
+        self.world.clear()
@@ -1,123 +1,89 @@
+import copy
 import pygame
 import os
 import random
+from . import sim_clock
+from .controls import read_keyboard_mask
+from .movement import move_fighter
+from .character_data import (get_character_definition, compile_character, ATTACK_ACTIONS,
+                             HIT_ONCE_FROM, HIT_ONCE_AT, HIT_MULTI, TRIGGER_HITS, ANCHOR_CENTER)
+from .frame_data import get_frame_data
+from .status_effects import StatusEffects, STATUS_KINDS
+from . import combat_events
+from . import projectiles
+from . import render_quality
+from .render_quality import to_render
+from . import spatial_hash
+from .spatial_hash import LAYER_ATTACK
+from .combat_events import (EVENT_HIT, EVENT_DAMAGE, EVENT_SHIELD_ABSORB, EVENT_SHIELD_BREAK,
+                            EVENT_STATUS_APPLIED, EVENT_KO, NO_FIGHTER)
 
 
-class BaseProjectile:
-    """
-    Clase base para proyectiles que pueden ser usados por cualquier fighter.
-    Proporciona funcionalidad común como movimiento, animación y colisión.
-    """
-    def __init__(self, x, y, velocity_x, velocity_y, damage, frames=None, target=None):
-        self.x = x
-        self.y = y
-        self.velocity_x = velocity_x
-        self.velocity_y = velocity_y
-        self.damage = damage
-        self.target = target
-        self.width = 20
-        self.height = 20
-        
-        # Sistema de animación
-        self.frames = frames or []
-        self.current_frame_index = 0
-        self.last_frame_time = pygame.time.get_ticks()
-        self.animation_speed = 100  # ms entre frames
-        
-        # Estados
-        self.is_alive = True
-        self.has_hit = False
-        
-    def rect(self):
-        """Retorna el rectángulo de colisión del proyectil."""
-        return pygame.Rect(int(self.x), int(self.y), self.width, self.height)
-        
-    def update(self, ground_level=550):
-        """Actualiza la posición y estado del proyectil."""
-        if not self.is_alive:
-            return
-            
-        # Actualizar posición
-        self.x += self.velocity_x
-        self.y += self.velocity_y
-        
-        # Aplicar gravedad si es necesario (subclases pueden sobrescribir)
-        self.apply_physics()
-        
-        # Verificar colisiones
-        self.check_collisions(ground_level)
-        
-        # Actualizar animación
-        self.update_animation()
-        
-    def apply_physics(self):
-        """Aplica física básica (gravedad). Subclases pueden sobrescribir."""
-        # Por defecto, no hay gravedad
-        pass
-        
-    def check_collisions(self, ground_level):
-        """Verifica colisiones con suelo y objetivo."""
-        # Colisión con suelo
-        if self.y + self.height >= ground_level:
-            self.on_ground_hit()
-            
-        # Colisión con objetivo
-        if self.target and self.rect().colliderect(self.target.collision_rect):
-            self.on_target_hit()
-            
-    def on_ground_hit(self):
-        """Llamado cuando el proyectil toca el suelo."""
-        self.is_alive = False
-        
-    def on_target_hit(self):
-        """Llamado cuando el proyectil toca el objetivo."""
-        if not self.has_hit:
-            self.target.apply_damage(self.damage)
-            self.target.is_hit = True
-            self.has_hit = True
-            self.is_alive = False
-            
-    def update_animation(self):
-        """Actualiza la animación del proyectil."""
-        if not self.frames or len(self.frames) <= 1:
-            return
-            
-        now = pygame.time.get_ticks()
-        if now - self.last_frame_time >= self.animation_speed:
-            self.current_frame_index = (self.current_frame_index + 1) % len(self.frames)
-            self.last_frame_time = now
-            
-    def get_current_frame(self):
-        """Retorna el frame actual para dibujar."""
-        if not self.frames:
-            return None
-        return pygame.transform.scale(self.frames[self.current_frame_index], (self.width, self.height))
-        
-
 class Fighter:
     """
     Clase padre Fighter que define la funcionalidad base para todos los personajes luchadores.
     Esta clase maneja movimiento, animaciones, ataques básicos y física del juego.
     Las clases hijas implementarán personajes específicos con sus propias características.
+
+    Las estadísticas y reglas de ataque se leen de characters.json (ver
+    character_data) usando la clave character_key de cada clase hija.
     """
+    # Clave del personaje en characters.json (definida por cada clase hija)
+    character_key = None
+
+    # Estado de simulación que copian snapshot()/restore(); el resto de
+    # atributos son constantes, sprites o recursos compartidos del combate.
+    # Las clases hijas añaden su propio estado.
+    snapshot_fields = (
+        'team', 'collision_rect', 'vertical_velocity', 'flip_sprite', 'current_action', 'frame_index',
+        'last_update_time', 'is_running', 'is_jumping', 'is_attacking', 'current_attack_type',
+        'attack_cooldown_timer', 'is_hit', 'damage_taken', 'current_health', 'is_alive',
+        'death_animation_done', 'status_effects', 'last_damage_applied', 'last_damage_timestamp',
+        'shield_active', 'shield_health', 'shield_cooldown_timer', 'attack_frame_counter',
+        'attack_has_hit', 'attack_hits_dealt',
+    )
+
     def __init__(self, player_number, initial_x, initial_y, flip_sprite, character_data, attack_sound):
+        # Definición del personaje basada en datos
+        definition = get_character_definition(self.character_key)
+        if character_data is None:
+            sprite = definition['sprite']
+            character_data = [sprite['size'], sprite['scale'], list(sprite['offset'])]
+
         # Propiedades básicas del jugador
-        self.player_number = player_number  # Número del jugador (1 o 2)
+        self.player_number = player_number  # Número del jugador (1 o 2; hasta 8 en la arena)
+        self.team = player_number  # Equipo (por defecto cada jugador en el suyo: todos contra todos)
         self.character_size = character_data[0]  # Tamaño base del sprite
         self.image_scale = character_data[1]  # Factor de escalado de la imagen
         self.sprite_offset = character_data[2]  # Offset para posicionamiento correcto del sprite
         self.flip_sprite = flip_sprite  # Si el sprite debe estar volteado horizontalmente
         
         # Sistema de animaciones - ahora carga sprites individuales frame por frame
-        self.animation_list = self.load_individual_sprites()
+        # (guardados a la resolución del framebuffer interno)
+        self.animation_list = render_quality.scale_animations(self.load_individual_sprites())
         self.current_action = 0  # 0:idle, 1:run, 2:jump, 3:attack1, 4:attack2, 5:attack3, 6:hit, 7:death
         self.frame_index = 0  # Índice del frame actual en la animación
         self.current_image = self.animation_list[self.current_action][self.frame_index]
-        self.last_update_time = pygame.time.get_ticks()  # Tiempo de la última actualización de animación
+        self.last_update_time = sim_clock.get_ticks()  # Tiempo de la última actualización de animación
+
+        # Tablas de reglas compiladas a partir de la definición y las animaciones cargadas
+        self.character_table = compile_character(
+            self.character_key, [len(frames) for frames in self.animation_list])
+        table = self.character_table
+        self.frame_data = get_frame_data(table)  # Startup / activos / recovery por ataque
+        self.character_name = table.display_name
+        self.sprites_inverted = table.sprites_inverted
         
         # Propiedades físicas y de colisión
-        self.collision_rect = pygame.Rect((initial_x, initial_y, 80, 180))  # Rectángulo de colisión
+        self.collision_rect = pygame.Rect((initial_x, initial_y, table.hitbox_width, table.hitbox_height))
+        # Rects reutilizables (se actualizan en el sitio para no crear objetos cada tick)
+        self.attack_rect = pygame.Rect(0, 0, 0, 0)  # Área de ataque del tick (la indexa el CollisionWorld)
+        self.display_rect = pygame.Rect(0, 0, 0, 0)  # Rect de dibujo de depuración (draw_hitbox)
+        self.shield_surface = None  # Esfera del escudo, creada al dibujarla por primera vez
+        self.shield_outline_surface = None  # Solo el borde (calidad mínima)
         self.vertical_velocity = 0  # Velocidad vertical para saltos y gravedad
+        self.jump_strength = table.jump_strength  # Impulso vertical del salto
+        self.movement_profile = table.movement_profile  # Gravedad, control aéreo, escudo y sangrado
         
         # Ajustar posición inicial para que esté exactamente en el suelo
         ground_level = 550  # Nivel del suelo estándar
@@ -133,79 +99,133 @@ class Fighter:
         self.is_hit = False  # Si el personaje fue golpeado
         
         # Sistema de salud (centralizado)
-        self.max_health = 100  # Salud máxima base para todos los personajes
+        self.max_health = table.max_health  # Salud máxima del personaje
         self.damage_taken = 0   # Daño acumulado total recibido
         self.current_health = self.max_health  # Salud derivada
         self.is_alive = True  # Si el personaje está vivo
         self.death_animation_done = False  # Flag para saber si terminó animación de muerte
         
-        # Sistema de efectos de estado
-        self.burn_damage_remaining = 0  # Daño de quemadura pendiente
-        self.burn_timer = 0  # Tiempo de quemadura restante (en frames)
-        self.burn_interval = 60  # Frames entre aplicaciones de daño de quemadura
-        self.burn_counter = 0  # Contador interno para el intervalo de quemadura
-        
-        # Sistema de sangrado (bleeding)
-        self.bleeding_damage_remaining = 0  # Daño de sangrado pendiente
-        self.bleeding_timer = 0  # Tiempo de sangrado restante (en frames)
-        self.bleeding_interval = 45  # Frames entre aplicaciones de daño de sangrado (más rápido que burn)
-        self.bleeding_counter = 0  # Contador interno para el intervalo de sangrado
+        # Efectos de estado (quemadura, sangrado, aturdimiento)
+        self.status_effects = StatusEffects(table.status_immunities)
+
+        # Eventos de combate (impactos, daño, escudo, KO) y último daño recibido (overlay de depuración)
+        self.event_bus = combat_events.default_bus
+        self.last_damage_applied = 0
+        self.last_damage_timestamp = None
         
         # Sistema de escudo
         self.shield_active = False  # Si el escudo está activo
         self.shield_health = 0  # Vida del escudo (20% de max_health)
-        self.shield_max_health = int(self.max_health * 0.20)  # Escudo absorbe el 20% de la vida máxima
+        self.shield_max_health = table.shield_max_health  # 20% de la vida base (100)
         self.shield_cooldown_timer = 0  # Temporizador de cooldown del escudo
-        self.shield_cooldown_max = 300  # Cooldown de 5 segundos (300 frames @ 60 FPS)
+        self.shield_cooldown_max = table.shield_cooldown  # Cooldown de 5 segundos (300 frames @ 60 FPS)
         
         # Sistema avanzado de ataques
         self.attack_frame_counter = 0  # Contador de frames para ataques complejos
         self.attack_has_hit = False  # Para evitar múltiples golpes en un ataque
+        self.attack_hits_dealt = set()  # Impactos ya aplicados en ataques multi-hit
         
-        # Sistema de proyectiles
-        self.active_projectiles = []  # Lista de proyectiles activos
+        # Sistema de proyectiles: todos viven en un ProjectileManager compartido
+        # (el combate lo actualiza y dibuja una vez por frame tras ambos luchadores)
+        self.projectiles = projectiles.default_manager
+        # Broadphase de colisiones del combate (hurtboxes, áreas de ataque, explosiones)
+        self.collision_world = spatial_hash.default_world
         
         # Velocidad base
-        self.base_movement_speed = 10
+        self.base_movement_speed = table.movement_speed
+
+        # Constantes propias del personaje (trap_cooldown, combo_window, ...)
+        for attribute_name, value in table.attributes.items():
+            setattr(self, attribute_name, value)
         
         # Controles específicos del personaje
         self.movement_controls = {}
         self.attack_controls = {}
         self.setup_controls()
 
-    def create_projectile(self, projectile_class, x, y, velocity_x, velocity_y, damage, **kwargs):
+        # Fuente de entrada alternativa al teclado (bots, simulaciones headless)
+        # Debe ser un callable(fighter, target) que retorne una máscara INPUT_*
+        self.input_source = None
+
+    def snapshot(self):
+        """
+        Copia del estado de simulación del luchador (sin sprites ni referencias a
+        otros objetos, por lo que se puede serializar con pickle).
+
+        Returns:
+            dict: Atributo -> valor para restore()
         """
-        Crea un proyectil y lo añade a la lista de proyectiles activos.
+        return {name: copy.copy(getattr(self, name)) for name in self.snapshot_fields}
+
+    def restore(self, snapshot):
+        """
+        Restaura un estado tomado con snapshot() (de este luchador o de otro del
+        mismo personaje). Los proyectiles del combate deben restaurarse antes.
+        """
+        for name, value in snapshot.items():
+            setattr(self, name, copy.copy(value))
+        animation = self.animation_list[self.current_action]
+        self.current_image = animation[min(self.frame_index, len(animation) - 1)]
+        self.collision_world.invalidate()
+
+    def reset(self, initial_x, flip_sprite):
+        """
+        Devuelve el luchador al estado con el que empieza un combate (los mismos
+        valores que deja __init__) en otra posición, sin recargar sprites ni
+        recompilar sus tablas. Retira sus proyectiles y trampas del combate
+        anterior; la fuente de entrada vuelve a ser el teclado.
+
+        Args:
+            initial_x (int): Posición horizontal inicial
+            flip_sprite (bool): Si empieza mirando a la izquierda
+        """
+        for projectile in self.projectiles.owned_by(self.player_number):
+            self.projectiles.kill(projectile)
+        self.team = self.player_number
+        self.collision_rect.x = initial_x
+        self.collision_rect.bottom = 550
+        self.vertical_velocity = 0
+        self.flip_sprite = flip_sprite
+        self.current_action = 0
+        self.frame_index = 0
+        self.current_image = self.animation_list[0][0]
+        self.last_update_time = sim_clock.get_ticks()
+        self.is_running = False
+        self.is_jumping = False
+        self.is_attacking = False
+        self.current_attack_type = 0
+        self.attack_cooldown_timer = 0
+        self.is_hit = False
+        self.damage_taken = 0
+        self.current_health = self.max_health
+        self.is_alive = True
+        self.death_animation_done = False
+        self.status_effects = StatusEffects(self.character_table.status_immunities)
+        self.last_damage_applied = 0
+        self.last_damage_timestamp = None
+        self.shield_active = False
+        self.shield_health = 0
+        self.shield_cooldown_timer = 0
+        self.attack_frame_counter = 0
+        self.attack_has_hit = False
+        self.attack_hits_dealt = set()
+        self.input_source = None
+
+    def create_projectile(self, x, y, velocity_x, velocity_y, damage, frames=(), target=None, width=20, height=20):
+        """
+        Activa un proyectil básico (línea recta) en el ProjectileManager.
         
         Args:
-            projectile_class: Clase del proyectil a crear
             x, y: Posición inicial
             velocity_x, velocity_y: Velocidad del proyectil
             damage: Daño que causa el proyectil
-            **kwargs: Argumentos adicionales específicos del proyectil
+            frames: Sprites de animación del proyectil
+            target: Luchador al que apunta (golpea al primer enemigo que toque)
         """
-        projectile = projectile_class(x, y, velocity_x, velocity_y, damage, **kwargs)
-        self.active_projectiles.append(projectile)
+        projectile = self.projectiles.spawn(projectiles.KIND_BASIC, self.player_number, target, x, y,
+                                            velocity_x, velocity_y, damage, width, height, self.team)
+        projectile.frames = tuple(frames)
         return projectile
-        
-    def update_projectiles(self, ground_level=550):
-        """Actualiza todos los proyectiles activos."""
-        remaining_projectiles = []
-        for projectile in self.active_projectiles:
-            projectile.update(ground_level)
-            if projectile.is_alive:
-                remaining_projectiles.append(projectile)
-        self.active_projectiles = remaining_projectiles
-        
-    def draw_projectiles(self, surface, camera_offset_x=0):
-        """Dibuja todos los proyectiles activos."""
-        for projectile in self.active_projectiles:
-            frame = projectile.get_current_frame()
-            if frame:
-                draw_x = int(projectile.x) + camera_offset_x
-                draw_y = int(projectile.y)
-                surface.blit(frame, (draw_x, draw_y))
-            # Eliminado el fallback de círculo blanco
 
     def load_individual_sprites(self):
         """
@@ -243,7 +263,19 @@ class Fighter:
                 'attack3': pygame.K_KP3
             }
 
-    def apply_damage(self, damage):
+    def receive_hit(self, damage, source=NO_FIGHTER):
+        """
+        Recibe un impacto directo (ataque cuerpo a cuerpo o proyectil).
+
+        Args:
+            damage (int): Daño bruto del impacto
+            source (int): player_number del atacante (NO_FIGHTER si se desconoce)
+        """
+        self.event_bus.emit(EVENT_HIT, self.player_number, source, damage)
+        self.apply_damage(damage, source)
+        self.is_hit = True
+
+    def apply_damage(self, damage, source=NO_FIGHTER):
         """
         Aplica daño al personaje de manera centralizada, considerando el escudo.
         
@@ -254,9 +286,11 @@ class Fighter:
         
         Args:
             damage (int): Cantidad de daño a aplicar
+            source (int): player_number del atacante (NO_FIGHTER para efectos de estado)
         """
         if damage <= 0 or not self.is_alive:
             return
+        bus = self.event_bus
         
         # Si el escudo está activo, aplicar distribución de daño
         if self.shield_active:
@@ -271,32 +305,35 @@ class Fighter:
                 self.shield_cooldown_timer = self.shield_cooldown_max  # Iniciar cooldown de 5 seg
                 # El daño restante del escudo también daña al personaje
                 character_damage += remaining_shield_damage
+                bus.emit(EVENT_SHIELD_ABSORB, self.player_number, source, shield_damage - remaining_shield_damage)
+                bus.emit(EVENT_SHIELD_BREAK, self.player_number, source)
             else:
                 # El escudo absorbe todo su daño asignado
                 self.shield_health -= shield_damage
+                bus.emit(EVENT_SHIELD_ABSORB, self.player_number, source, shield_damage)
             
             # Aplicar el daño total al personaje
             self.damage_taken += character_damage
         else:
             # Sin escudo: todo el daño va al personaje
+            character_damage = damage
             self.damage_taken += damage
+        self.last_damage_applied = character_damage
+        self.last_damage_timestamp = sim_clock.get_ticks()
+        bus.emit(EVENT_DAMAGE, self.player_number, source, character_damage)
         
         # Actualizar salud actual basada en daño total acumulado
         self.current_health = max(self.max_health - self.damage_taken, 0)
         if self.current_health <= 0:
             self.is_alive = False
+            bus.emit(EVENT_KO, self.player_number, source)
 
-    def apply_burn_effect(self, burn_damage, burn_duration_frames):
-        """Aplica un efecto de quemadura gradual."""
-        self.burn_damage_remaining = burn_damage
-        self.burn_timer = burn_duration_frames
-        self.burn_counter = 0
-    
-    def apply_bleeding_effect(self, bleeding_damage, bleeding_duration_frames):
-        """Aplica un efecto de sangrado gradual."""
-        self.bleeding_damage_remaining = bleeding_damage
-        self.bleeding_timer = bleeding_duration_frames
-        self.bleeding_counter = 0
+    def apply_status_effect(self, kind, damage, duration_ticks, source=NO_FIGHTER):
+        """Aplica un efecto de estado (STATUS_BURN, STATUS_BLEEDING, STATUS_STUN)."""
+        if not self.status_effects.apply(kind, damage, duration_ticks):
+            return False
+        self.event_bus.emit(EVENT_STATUS_APPLIED, self.player_number, source, damage, STATUS_KINDS.index(kind))
+        return True
 
     def activate_shield(self):
         """
@@ -328,6 +365,17 @@ class Fighter:
         """Retorna la velocidad de movimiento actual."""
         return self.base_movement_speed
 
+    def read_input_mask(self, target):
+        """
+        Obtiene la máscara de entrada de este frame.
+
+        Usa la fuente de entrada asignada si existe; en caso contrario
+        lee el teclado con los controles del jugador.
+        """
+        if self.input_source is not None:
+            return self.input_source(self, target)
+        return read_keyboard_mask(self.movement_controls, self.attack_controls)
+
     def move(self, screen_width, screen_height, surface, target, round_over):
         """
         Maneja el movimiento del personaje, incluyendo controles, física y colisiones.
@@ -337,123 +385,13 @@ class Fighter:
         - Escudo: Tecla sostenida para mantener escudo activo
         - Ataques: 3 botones de ataque (ejecutan si el escudo NO está activo)
         
-        NORMALIZACIÓN DE MOVIMIENTO DIAGONAL:
-        - Calcula la magnitud del vector de velocidad (x, y)
-        - Si la magnitud supera la velocidad máxima, normaliza ambas componentes
-        - Resultado: movimiento consistente en todas las direcciones
+        El tick de movimiento lo resuelve el núcleo común (movement.move_fighter)
+        con el perfil de movimiento del personaje (salto, gravedad, control
+        aéreo, escudo y sangrado) definido en characters.json.
         """
-        # Constantes de movimiento y física
-        MOVEMENT_SPEED = self.get_movement_speed()
-        GRAVITY_FORCE = 2
-        JUMP_STRENGTH = -30
-        
-        # Variables de movimiento para este frame
-        horizontal_delta = 0
-        vertical_delta = 0
-        
-        # Resetear estado de correr cada frame
-        self.is_running = False
-        if not self.is_attacking:
-            self.current_attack_type = 0
-        
-        # Obtener teclas presionadas actualmente
-        pressed_keys = pygame.key.get_pressed()
-        
-        # Solo permitir acciones si no está atacando, está vivo y la ronda no ha terminado
-        if not self.is_attacking and self.is_alive and not round_over:
-            # Procesamiento de movimiento horizontal
-            if pressed_keys[self.movement_controls['left']]:
-                horizontal_delta = -MOVEMENT_SPEED
-                self.is_running = True
-            if pressed_keys[self.movement_controls['right']]:
-                horizontal_delta = MOVEMENT_SPEED
-                self.is_running = True
-                
-            # Procesamiento de salto
-            if pressed_keys[self.movement_controls['jump']] and not self.is_jumping:
-                self.vertical_velocity = JUMP_STRENGTH
-                self.is_jumping = True
-                
-            # SISTEMA DE ESCUDO - Control por tecla sostenida
-            # - Se activa: mientras la tecla está presionada Y el cooldown ha expirado
-            # - Se desactiva: cuando se suelta la tecla (no por tiempo ni cooldown)
-            # - Cooldown comienza: cuando el escudo es destruido (se toma 300 frames de daño)
-            if pressed_keys[self.movement_controls['shield']]:
-                # Tecla presionada: intentar activar escudo
-                if not self.shield_active and self.shield_cooldown_timer <= 0:
-                    self.shield_active = True
-                    self.shield_health = self.shield_max_health
-            else:
-                # Tecla soltada: desactivar escudo (pero no cancela cooldown si está en progreso)
-                self.shield_active = False
-                
-            # Procesamiento de ataques - bloqueados mientras el escudo está activo
-            # Esto asegura que los jugadores tomen una decisión: atacar O defender
-            if not self.shield_active:
-                for attack_name, attack_key in self.attack_controls.items():
-                    if pressed_keys[attack_key]:
-                        self.execute_attack(target)
-                        if attack_name == 'attack1':
-                            self.current_attack_type = 1
-                        elif attack_name == 'attack2':
-                            self.current_attack_type = 2
-                        elif attack_name == 'attack3':
-                            self.current_attack_type = 3
-                        break
-        
-        # Aplicar gravedad a la velocidad vertical
-        self.vertical_velocity += GRAVITY_FORCE
-        vertical_delta += self.vertical_velocity
-        
-        # NORMALIZACIÓN DE MOVIMIENTO DIAGONAL
-        # Problema resuelto: Cuando el jugador presiona múltiples direcciones simultáneamente,
-        # la velocidad se acumulaba sin límite (diagonal más rápido que línea recta)
-        # 
-        # Solución: Calcular la magnitud del vector (horizontal_delta, vertical_delta)
-        # Si la magnitud > MOVEMENT_SPEED, reescalar ambas componentes proporcionalmente
-        # 
-        # Fórmula:
-        # magnitude = √(horizontal_delta² + vertical_delta²)
-        # normalized_horizontal = (horizontal_delta / magnitude) * MOVEMENT_SPEED
-        # 
-        # Nota: La gravedad se aplica por separado después de la normalización
-        # para mantener la física de salto sin alteraciones
-        if horizontal_delta != 0 and vertical_delta != 0:
-            import math
-            magnitude = math.sqrt(horizontal_delta**2 + vertical_delta**2)
-            # Mantener solo la componente horizontal normalizada
-            # La gravedad se aplica por separado
-            normalized_horizontal = (horizontal_delta / magnitude) * MOVEMENT_SPEED if magnitude > 0 else 0
-            horizontal_delta = normalized_horizontal
-            # Reaplicar la gravedad al componente vertical (independiente de normalización)
-            vertical_delta = self.vertical_velocity
-        
-        # Mantener personaje dentro de los límites de pantalla horizontalmente
-        if self.collision_rect.left + horizontal_delta < 0:
-            horizontal_delta = -self.collision_rect.left
-        if self.collision_rect.right + horizontal_delta > screen_width:
-            horizontal_delta = screen_width - self.collision_rect.right
-            
-        # Mantener personaje en el suelo
-        ground_level = screen_height - 50
-        if self.collision_rect.bottom + vertical_delta > ground_level:
-            self.vertical_velocity = 0
-            self.is_jumping = False
-            vertical_delta = ground_level - self.collision_rect.bottom
-        
-        # Hacer que los personajes se miren entre sí
-        if target.collision_rect.centerx > self.collision_rect.centerx:
-            self.flip_sprite = False
-        else:
-            self.flip_sprite = True
-        
-        # Procesar efectos de quemadura y sangrado
-        self.process_burn_effect()
-        self.process_bleeding_effect()
-        
-        # Actualizar posición final del personaje
-        self.collision_rect.x += horizontal_delta
-        self.collision_rect.y += vertical_delta
+        input_mask = self.read_input_mask(target)
+        move_fighter(self, self.movement_profile, self.get_movement_speed(), input_mask,
+                     target, screen_width, screen_height, round_over)
 
     def update(self, target=None):
         """Actualiza las animaciones y estados del personaje cada frame."""
@@ -467,12 +405,9 @@ class Fighter:
         elif self.is_hit:
             self.update_current_action(6)  # 6: animación de ser golpeado
         elif self.is_attacking:
-            if self.current_attack_type == 1:
-                self.update_current_action(3)  # 3: primer ataque
-            elif self.current_attack_type == 2:
-                self.update_current_action(4)  # 4: segundo ataque
-            elif self.current_attack_type == 3:
-                self.update_current_action(5)  # 5: tercer ataque
+            attack_action = ATTACK_ACTIONS[self.current_attack_type]  # 3, 4 o 5 según el ataque
+            if attack_action is not None:
+                self.update_current_action(attack_action)
             self.attack_frame_counter += 1
         elif self.is_jumping:
             self.update_current_action(2)  # 2: animación de salto
@@ -485,7 +420,7 @@ class Fighter:
         animation_frame_duration = 50
         self.current_image = self.animation_list[self.current_action][self.frame_index]
         
-        current_time = pygame.time.get_ticks()
+        current_time = sim_clock.get_ticks()
         if current_time - self.last_update_time > animation_frame_duration:
             self.frame_index += 1
             self.last_update_time = current_time
@@ -494,23 +429,24 @@ class Fighter:
                 self.check_collision_with_target(target)
             
         # Verificar si la animación ha completado todos sus frames
-        if self.frame_index >= len(self.animation_list[self.current_action]):
+        animation_length = self.character_table.animation_lengths[self.current_action]
+        if self.frame_index >= animation_length:
             if not self.is_alive:
-                self.frame_index = len(self.animation_list[self.current_action]) - 1
+                self.frame_index = animation_length - 1
                 self.death_animation_done = True
             else:
                 self.frame_index = 0
                 
                 if self.current_action in [3, 4, 5]:  # Cualquiera de los 3 ataques
                     self.is_attacking = False
-                    self.attack_cooldown_timer = 20
+                    self.attack_cooldown_timer = self.character_table.attack_end_cooldown
                     self.attack_has_hit = False
                     self.attack_frame_counter = 0
                     
                 if self.current_action == 6:
                     self.is_hit = False
                     self.is_attacking = False
-                    self.attack_cooldown_timer = 20
+                    self.attack_cooldown_timer = self.character_table.attack_end_cooldown
 
         # Decrementar el cooldown de ataque
         if self.attack_cooldown_timer > 0:
@@ -518,9 +454,6 @@ class Fighter:
             
         # Actualizar estado del escudo
         self.update_shield()
-
-        # Actualizar proyectiles
-        self.update_projectiles()
         
         # Hook para clases hijas
         if hasattr(self, 'post_update_hook'):
@@ -530,82 +463,50 @@ class Fighter:
         """Ejecuta un ataque contra el objetivo si no hay cooldown activo."""
         if self.attack_cooldown_timer == 0:
             self.is_attacking = True
-            self.attack_sound_effect.play()
+            if self.attack_sound_effect:
+                self.attack_sound_effect.play()
             self.attack_has_hit = False
             self.attack_frame_counter = 0
-            if hasattr(self, 'attack2_frames_hit_record'):
-                self.attack2_frames_hit_record.clear()
-
-    def process_burn_effect(self):
-        """Procesa los efectos de quemadura aplicados al personaje."""
-        if self.burn_timer > 0:
-            self.burn_counter += 1
-            
-            if self.burn_counter >= self.burn_interval:
-                damage_per_interval = max(1, self.burn_damage_remaining // (self.burn_timer // self.burn_interval)) if self.burn_timer >= self.burn_interval else self.burn_damage_remaining
-                
-                if damage_per_interval > 0:
-                    self.apply_damage(damage_per_interval)
-                    self.burn_damage_remaining -= damage_per_interval
-                
-                self.burn_counter = 0
-                
-            self.burn_timer -= 1
-            
-            if self.burn_timer <= 0 or self.burn_damage_remaining <= 0:
-                self.burn_timer = 0
-                self.burn_damage_remaining = 0
-    
-    def process_bleeding_effect(self):
-        """Procesa los efectos de sangrado aplicados al personaje."""
-        if self.bleeding_timer > 0:
-            self.bleeding_counter += 1
-            
-            if self.bleeding_counter >= self.bleeding_interval:
-                damage_per_interval = max(1, self.bleeding_damage_remaining // (self.bleeding_timer // self.bleeding_interval)) if self.bleeding_timer >= self.bleeding_interval else self.bleeding_damage_remaining
-                
-                if damage_per_interval > 0:
-                    self.apply_damage(damage_per_interval)
-                    self.bleeding_damage_remaining -= damage_per_interval
-                
-                self.bleeding_counter = 0
-                
-            self.bleeding_timer -= 1
-            
-            if self.bleeding_timer <= 0 or self.bleeding_damage_remaining <= 0:
-                self.bleeding_timer = 0
-                self.bleeding_damage_remaining = 0
-                self.burn_counter = 0
+            self.attack_hits_dealt.clear()
+            # Cooldown inicial propio del personaje (Tank, Trapper), si lo define
+            if self.character_table.start_cooldown is not None:
+                self.attack_cooldown_timer = self.character_table.start_cooldown
 
     def update_current_action(self, new_action):
         """Actualiza la acción actual del personaje si es diferente a la anterior."""
         if new_action != self.current_action:
             self.current_action = new_action
             self.frame_index = 0
-            self.last_update_time = pygame.time.get_ticks()
+            self.last_update_time = sim_clock.get_ticks()
 
     def draw(self, surface, camera_offset_x=0, show_hitboxes=False):
-        """Dibuja el personaje en la superficie especificada."""
+        """
+        Dibuja el personaje en la superficie especificada (una Surface o una
+        RenderQueue: el dibujo del luchador solo usa blit).
+        """
         actual_flip = self.flip_sprite
         if hasattr(self, 'sprites_inverted') and self.sprites_inverted:
             actual_flip = not self.flip_sprite
         
-        final_image = pygame.transform.flip(self.current_image, actual_flip, False)
-        
-        sprite_width = self.current_image.get_width()
-        sprite_height = self.current_image.get_height()
-        
-        draw_x = self.collision_rect.centerx - (sprite_width // 2) + camera_offset_x
-        draw_y = self.collision_rect.bottom - sprite_height + 20
-        
-        surface.blit(final_image, (draw_x, draw_y))
+        self.draw_sprite(surface, self.current_image, actual_flip, camera_offset_x)
         
         # Dibujar escudo si está activo
         if self.shield_active:
             self.draw_shield(surface, camera_offset_x)
+
+    def draw_sprite(self, surface, image, flip, camera_offset_x=0):
+        """
+        Dibuja un frame centrado en la hitbox y apoyado en su borde inferior.
+        La posición se calcula en unidades del mundo y se convierte a la
+        resolución interna (el frame ya está a esa resolución).
+        """
+        # Sin volteo se dibuja el sprite tal cual (flip siempre crea una copia)
+        final_image = pygame.transform.flip(image, True, False) if flip else image
+        
+        draw_x = to_render(self.collision_rect.centerx + camera_offset_x) - image.get_width() // 2
+        draw_y = to_render(self.collision_rect.bottom + 20) - image.get_height()
         
-        # Dibujar proyectiles
-        self.draw_projectiles(surface, camera_offset_x)
+        surface.blit(final_image, (draw_x, draw_y))
 
     def draw_shield(self, surface, camera_offset_x=0):
         """
@@ -630,81 +531,184 @@ class Fighter:
         # Esto asegura proporcionalidad independientemente del tamaño del sprite
         hitbox_width = self.collision_rect.width
         hitbox_height = self.collision_rect.height
-        shield_radius = max(hitbox_width, hitbox_height) // 2  # Radio proporcional a la hitbox
-        
-        # Opacidad fija y transparente (30% de opacidad = 76/255)
-        shield_opacity = 76
-        
-        # Crear una superficie con canal alfa para el escudo
-        shield_surface = pygame.Surface((shield_radius * 2, shield_radius * 2), pygame.SRCALPHA)
-        
-        # Color celeste transparente (consistente, no basado en vida)
-        shield_color = (100, 200, 255, shield_opacity)
-        
-        # Dibujar círculo del escudo
-        pygame.draw.circle(shield_surface, shield_color, (shield_radius, shield_radius), shield_radius)
-        
-        # Dibujar borde del escudo (más oscuro, pero también transparente)
-        border_color = (50, 150, 255, int(shield_opacity * 1.5))
-        pygame.draw.circle(shield_surface, border_color, (shield_radius, shield_radius), shield_radius, 2)
+        shield_radius = to_render(max(hitbox_width, hitbox_height) // 2)  # Radio proporcional a la hitbox
+        center_x = to_render(self.collision_rect.centerx + camera_offset_x)
+        center_y = to_render(self.collision_rect.centery)
+
+        # Calidad mínima: solo el borde, con color clave en lugar de mezcla alfa
+        if not render_quality.shield_alpha:
+            outline = self.shield_outline_surface
+            if outline is None:
+                outline = pygame.Surface((shield_radius * 2, shield_radius * 2))
+                outline.set_colorkey((0, 0, 0))
+                pygame.draw.circle(outline, (50, 150, 255), (shield_radius, shield_radius), shield_radius, 2)
+                self.shield_outline_surface = outline
+            surface.blit(outline, (center_x - shield_radius, center_y - shield_radius))
+            return
         
-        # Posición del escudo (centrado en el sprite del personaje)
-        shield_x = self.collision_rect.centerx - shield_radius + camera_offset_x
-        shield_y = self.collision_rect.centery - shield_radius
+        # La esfera no cambia durante el combate: se crea una vez y se reutiliza
+        shield_surface = self.shield_surface
+        if shield_surface is None:
+            # Opacidad fija y transparente (30% de opacidad = 76/255)
+            shield_opacity = 76
+
+            # Crear una superficie con canal alfa para el escudo
+            shield_surface = pygame.Surface((shield_radius * 2, shield_radius * 2), pygame.SRCALPHA)
+
+            # Color celeste transparente (consistente, no basado en vida)
+            shield_color = (100, 200, 255, shield_opacity)
+
+            # Dibujar círculo del escudo
+            pygame.draw.circle(shield_surface, shield_color, (shield_radius, shield_radius), shield_radius)
+
+            # Dibujar borde del escudo (más oscuro, pero también transparente)
+            border_color = (50, 150, 255, int(shield_opacity * 1.5))
+            pygame.draw.circle(shield_surface, border_color, (shield_radius, shield_radius), shield_radius, 2)
+            self.shield_surface = shield_surface
         
-        # Blit del escudo a la superficie principal
-        surface.blit(shield_surface, (int(shield_x), int(shield_y)))
+        # Blit del escudo centrado en el sprite del personaje
+        surface.blit(shield_surface, (center_x - shield_radius, center_y - shield_radius))
 
     def draw_hitbox(self, surface, show_attack_area=False, camera_offset_x=0):
         """Dibuja la hitbox del personaje y opcionalmente el área de ataque."""
-        # Dibujar hitbox del personaje
-        adjusted_rect = pygame.Rect(
-            self.collision_rect.x + camera_offset_x,
-            self.collision_rect.y,
-            self.collision_rect.width,
-            self.collision_rect.height
-        )
+        # Dibujar hitbox del personaje (display_rect se reutiliza para ambos rectángulos)
+        adjusted_rect = self.display_rect
+        adjusted_rect.update(self.collision_rect)
+        adjusted_rect.x += camera_offset_x
         pygame.draw.rect(surface, (0, 255, 0), adjusted_rect, 2)
         
         # Dibujar área de ataque si está atacando
         if show_attack_area and self.is_attacking:
-            attack_area = self.get_attack_area_for_display(self.current_attack_type)
+            attack_area = self.get_attack_area_for_display(self.current_attack_type, adjusted_rect)
             if attack_area:
-                adjusted_attack_area = pygame.Rect(
-                    attack_area.x + camera_offset_x,
-                    attack_area.y,
-                    attack_area.width,
-                    attack_area.height
-                )
-                pygame.draw.rect(surface, (255, 0, 0), adjusted_attack_area, 2)
-
-    # Métodos que deben ser implementados por las clases hijas
+                attack_area.x += camera_offset_x
+                pygame.draw.rect(surface, (255, 0, 0), attack_area, 2)
+
+    # Reglas de ataque basadas en la tabla compilada del personaje
     def get_attack_area(self):
-        """Retorna el área de ataque actual. Debe ser implementado por clases hijas."""
-        return None
+        """
+        Retorna el área de ataque actual (None si no ataca o el ataque no tiene área).
+
+        Es siempre el mismo Rect (attack_rect) actualizado en el sitio: sirve
+        hasta el siguiente tick; quien necesite conservarlo debe copiarlo.
+        """
+        if not self.is_attacking:
+            return None
+        return self.get_attack_area_for_display(self.current_attack_type, self.attack_rect)
         
-    def get_attack_area_for_display(self, attack_type):
-        """Retorna el área de ataque para visualización. Debe ser implementado por clases hijas."""
-        return None
+    def get_attack_area_for_display(self, attack_type, rect=None):
+        """
+        Construye el área de un tipo de ataque a partir de la tabla del personaje.
+
+        Args:
+            rect (pygame.Rect): Rect en el que escribir el área (por defecto uno nuevo)
+        """
+        area = self.character_table.area[attack_type]
+        if area is None:
+            return None
+        attack_width, attack_height, y_offset, anchor, gap, centered = area
+
+        if anchor == ANCHOR_CENTER:
+            attack_x = self.collision_rect.centerx - (attack_width // 2)
+        elif self.flip_sprite:
+            attack_x = self.collision_rect.centerx - attack_width - gap
+        else:
+            attack_x = self.collision_rect.centerx + gap
+
+        if centered:
+            attack_y = self.collision_rect.centery - attack_height // 2 + y_offset
+        else:
+            attack_y = self.collision_rect.y + y_offset
+        if attack_height is None:
+            # Área que llega hasta el suelo
+            attack_height = 550 - attack_y + 20
+        if rect is None:
+            return pygame.Rect(attack_x, attack_y, attack_width, attack_height)
+        rect.update(attack_x, attack_y, attack_width, attack_height)
+        return rect
         
     def calculate_attack_damage(self):
-        """Calcula el daño del ataque actual. Debe ser implementado por clases hijas."""
-        return 10
+        """Calcula el daño del ataque actual (en multi-hit, el del frame actual)."""
+        table = self.character_table
+        attack_type = self.current_attack_type
+        if table.hit_kind[attack_type] == HIT_MULTI:
+            hit_index = table.multi_hit_index(attack_type, self.frame_index)
+            return table.hit_damages[attack_type][hit_index] if hit_index >= 0 else 0
+        return table.damage[attack_type]
         
     def check_collision_with_target(self, target):
-        """Verifica colisión con el objetivo. Puede ser sobrescrito por clases hijas."""
+        """
+        Verifica colisión con el objetivo según la tabla del personaje.
+
+        - once_from / once_at: un impacto desde / exactamente en el frame de impacto
+        - multi: un impacto por cada frame de impacto definido
+        - trap / projectile: dispara trigger_attack en el frame de impacto
+        Los demás tipos (lluvia, sacrificio) se gestionan en las clases hijas.
+        """
+        if not self.is_attacking or not self.is_alive or not target.is_alive:
+            return
+
+        table = self.character_table
+        attack_type = self.current_attack_type
+        hit_kind = table.hit_kind[attack_type]
+        hit_frame = table.hit_frame[attack_type]
+
+        if hit_kind in TRIGGER_HITS:
+            if self.frame_index == hit_frame and not self.attack_has_hit:
+                self.trigger_attack(hit_kind, target)
+                self.attack_has_hit = True
+            return
+
         attack_area = self.get_attack_area()
         if attack_area is None:
             return
-            
-        if not attack_area.colliderect(target.collision_rect):
-            return
-            
-        if self.attack_has_hit:
+        self.collision_world.add(attack_area, self, LAYER_ATTACK)
+        if target not in self.collision_world.fighters_touching(attack_area):
             return
-            
-        damage = self.calculate_attack_damage()
-        if damage > 0:
-            target.apply_damage(damage)
-            target.is_hit = True
-            self.attack_has_hit = True
\ No newline at end of file
+
+        if hit_kind == HIT_MULTI:
+            hit_index = table.multi_hit_index(attack_type, self.frame_index)
+            if hit_index < 0 or hit_index in self.attack_hits_dealt:
+                return
+            self.attack_hits_dealt.add(hit_index)
+            is_last_hit = hit_index == len(table.hit_frames[attack_type]) - 1
+            self.apply_attack_hit(target, table.hit_damages[attack_type][hit_index],
+                                  not table.status_on_last_hit[attack_type] or is_last_hit)
+        elif not self.attack_has_hit:
+            if hit_kind == HIT_ONCE_FROM and self.frame_index >= hit_frame or \
+                    hit_kind == HIT_ONCE_AT and self.frame_index == hit_frame:
+                self.apply_attack_hit(target, table.damage[attack_type])
+                self.attack_has_hit = True
+
+    def apply_attack_hit(self, target, damage, apply_status=True):
+        """Aplica daño, efecto de estado y empuje del ataque actual al objetivo."""
+        target.receive_hit(damage, self.player_number)
+
+        status = self.character_table.status[self.current_attack_type]
+        if status and apply_status:
+            target.apply_status_effect(*status, source=self.player_number)
+
+        knockback = self.character_table.knockback[self.current_attack_type]
+        if knockback:
+            self.apply_knockback(target, knockback)
+
+    def apply_knockback(self, target, knockback_force):
+        """Empuja al objetivo en la dirección en la que mira el atacante."""
+        if self.flip_sprite:
+            # Empujar hacia la izquierda
+            target.collision_rect.x -= knockback_force
+        else:
+            # Empujar hacia la derecha
+            target.collision_rect.x += knockback_force
+        
+        # Asegurar que el enemigo no salga de los límites de pantalla
+        if target.collision_rect.left < 0:
+            target.collision_rect.left = 0
+        elif target.collision_rect.right > 1400:  # SCREEN_WIDTH
+            target.collision_rect.right = 1400
+        # La hurtbox cambió de celda posiblemente: reindexar antes de la próxima consulta
+        self.collision_world.invalidate()
+
+    def trigger_attack(self, hit_kind, target):
+        """Ataques sin área de contacto (trampas, proyectiles). Implementado por clases hijas."""
+        pass
\ No newline at end of file
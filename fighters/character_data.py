@@ -0,0 +1,207 @@
+"""
+Definiciones de personajes basadas en datos.
+
+Las estadísticas, perfiles de movimiento, inmunidades a efectos de estado,
+hitboxes, áreas de ataque, daños, fracciones de frames de impacto y
+cooldowns de cada personaje viven en
+characters.json, junto con los metadatos del registro de personajes (clase,
+módulo, previsualización y sonido; ver registry). Al cargar
+las animaciones de un luchador, su definición se compila a tablas planas
+indexadas por tipo de ataque (0 = sin ataque, 1-3) que Fighter consulta en
+cada tick en lugar de ramificar por current_attack_type.
+
+Los valores que empiezan por "@" hacen referencia a un atributo de la
+sección "attributes" del mismo personaje (por ejemplo
+"@massive_knockback_force"), de modo que cada constante se define una sola
+vez.
+"""
+
+import json
+import os
+
+from .movement import MovementProfile
+from .status_effects import STATUS_KINDS
+
+CHARACTERS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'characters.json')
+
+# Tipos de impacto de los ataques
+HIT_NONE = 'none'              # Sin daño por contacto
+HIT_ONCE_FROM = 'once_from'    # Un impacto a partir de un frame
+HIT_ONCE_AT = 'once_at'        # Un impacto exactamente en un frame
+HIT_MULTI = 'multi'            # Varios impactos en frames concretos
+HIT_TRAP = 'trap'              # Coloca una trampa (Trapper)
+HIT_PROJECTILE = 'projectile'  # Dispara un proyectil (Trapper)
+HIT_RAIN = 'rain'              # Lluvia de gotas de lava (Slime Demon)
+HIT_SACRIFICE = 'sacrifice'    # Explosión de auto-sacrificio (Slime Demon)
+
+# Tipos que se disparan en un frame sin área de contacto
+TRIGGER_HITS = (HIT_TRAP, HIT_PROJECTILE)
+
+# Anclaje de las áreas de ataque
+ANCHOR_FRONT = 'front'          # Desde centerx hacia donde mira
+ANCHOR_CENTER = 'center'        # Centrada en centerx
+ANCHOR_FRONT_GAP = 'front_gap'  # Frontal con separación "gap" respecto a centerx
+
+# Acción de animación de cada tipo de ataque
+ATTACK_ACTIONS = (None, 3, 4, 5)
+
+_raw_data = None
+_compiled_cache = {}
+
+
+def load_character_data(path=None):
+    """Lee el fichero de personajes (cacheado tras la primera lectura)."""
+    global _raw_data
+    if path is not None:
+        with open(path, 'r', encoding='utf-8') as data_file:
+            return json.load(data_file)
+    if _raw_data is None:
+        with open(CHARACTERS_FILE, 'r', encoding='utf-8') as data_file:
+            _raw_data = json.load(data_file)
+    return _raw_data
+
+
+def get_character_definition(character_key):
+    """
+    Devuelve la definición de un personaje combinada con los valores por defecto.
+
+    Args:
+        character_key (str): Clave del personaje en characters.json (p. ej. "tank")
+    """
+    data = load_character_data()
+    if character_key not in data['characters']:
+        raise KeyError(f"Personaje no definido en characters.json: {character_key}")
+    definition = dict(data['defaults'])
+    definition.update(data['characters'][character_key])
+    # El perfil de movimiento se combina campo a campo con el de por defecto
+    definition['movement'] = dict(data['defaults']['movement'], **data['characters'][character_key].get('movement', {}))
+    definition['key'] = character_key
+    return definition
+
+
+def character_keys():
+    """Claves de todos los personajes definidos, en el orden del fichero."""
+    return list(load_character_data()['characters'])
+
+
+class CompiledCharacter:
+    """
+    Tablas planas de un personaje, listas para consultas O(1) por tick.
+
+    Las listas por ataque tienen 4 posiciones (índice = current_attack_type).
+    """
+    def __init__(self, definition, animation_lengths):
+        self.key = definition['key']
+        self.class_name = definition.get('class')
+        self.display_name = definition.get('display_name', self.key)
+        self.attributes = dict(definition.get('attributes', {}))
+        self.animation_lengths = tuple(animation_lengths)
+
+        sprite = definition.get('sprite')
+        self.sprite_data = [sprite['size'], sprite['scale'], list(sprite['offset'])] if sprite else None
+        self.max_health = definition['max_health']
+        self.movement_speed = definition['movement_speed']
+        self.jump_strength = definition['jump_strength']
+        movement = definition['movement']
+        self.movement_profile = MovementProfile(self.jump_strength, movement['gravity'], movement['air_control'],
+                                                movement['shield_input'])
+        self.status_immunities = frozenset(definition['status_immunities'])
+        unknown = self.status_immunities.difference(STATUS_KINDS)
+        if unknown:
+            raise ValueError(f"{self.key}: efectos de estado desconocidos en status_immunities: {sorted(unknown)}")
+        self.hitbox_width = definition['hitbox']['width']
+        self.hitbox_height = definition['hitbox']['height']
+        self.sprites_inverted = definition['sprites_inverted']
+        self.shield_max_health = definition['shield_max_health']
+        self.shield_cooldown = definition['shield_cooldown']
+        self.attack_end_cooldown = definition['attack_end_cooldown']
+        self.start_cooldown = self._resolve(definition.get('start_cooldown'))
+
+        self.hit_kind = [HIT_NONE] * 4
+        self.damage = [0] * 4
+        self.knockback = [0] * 4
+        self.status = [None] * 4            # (tipo, daño, duración) o None
+        self.status_on_last_hit = [False] * 4
+        self.hit_frame = [0] * 4            # Frame de impacto (once_from/once_at/trap/...)
+        self.hit_frames = [()] * 4          # Frames de impacto múltiples
+        self.hit_damages = [()] * 4         # Daño de cada impacto múltiple
+        self.area = [None] * 4              # Ver _compile_area
+        self.multi_hit_lookup = [()] * 4    # Frame -> índice de impacto múltiple (o -1)
+        for attack_key, attack in definition.get('attacks', {}).items():
+            self._compile_attack(int(attack_key), attack)
+
+    def _resolve(self, value):
+        """Sustituye las referencias "@atributo" por su valor."""
+        if isinstance(value, str) and value.startswith('@'):
+            return self.attributes[value[1:]]
+        return value
+
+    def _frame(self, fraction, total_frames):
+        numerator, denominator = fraction
+        return (numerator * total_frames) // denominator
+
+    def _compile_attack(self, attack_type, attack):
+        total_frames = self.animation_lengths[ATTACK_ACTIONS[attack_type]]
+        self.hit_kind[attack_type] = attack['hit']
+        self.damage[attack_type] = self._resolve(attack.get('damage', 0))
+        self.knockback[attack_type] = self._resolve(attack.get('knockback', 0))
+        if 'frame' in attack:
+            self.hit_frame[attack_type] = self._frame(attack['frame'], total_frames)
+
+        if 'hits' in attack:
+            # Base "last": fracciones del último frame (como el ataque 2 del Warrior)
+            basis = total_frames - 1 if attack.get('frame_basis') == 'last' else total_frames
+            frames, damages = [], []
+            for hit in attack['hits']:
+                frame = self._frame(hit['frame'], basis)
+                # Los impactos deben quedar en frames estrictamente crecientes
+                if frames and frame <= frames[-1]:
+                    frame = frames[-1] + 1
+                frames.append(frame)
+                damages.append(self._resolve(hit['damage']))
+            self.hit_frames[attack_type] = tuple(frames)
+            self.hit_damages[attack_type] = tuple(damages)
+            self.multi_hit_lookup[attack_type] = tuple(
+                frames.index(frame) if frame in frames else -1 for frame in range(total_frames))
+            self.damage[attack_type] = damages[0]
+
+        status = attack.get('status')
+        if status:
+            self.status[attack_type] = (status['type'], status['damage'], status['duration'])
+            self.status_on_last_hit[attack_type] = status.get('on') == 'last_hit'
+
+        if 'area' in attack:
+            self.area[attack_type] = self._compile_area(attack['area'])
+
+    def _compile_area(self, area):
+        """
+        Compila un área a (ancho, alto, desplazamiento_y, anclaje, separación,
+        centrada_verticalmente). Un alto None significa "hasta el suelo".
+        """
+        if 'width_scale' in area:
+            width = int(self.hitbox_width * area['width_scale'])
+        else:
+            width = area['width']
+        height = None if area['height'] == 'to_ground' else area['height']
+        return (width, height, area.get('y_offset', 0), area.get('anchor', ANCHOR_FRONT),
+                area.get('gap', 0), area.get('y_anchor') == 'center')
+
+    def multi_hit_index(self, attack_type, frame_index):
+        """Índice del impacto múltiple que corresponde a un frame (o -1)."""
+        lookup = self.multi_hit_lookup[attack_type]
+        return lookup[frame_index] if frame_index < len(lookup) else -1
+
+
+def compile_character(character_key, animation_lengths):
+    """
+    Compila (o recupera de la caché) las tablas de un personaje.
+
+    Args:
+        character_key (str): Clave del personaje
+        animation_lengths: Número de frames de cada acción (0-7)
+    """
+    cache_key = (character_key, tuple(animation_lengths))
+    if cache_key not in _compiled_cache:
+        _compiled_cache[cache_key] = CompiledCharacter(get_character_definition(character_key),
+                                                       animation_lengths)
+    return _compiled_cache[cache_key]
@@ -0,0 +1,172 @@
+"""
+Bus de eventos de combate (impactos, daño, escudo, efectos de estado, KO).
+
+Los luchadores y sus proyectiles publican eventos tipados en un buffer
+circular preasignado; HUD, audio, repeticiones, estadísticas o red los
+consumen con su propio cursor, sin acoplarse a quién aplicó el daño.
+
+Cada evento ocupa una ranura de varias listas paralelas (tipo, tiempo,
+objetivo, origen, cantidad, detalle), por lo que publicar un evento no crea
+ningún objeto. Si un consumidor se queda más de `capacity` eventos atrás,
+pierde los más antiguos (se contabilizan en EventCursor.lost).
+
+Uso típico de un consumidor:
+    cursor = bus.cursor()
+    ...
+    for sequence in cursor.poll():
+        slot = sequence & bus.mask
+        if bus.kind[slot] == EVENT_KO:
+            ...
+"""
+
+from . import sim_clock
+
+# Tipos de evento
+EVENT_HIT = 0             # Un ataque o proyectil conectó (amount = daño bruto)
+EVENT_DAMAGE = 1          # Salud perdida por el objetivo (amount = daño a la salud)
+EVENT_SHIELD_ABSORB = 2   # Daño absorbido por el escudo (amount)
+EVENT_SHIELD_BREAK = 3    # El escudo se rompió
+EVENT_STATUS_APPLIED = 4  # Efecto de estado aplicado (detail = índice en STATUS_KINDS, amount = daño)
+EVENT_KO = 5              # El objetivo ha caído
+EVENT_NAMES = ('hit', 'damage', 'shield_absorb', 'shield_break', 'status_applied', 'ko')
+
+# Luchador desconocido o sin origen (daño de efectos de estado)
+NO_FIGHTER = 0
+
+DEFAULT_CAPACITY = 256
+
+
+class CombatEventBus:
+    """
+    Buffer circular de eventos de combate.
+
+    Args:
+        capacity (int): Número de ranuras (se redondea a potencia de dos)
+    """
+    __slots__ = ('capacity', 'mask', 'head', 'kind', 'time_ms', 'target', 'source', 'amount', 'detail')
+
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        size = 1
+        while size < capacity:
+            size *= 2
+        self.capacity = size
+        self.mask = size - 1
+        self.head = 0                 # Eventos publicados desde el último clear()
+        self.kind = [0] * size
+        self.time_ms = [0] * size
+        self.target = [NO_FIGHTER] * size
+        self.source = [NO_FIGHTER] * size
+        self.amount = [0] * size
+        self.detail = [0] * size
+
+    def emit(self, kind, target, source, amount=0, detail=0):
+        """
+        Publica un evento.
+
+        Args:
+            kind (int): Tipo de evento (EVENT_*)
+            target (int): player_number del luchador afectado
+            source (int): player_number del atacante o NO_FIGHTER
+        """
+        slot = self.head & self.mask
+        self.kind[slot] = kind
+        self.time_ms[slot] = sim_clock.get_ticks()
+        self.target[slot] = target
+        self.source[slot] = source
+        self.amount[slot] = amount
+        self.detail[slot] = detail
+        self.head += 1
+
+    def clear(self):
+        """Descarta todos los eventos (los cursores existentes se reinician solos)."""
+        self.head = 0
+
+    def cursor(self):
+        """Crea un cursor de consumidor situado en el evento más reciente."""
+        return EventCursor(self)
+
+    def describe(self, sequence):
+        """Evento como tupla legible (para depuración y volcados)."""
+        slot = sequence & self.mask
+        return (EVENT_NAMES[self.kind[slot]], self.time_ms[slot], self.target[slot],
+                self.source[slot], self.amount[slot], self.detail[slot])
+
+
+class EventCursor:
+    """Posición de lectura de un consumidor en un CombatEventBus."""
+    __slots__ = ('bus', 'position', 'lost')
+
+    def __init__(self, bus):
+        self.bus = bus
+        self.position = bus.head
+        self.lost = 0  # Eventos sobrescritos antes de leerse
+
+    def poll(self):
+        """
+        Devuelve el rango de números de secuencia pendientes y los marca como leídos.
+        La ranura de cada evento es `sequence & bus.mask`.
+        """
+        head = self.bus.head
+        start = self.position
+        if start > head:
+            # El bus se vació con clear()
+            start = 0
+        oldest = head - self.bus.capacity
+        if start < oldest:
+            self.lost += oldest - start
+            start = oldest
+        self.position = head
+        return range(start, head)
+
+
+class CombatStats:
+    """
+    Consumidor de estadísticas por luchador (golpes, daño, escudo, efectos, KO).
+
+    Args:
+        bus (CombatEventBus): Bus del que leer
+    """
+    def __init__(self, bus):
+        self.bus = bus
+        self.events = bus.cursor()
+        self.per_fighter = {}
+
+    def _entry(self, player_number):
+        entry = self.per_fighter.get(player_number)
+        if entry is None:
+            entry = self.per_fighter[player_number] = {
+                'hits_landed': 0, 'damage_dealt': 0, 'damage_taken': 0, 'shield_absorbed': 0,
+                'shield_breaks': 0, 'statuses_applied': 0, 'ko': False,
+            }
+        return entry
+
+    def consume(self):
+        """Procesa los eventos pendientes del bus."""
+        bus = self.bus
+        for sequence in self.events.poll():
+            slot = sequence & bus.mask
+            kind = bus.kind[slot]
+            target = bus.target[slot]
+            source = bus.source[slot]
+            amount = bus.amount[slot]
+            if kind == EVENT_HIT:
+                self._entry(source)['hits_landed'] += 1
+            elif kind == EVENT_DAMAGE:
+                self._entry(target)['damage_taken'] += amount
+                self._entry(source)['damage_dealt'] += amount
+            elif kind == EVENT_SHIELD_ABSORB:
+                self._entry(target)['shield_absorbed'] += amount
+            elif kind == EVENT_SHIELD_BREAK:
+                self._entry(target)['shield_breaks'] += 1
+            elif kind == EVENT_STATUS_APPLIED:
+                self._entry(source)['statuses_applied'] += 1
+            elif kind == EVENT_KO:
+                self._entry(target)['ko'] = True
+
+    def as_dict(self):
+        """Estadísticas por player_number (NO_FIGHTER = daño sin origen)."""
+        return {player_number: dict(entry) for player_number, entry in sorted(self.per_fighter.items())}
+
+
+# Bus por defecto compartido por los luchadores que no reciben uno propio
+default_bus = CombatEventBus()
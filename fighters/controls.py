@@ -0,0 +1,60 @@
+"""
+Capa de entrada de los luchadores basada en máscaras de bits.
+
+Cada frame el luchador obtiene una máscara entera con las acciones
+solicitadas. En el juego la máscara se construye a partir del teclado;
+en simulaciones y bots la produce cualquier fuente que devuelva un
+entero con los mismos bits.
+"""
+
+import pygame
+
+INPUT_NONE = 0
+INPUT_LEFT = 1 << 0
+INPUT_RIGHT = 1 << 1
+INPUT_JUMP = 1 << 2
+INPUT_SHIELD = 1 << 3
+INPUT_ATTACK1 = 1 << 4
+INPUT_ATTACK2 = 1 << 5
+INPUT_ATTACK3 = 1 << 6
+
+# Bits de ataque en orden de prioridad (attack1 primero, como en el teclado)
+INPUT_ATTACKS = (INPUT_ATTACK1, INPUT_ATTACK2, INPUT_ATTACK3)
+
+# Relación entre los nombres de control de cada luchador y sus bits
+MOVEMENT_BITS = {
+    'left': INPUT_LEFT,
+    'right': INPUT_RIGHT,
+    'jump': INPUT_JUMP,
+    'shield': INPUT_SHIELD
+}
+ATTACK_BITS = {
+    'attack1': INPUT_ATTACK1,
+    'attack2': INPUT_ATTACK2,
+    'attack3': INPUT_ATTACK3
+}
+
+
+def read_keyboard_mask(movement_controls, attack_controls, pressed_keys=None):
+    """
+    Construye la máscara de entrada a partir del estado del teclado.
+
+    Args:
+        movement_controls (dict): Nombre de control -> tecla de pygame
+        attack_controls (dict): Nombre de ataque -> tecla de pygame
+        pressed_keys: Resultado de pygame.key.get_pressed() (opcional)
+
+    Returns:
+        int: Máscara con los bits INPUT_* activos
+    """
+    if pressed_keys is None:
+        pressed_keys = pygame.key.get_pressed()
+
+    mask = INPUT_NONE
+    for control_name, key in movement_controls.items():
+        if pressed_keys[key]:
+            mask |= MOVEMENT_BITS[control_name]
+    for attack_name, key in attack_controls.items():
+        if pressed_keys[key]:
+            mask |= ATTACK_BITS[attack_name]
+    return mask
@@ -0,0 +1,296 @@
+"""
+Oponente controlado por la CPU basado en reglas.
+
+Un CpuController es una fuente de entrada más (Fighter.input_source): cada
+tick recibe al luchador y a su objetivo y devuelve la misma máscara INPUT_*
+que produciría el teclado, así que el movimiento, los cooldowns y las reglas
+de ataque son exactamente las del jugador humano.
+
+El controlador decide cada `reaction_ticks` ticks (según la dificultad) y
+mantiene la última máscara entre decisiones, como quien deja pulsada una
+tecla. Lo que sabe del combate:
+- alcance de cada ataque: tamaño de get_attack_area_for_display
+- amenazas: áreas de ataque, explosiones y proyectiles enemigos indexados en
+  el CollisionWorld durante el tick anterior (el tick actual aún no empezó
+  cuando se lee la entrada)
+- escudo: solo si el perfil lo permite y shield_cooldown_timer ha llegado a 0
+
+Cada personaje puede tener su propio comportamiento (CPU_CONTROLLERS):
+el Trapper coloca trampas en el camino del enemigo y dispara flechas
+manteniendo la distancia, y el Slime Demon se aleja para usar la lluvia de
+lava. El resto usa el comportamiento cuerpo a cuerpo de CpuController.
+"""
+
+import random
+
+import pygame
+
+from . import sim_clock
+from .character_data import HIT_MULTI
+from .controls import (INPUT_NONE, INPUT_LEFT, INPUT_RIGHT, INPUT_JUMP, INPUT_SHIELD,
+                       INPUT_ATTACK1, INPUT_ATTACK2, INPUT_ATTACK3, INPUT_ATTACKS)
+from .projectiles import ProjectileManager
+from .spatial_hash import LAYER_PROJECTILE, LAYER_TRAP, LAYER_EXPLOSION, LAYER_ATTACK
+
+# Niveles de dificultad: tiempo de reacción (ticks entre decisiones),
+# probabilidad de error, de levantar el escudo ante una amenaza y de avanzar
+CPU_DIFFICULTIES = {
+    'easy': {'name': 'Fácil', 'reaction_ticks': 20, 'mistake_chance': 0.35,
+             'shield_chance': 0.25, 'aggression': 0.45},
+    'normal': {'name': 'Normal', 'reaction_ticks': 10, 'mistake_chance': 0.12,
+               'shield_chance': 0.6, 'aggression': 0.75},
+    'hard': {'name': 'Difícil', 'reaction_ticks': 3, 'mistake_chance': 0.0,
+             'shield_chance': 1.0, 'aggression': 1.0},
+}
+CPU_DIFFICULTY_ORDER = ('easy', 'normal', 'hard')
+DEFAULT_CPU_DIFFICULTY = 'normal'
+
+# Opción de la selección de personajes que usa la IA de búsqueda
+# (simulation.search_ai) en lugar de las reglas
+CPU_SEARCH = 'search'
+CPU_SEARCH_NAME = 'Búsqueda'
+
+# Margen alrededor de la hurtbox en el que una amenaza cuenta como inminente
+THREAT_MARGIN = 60
+THREAT_LAYERS = LAYER_PROJECTILE | LAYER_EXPLOSION | LAYER_ATTACK
+
+# Distancia por delante en la que se salta una trampa enemiga
+TRAP_LOOKAHEAD = 120
+
+# Distancia a la pared a partir de la cual huir deja de tener sentido
+WALL_MARGIN = 80
+STAGE_WIDTH = 1400
+
+
+class CpuController:
+    """
+    Controlador de CPU cuerpo a cuerpo: se acerca, ataca con el golpe de más
+    daño que alcanza al objetivo y se cubre con el escudo ante amenazas.
+
+    Args:
+        difficulty (str): Clave de CPU_DIFFICULTIES
+        seed (int): Semilla del generador propio (no toca el random global)
+    """
+    def __init__(self, difficulty=DEFAULT_CPU_DIFFICULTY, seed=None):
+        settings = CPU_DIFFICULTIES[difficulty]
+        self.difficulty = difficulty
+        self.reaction_ticks = settings['reaction_ticks']
+        self.mistake_chance = settings['mistake_chance']
+        self.shield_chance = settings['shield_chance']
+        self.aggression = settings['aggression']
+        self.rng = random.Random(seed)
+        self.ticks_until_decision = 0
+        self.held_mask = INPUT_NONE
+        self.attack_reach = None  # Alcance horizontal de cada ataque (índice 1-3), None sin área
+        self.attack_damage = None
+        self.probe_rect = pygame.Rect(0, 0, 0, 0)  # Rect reutilizable para consultas
+
+    def __call__(self, fighter, target):
+        if self.ticks_until_decision > 0:
+            self.ticks_until_decision -= 1
+            return self.held_mask
+        self.ticks_until_decision = self.reaction_ticks - 1
+        if self.attack_reach is None:
+            self.measure_attacks(fighter)
+        if target is None or not fighter.is_alive or not target.is_alive:
+            self.held_mask = INPUT_NONE
+        elif self.rng.random() < self.mistake_chance:
+            self.held_mask = self.rng.choice((INPUT_NONE, INPUT_LEFT, INPUT_RIGHT, INPUT_JUMP))
+        else:
+            self.held_mask = self.decide(fighter, target)
+        return self.held_mask
+
+    def measure_attacks(self, fighter):
+        """Alcance (desde el centro del luchador) y daño de cada ataque según su tabla."""
+        table = fighter.character_table
+        center_x = fighter.collision_rect.centerx
+        self.attack_reach = [None] * 4
+        self.attack_damage = [0] * 4
+        for attack_type in (1, 2, 3):
+            area = fighter.get_attack_area_for_display(attack_type)
+            if area is not None:
+                self.attack_reach[attack_type] = max(abs(area.left - center_x), abs(area.right - center_x))
+            if table.hit_kind[attack_type] == HIT_MULTI:
+                self.attack_damage[attack_type] = sum(table.hit_damages[attack_type])
+            else:
+                self.attack_damage[attack_type] = table.damage[attack_type] or 0
+
+    # ------------------------------------------------------------------
+    # Lectura del combate
+    # ------------------------------------------------------------------
+    @staticmethod
+    def gap_to(fighter, target):
+        """Distancia horizontal desde el centro del luchador hasta el borde cercano del objetivo."""
+        return abs(target.collision_rect.centerx - fighter.collision_rect.centerx) - \
+            target.collision_rect.width // 2
+
+    @staticmethod
+    def toward(fighter, target):
+        """Bit de dirección hacia el objetivo."""
+        return INPUT_RIGHT if target.collision_rect.centerx > fighter.collision_rect.centerx else INPUT_LEFT
+
+    @staticmethod
+    def away(fighter, target):
+        """Bit de dirección para alejarse del objetivo."""
+        return INPUT_LEFT if target.collision_rect.centerx > fighter.collision_rect.centerx else INPUT_RIGHT
+
+    @staticmethod
+    def cornered(fighter, target):
+        """Si alejarse del objetivo choca contra el borde del escenario."""
+        rect = fighter.collision_rect
+        if target.collision_rect.centerx > rect.centerx:
+            return rect.left < WALL_MARGIN
+        return rect.right > STAGE_WIDTH - WALL_MARGIN
+
+    def threatened(self, fighter):
+        """Si un ataque, explosión o proyectil enemigo está encima del luchador."""
+        probe = self.probe_rect
+        probe.update(fighter.collision_rect)
+        probe.inflate_ip(2 * THREAT_MARGIN, THREAT_MARGIN)
+        team = fighter.team
+        for item in fighter.collision_world.entities_touching(probe, THREAT_LAYERS):
+            owner_team = getattr(item, 'owner_team', None)
+            if owner_team is None:
+                owner_team = item.team
+            if owner_team != team:
+                return True
+        return False
+
+    def enemy_trap_ahead(self, fighter, direction):
+        """Si hay una trampa enemiga en el suelo justo delante en la dirección de avance."""
+        rect = fighter.collision_rect
+        probe = self.probe_rect
+        if direction == INPUT_RIGHT:
+            probe.update(rect.right, rect.bottom - 40, TRAP_LOOKAHEAD, 60)
+        else:
+            probe.update(rect.left - TRAP_LOOKAHEAD, rect.bottom - 40, TRAP_LOOKAHEAD, 60)
+        return any(trap.owner_team != fighter.team
+                   for trap in fighter.collision_world.entities_touching(probe, LAYER_TRAP))
+
+    def can_attack(self, fighter):
+        return not fighter.is_attacking and fighter.attack_cooldown_timer == 0
+
+    def can_shield(self, fighter):
+        return fighter.movement_profile.shield_input and fighter.shield_cooldown_timer <= 0
+
+    # ------------------------------------------------------------------
+    # Decisión
+    # ------------------------------------------------------------------
+    def best_attack_in_reach(self, fighter, target):
+        """Bit del ataque de más daño que alcanza al objetivo (INPUT_NONE si ninguno)."""
+        gap = self.gap_to(fighter, target)
+        best_bit = INPUT_NONE
+        best_damage = -1
+        for attack_type, attack_bit in enumerate(INPUT_ATTACKS, start=1):
+            reach = self.attack_reach[attack_type]
+            if reach is not None and reach >= gap and self.attack_damage[attack_type] > best_damage:
+                best_bit, best_damage = attack_bit, self.attack_damage[attack_type]
+        return best_bit
+
+    def defend(self, fighter, target):
+        """Respuesta a una amenaza: escudo si está disponible, si no retroceder (o saltar si no hay sitio)."""
+        if self.can_shield(fighter) and self.rng.random() < self.shield_chance:
+            return INPUT_SHIELD
+        if self.cornered(fighter, target):
+            return INPUT_JUMP | self.toward(fighter, target)
+        return self.away(fighter, target)
+
+    def approach(self, fighter, target):
+        """Avanza hacia el objetivo saltando las trampas enemigas del camino."""
+        if self.rng.random() >= self.aggression:
+            return INPUT_NONE
+        direction = self.toward(fighter, target)
+        if self.enemy_trap_ahead(fighter, direction):
+            return direction | INPUT_JUMP
+        return direction
+
+    def decide(self, fighter, target):
+        """Máscara de entrada de una decisión (comportamiento cuerpo a cuerpo)."""
+        if self.threatened(fighter):
+            return self.defend(fighter, target)
+        if self.can_attack(fighter):
+            attack_bit = self.best_attack_in_reach(fighter, target)
+            if attack_bit:
+                return attack_bit
+        return self.approach(fighter, target)
+
+
+class TrapperCpu(CpuController):
+    """
+    Trapper: mantiene la distancia con su velocidad, siembra trampas entre él
+    y el enemigo cuando este se acerca y dispara flechas desde lejos.
+    """
+    # Distancias (hasta el borde del objetivo) que el Trapper intenta mantener
+    FLEE_DISTANCE = 220
+    TRAP_MIN_DISTANCE = 150
+    TRAP_MAX_DISTANCE = 500
+
+    def trap_ready(self, fighter):
+        """Si place_trap colocaría una trampa sin retirar otra viva."""
+        if sim_clock.get_ticks() - fighter.last_trap_time < fighter.trap_cooldown:
+            return False
+        is_live = ProjectileManager.is_live
+        return any(not is_live(trap, serial) for trap, serial in fighter.trap_slots)
+
+    def decide(self, fighter, target):
+        gap = self.gap_to(fighter, target)
+        if self.threatened(fighter) and not self.cornered(fighter, target):
+            return self.away(fighter, target)
+        if self.can_attack(fighter):
+            # Cuerpo a cuerpo solo si el enemigo ya está encima (o no hay hacia dónde huir)
+            if self.attack_reach[1] is not None and gap <= self.attack_reach[1] and \
+                    (gap < self.FLEE_DISTANCE // 2 or self.cornered(fighter, target)):
+                return INPUT_ATTACK1
+            if self.TRAP_MIN_DISTANCE <= gap <= self.TRAP_MAX_DISTANCE and self.trap_ready(fighter):
+                return INPUT_ATTACK2
+            if gap >= self.FLEE_DISTANCE:
+                return INPUT_ATTACK3
+        if gap < self.FLEE_DISTANCE and not self.cornered(fighter, target):
+            return self.away(fighter, target)
+        if gap > self.TRAP_MAX_DISTANCE:
+            return self.approach(fighter, target)
+        return INPUT_NONE
+
+
+class SlimeDemonCpu(CpuController):
+    """
+    Slime Demon: se mantiene lejos para que la lluvia de lava caiga sobre el
+    enemigo, golpea si este llega a su alcance y remata con el sacrificio
+    cuando la explosión basta para acabar con él.
+    """
+    RAIN_DISTANCE = 350
+    SACRIFICE_REACH = 220
+
+    def decide(self, fighter, target):
+        gap = self.gap_to(fighter, target)
+        if self.threatened(fighter) and gap > self.attack_reach[1]:
+            return self.defend(fighter, target)
+        if self.can_attack(fighter):
+            sacrifice = int(fighter.current_health * fighter.sacrifice_ratio)
+            if gap <= self.SACRIFICE_REACH and sacrifice >= target.current_health:
+                return INPUT_ATTACK3
+            if gap <= self.attack_reach[1]:
+                return INPUT_ATTACK1
+            if gap >= self.RAIN_DISTANCE:
+                return INPUT_ATTACK2
+        if gap < self.RAIN_DISTANCE and not self.cornered(fighter, target):
+            return self.away(fighter, target)
+        return INPUT_NONE
+
+
+# Comportamiento de CPU por clave de personaje (characters.json)
+CPU_CONTROLLERS = {
+    'trapper': TrapperCpu,
+    'slime_demon': SlimeDemonCpu,
+}
+
+
+def create_cpu_controller(fighter, difficulty=DEFAULT_CPU_DIFFICULTY, seed=None):
+    """
+    Crea el controlador de CPU adecuado para el personaje del luchador.
+
+    Returns:
+        CpuController: Fuente de entrada para asignar a fighter.input_source
+    """
+    controller_class = CPU_CONTROLLERS.get(fighter.character_key, CpuController)
+    return controller_class(difficulty, seed)
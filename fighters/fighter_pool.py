@@ -0,0 +1,51 @@
+"""
+Luchadores reutilizables entre combates.
+
+Crear un luchador carga y escala todos sus sprites y compila sus tablas de
+reglas, lo que cuesta decenas de milisegundos por personaje. FighterPool
+guarda los luchadores ya creados por (clase, player_number) y, cuando se
+vuelve a pedir el mismo personaje para el mismo jugador, devuelve la misma
+instancia tras Fighter.reset(): una revancha no vuelve a leer nada del disco.
+
+Un luchador entregado pertenece al combate que lo pidió hasta que se pide
+otra vez: no se debe reutilizar el pool mientras un combate anterior siga
+en marcha con los mismos jugadores.
+"""
+
+
+class FighterPool:
+    """
+    Luchadores creados, por (clase, player_number).
+
+    Attributes:
+        created (int): Luchadores construidos desde cero
+        reused (int): Peticiones servidas con un luchador ya creado
+    """
+    def __init__(self):
+        self.fighters = {}
+        self.created = 0
+        self.reused = 0
+
+    def acquire(self, fighter_class, player_number, initial_x, initial_y, flip_sprite, attack_sound=None):
+        """
+        Luchador listo para empezar un combate: el del pool reiniciado o uno nuevo.
+        Mismos argumentos que el constructor de las clases de personaje.
+
+        Returns:
+            Fighter: Luchador en su estado inicial
+        """
+        key = (fighter_class, player_number)
+        fighter = self.fighters.get(key)
+        if fighter is None:
+            fighter = fighter_class(player_number, initial_x, initial_y, flip_sprite, attack_sound)
+            self.fighters[key] = fighter
+            self.created += 1
+        else:
+            fighter.reset(initial_x, flip_sprite)
+            fighter.attack_sound_effect = attack_sound
+            self.reused += 1
+        return fighter
+
+    def clear(self):
+        """Olvida todos los luchadores (sus sprites se liberan con ellos)."""
+        self.fighters.clear()
@@ -0,0 +1,212 @@
+"""
+Tablas de frame data por personaje (startup, frames activos, recovery e impactos).
+
+Se construyen una sola vez por personaje a partir de sus tablas compiladas
+(CompiledCharacter), es decir, cuando se cargan sus animaciones. Los frames
+son frames de animación (frame_index); la equivalencia en ticks de juego
+(60 por segundo) se calcula con el reloj simulado.
+
+Uso:
+    python -m fighters.frame_data
+    python -m fighters.frame_data --character tank --json --output tank.json
+"""
+
+import argparse
+import contextlib
+import json
+import sys
+
+from . import sim_clock
+from .character_data import (ATTACK_ACTIONS, HIT_NONE, HIT_ONCE_FROM, HIT_MULTI, HIT_RAIN,
+                             HIT_SACRIFICE, character_keys)
+
+# Milisegundos que deben pasar (estrictamente) para avanzar un frame de animación
+ANIMATION_FRAME_MS = 50
+
+
+def _ticks_per_animation_frame():
+    """Ticks que dura cada frame de animación con el reloj simulado (peor caso)."""
+    worst = 1
+    for start in range(sim_clock.SIMULATED_FPS):
+        ticks = 1
+        while sim_clock.ticks_to_ms(start + ticks) - sim_clock.ticks_to_ms(start) <= ANIMATION_FRAME_MS:
+            ticks += 1
+        worst = max(worst, ticks)
+    return worst
+
+
+TICKS_PER_ANIMATION_FRAME = _ticks_per_animation_frame()
+
+
+class AttackFrameData:
+    """
+    Frame data de un ataque, con los frames en los que el motor puede registrar el impacto.
+
+    Los ataques de contacto, trampas y proyectiles se comprueban en
+    Fighter.update() justo después de avanzar frame_index, así que el frame 0
+    nunca se comprueba y el frame total_frames sí (el tick en que la
+    animación termina). Cada comprobación ocurre al empezar su frame.
+    El sacrificio del Slime Demon se comprueba en cada tick de su post_update_hook.
+
+    Attributes:
+        startup (int): Frames mostrados antes de la primera comprobación
+        active (int): Frames en los que el ataque puede impactar
+        recovery (int): Frames mostrados tras la última comprobación
+        hit_frames (tuple): Frames de impacto alcanzables
+        hit_damages (tuple): Daño de cada impacto
+        first_active, last_active (int): Primer y último frame en que puede impactar
+    """
+    def __init__(self, compiled, attack_type):
+        self.attack_type = attack_type
+        self.hit_kind = compiled.hit_kind[attack_type]
+        self.action = ATTACK_ACTIONS[attack_type]
+        total_frames = compiled.animation_lengths[self.action]
+
+        if self.hit_kind == HIT_RAIN:
+            # El Slime Demon mantiene idle durante la lluvia: dura tantos ticks
+            # como frames tiene la animación del ataque y las gotas salen al inicio
+            self.action = 0
+            total_frames = -(-total_frames // TICKS_PER_ANIMATION_FRAME)
+        self.total_frames = total_frames
+
+        # Frames que alcanza la comprobación tras avanzar la animación
+        checked_after_advance = self.hit_kind not in (HIT_RAIN, HIT_SACRIFICE)
+        first_checked = 1 if checked_after_advance else 0
+        if self.hit_kind == HIT_MULTI:
+            # multi_hit_lookup solo cubre los frames de la animación
+            frames = compiled.hit_frames[attack_type]
+            damages = compiled.hit_damages[attack_type]
+            reachable = [index for index, frame in enumerate(frames) if first_checked <= frame < total_frames]
+            self.hit_frames = tuple(frames[index] for index in reachable)
+            self.hit_damages = tuple(damages[index] for index in reachable)
+        elif self.hit_kind == HIT_NONE:
+            self.hit_frames, self.hit_damages = (), ()
+        elif self.hit_kind in (HIT_ONCE_FROM, HIT_SACRIFICE):
+            # Desde el frame de impacto (o el primero comprobado) hasta el final
+            self.hit_frames = (max(compiled.hit_frame[attack_type], first_checked),)
+            self.hit_damages = (compiled.damage[attack_type],)
+        elif first_checked <= compiled.hit_frame[attack_type] < total_frames:
+            self.hit_frames = (compiled.hit_frame[attack_type],)
+            self.hit_damages = (compiled.damage[attack_type],)
+        else:
+            self.hit_frames, self.hit_damages = (), ()
+
+        if not self.hit_frames:
+            self.first_active = self.last_active = None
+            self.startup, self.active, self.recovery = total_frames, 0, 0
+            return
+        self.first_active = self.hit_frames[0]
+        if self.hit_kind == HIT_ONCE_FROM:
+            # También se comprueba al pasar del último frame (fin de la animación)
+            self.last_active = total_frames
+        elif self.hit_kind == HIT_SACRIFICE:
+            self.last_active = total_frames - 1
+        else:
+            self.last_active = self.hit_frames[-1]
+        self.startup = self.first_active
+        self.active = self.last_active - self.first_active + 1
+        # Con la comprobación al empezar el frame, el propio frame cuenta como recovery
+        self.recovery = total_frames - self.last_active - (0 if checked_after_advance else 1)
+
+    def can_hit_at(self, frame_index):
+        """Si el motor puede registrar el impacto con este frame_index."""
+        if not self.hit_frames:
+            return False
+        if self.hit_kind in (HIT_ONCE_FROM, HIT_SACRIFICE):
+            return self.first_active <= frame_index <= self.last_active
+        return frame_index in self.hit_frames
+
+    def to_ticks(self, frames):
+        """Convierte frames de animación a ticks de juego."""
+        return frames * TICKS_PER_ANIMATION_FRAME
+
+    def as_dict(self):
+        return {
+            'attack_type': self.attack_type,
+            'hit_kind': self.hit_kind,
+            'total_frames': self.total_frames,
+            'startup': self.startup,
+            'active': self.active,
+            'recovery': self.recovery,
+            'first_active': self.first_active,
+            'last_active': self.last_active,
+            'hit_frames': list(self.hit_frames),
+            'hit_damages': list(self.hit_damages),
+            'startup_ticks': self.to_ticks(self.startup),
+            'total_ticks': self.to_ticks(self.total_frames),
+        }
+
+
+class FrameData:
+    """Frame data de los tres ataques de un personaje (attacks[1..3])."""
+    def __init__(self, compiled):
+        self.key = compiled.key
+        self.display_name = compiled.display_name
+        self.attack_end_cooldown = compiled.attack_end_cooldown
+        self.attacks = [None] + [AttackFrameData(compiled, attack_type) for attack_type in (1, 2, 3)]
+
+    def as_dict(self):
+        return {
+            'key': self.key,
+            'name': self.display_name,
+            'ticks_per_frame': TICKS_PER_ANIMATION_FRAME,
+            'attack_end_cooldown_ticks': self.attack_end_cooldown,
+            'attacks': [attack.as_dict() for attack in self.attacks[1:]],
+        }
+
+
+_frame_data_cache = {}
+
+
+def get_frame_data(compiled):
+    """Frame data de un personaje compilado (cacheado por tablas compiladas)."""
+    cache_key = (compiled.key, compiled.animation_lengths)
+    if cache_key not in _frame_data_cache:
+        _frame_data_cache[cache_key] = FrameData(compiled)
+    return _frame_data_cache[cache_key]
+
+
+def format_frame_data(frame_data):
+    """Tabla de texto con la frame data de un personaje."""
+    lines = [f"{frame_data.display_name} "
+             f"(1 frame = {TICKS_PER_ANIMATION_FRAME} ticks, cooldown final {frame_data.attack_end_cooldown} ticks)",
+             f"  {'Ataque':<7}{'Tipo':<11}{'Frames':>7}{'Startup':>8}{'Activos':>8}{'Recovery':>9}  Impactos (frame:daño)"]
+    for attack in frame_data.attacks[1:]:
+        hits = ' '.join(f"{frame}:{damage}" for frame, damage in zip(attack.hit_frames, attack.hit_damages))
+        lines.append(f"  {attack.attack_type:<7}{attack.hit_kind:<11}{attack.total_frames:>7}"
+                     f"{attack.startup:>8}{attack.active:>8}{attack.recovery:>9}  {hits or '-'}")
+    return '\n'.join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Volcado de la frame data de los personajes")
+    parser.add_argument('--character', choices=character_keys(), help="Solo este personaje")
+    parser.add_argument('--json', action='store_true', help="Salida en JSON")
+    parser.add_argument('--output', help="Escribir el volcado en este fichero en lugar de la salida estándar")
+    args = parser.parse_args()
+
+    # Las longitudes de animación requieren cargar los sprites (modo headless)
+    from simulation.headless import init_headless, FIGHTER_CLASSES
+    tables = []
+    # Los mensajes de carga de sprites van a stderr para no mezclarse con la tabla
+    with contextlib.redirect_stdout(sys.stderr):
+        init_headless()
+        for fighter_class in FIGHTER_CLASSES.values():
+            if args.character and fighter_class.character_key != args.character:
+                continue
+            fighter = fighter_class(1, 300, 370, False, None)
+            tables.append(fighter.frame_data)
+
+    if args.json:
+        dump = json.dumps([frame_data.as_dict() for frame_data in tables], indent=2)
+    else:
+        dump = '\n\n'.join(format_frame_data(frame_data) for frame_data in tables)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as output_file:
+            output_file.write(dump + '\n')
+    else:
+        print(dump)
+
+
+if __name__ == '__main__':
+    main()
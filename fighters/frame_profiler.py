@@ -0,0 +1,159 @@
+"""
+Perfilador por frame con overlay en pantalla.
+
+Mide secciones anidadas del frame (push/pop) con time.perf_counter y guarda
+las últimas PROFILER_HISTORY_FRAMES muestras de cada una. El overlay muestra
+la media y el percentil 99 de cada sección (sangradas según su anidamiento),
+el tiempo de trabajo y los FPS del frame, y una gráfica del tiempo de cada
+frame frente al presupuesto de 60 FPS.
+
+Desactivado no cuesta nada: quien instrumenta guarda None en lugar del
+perfilador y solo comprueba esa referencia (Arena.profiler, main.py).
+
+Uso:
+    profiler.begin_frame()
+    profiler.push('update_game_state')
+    ...
+    profiler.pop()
+    profiler.end_frame()
+    profiler.draw(surface, font, x, y)
+"""
+
+import time
+from collections import deque
+
+import pygame
+
+PROFILER_HISTORY_FRAMES = 240
+PROFILER_REFRESH_FRAMES = 15   # Frames entre recálculos de las estadísticas del panel
+FRAME_BUDGET_MS = 1000 / 60
+
+PANEL_WIDTH = 360
+ROW_HEIGHT = 16
+GRAPH_HEIGHT = 60
+GRAPH_SCALE_MS = 2 * FRAME_BUDGET_MS  # Tiempo que ocupa toda la altura de la gráfica
+
+COLOR_PANEL = (0, 0, 0, 170)
+COLOR_TEXT = (255, 255, 255)
+COLOR_SLOW = (255, 90, 90)
+COLOR_BAR = (80, 220, 120)
+COLOR_BUDGET = (255, 255, 0)
+
+
+def percentile(samples, fraction):
+    """Percentil de una secuencia de muestras (sin interpolar)."""
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+class FrameProfiler:
+    """
+    Tiempos por sección de los últimos frames.
+
+    Args:
+        history_frames (int): Frames que entran en la media y el p99
+    """
+    def __init__(self, history_frames=PROFILER_HISTORY_FRAMES):
+        self.history_frames = history_frames
+        self.sections = {}   # nombre -> deque de segundos por frame (en orden de aparición)
+        self.depths = {}     # nombre -> nivel de anidamiento
+        self.current = {}    # nombre -> segundos acumulados en el frame actual
+        self.stack = []
+        self.work_times = deque(maxlen=history_frames)
+        self.frame_intervals = deque(maxlen=history_frames)
+        self.frame_start = None
+        self.frames = 0
+        self.panel = None
+        self.panel_frame = None
+        self.status = ''     # Línea extra del panel (por ejemplo, la calidad de render)
+        self.graph = pygame.Surface((PANEL_WIDTH, GRAPH_HEIGHT), pygame.SRCALPHA)
+        self.graph.fill(COLOR_PANEL)
+
+    def begin_frame(self):
+        now = time.perf_counter()
+        if self.frame_start is not None:
+            self.frame_intervals.append(now - self.frame_start)
+        self.frame_start = now
+
+    def push(self, name):
+        if name not in self.sections:
+            self.sections[name] = deque(maxlen=self.history_frames)
+            self.depths[name] = len(self.stack)
+        self.stack.append((name, time.perf_counter()))
+
+    def pop(self):
+        name, start = self.stack.pop()
+        self.current[name] = self.current.get(name, 0.0) + time.perf_counter() - start
+
+    def end_frame(self):
+        """Cierra el frame: las secciones que no se ejecutaron cuentan como 0."""
+        if self.frame_start is None:
+            return
+        self.work_times.append(time.perf_counter() - self.frame_start)
+        current = self.current
+        for name, samples in self.sections.items():
+            samples.append(current.get(name, 0.0))
+        current.clear()
+        self.frames += 1
+        self.draw_graph_column(self.work_times[-1] * 1000)
+
+    def stats(self):
+        """
+        Returns:
+            list: (nombre, nivel, media ms, p99 ms) de cada sección
+        """
+        return [(name, self.depths[name], sum(samples) / len(samples) * 1000, percentile(samples, 0.99) * 1000)
+                for name, samples in self.sections.items() if samples]
+
+    # ------------------------------------------------------------------
+    # Overlay
+    # ------------------------------------------------------------------
+    def draw_graph_column(self, work_ms):
+        """Desplaza la gráfica un píxel y dibuja el frame recién terminado a la derecha."""
+        graph = self.graph
+        graph.scroll(-1, 0)
+        x = PANEL_WIDTH - 1
+        graph.fill(COLOR_PANEL, (x, 0, 1, GRAPH_HEIGHT))
+        height = min(GRAPH_HEIGHT, int(work_ms / GRAPH_SCALE_MS * GRAPH_HEIGHT))
+        if height:
+            color = COLOR_BAR if work_ms <= FRAME_BUDGET_MS else COLOR_SLOW
+            graph.fill(color, (x, GRAPH_HEIGHT - height, 1, height))
+        graph.set_at((x, GRAPH_HEIGHT - int(FRAME_BUDGET_MS / GRAPH_SCALE_MS * GRAPH_HEIGHT)), COLOR_BUDGET)
+
+    def render_panel(self, font):
+        """Vuelve a dibujar la tabla de estadísticas (cada PROFILER_REFRESH_FRAMES frames)."""
+        rows = self.stats()
+        status_rows = 1 if self.status else 0
+        height = (len(rows) + 2 + status_rows) * ROW_HEIGHT + 8
+        if self.panel is None or self.panel.get_height() != height:
+            self.panel = pygame.Surface((PANEL_WIDTH, height), pygame.SRCALPHA)
+        panel = self.panel
+        panel.fill(COLOR_PANEL)
+
+        if self.work_times:
+            work_ms = sum(self.work_times) / len(self.work_times) * 1000
+            work_p99 = percentile(self.work_times, 0.99) * 1000
+            intervals = self.frame_intervals
+            fps = len(intervals) / sum(intervals) if intervals else 0.0
+            header = f"Frame: {work_ms:.2f} ms media | p99 {work_p99:.2f} ms | {fps:.0f} FPS"
+            color = COLOR_TEXT if work_p99 <= FRAME_BUDGET_MS else COLOR_SLOW
+            panel.blit(font.render(header, True, color), (6, 4))
+        if self.status:
+            panel.blit(font.render(self.status, True, COLOR_TEXT), (6, 4 + ROW_HEIGHT))
+        columns_y = 4 + (1 + status_rows) * ROW_HEIGHT
+        panel.blit(font.render("tramo", True, COLOR_TEXT), (6, columns_y))
+        panel.blit(font.render("media ms", True, COLOR_TEXT), (PANEL_WIDTH - 150, columns_y))
+        panel.blit(font.render("p99 ms", True, COLOR_TEXT), (PANEL_WIDTH - 60, columns_y))
+        for index, (name, depth, mean_ms, p99_ms) in enumerate(rows):
+            y = columns_y + (index + 1) * ROW_HEIGHT
+            panel.blit(font.render(name, True, COLOR_TEXT), (6 + 12 * depth, y))
+            panel.blit(font.render(f"{mean_ms:.3f}", True, COLOR_TEXT), (PANEL_WIDTH - 150, y))
+            panel.blit(font.render(f"{p99_ms:.3f}", True, COLOR_TEXT), (PANEL_WIDTH - 60, y))
+        self.panel_frame = self.frames
+
+    def draw(self, surface, font, x, y):
+        """Dibuja la tabla y la gráfica de tiempos con la esquina superior izquierda en (x, y)."""
+        if self.panel is None or self.frames - self.panel_frame >= PROFILER_REFRESH_FRAMES:
+            self.render_panel(font)
+        surface.blit(self.panel, (x, y))
+        surface.blit(self.graph, (x, y + self.panel.get_height()))
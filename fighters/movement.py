@@ -0,0 +1,135 @@
+"""
+Núcleo de movimiento común a todos los luchadores.
+
+Fighter.move delega aquí: entrada horizontal, salto, escudo, ataques,
+gravedad, límites de pantalla, orientación y efectos de estado por tick.
+Las diferencias entre personajes (salto, gravedad, control aéreo y escudo)
+vienen del perfil de movimiento de characters.json en lugar de
+copias de move() en cada clase.
+
+Perfiles de control aéreo:
+- "normalized": la componente horizontal se reescala con la magnitud del
+  vector (horizontal, vertical) cuando ambas son distintas de cero
+- "direct": la velocidad horizontal se aplica sin reescalar
+"""
+
+import math
+
+from .status_effects import STATUS_STUN
+from .controls import (INPUT_LEFT, INPUT_RIGHT, INPUT_JUMP, INPUT_SHIELD, INPUT_ATTACK1, INPUT_ATTACK2,
+                       INPUT_ATTACK3, INPUT_ATTACKS)
+
+AIR_CONTROL_NORMALIZED = 'normalized'
+AIR_CONTROL_DIRECT = 'direct'
+
+# Distancia entre el borde inferior de la pantalla y el suelo
+GROUND_MARGIN = 50
+
+# Cualquiera de los tres botones de ataque
+_ANY_ATTACK = INPUT_ATTACK1 | INPUT_ATTACK2 | INPUT_ATTACK3
+
+
+class MovementProfile:
+    """
+    Parámetros de movimiento de un personaje.
+
+    Args:
+        jump_strength (int): Velocidad vertical inicial del salto (negativa = hacia arriba)
+        gravity (int): Aceleración vertical por tick
+        air_control (str): AIR_CONTROL_NORMALIZED o AIR_CONTROL_DIRECT
+        shield_input (bool): Si la tecla de escudo activa el escudo (y bloquea ataques)
+    """
+    def __init__(self, jump_strength, gravity, air_control, shield_input):
+        if air_control not in (AIR_CONTROL_NORMALIZED, AIR_CONTROL_DIRECT):
+            raise ValueError(f"Perfil de control aéreo desconocido: {air_control}")
+        self.jump_strength = jump_strength
+        self.gravity = gravity
+        self.air_control = air_control
+        self.normalize_diagonal = air_control == AIR_CONTROL_NORMALIZED
+        self.shield_input = shield_input
+
+
+def move_fighter(fighter, profile, movement_speed, input_mask, target, screen_width, screen_height, round_over):
+    """
+    Avanza un tick de movimiento de un luchador.
+
+    Args:
+        fighter (Fighter): Luchador a mover
+        profile (MovementProfile): Perfil de movimiento del personaje
+        movement_speed: Velocidad horizontal de este tick (get_movement_speed())
+        input_mask (int): Máscara de entrada de este tick
+        target (Fighter): Oponente (orientación y ataques)
+    """
+    horizontal_delta = 0
+    vertical_delta = 0
+
+    # Resetear estado de correr cada frame
+    fighter.is_running = False
+    if not fighter.is_attacking:
+        fighter.current_attack_type = 0
+
+    # Solo permitir acciones si no está atacando ni aturdido, está vivo y la ronda no ha terminado
+    status_effects = fighter.status_effects
+    if not fighter.is_attacking and fighter.is_alive and not round_over and not status_effects.is_active(STATUS_STUN):
+        if input_mask & INPUT_LEFT:
+            horizontal_delta = -movement_speed
+            fighter.is_running = True
+        if input_mask & INPUT_RIGHT:
+            horizontal_delta = movement_speed
+            fighter.is_running = True
+
+        if input_mask & INPUT_JUMP and not fighter.is_jumping:
+            fighter.vertical_velocity = profile.jump_strength
+            fighter.is_jumping = True
+
+        # Escudo por tecla sostenida: se activa si el cooldown ha expirado y se
+        # desactiva al soltar la tecla (sin cancelar un cooldown en curso)
+        if profile.shield_input:
+            if input_mask & INPUT_SHIELD:
+                if not fighter.shield_active and fighter.shield_cooldown_timer <= 0:
+                    fighter.shield_active = True
+                    fighter.shield_health = fighter.shield_max_health
+            else:
+                fighter.shield_active = False
+
+        # Ataques bloqueados mientras el escudo está activo: atacar O defender
+        if input_mask & _ANY_ATTACK and not (profile.shield_input and fighter.shield_active):
+            for attack_type, attack_bit in enumerate(INPUT_ATTACKS, start=1):
+                if input_mask & attack_bit:
+                    fighter.execute_attack(target)
+                    fighter.current_attack_type = attack_type
+                    break
+
+    # Aplicar gravedad a la velocidad vertical
+    fighter.vertical_velocity += profile.gravity
+    vertical_delta += fighter.vertical_velocity
+
+    # Normalización diagonal: solo se reescala la componente horizontal, la
+    # vertical conserva la física del salto
+    if profile.normalize_diagonal and horizontal_delta != 0 and vertical_delta != 0:
+        magnitude = math.sqrt(horizontal_delta ** 2 + vertical_delta ** 2)
+        horizontal_delta = (horizontal_delta / magnitude) * movement_speed
+
+    # Mantener personaje dentro de los límites de pantalla horizontalmente
+    rect = fighter.collision_rect
+    if rect.left + horizontal_delta < 0:
+        horizontal_delta = -rect.left
+    if rect.right + horizontal_delta > screen_width:
+        horizontal_delta = screen_width - rect.right
+
+    # Mantener personaje en el suelo
+    ground_level = screen_height - GROUND_MARGIN
+    if rect.bottom + vertical_delta > ground_level:
+        fighter.vertical_velocity = 0
+        fighter.is_jumping = False
+        vertical_delta = ground_level - rect.bottom
+
+    # Hacer que los personajes se miren entre sí
+    fighter.flip_sprite = target.collision_rect.centerx <= rect.centerx
+
+    # Avanzar los efectos de estado (O(1) salvo en sus ticks de daño o fin)
+    status_effects.process(fighter)
+
+    # Actualizar posición final del personaje
+    rect.x += horizontal_delta
+    rect.y += vertical_delta
@@ -0,0 +1,337 @@
+"""
+Pool de proyectiles y gestor único de proyectiles (trampas, flechas, gotas de lava...).
+
+Todos los proyectiles de un combate son registros Projectile con __slots__
+que viven en un único ProjectileManager:
+
+- spawn() reutiliza registros de una lista libre; tras el calentamiento
+  disparar no crea objetos nuevos.
+- kill() retira un proyectil en O(1) intercambiándolo con el último activo
+  (swap-remove), sin reconstruir listas.
+- update() y draw() recorren una sola vez todos los proyectiles activos, sea
+  cual sea su dueño. Las colisiones con luchadores se consultan en el
+  CollisionWorld (broadphase) y cada proyectil vivo se indexa en él.
+
+El comportamiento de cada tipo de proyectil se registra con register_kind():
+cada personaje aporta sus funciones de actualización y dibujo (por ejemplo
+las trampas del Trapper) y el registro solo guarda datos.
+"""
+
+import weakref
+
+import pygame
+
+from . import render_quality
+from .render_quality import to_render
+from . import sim_clock
+from . import spatial_hash
+from .spatial_hash import LAYER_PROJECTILE
+
+# Tabla de tipos: índice = kind. Los tipos de cada personaje se registran al
+# importar su módulo, así que el índice depende del orden de importación:
+# entre procesos (snapshots) los tipos viajan por nombre
+_KIND_NAMES = []
+_KIND_IDS = {}
+_KIND_UPDATE = []
+_KIND_DRAW = []
+_KIND_LAYER = []
+
+
+def register_kind(name, update, draw, layer=LAYER_PROJECTILE):
+    """
+    Registra un tipo de proyectil.
+
+    Args:
+        name (str): Nombre del tipo (para depuración)
+        update: update(projectile, ground_level, world) -> bool, False si el proyectil termina.
+            Debe dejar en projectile.hit_rect su caja de colisión actual
+        draw: draw(projectile, surface, camera_offset_x); surface puede ser una
+            RenderQueue, así que solo debe usar surface.blit
+        layer (int): Capa del CollisionWorld en la que se indexa
+
+    Returns:
+        int: Identificador del tipo para ProjectileManager.spawn()
+    """
+    _KIND_IDS[name] = len(_KIND_NAMES)
+    _KIND_NAMES.append(name)
+    _KIND_UPDATE.append(update)
+    _KIND_DRAW.append(draw)
+    _KIND_LAYER.append(layer)
+    return len(_KIND_NAMES) - 1
+
+
+def kind_name(kind):
+    """Nombre con el que se registró un tipo de proyectil."""
+    return _KIND_NAMES[kind]
+
+
+# Copias reducidas de los sprites de proyectiles (calidad de render baja y/o
+# framebuffer interno más pequeño): sprite -> (escala, copia). Desaparecen con
+# el sprite original
+_reduced_sprites = weakref.WeakKeyDictionary()
+
+
+def visual_sprite(sprite):
+    """
+    Sprite a dibujar a la resolución interna según la calidad de render: el
+    original o una copia reducida en caché.
+    """
+    scale = render_quality.projectile_scale * render_quality.render_scale
+    if scale == 1.0 or sprite is None:
+        return sprite
+    cached = _reduced_sprites.get(sprite)
+    if cached is None or cached[0] != scale:
+        width, height = sprite.get_size()
+        cached = (scale, pygame.transform.scale(sprite, (max(1, int(width * scale)), max(1, int(height * scale)))))
+        _reduced_sprites[sprite] = cached
+    return cached[1]
+
+
+def blit_sprite(surface, sprite, x, y):
+    """
+    Dibuja un sprite con la esquina en (x, y) (unidades del mundo); la copia
+    reducida se centra en el mismo sitio.
+    """
+    drawn = visual_sprite(sprite)
+    if drawn is not sprite:
+        x = to_render(x + sprite.get_width() // 2) - drawn.get_width() // 2
+        y = to_render(y + sprite.get_height() // 2) - drawn.get_height() // 2
+    surface.blit(drawn, (x, y))
+
+
+class Projectile:
+    """
+    Registro de un proyectil. Los campos genéricos se interpretan según el tipo
+    (por ejemplo `frames` son los sprites de aterrizaje de una trampa o los de
+    caída de una gota de lava).
+    """
+    __slots__ = (
+        'kind', 'serial', 'index', 'owner_number', 'owner_team', 'target',
+        'x', 'y', 'velocity_x', 'velocity_y', 'width', 'height', 'damage',
+        'state', 'has_hit', 'animation_frame', 'frame_counter', 'last_frame_time', 'created_ms',
+        'sprite', 'frames', 'extra_frames', 'hit_rect', 'stun_ticks',
+    )
+
+    def __init__(self):
+        self.serial = 0  # 0 = registro libre
+        self.index = -1
+        self.hit_rect = pygame.Rect(0, 0, 0, 0)  # Rect reutilizable para colisiones
+        self.release()
+
+    def release(self):
+        """Suelta las referencias del proyectil anterior (sprites y objetivo)."""
+        self.target = None
+        self.sprite = None
+        self.frames = ()
+        self.extra_frames = ()
+
+    def rect(self):
+        """Rectángulo de colisión del proyectil (reutiliza hit_rect)."""
+        self.hit_rect.update(int(self.x), int(self.y), self.width, self.height)
+        return self.hit_rect
+
+
+class ProjectileManager:
+    """
+    Dueño de todos los proyectiles de un combate.
+
+    Args:
+        initial_capacity (int): Registros a preasignar en la lista libre
+        world (CollisionWorld): Broadphase del combate (por defecto el compartido)
+    """
+    def __init__(self, initial_capacity=32, world=None):
+        self.world = world or spatial_hash.default_world
+        self.active = []        # Proyectiles vivos (orden arbitrario por swap-remove)
+        self.free = [Projectile() for _ in range(initial_capacity)]
+        self.allocated = initial_capacity  # Registros creados en total (para medir el pool)
+        self.next_serial = 1
+
+    def __len__(self):
+        return len(self.active)
+
+    def spawn(self, kind, owner_number, target, x, y, velocity_x=0, velocity_y=0, damage=0, width=20, height=20,
+              owner_team=None):
+        """
+        Activa un proyectil tomado del pool.
+
+        Args:
+            kind (int): Tipo registrado con register_kind()
+            owner_number (int): player_number de quien lo lanza
+            target (Fighter): Objetivo al que apunta (los impactos alcanzan a cualquier enemigo)
+            owner_team (int): Equipo de quien lo lanza (por defecto owner_number, todos contra todos)
+        """
+        if self.free:
+            projectile = self.free.pop()
+        else:
+            projectile = Projectile()
+            self.allocated += 1
+        now = sim_clock.get_ticks()
+        projectile.kind = kind
+        projectile.serial = self.next_serial
+        self.next_serial += 1
+        projectile.owner_number = owner_number
+        projectile.owner_team = owner_number if owner_team is None else owner_team
+        projectile.target = target
+        projectile.x = x
+        projectile.y = y
+        projectile.velocity_x = velocity_x
+        projectile.velocity_y = velocity_y
+        projectile.width = width
+        projectile.height = height
+        projectile.damage = damage
+        projectile.state = 0
+        projectile.has_hit = False
+        projectile.animation_frame = 0
+        projectile.frame_counter = 0
+        projectile.last_frame_time = now
+        projectile.created_ms = now
+        projectile.stun_ticks = 0
+        projectile.hit_rect.update(int(x), int(y), width, height)
+        projectile.index = len(self.active)
+        self.active.append(projectile)
+        return projectile
+
+    def kill(self, projectile):
+        """Retira un proyectil activo en O(1) y devuelve su registro al pool."""
+        active = self.active
+        last = active.pop()
+        if last is not projectile:
+            active[projectile.index] = last
+            last.index = projectile.index
+        projectile.index = -1
+        projectile.serial = 0
+        projectile.release()
+        self.free.append(projectile)
+
+    @staticmethod
+    def is_live(projectile, serial):
+        """Indica si `projectile` sigue siendo el proyectil con ese serial (no ha terminado ni se ha reutilizado)."""
+        return projectile is not None and projectile.serial == serial
+
+    def update(self, ground_level=550):
+        """Actualiza todos los proyectiles activos en una sola pasada y los indexa en el CollisionWorld."""
+        active = self.active
+        world = self.world
+        index = 0
+        while index < len(active):
+            projectile = active[index]
+            kind = projectile.kind
+            if _KIND_UPDATE[kind](projectile, ground_level, world):
+                world.add(projectile.hit_rect, projectile, _KIND_LAYER[kind])
+                index += 1
+            else:
+                # El último proyectil ocupa esta posición y se procesa a continuación
+                self.kill(projectile)
+
+    def draw(self, surface, camera_offset_x=0):
+        """Dibuja todos los proyectiles activos en una sola pasada."""
+        for projectile in self.active:
+            _KIND_DRAW[projectile.kind](projectile, surface, camera_offset_x)
+
+    def owned_by(self, owner_number):
+        """Proyectiles activos de un luchador."""
+        return [projectile for projectile in self.active if projectile.owner_number == owner_number]
+
+    def clear(self):
+        """Retira todos los proyectiles (nuevo combate)."""
+        while self.active:
+            self.kill(self.active[-1])
+
+    def find(self, serial):
+        """Proyectil activo con ese serial (None si ya terminó)."""
+        for projectile in self.active:
+            if projectile.serial == serial:
+                return projectile
+        return None
+
+    def snapshot(self):
+        """
+        Copia del estado de simulación de los proyectiles activos (serializable con pickle).
+
+        Los sprites no se copian: de `frames` y `extra_frames` solo se guarda
+        cuántos hay, que es lo que usan las actualizaciones de cada tipo, el
+        objetivo se guarda por su player_number y el tipo por su nombre.
+        """
+        records = []
+        for projectile in self.active:
+            target = projectile.target
+            records.append(tuple(getattr(projectile, name) for name in _SNAPSHOT_SLOTS) + (
+                _KIND_NAMES[projectile.kind], target.player_number if target is not None else 0,
+                tuple(projectile.hit_rect), len(projectile.frames), len(projectile.extra_frames)))
+        return self.next_serial, tuple(records)
+
+    def restore(self, snapshot, fighters_by_number):
+        """
+        Sustituye los proyectiles activos por los de un snapshot().
+
+        Los proyectiles restaurados no tienen sprites (sus frames son None): el
+        estado restaurado sirve para simular, no para dibujar. Los tipos del
+        snapshot deben estar registrados (módulos de sus personajes importados).
+
+        Args:
+            fighters_by_number (dict): player_number -> Fighter para enlazar los objetivos
+        """
+        self.clear()
+        self.next_serial, records = snapshot
+        slot_count = len(_SNAPSHOT_SLOTS)
+        for record in records:
+            if self.free:
+                projectile = self.free.pop()
+            else:
+                projectile = Projectile()
+                self.allocated += 1
+            for name, value in zip(_SNAPSHOT_SLOTS, record):
+                setattr(projectile, name, value)
+            kind, target_number, hit_rect, frame_count, extra_frame_count = record[slot_count:]
+            projectile.kind = _KIND_IDS[kind]
+            projectile.target = fighters_by_number.get(target_number)
+            projectile.hit_rect.update(hit_rect)
+            projectile.frames = (None,) * frame_count
+            projectile.extra_frames = (None,) * extra_frame_count
+            projectile.index = len(self.active)
+            self.active.append(projectile)
+
+
+# Campos de Projectile que copia ProjectileManager.snapshot() tal cual
+_SNAPSHOT_SLOTS = (
+    'serial', 'owner_number', 'owner_team', 'x', 'y', 'velocity_x', 'velocity_y', 'width', 'height',
+    'damage', 'state', 'has_hit', 'animation_frame', 'frame_counter', 'last_frame_time', 'created_ms',
+    'stun_ticks',
+)
+
+
+# ----------------------------------------------------------------------
+# Proyectil básico: línea recta, anima sus frames y daña al primer enemigo que toca
+# ----------------------------------------------------------------------
+BASIC_ANIMATION_MS = 100  # ms entre frames
+
+
+def _update_basic(projectile, ground_level, world):
+    projectile.x += projectile.velocity_x
+    projectile.y += projectile.velocity_y
+    if projectile.y + projectile.height >= ground_level:
+        return False
+    enemies = world.enemies_touching(projectile.rect(), projectile.owner_team)
+    if enemies:
+        enemies[0].receive_hit(projectile.damage, projectile.owner_number)
+        return False
+    frames = projectile.frames
+    if len(frames) > 1:
+        now = sim_clock.get_ticks()
+        if now - projectile.last_frame_time >= BASIC_ANIMATION_MS:
+            projectile.animation_frame = (projectile.animation_frame + 1) % len(frames)
+            projectile.last_frame_time = now
+    return True
+
+
+def _draw_basic(projectile, surface, camera_offset_x):
+    if projectile.frames:
+        blit_sprite(surface, projectile.frames[projectile.animation_frame],
+                    int(projectile.x) + camera_offset_x, int(projectile.y))
+
+
+KIND_BASIC = register_kind('basic', _update_basic, _draw_basic)
+
+
+# Gestor por defecto compartido por los luchadores que no reciben uno propio
+default_manager = ProjectileManager()
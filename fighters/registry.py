@@ -0,0 +1,115 @@
+"""
+Registro de personajes.
+
+La lista de personajes sale de characters.json: cada entrada indica su clase
+("class"), el módulo de fighters que la define ("module"), el nombre y la
+descripción de la pantalla de selección, la imagen de previsualización
+("preview") y la clave de su sonido de ataque ("sound"). La selección de
+personajes, la creación de luchadores y las simulaciones leen de aquí.
+
+Las clases no se importan al arrancar: fighter_class() importa el módulo del
+personaje la primera vez que se pide, y el módulo registra su clase con
+@register_fighter. Añadir un personaje es añadir su entrada en
+characters.json y su módulo con la clase decorada.
+"""
+
+import importlib
+from collections.abc import Mapping
+
+from .character_data import load_character_data
+
+_entries = None
+_entries_by_class = {}
+_classes = {}
+
+
+class CharacterEntry:
+    """
+    Metadatos de un personaje (sin cargar su módulo ni sus sprites).
+
+    Attributes:
+        key (str): Clave en characters.json
+        class_name (str): Nombre de la clase del luchador
+        module (str): Módulo de fighters que define la clase
+        display_name (str): Nombre en la selección y el HUD
+        description (str): Descripción en la selección
+        preview_path (str): Imagen de previsualización
+        sound (str): Clave del efecto de sonido de ataque
+    """
+    def __init__(self, key, definition):
+        self.key = key
+        self.class_name = definition['class']
+        self.module = definition['module']
+        self.display_name = definition.get('display_name', key)
+        self.description = definition.get('description', '')
+        self.preview_path = definition.get('preview')
+        self.sound = definition.get('sound')
+
+
+def character_entries():
+    """Personajes en el orden de characters.json."""
+    global _entries
+    if _entries is None:
+        _entries = [CharacterEntry(key, definition)
+                    for key, definition in load_character_data()['characters'].items()]
+        _entries_by_class.update((entry.class_name, entry) for entry in _entries)
+    return _entries
+
+
+def character_names():
+    """Nombres de clase de todos los personajes."""
+    return [entry.class_name for entry in character_entries()]
+
+
+def get_entry(class_name):
+    """
+    Metadatos de un personaje por su nombre de clase.
+
+    Raises:
+        KeyError: Si no hay ningún personaje con esa clase
+    """
+    character_entries()
+    if class_name not in _entries_by_class:
+        raise KeyError(f"Personaje no registrado: {class_name}")
+    return _entries_by_class[class_name]
+
+
+def register_fighter(fighter_class):
+    """Decorador de las clases de personaje: las registra al importar su módulo."""
+    _classes[fighter_class.__name__] = fighter_class
+    return fighter_class
+
+
+def fighter_class(class_name):
+    """
+    Clase de un personaje, importando su módulo si todavía no se ha cargado.
+
+    Raises:
+        KeyError: Si no hay ningún personaje con esa clase
+    """
+    loaded = _classes.get(class_name)
+    if loaded is None:
+        importlib.import_module(f"{__package__}.{get_entry(class_name).module}")
+        loaded = _classes[class_name]
+    return loaded
+
+
+def load_all():
+    """Importa todos los personajes (por ejemplo para instrumentar sus clases)."""
+    return {class_name: fighter_class(class_name) for class_name in character_names()}
+
+
+class FighterClasses(Mapping):
+    """Nombre de clase -> clase, importando cada personaje al consultarlo."""
+    def __getitem__(self, class_name):
+        return fighter_class(class_name)
+
+    def __contains__(self, class_name):
+        character_entries()
+        return class_name in _entries_by_class
+
+    def __iter__(self):
+        return iter(character_names())
+
+    def __len__(self):
+        return len(character_entries())
@@ -0,0 +1,144 @@
+"""
+Calidad de render adaptativa.
+
+La calidad actual es estado del módulo (como sim_clock): quien dibuja
+consulta las banderas directamente (render_quality.shield_alpha, ...) y
+FramePacer las cambia según el coste de los frames.
+
+Cada nivel desactiva un efecto más, del menos visible al más visible:
+  0 alta                 todo activo
+  1 sin partículas       sin partículas en los menús
+  2 fondo fijo           fondo sin parallax ni reescalado
+  3 proyectiles reducidos  sprites de proyectiles a PROJECTILE_REDUCED_SCALE
+  4 mínima               escudo opaco (sin mezcla alfa)
+
+La simulación no depende de la calidad: solo cambia lo que se dibuja.
+
+Aparte de los niveles, la escala de render (render_scale, fija desde el
+arranque) dibuja el mundo en un framebuffer interno más pequeño que se
+reescala una vez por frame a la ventana. Los sprites de los luchadores se
+guardan ya a esa resolución y los de proyectiles se reducen en caché; las
+posiciones siguen en unidades del mundo y se convierten con to_render() solo
+al dibujar, así que hitboxes y colisiones no cambian.
+"""
+
+import time
+
+import pygame
+
+FRAME_BUDGET_MS = 1000 / 60
+
+# Sin tildes: la fuente del overlay no las incluye
+QUALITY_NAMES = ('alta', 'sin particulas', 'fondo fijo', 'proyectiles reducidos', 'minima')
+MAX_QUALITY_LEVEL = len(QUALITY_NAMES) - 1
+PROJECTILE_REDUCED_SCALE = 0.6
+
+# Histéresis del control: bajar es rápido y subir pide margen sostenido
+DEGRADE_RATIO = 0.9        # Frame lento: coste > 90% del presupuesto
+DEGRADE_FRAMES = 30        # Frames lentos seguidos para bajar un nivel (0.5 s)
+RESTORE_RATIO = 0.5        # Frame holgado: media < 50% del presupuesto
+RESTORE_FRAMES = 180       # Frames holgados seguidos para subir un nivel (3 s)
+COST_SMOOTHING = 0.1       # Peso del último frame en la media exponencial
+
+# Escala del framebuffer interno respecto a la ventana (1.0 = sin reescalado)
+MIN_RENDER_SCALE = 0.25
+
+# Estado actual (nivel 0: todo activo)
+level = 0
+menu_particles = True
+background_parallax = True
+projectile_scale = 1.0
+shield_alpha = True
+render_scale = 1.0
+
+
+def set_level(new_level):
+    """Aplica un nivel de calidad (0 = alta ... MAX_QUALITY_LEVEL = mínima)."""
+    global level, menu_particles, background_parallax, projectile_scale, shield_alpha
+    level = max(0, min(MAX_QUALITY_LEVEL, new_level))
+    menu_particles = level < 1
+    background_parallax = level < 2
+    projectile_scale = 1.0 if level < 3 else PROJECTILE_REDUCED_SCALE
+    shield_alpha = level < 4
+
+
+def set_render_scale(scale):
+    """
+    Fija la escala del framebuffer interno. Debe llamarse antes de crear
+    luchadores: sus sprites se guardan a la resolución interna al cargarlos.
+    """
+    global render_scale
+    if not MIN_RENDER_SCALE <= scale <= 1.0:
+        raise ValueError(f"Escala de render fuera de rango ({MIN_RENDER_SCALE:g} - 1): {scale}")
+    render_scale = scale
+
+
+def to_render(value):
+    """Coordenada o tamaño en unidades del mundo -> píxeles del framebuffer interno."""
+    return int(value * render_scale)
+
+
+def scale_animations(animation_list):
+    """Frames de animación a la resolución interna (los originales se descartan)."""
+    if render_scale == 1.0:
+        return animation_list
+    return [[pygame.transform.scale(frame, (max(1, to_render(frame.get_width())),
+                                            max(1, to_render(frame.get_height()))))
+             for frame in frames]
+            for frames in animation_list]
+
+
+def describe():
+    """Nivel actual para el overlay de depuración."""
+    text = f"Calidad: {QUALITY_NAMES[level]} ({level}/{MAX_QUALITY_LEVEL})"
+    if render_scale != 1.0:
+        text += f" | Escala {render_scale:g}x"
+    return text
+
+
+class FramePacer:
+    """
+    Mide el trabajo de cada frame (eventos, actualización, dibujo y
+    display.update, sin la espera de Clock.tick) y ajusta la calidad.
+
+    Args:
+        budget_ms (float): Presupuesto de un frame
+        adaptive (bool): False fija el nivel actual (solo mide)
+    """
+    def __init__(self, budget_ms=FRAME_BUDGET_MS, adaptive=True):
+        self.budget_ms = budget_ms
+        self.adaptive = adaptive
+        self.frame_start = None
+        self.cost_ms = 0.0       # Media exponencial del coste
+        self.slow_frames = 0
+        self.fast_frames = 0
+
+    def begin_frame(self):
+        self.frame_start = time.perf_counter()
+
+    def end_frame(self):
+        if self.frame_start is None:
+            return
+        self.record((time.perf_counter() - self.frame_start) * 1000)
+
+    def record(self, frame_ms):
+        """Registra el coste de un frame y cambia de nivel si hace falta."""
+        self.cost_ms += (frame_ms - self.cost_ms) * COST_SMOOTHING
+        if not self.adaptive:
+            return
+        if frame_ms > self.budget_ms * DEGRADE_RATIO:
+            self.slow_frames += 1
+            self.fast_frames = 0
+        elif self.cost_ms < self.budget_ms * RESTORE_RATIO:
+            self.fast_frames += 1
+            self.slow_frames = 0
+        else:
+            self.slow_frames = 0
+            self.fast_frames = 0
+
+        if self.slow_frames >= DEGRADE_FRAMES and level < MAX_QUALITY_LEVEL:
+            set_level(level + 1)
+            self.slow_frames = 0
+        elif self.fast_frames >= RESTORE_FRAMES and level > 0:
+            set_level(level - 1)
+            self.fast_frames = 0
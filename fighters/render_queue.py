@@ -0,0 +1,87 @@
+"""
+Cola de dibujo por capas para la escena del combate.
+
+RenderQueue tiene la misma firma de blit que una Surface, así que los draw()
+de luchadores y proyectiles la reciben en lugar de la superficie: en vez de
+dibujar, apuntan una entrada (sprite, destino, área, flags) en la capa activa.
+flush() envía cada capa a la superficie destino con un único
+Surface.blits(..., doreturn=False): una sola llamada de Python a SDL por capa
+en lugar de una por sprite, y sin crear el Rect que devuelve cada blit.
+
+Las capas se vuelcan en orden (fondo, luchadores, proyectiles). Dentro de una
+capa se respeta el orden de llegada salvo en las capas de sorted_layers, que
+agrupan las entradas del mismo sprite para que SDL lo lea seguido (el orden
+entre sprites distintos de esa capa deja de estar garantizado: solo conviene
+donde da igual cuál queda encima, como los proyectiles).
+
+Solo admite blits: lo que se dibuje con pygame.draw debe ir antes a un
+sprite en caché (como el contorno del escudo).
+"""
+
+from pygame import Rect
+
+LAYER_BACKGROUND = 0
+LAYER_FIGHTERS = 1
+LAYER_PROJECTILES = 2
+LAYER_NAMES = ('fondo', 'luchadores', 'proyectiles')
+
+
+def _entry_source(entry):
+    return id(entry[0])
+
+
+class RenderQueue:
+    """
+    Blits aplazados por capa.
+
+    Args:
+        target (pygame.Surface): Superficie en la que se vuelca la cola
+        sorted_layers: Capas cuyas entradas se agrupan por sprite al volcarlas
+    """
+    def __init__(self, target, sorted_layers=()):
+        self.target = target
+        self.sorted_layers = frozenset(sorted_layers)
+        self.layers = [[] for _ in LAYER_NAMES]
+        self.layer = LAYER_FIGHTERS
+        self.entries = self.layers[self.layer]
+        self.last_flush_blits = 0    # Entradas del último volcado
+        self.last_flush_calls = 0    # Llamadas a Surface.blits del último volcado
+
+    def set_layer(self, layer):
+        """Capa en la que se apuntan los blits siguientes."""
+        self.layer = layer
+        self.entries = self.layers[layer]
+
+    def blit(self, source, dest, area=None, special_flags=0):
+        """
+        Como Surface.blit, pero aplazado hasta flush(). Un Rect de destino o de
+        área se copia: quien dibuja puede seguir reutilizando el suyo.
+        """
+        if type(dest) is Rect:
+            dest = dest.topleft
+        if type(area) is Rect:
+            area = Rect(area)
+        self.entries.append((source, dest, area, special_flags))
+
+    def __len__(self):
+        return sum(len(entries) for entries in self.layers)
+
+    def flush(self):
+        """Dibuja las capas en orden (un Surface.blits por capa con entradas) y vacía la cola."""
+        blits = self.target.blits
+        self.last_flush_blits = 0
+        self.last_flush_calls = 0
+        for layer, entries in enumerate(self.layers):
+            if not entries:
+                continue
+            if layer in self.sorted_layers:
+                entries.sort(key=_entry_source)
+            blits(entries, doreturn=False)
+            self.last_flush_blits += len(entries)
+            self.last_flush_calls += 1
+            entries.clear()
+
+    def clear(self):
+        """Descarta lo apuntado sin dibujarlo."""
+        for entries in self.layers:
+            entries.clear()
@@ -0,0 +1,58 @@
+"""
+Reloj compartido por los luchadores y sus proyectiles.
+
+En el juego normal delega en pygame.time.get_ticks(). Las simulaciones
+headless lo cambian a tiempo simulado: cada tick avanza exactamente un
+frame de 60 FPS, de modo que animaciones, combos y trampas son
+deterministas e independientes de la velocidad real de la máquina.
+"""
+
+import pygame
+
+# Frames por segundo que representa un tick simulado
+SIMULATED_FPS = 60
+
+# Tick simulado actual (None = usar el reloj real de pygame)
+_simulated_tick = None
+
+
+def ticks_to_ms(tick):
+    """Convierte un número de ticks simulados a milisegundos (entero)."""
+    return (tick * 1000) // SIMULATED_FPS
+
+
+def get_ticks():
+    """Retorna el tiempo actual en milisegundos (real o simulado)."""
+    if _simulated_tick is None:
+        return pygame.time.get_ticks()
+    return ticks_to_ms(_simulated_tick)
+
+
+def use_simulated_time(start_tick=0):
+    """Activa el tiempo simulado comenzando en el tick indicado."""
+    global _simulated_tick
+    _simulated_tick = start_tick
+
+
+def use_real_time():
+    """Vuelve a usar el reloj real de pygame."""
+    global _simulated_tick
+    _simulated_tick = None
+
+
+def is_simulated():
+    """Indica si el reloj está en modo simulado."""
+    return _simulated_tick is not None
+
+
+def get_simulated_tick():
+    """Retorna el tick simulado actual (None si se usa el reloj real)."""
+    return _simulated_tick
+
+
+def advance_tick(count=1):
+    """Avanza el reloj simulado el número de ticks indicado."""
+    global _simulated_tick
+    if _simulated_tick is None:
+        raise RuntimeError("El reloj no está en modo simulado")
+    _simulated_tick += count
@@ -2,157 +2,122 @@ import pygame
 import os
 import random
 from .base_fighter import Fighter
+from .registry import register_fighter
+from . import sim_clock
+from .character_data import ATTACK_ACTIONS
+from .projectiles import register_kind, visual_sprite, blit_sprite
+from .render_quality import to_render
+from .spatial_hash import LAYER_EXPLOSION
 
 
-class SlimeDemonFighter(Fighter):
-    """
-    Clase específica para el personaje Slime Demon.
-    Hereda de Fighter e implementa carga de sprites y características específicas.
-    NOTA: Los sprites del Slime Demon pueden estar orientados en dirección opuesta,
-    por lo que sobrescribimos la lógica de flip.
-    """
-    
-    class LavaDropProjectile:
-        """Pequeña gota de lava que usa frames de attack2 para animación.
-        - Mientras cae: usa los primeros 2 frames de attack2 alternando
-        - Cuando explota: usa los frames restantes de attack2 rápidamente
-        """
-        def __init__(self, x, y, fall_speed, damage, target_rect, fall_frames=None, explosion_frames=None):
-            self.x = x
-            self.y = y
-            self.fall_speed = fall_speed
-            self.damage = damage
-            self.target_rect = target_rect
-            self.width = 20
-            self.height = 20
-            self.phase = 'fall'
-            # Frames de animación para el PROYECTIL (no el personaje)
-            self.fall_frames = fall_frames or []
-            self.explosion_frames = explosion_frames or []
-            self.current_frame_index = 0
-            self.last_frame_time = pygame.time.get_ticks()
-            self.fall_anim_speed = 150  # ms entre frames mientras cae
-            self.explosion_anim_speed = 50  # ms entre frames durante explosión
-            # Estados de explosión
-            self.explosion_rect = None
-            self.explosion_finished = False
-            self.damage_applied = False
-
-        def rect(self):
-            return pygame.Rect(int(self.x), int(self.y), self.width, self.height)
+# ----------------------------------------------------------------------
+# Gotas de lava del ataque 2 (proyectiles del ProjectileManager)
+# ----------------------------------------------------------------------
+# Estados de una gota
+DROP_FALLING = 0
+DROP_EXPLODING = 1
 
-        def update(self, ground_level, target):
-            if self.phase == 'fall':
-                self.y += self.fall_speed
-                self._update_fall_animation()
-                r = self.rect()
-                # Impacto con enemigo
-                if r.colliderect(target.collision_rect):
-                    self._enter_explosion()
-                    self._apply_damage_if_inside(target)
-                # Impacto con suelo
-                elif self.y + self.height >= ground_level:
-                    self._enter_explosion()
-                    self._apply_damage_if_inside(target)
-            elif self.phase == 'explosion':
-                self._update_explosion_animation()
+LAVA_DROP_SIZE = 20             # Tamaño de la gota mientras cae
+LAVA_EXPLOSION_SIZE = 60        # Tamaño del área (y sprite) de la explosión
+LAVA_FALL_ANIMATION_MS = 150    # ms entre frames mientras cae
+LAVA_EXPLOSION_ANIMATION_MS = 50  # ms entre frames durante la explosión
 
-        def _update_fall_animation(self):
-            """Anima el proyectil alternando entre los primeros 2 frames de attack2."""
-            if not self.fall_frames or len(self.fall_frames) < 2:
-                return
-            now = pygame.time.get_ticks()
-            if now - self.last_frame_time >= self.fall_anim_speed:
-                self.current_frame_index = (self.current_frame_index + 1) % len(self.fall_frames)
-                self.last_frame_time = now
 
-        def _update_explosion_animation(self):
-            """Reproduce rápidamente los frames de explosión."""
-            if not self.explosion_frames:
-                self.explosion_finished = True
-                return
-            now = pygame.time.get_ticks()
-            if now - self.last_frame_time >= self.explosion_anim_speed:
-                self.current_frame_index += 1
-                if self.current_frame_index >= len(self.explosion_frames):
-                    self.explosion_finished = True
-                else:
-                    self.last_frame_time = now
+def _update_lava_drop(drop, ground_level, world):
+    """Cae hasta tocar a un enemigo o el suelo y explota (frames = caída, extra_frames = explosión)."""
+    if drop.state == DROP_FALLING:
+        drop.y += drop.velocity_y
+        # Animación de caída alternando los primeros 2 frames de attack2
+        if len(drop.frames) >= 2:
+            now = sim_clock.get_ticks()
+            if now - drop.last_frame_time >= LAVA_FALL_ANIMATION_MS:
+                drop.animation_frame = (drop.animation_frame + 1) % len(drop.frames)
+                drop.last_frame_time = now
+        # Impacto con enemigo o con el suelo
+        if world.enemies_touching(drop.rect(), drop.owner_team) or drop.y + drop.height >= ground_level:
+            drop.state = DROP_EXPLODING
+            drop.animation_frame = 0
+            drop.last_frame_time = sim_clock.get_ticks()
+            explosion = drop.hit_rect
+            explosion.update(int(drop.x + drop.width / 2 - LAVA_EXPLOSION_SIZE / 2),
+                             int(drop.y + drop.height / 2 - LAVA_EXPLOSION_SIZE / 2),
+                             LAVA_EXPLOSION_SIZE, LAVA_EXPLOSION_SIZE)
+            if not drop.has_hit:
+                # La explosión alcanza a todos los enemigos dentro del área
+                for enemy in world.enemies_touching(explosion, drop.owner_team):
+                    enemy.receive_hit(drop.damage, drop.owner_number)
+                    drop.has_hit = True
+        return True
 
-        def _enter_explosion(self):
-            if self.phase == 'explosion':
-                return
-            self.phase = 'explosion'
-            self.current_frame_index = 0  # Começar desde el primer frame de explosión
-            self.last_frame_time = pygame.time.get_ticks()
-            # Área de explosión
-            size = 60
-            ex = int(self.x + self.width/2 - size/2)
-            ey = int(self.y + self.height/2 - size/2)
-            self.explosion_rect = pygame.Rect(ex, ey, size, size)
+    # Explosión: reproduce rápidamente los frames restantes de attack2
+    if not drop.extra_frames:
+        return False
+    now = sim_clock.get_ticks()
+    if now - drop.last_frame_time >= LAVA_EXPLOSION_ANIMATION_MS:
+        drop.animation_frame += 1
+        if drop.animation_frame >= len(drop.extra_frames):
+            return False
+        drop.last_frame_time = now
+    return True
 
-        def _apply_damage_if_inside(self, target):
-            if not self.damage_applied and self.explosion_rect and self.explosion_rect.colliderect(target.collision_rect):
-                target.apply_damage(self.damage)
-                target.is_hit = True
-                self.damage_applied = True
 
-        def get_current_frame(self):
-            """Retorna el frame actual del proyectil según su fase."""
-            if self.phase == 'fall' and self.fall_frames:
-                frame = self.fall_frames[self.current_frame_index % len(self.fall_frames)]
-                # Escalar a tamaño pequeño para proyectil
-                return pygame.transform.scale(frame, (self.width, self.height))
-            elif self.phase == 'explosion' and self.explosion_frames and self.current_frame_index < len(self.explosion_frames):
-                frame = self.explosion_frames[self.current_frame_index]
-                # Escalar a tamaño de explosión más grande y centrar en la posición del proyectil
-                explosion_size = 60  # Mismo tamaño que el área de daño
-                return pygame.transform.scale(frame, (explosion_size, explosion_size))
-            return None
+def _draw_lava_drop(drop, surface, camera_offset_x):
+    if drop.state == DROP_FALLING:
+        if drop.frames:
+            blit_sprite(surface, drop.frames[drop.animation_frame % len(drop.frames)],
+                        int(drop.x) + camera_offset_x, int(drop.y))
+    elif drop.animation_frame < len(drop.extra_frames):
+        # La explosión se centra en la posición de la gota
+        frame = visual_sprite(drop.extra_frames[drop.animation_frame])
+        surface.blit(frame, (to_render(int(drop.x) + camera_offset_x) - frame.get_width() // 2,
+                             to_render(drop.y) - frame.get_height() // 2))
 
-        def is_alive(self):
-            return not (self.phase == 'explosion' and self.explosion_finished)
 
-    def __init__(self, player_number, initial_x, initial_y, flip_sprite, attack_sound):
-        # Slime Demon con tamaño más moderado
-        slime_demon_data = [150, 3.2, [65, 40]]  # [size, scale, offset] - reducido considerablemente
+KIND_LAVA_DROP = register_kind('lava_drop', _update_lava_drop, _draw_lava_drop)
 
-        # Inicializar la clase padre
-        super().__init__(player_number, initial_x, initial_y, flip_sprite, slime_demon_data, attack_sound)
 
-        # Características específicas del Slime Demon
-        self.character_name = "Slime Demon"
-        self.max_health = 100  # Salud estándar
-        self.current_health = self.max_health
-        
-        # Flag para indicar que este personaje tiene sprites invertidos
-        self.sprites_inverted = True
 
-        # Ajustar velocidad reducida
-        self.base_movement_speed = 6  # Notoriamente menor que 10 del Warrior
+@register_fighter
+class SlimeDemonFighter(Fighter):
+    """
+    Clase específica para el personaje Slime Demon.
+    Hereda de Fighter e implementa carga de sprites y características específicas.
+    NOTA: Los sprites del Slime Demon pueden estar orientados en dirección opuesta,
+    por lo que sobrescribimos la lógica de flip.
+    """
+    
+    character_key = 'slime_demon'
+    snapshot_fields = Fighter.snapshot_fields + ('attack2_projectiles_spawned', 'attack3_explosion_triggered')
 
-        # Ajustar hitbox para tamaño más moderado
-        old_bottom = self.collision_rect.bottom
-        self.collision_rect.width = 90   # Reducido de 110
-        self.collision_rect.height = 190  # Reducido de 220
-        self.collision_rect.bottom = old_bottom
+    def __init__(self, player_number, initial_x, initial_y, flip_sprite, attack_sound):
+        # Estadísticas, hitbox y ataques definidos en characters.json
+        # (incluye lava_drop_damage y sacrifice_ratio)
+        super().__init__(player_number, initial_x, initial_y, flip_sprite, None, attack_sound)
 
         # Sistema de proyectiles para ataque 2 (lluvia)
-        self.active_projectiles = []
         self.attack2_projectiles_spawned = False
+        self.lava_drop_frames = None  # (frames de caída, frames de explosión) ya escalados
 
         # Flags para explosión de ataque 3 (auto-sacrificio)
         self.attack3_explosion_triggered = False
+        self.explosion_rect = pygame.Rect(0, 0, 0, 0)  # Rect reutilizable del área de la explosión
 
     def spawn_attack2_projectiles(self, target):
         """Genera de 1 a 3 pequeñas gotas de lava que usan frames de attack2."""
         if self.attack2_projectiles_spawned:
             return
         count = random.randint(1, 3)
-        # Obtener frames de attack2 para los PROYECTILES
-        attack2_frames = self.animation_list[4] if len(self.animation_list) > 4 else []
-        fall_frames = attack2_frames[:2] if len(attack2_frames) >= 2 else []
-        explosion_frames = attack2_frames[2:] if len(attack2_frames) > 2 else []
+        if self.lava_drop_frames is None:
+            # Frames de attack2 para los PROYECTILES, escalados una sola vez
+            attack2_frames = self.animation_list[4] if len(self.animation_list) > 4 else []
+            fall_frames = attack2_frames[:2] if len(attack2_frames) >= 2 else []
+            explosion_frames = attack2_frames[2:] if len(attack2_frames) > 2 else []
+            self.lava_drop_frames = (
+                tuple(pygame.transform.scale(frame, (LAVA_DROP_SIZE, LAVA_DROP_SIZE)) for frame in fall_frames),
+                tuple(pygame.transform.scale(frame, (LAVA_EXPLOSION_SIZE, LAVA_EXPLOSION_SIZE))
+                      for frame in explosion_frames),
+            )
+        fall_frames, explosion_frames = self.lava_drop_frames
         
         for i in range(count):
             # Reducir el rango de offset para asegurar que los proyectiles sean visibles
@@ -160,36 +125,23 @@ class SlimeDemonFighter(Fighter):
             spawn_x = max(50, min(1350, target.collision_rect.centerx + offset))
             spawn_y = 50
             fall_speed = random.uniform(7, 11)
-            proj = self.LavaDropProjectile(
-                spawn_x, spawn_y, 
-                fall_speed=fall_speed, 
-                damage=4, 
-                target_rect=target.collision_rect,
-                fall_frames=fall_frames, 
-                explosion_frames=explosion_frames
-            )
-            self.active_projectiles.append(proj)
+            drop = self.projectiles.spawn(KIND_LAVA_DROP, self.player_number, target, spawn_x, spawn_y,
+                                          velocity_y=fall_speed, damage=self.lava_drop_damage,
+                                          width=LAVA_DROP_SIZE, height=LAVA_DROP_SIZE, owner_team=self.team)
+            drop.state = DROP_FALLING
+            drop.frames = fall_frames
+            drop.extra_frames = explosion_frames
         
         self.attack2_projectiles_spawned = True
 
-    def process_projectiles(self, target):
-        """Actualiza todos los proyectiles activos."""
-        ground_level = 550
-        remaining = []
-        for proj in self.active_projectiles:
-            proj.update(ground_level, target)
-            if proj.is_alive():
-                remaining.append(proj)
-        self.active_projectiles = remaining
-
     def trigger_attack3_explosion(self, target):
-        """Explosión sacrificando mitad de vida actual para infligir igual daño al enemigo."""
+        """Explosión sacrificando mitad de vida actual para infligir igual daño a los enemigos del área."""
         if self.attack3_explosion_triggered:
             return
         current_effective_health = self.current_health
         if current_effective_health <= 0:
             return
-        sacrifice = current_effective_health // 2
+        sacrifice = int(current_effective_health * self.sacrifice_ratio)
         if sacrifice <= 0:
             return
         
@@ -201,11 +153,13 @@ class SlimeDemonFighter(Fighter):
         explosion_height = 360
         explosion_x = self.collision_rect.centerx - explosion_width // 2
         explosion_y = self.collision_rect.bottom - explosion_height
-        explosion_rect = pygame.Rect(explosion_x, explosion_y, explosion_width, explosion_height)
+        explosion_rect = self.explosion_rect
+        explosion_rect.update(explosion_x, explosion_y, explosion_width, explosion_height)
         
-        if explosion_rect.colliderect(target.collision_rect) and target.is_alive:
-            target.apply_damage(sacrifice)
-            target.is_hit = True
+        self.collision_world.add(explosion_rect, self, LAYER_EXPLOSION)
+        for enemy in self.collision_world.enemies_touching(explosion_rect, self.team):
+            if enemy.is_alive:
+                enemy.receive_hit(sacrifice, self.player_number)
         
         self.attack3_explosion_triggered = True
         self.attack3_explosion_rect = explosion_rect
@@ -223,19 +177,17 @@ class SlimeDemonFighter(Fighter):
             self.update_current_action(6)  # 6: animación de ser golpeado
         elif self.is_attacking:
             # PERSONALIZACIÓN: Durante attack2, mantener idle para evitar frames de attack2
-            if self.current_attack_type == 1:
-                self.update_current_action(3)  # 3: primer ataque
-            elif self.current_attack_type == 2:
+            if self.current_attack_type == 2:
                 self.update_current_action(0)  # 0: idle (NO attack2)
-                # Para attack2, terminar después de cierta cantidad de frames
-                attack2_duration = len(self.animation_list[4]) if len(self.animation_list) > 4 else 5
+                # Para attack2, terminar tras tantos ticks como frames tiene su animación
+                attack2_duration = self.character_table.animation_lengths[4]
                 if self.attack_frame_counter >= attack2_duration:
                     self.is_attacking = False
-                    self.attack_cooldown_timer = 20
+                    self.attack_cooldown_timer = self.character_table.attack_end_cooldown
                     self.attack_has_hit = False
                     self.attack2_projectiles_spawned = False
-            elif self.current_attack_type == 3:
-                self.update_current_action(5)  # 5: tercer ataque
+            elif self.current_attack_type in (1, 3):
+                self.update_current_action(ATTACK_ACTIONS[self.current_attack_type])
             
             self.attack_frame_counter += 1
         elif self.is_jumping:
@@ -252,7 +204,7 @@ class SlimeDemonFighter(Fighter):
         self.current_image = self.animation_list[self.current_action][self.frame_index]
         
         # Verificar si es tiempo de avanzar al siguiente frame de animación
-        current_time = pygame.time.get_ticks()
+        current_time = sim_clock.get_ticks()
         if current_time - self.last_update_time > animation_frame_duration:
             self.frame_index += 1
             self.last_update_time = current_time
@@ -262,10 +214,11 @@ class SlimeDemonFighter(Fighter):
                 self.check_collision_with_target(target)
             
         # Verificar si la animación ha completado todos sus frames
-        if self.frame_index >= len(self.animation_list[self.current_action]):
+        animation_length = self.character_table.animation_lengths[self.current_action]
+        if self.frame_index >= animation_length:
             if not self.is_alive:
                 # Si está muerto, mantener en el último frame de muerte
-                self.frame_index = len(self.animation_list[self.current_action]) - 1
+                self.frame_index = animation_length - 1
                 self.death_animation_done = True
             else:
                 # Reiniciar animación para acciones repetitivas
@@ -274,20 +227,18 @@ class SlimeDemonFighter(Fighter):
                 # Manejar fin de animaciones específicas
                 if self.current_action in [3, 5]:  # Solo ataques 1 y 3 (no 2)
                     self.is_attacking = False
-                    self.attack_cooldown_timer = 20
+                    self.attack_cooldown_timer = self.character_table.attack_end_cooldown
                     self.attack_has_hit = False
                     
                 if self.current_action == 6:  # Animación de recibir daño
                     self.is_hit = False
                     self.is_attacking = False
-                    self.attack_cooldown_timer = 20
+                    self.attack_cooldown_timer = self.character_table.attack_end_cooldown
         
         # Decrementar el cooldown de ataque
         if self.attack_cooldown_timer > 0:
             self.attack_cooldown_timer -= 1
-            
-        # Procesar efectos de quemadura
-        self.process_burn_effect()
+
             
         # Llamar hook personalizado
         self.post_update_hook(target)
@@ -297,76 +248,19 @@ class SlimeDemonFighter(Fighter):
         if not self.is_alive:
             return
         
-        # Siempre procesar proyectiles activos sin importar estado de ataque
-        if self.active_projectiles:
-            self.process_projectiles(target)
-        
         # Spawn proyectiles al inicio del segundo ataque
         if self.is_attacking and self.current_attack_type == 2 and self.frame_index == 0:
             self.spawn_attack2_projectiles(target)
         
         # Ataque 3: explosión al alcanzar último tercio de la animación
         if self.is_attacking and self.current_attack_type == 3:
-            total_frames_atk3 = len(self.animation_list[5]) if len(self.animation_list) > 5 else 0
-            trigger_threshold = (2 * total_frames_atk3) // 3
-            if self.frame_index >= trigger_threshold:
+            if self.frame_index >= self.character_table.hit_frame[3]:
                 self.trigger_attack3_explosion(target)
         else:
             if not self.is_attacking:
                 self.attack3_explosion_triggered = False
                 self.attack3_explosion_rect = None
 
-    def calculate_attack_damage(self):
-        """Daños específicos del Slime Demon rework."""
-        if self.current_attack_type == 1:
-            # Aplicar daño sólo segunda mitad para simular carga lenta
-            total_frames_atk1 = len(self.animation_list[3]) if len(self.animation_list) > 3 else 0
-            if total_frames_atk1 and self.frame_index >= total_frames_atk1 // 2 and not self.attack_has_hit:
-                return 14  # Un poco más que el ataque 3 del Warrior
-            return 0
-        # Ataque 2 y 3 gestionan su daño externamente
-        return 0
-
-    def check_collision_with_target(self, target):
-        """Sobrescribe colisión para ataque 1 (pesado). Ataques 2 y 3 gestionan daño externamente."""
-        if not self.is_attacking or not self.is_alive or not target.is_alive:
-            return
-        if self.current_attack_type != 1:
-            return  # Otros ataques no aplican daño por contacto directo
-        
-        attack_area = self.get_attack_area()
-        if attack_area is None or not attack_area.colliderect(target.collision_rect):
-            return
-        if self.attack_has_hit:
-            return
-        
-        dmg = self.calculate_attack_damage()
-        if dmg > 0:
-            target.apply_damage(dmg)
-            target.is_hit = True
-            self.attack_has_hit = True
-
-    def get_attack_area(self):
-        """Área de ataque personalizada."""
-        if not self.is_attacking:
-            return None
-        if self.current_attack_type == 1:
-            width = 300
-            attack_y = self.collision_rect.y - 60
-            attack_height = 550 - attack_y + 20
-            if self.flip_sprite:
-                attack_x = self.collision_rect.centerx - width
-            else:
-                attack_x = self.collision_rect.centerx
-            return pygame.Rect(attack_x, attack_y, width, attack_height)
-        return None
-
-    def get_attack_area_for_display(self, attack_type):
-        """Para visualización, mostrar área del ataque 1 únicamente."""
-        if attack_type == 1:
-            return self.get_attack_area()
-        return None
-
     def draw(self, surface, camera_offset_x=0, show_hitboxes=False):
         """Dibuja el Slime Demon y sus proyectiles independientes."""
         # Durante attack2, mostrar idle en lugar de la animación de attack2
@@ -378,7 +272,7 @@ class SlimeDemonFighter(Fighter):
             if len(self.animation_list) > 0 and len(self.animation_list[0]) > 0:
                 idle_frames = len(self.animation_list[0])
                 # Usar el tiempo para determinar el frame actual de idle
-                current_time = pygame.time.get_ticks()
+                current_time = sim_clock.get_ticks()
                 animation_frame_duration = 200  # Animación más lenta para idle
                 idle_frame_index = (current_time // animation_frame_duration) % idle_frames
                 temp_image = self.animation_list[0][idle_frame_index]
@@ -390,46 +284,29 @@ class SlimeDemonFighter(Fighter):
                 if hasattr(self, 'sprites_inverted') and self.sprites_inverted:
                     actual_flip = not self.flip_sprite
                 
-                # Voltear la imagen horizontalmente si es necesario
-                final_image = pygame.transform.flip(temp_image, actual_flip, False)
-                
-                # Centrar el sprite en la hitbox automáticamente
-                sprite_width = temp_image.get_width()
-                sprite_height = temp_image.get_height()
-                
-                # Centrar horizontalmente el sprite en la hitbox
-                draw_x = self.collision_rect.centerx - (sprite_width // 2) + camera_offset_x
-                
-                # Alinear verticalmente
-                draw_y = self.collision_rect.bottom - sprite_height + 20
-                
-                surface.blit(final_image, (draw_x, draw_y))
+                # Centrado en la hitbox igual que cualquier otro frame
+                self.draw_sprite(surface, temp_image, actual_flip, camera_offset_x)
         else:
             # Dibujar normalmente para todos los otros ataques
             super().draw(surface, camera_offset_x, show_hitboxes)
+
+    def draw_hitbox(self, surface, show_attack_area=False, camera_offset_x=0):
+        """Hitbox y área de ataque, más el contorno de la explosión del ataque 3."""
+        super().draw_hitbox(surface, show_attack_area, camera_offset_x)
+        if self.attack3_explosion_triggered and self.is_attacking and self.current_attack_type == 3:
+            if hasattr(self, 'attack3_explosion_rect') and self.attack3_explosion_rect:
+                r = self.display_rect
+                r.update(self.attack3_explosion_rect)
+                r.x += camera_offset_x
+                pygame.draw.rect(surface, (255, 140, 0), r, 3)
         
-        # Dibujar proyectiles usando sus propios frames de animación
-        for proj in self.active_projectiles:
-            frame = proj.get_current_frame()
-            if frame:
-                if proj.phase == 'explosion':
-                    # Para explosión, centrar el frame en la posición del proyectil
-                    draw_x = int(proj.x) - frame.get_width()//2 + camera_offset_x
-                    draw_y = int(proj.y) - frame.get_height()//2
-                else:
-                    # Para caída, dibujar el frame normalmente
-                    draw_x = int(proj.x) + camera_offset_x
-                    draw_y = int(proj.y)
-                surface.blit(frame, (draw_x, draw_y))
-            # Eliminado el fallback de círculo naranja
-        
-        # Opcional: dibujar contorno de explosión del ataque 3 (solo si se muestran hitboxes)
-        if show_hitboxes:
-            if self.attack3_explosion_triggered and self.is_attacking and self.current_attack_type == 3:
-                if hasattr(self, 'attack3_explosion_rect') and self.attack3_explosion_rect:
-                    r = self.attack3_explosion_rect
-                    pygame.draw.rect(surface, (255, 140, 0), pygame.Rect(r.x + camera_offset_x, r.y, r.width, r.height), 3)
-        
+    def reset(self, initial_x, flip_sprite):
+        """Estado de inicio de combate (también sin lluvia ni explosión en curso)."""
+        super().reset(initial_x, flip_sprite)
+        self.attack2_projectiles_spawned = False
+        self.attack3_explosion_triggered = False
+        self.attack3_explosion_rect = None
+
     def load_individual_sprites(self):
         """Carga los sprites individuales del Slime Demon desde sus directorios."""
         base_path = "assets/images/slime_demon/Sprites"
@@ -0,0 +1,238 @@
+"""
+Broadphase de colisiones: hash espacial de rejilla uniforme sobre el escenario.
+
+El escenario (1400x600) se divide en celdas cuadradas; cada rectángulo se
+añade a todas las celdas que toca. Una consulta solo mira las celdas del
+rectángulo consultado y resuelve cada celda en bloque con Rect.collidelistall,
+por lo que su coste depende de la densidad local y no del número total de
+entidades.
+
+CollisionWorld agrupa los índices de un combate:
+- luchadores (hurtboxes), que se reindexan solo cuando alguno se ha movido;
+  también resuelve objetivos (enemigo más cercano) y filtra por equipo
+- entidades del tick: proyectiles, trampas, explosiones y áreas de ataque,
+  con una capa (LAYER_*) para filtrar las consultas
+
+Orden en cada tick: mover luchadores -> begin_tick() -> update de los
+luchadores (áreas de ataque, explosiones) -> ProjectileManager.update() ->
+end_tick(). Entre ticks el mundo no guarda la lista de luchadores: cada
+luchador apunta a su mundo (Fighter.collision_world), y si el mundo apuntara
+a los luchadores el ciclo solo lo liberaría el recolector de ciclos.
+"""
+
+import pygame
+
+# Dimensiones del escenario (mismas que main.py)
+STAGE_WIDTH = 1400
+STAGE_HEIGHT = 600
+DEFAULT_CELL_SIZE = 100
+
+# Capas de entidades
+LAYER_FIGHTER = 1
+LAYER_PROJECTILE = 2
+LAYER_TRAP = 4
+LAYER_EXPLOSION = 8
+LAYER_ATTACK = 16
+ALL_LAYERS = LAYER_FIGHTER | LAYER_PROJECTILE | LAYER_TRAP | LAYER_EXPLOSION | LAYER_ATTACK
+
+# Colores del overlay de depuración por capa
+LAYER_COLORS = {
+    LAYER_FIGHTER: (0, 255, 0),
+    LAYER_PROJECTILE: (255, 255, 0),
+    LAYER_TRAP: (255, 128, 0),
+    LAYER_EXPLOSION: (255, 0, 0),
+    LAYER_ATTACK: (255, 0, 255),
+}
+
+
+class SpatialHash:
+    """
+    Rejilla uniforme de rectángulos.
+
+    Los rectángulos se guardan por referencia: si uno se mueve fuera de sus
+    celdas hay que reconstruir el índice (clear() + insert()). Lo que queda
+    fuera del escenario se asigna a las celdas del borde.
+
+    Args:
+        width, height (int): Tamaño del área cubierta
+        cell_size (int): Lado de cada celda en píxeles
+    """
+    __slots__ = ('cell_size', 'columns', 'rows', 'cell_rects', 'cell_entries', 'occupied',
+                 'rects', 'items', 'layers')
+
+    def __init__(self, width=STAGE_WIDTH, height=STAGE_HEIGHT, cell_size=DEFAULT_CELL_SIZE):
+        self.cell_size = cell_size
+        self.columns = width // cell_size + 1
+        self.rows = height // cell_size + 1
+        count = self.columns * self.rows
+        self.cell_rects = [[] for _ in range(count)]    # Rectángulos de cada celda
+        self.cell_entries = [[] for _ in range(count)]  # Entrada de cada rectángulo de la celda
+        self.occupied = []  # Celdas no vacías (clear() solo recorre estas)
+        self.rects = []
+        self.items = []
+        self.layers = []
+
+    def __len__(self):
+        return len(self.items)
+
+    def _span(self, rect):
+        """Columnas y filas (inclusivas) que toca un rectángulo, limitadas a la rejilla."""
+        cell_size = self.cell_size
+        last_column = self.columns - 1
+        last_row = self.rows - 1
+        first_column = min(max(rect.left // cell_size, 0), last_column)
+        end_column = min(max((rect.right - 1) // cell_size, 0), last_column)
+        first_row = min(max(rect.top // cell_size, 0), last_row)
+        end_row = min(max((rect.bottom - 1) // cell_size, 0), last_row)
+        return first_column, end_column, first_row, end_row
+
+    def insert(self, rect, item, layer=LAYER_FIGHTER):
+        """Añade un rectángulo con su objeto asociado y devuelve su número de entrada."""
+        entry = len(self.items)
+        self.rects.append(rect)
+        self.items.append(item)
+        self.layers.append(layer)
+        first_column, end_column, first_row, end_row = self._span(rect)
+        columns = self.columns
+        for row in range(first_row, end_row + 1):
+            for cell in range(row * columns + first_column, row * columns + end_column + 1):
+                cell_rects = self.cell_rects[cell]
+                if not cell_rects:
+                    self.occupied.append(cell)
+                cell_rects.append(rect)
+                self.cell_entries[cell].append(entry)
+        return entry
+
+    def clear(self):
+        """Vacía el índice (coste proporcional a las celdas ocupadas)."""
+        for cell in self.occupied:
+            self.cell_rects[cell].clear()
+            self.cell_entries[cell].clear()
+        self.occupied.clear()
+        self.rects.clear()
+        self.items.clear()
+        self.layers.clear()
+
+    def query(self, rect, layers=ALL_LAYERS):
+        """Objetos cuyos rectángulos se solapan con `rect` (filtrados por capa, sin repetidos)."""
+        first_column, end_column, first_row, end_row = self._span(rect)
+        items = self.items
+        entry_layers = self.layers
+        found = []
+        if first_column == end_column and first_row == end_row:
+            # Caso habitual: el rectángulo cae en una sola celda
+            cell = first_row * self.columns + first_column
+            entries = self.cell_entries[cell]
+            for index in rect.collidelistall(self.cell_rects[cell]):
+                entry = entries[index]
+                if entry_layers[entry] & layers:
+                    found.append(items[entry])
+            return found
+
+        seen = set()
+        columns = self.columns
+        for row in range(first_row, end_row + 1):
+            for cell in range(row * columns + first_column, row * columns + end_column + 1):
+                entries = self.cell_entries[cell]
+                if not entries:
+                    continue
+                for index in rect.collidelistall(self.cell_rects[cell]):
+                    entry = entries[index]
+                    if entry not in seen and entry_layers[entry] & layers:
+                        seen.add(entry)
+                        found.append(items[entry])
+        return found
+
+    def query_many(self, rects, layers=ALL_LAYERS):
+        """Consulta en lote: una lista de resultados por rectángulo."""
+        query = self.query
+        return [query(rect, layers) for rect in rects]
+
+
+class CollisionWorld:
+    """
+    Broadphase de un combate: hurtboxes de los luchadores y entidades del tick.
+
+    Args:
+        width, height (int): Tamaño del escenario
+        cell_size (int): Lado de las celdas de ambos índices
+    """
+    def __init__(self, width=STAGE_WIDTH, height=STAGE_HEIGHT, cell_size=DEFAULT_CELL_SIZE):
+        self.fighter_index = SpatialHash(width, height, cell_size)
+        self.entity_index = SpatialHash(width, height, cell_size)
+        self.fighters = ()
+        self.dirty = True  # Algún luchador se movió desde la última indexación
+
+    def begin_tick(self, fighters):
+        """Empieza un tick tras mover a los luchadores: vacía las entidades y marca las hurtboxes para reindexar."""
+        self.fighters = fighters
+        self.dirty = True
+        self.entity_index.clear()
+
+    def end_tick(self):
+        """Termina el tick: suelta los luchadores y sus hurtboxes (las entidades del tick se conservan)."""
+        self.fighters = ()
+        self.dirty = True
+        self.fighter_index.clear()
+
+    def invalidate(self):
+        """Marca las hurtboxes para reindexar (un luchador se movió, por ejemplo por empuje)."""
+        self.dirty = True
+
+    def fighters_touching(self, rect):
+        """Luchadores cuya hurtbox se solapa con `rect`."""
+        if self.dirty:
+            index = self.fighter_index
+            index.clear()
+            for fighter in self.fighters:
+                index.insert(fighter.collision_rect, fighter, LAYER_FIGHTER)
+            self.dirty = False
+        return self.fighter_index.query(rect)
+
+    def enemies_touching(self, rect, team):
+        """Luchadores de otros equipos cuya hurtbox se solapa con `rect`."""
+        return [fighter for fighter in self.fighters_touching(rect) if fighter.team != team]
+
+    @staticmethod
+    def nearest_enemy(fighter, fighters):
+        """
+        Enemigo más cercano en horizontal entre `fighters`, prefiriendo los que siguen vivos.
+
+        Returns:
+            Fighter: None si no hay luchadores de otros equipos
+        """
+        center_x = fighter.collision_rect.centerx
+        best = None
+        best_key = None
+        for other in fighters:
+            if other.team == fighter.team:
+                continue
+            key = (not other.is_alive, abs(other.collision_rect.centerx - center_x))
+            if best_key is None or key < best_key:
+                best, best_key = other, key
+        return best
+
+    def add(self, rect, item, layer):
+        """Indexa una entidad del tick (proyectil, trampa, explosión o área de ataque)."""
+        self.entity_index.insert(rect, item, layer)
+
+    def entities_touching(self, rect, layers=ALL_LAYERS):
+        """Entidades del tick que se solapan con `rect`."""
+        return self.entity_index.query(rect, layers)
+
+    def clear(self):
+        """Suelta todas las referencias (nuevo combate)."""
+        self.fighters = ()
+        self.dirty = True
+        self.fighter_index.clear()
+        self.entity_index.clear()
+
+    def draw_debug(self, surface, camera_offset_x=0):
+        """Dibuja las entidades indexadas en este tick con el color de su capa."""
+        index = self.entity_index
+        for rect, layer in zip(index.rects, index.layers):
+            pygame.draw.rect(surface, LAYER_COLORS[layer], rect.move(camera_offset_x, 0), 1)
+
+
+# Mundo por defecto compartido por los luchadores que no reciben uno propio
+default_world = CollisionWorld()
@@ -0,0 +1,143 @@
+"""
+Motor de efectos de estado (quemadura, sangrado, aturdimiento y futuros DoT).
+
+Cada luchador guarda sus efectos en un array compacto indexado por tipo de
+efecto, con la lista de efectos activos aparte. Los efectos se programan por
+tick: process() solo trabaja cuando llega el siguiente tick de daño o de fin
+de algún efecto (next_wake), de modo que el coste es O(efectos activos) en
+esos ticks y O(1) en el resto. El orden de proceso es el del índice del tipo,
+por lo que el resultado es determinista.
+
+El daño se reparte como en el sistema original: en cada intervalo se aplica
+max(1, daño_restante // intervalos_restantes), y el último tramo aplica
+todo lo que quede.
+"""
+
+# Tipos de efecto
+STATUS_BURN = 'burn'
+STATUS_BLEEDING = 'bleeding'
+STATUS_STUN = 'stun'
+
+# Reglas de acumulación al reaplicar un efecto activo
+STACK_REPLACE = 'replace'  # El nuevo efecto sustituye al anterior
+STACK_ADD = 'add'          # Suma el daño y alarga la duración hasta la mayor de las dos
+STACK_EXTEND = 'extend'    # Conserva el efecto y alarga la duración hasta la mayor de las dos
+
+# Definición de cada tipo: (intervalo de daño en ticks o 0 si no hace daño, acumulación)
+STATUS_DEFINITIONS = {
+    STATUS_BURN: (60, STACK_REPLACE),
+    STATUS_BLEEDING: (45, STACK_REPLACE),
+    STATUS_STUN: (0, STACK_EXTEND),
+}
+STATUS_KINDS = tuple(STATUS_DEFINITIONS)
+_KIND_INDEX = {kind: index for index, kind in enumerate(STATUS_KINDS)}
+_INTERVALS = tuple(STATUS_DEFINITIONS[kind][0] for kind in STATUS_KINDS)
+_STACKING = tuple(STATUS_DEFINITIONS[kind][1] for kind in STATUS_KINDS)
+
+_NEVER = float('inf')
+
+
+class StatusEffects:
+    """
+    Efectos de estado activos de un luchador.
+
+    No guarda referencia al luchador (process() lo recibe) para no crear un
+    ciclo de referencias que retrasaría la liberación de sus sprites.
+
+    Args:
+        immunities: Tipos de efecto que no se aplican a este luchador
+    """
+    __slots__ = ('immunities', 'tick', 'next_wake', 'active', 'remaining', 'end_tick', 'next_tick')
+
+    def __init__(self, immunities=()):
+        self.immunities = frozenset(immunities)
+        self.tick = 0                # Ticks procesados por este luchador
+        self.next_wake = _NEVER      # Próximo tick en el que hay algo que hacer
+        self.active = []             # Índices de tipos activos, ordenados
+        count = len(STATUS_KINDS)
+        self.remaining = [0] * count  # Daño pendiente
+        self.end_tick = [0] * count   # Tick en el que termina el efecto
+        self.next_tick = [0] * count  # Siguiente tick de daño
+
+    def apply(self, kind, damage, duration):
+        """
+        Aplica un efecto según su regla de acumulación.
+
+        Returns:
+            bool: False si el luchador es inmune o la duración no es positiva
+        """
+        index = _KIND_INDEX[kind]
+        if kind in self.immunities or duration <= 0 or (_INTERVALS[index] and damage <= 0):
+            return False
+        end_tick = self.tick + duration
+        if index in self.active and _STACKING[index] != STACK_REPLACE:
+            if _STACKING[index] == STACK_ADD:
+                self.remaining[index] += damage
+            self.end_tick[index] = max(self.end_tick[index], end_tick)
+        else:
+            if index not in self.active:
+                self.active.append(index)
+                self.active.sort()
+            self.remaining[index] = damage
+            self.end_tick[index] = end_tick
+            interval = _INTERVALS[index]
+            self.next_tick[index] = self.tick + interval if interval else _NEVER
+        self._reschedule()
+        return True
+
+    def is_active(self, kind):
+        """Indica si un tipo de efecto está activo."""
+        return _KIND_INDEX[kind] in self.active
+
+    def clear(self):
+        """Elimina todos los efectos activos."""
+        self.active.clear()
+        self.next_wake = _NEVER
+
+    def process(self, owner):
+        """
+        Avanza un tick: aplica el daño programado y retira los efectos terminados.
+
+        Args:
+            owner (Fighter): Luchador que recibe el daño (apply_damage)
+        """
+        self.tick += 1
+        tick = self.tick
+        if tick < self.next_wake:
+            return
+        for index in tuple(self.active):
+            interval = _INTERVALS[index]
+            if interval and tick == self.next_tick[index]:
+                remaining = self.remaining[index]
+                ticks_left = self.end_tick[index] - tick + 1
+                damage = max(1, remaining // (ticks_left // interval)) if ticks_left >= interval else remaining
+                if damage > 0:
+                    owner.apply_damage(damage)
+                    self.remaining[index] = remaining - damage
+                self.next_tick[index] = tick + interval
+            if tick >= self.end_tick[index] or (interval and self.remaining[index] <= 0):
+                self.active.remove(index)
+        self._reschedule()
+
+    def __copy__(self):
+        """Copia independiente (listas propias)."""
+        clone = StatusEffects.__new__(StatusEffects)
+        clone.immunities = self.immunities
+        clone.tick = self.tick
+        clone.next_wake = self.next_wake
+        clone.active = list(self.active)
+        clone.remaining = list(self.remaining)
+        clone.end_tick = list(self.end_tick)
+        clone.next_tick = list(self.next_tick)
+        return clone
+
+    def _reschedule(self):
+        wake = _NEVER
+        for index in self.active:
+            wake = min(wake, self.next_tick[index], self.end_tick[index])
+        self.next_wake = wake
+
+    def snapshot(self):
+        """Estado inmutable de los efectos (para comparar o restaurar)."""
+        return (self.tick, tuple((STATUS_KINDS[index], self.remaining[index], self.end_tick[index],
+                                  self.next_tick[index]) for index in self.active))
@@ -0,0 +1,202 @@
+"""
+Trazas de spans exportables a Chrome trace / Perfetto.
+
+SpanTracer guarda cada span (inicio y fin con time.perf_counter_ns, reloj
+monótono en nanosegundos, y el índice de su nombre) en arrays preasignados
+que funcionan como búfer circular: con el búfer lleno se sobrescriben los
+spans más antiguos, de modo que un volcado siempre contiene los últimos
+`capacity` spans. dump() escribe el formato JSON de Chrome trace (eventos
+"X"), que abren chrome://tracing y ui.perfetto.dev. Cada span guarda
+también el hilo que lo abrió (por ejemplo las cargas de la precarga de
+escenas), que aparece como una pista propia.
+
+Dos formas de registrar spans:
+- push(name) / pop(): la misma interfaz que FrameProfiler, para los puntos
+  de medición de main.py y de Arena.step_profiled
+- instrument_methods(): envuelve métodos de clase (carga de sprites,
+  Fighter.update, check_collision_with_target, draw...) solo cuando se
+  activa el modo traza; sin él las clases quedan intactas y no hay coste.
+"""
+
+import functools
+import json
+import os
+import threading
+from array import array
+from time import perf_counter_ns
+
+from . import registry
+from .base_fighter import Fighter
+from .projectiles import ProjectileManager
+from .spatial_hash import CollisionWorld
+
+DEFAULT_TRACE_CAPACITY = 1 << 20  # Spans en el búfer (~20 MB)
+DEFAULT_TRACE_PATH = 'dungeon_fighters.trace.json'
+
+# Métodos que se trazan en cada clase (solo si la clase los define)
+TRACED_FIGHTER_METHODS = (
+    '__init__', 'load_individual_sprites', 'load_trap_and_projectile_sprites',
+    'move', 'update', 'check_collision_with_target', 'draw', 'draw_shield', 'draw_hitbox',
+)
+TRACED_PROJECTILE_METHODS = ('update', 'draw')
+TRACED_WORLD_METHODS = ('begin_tick', 'draw_debug')
+
+
+class SpanTracer:
+    """
+    Búfer circular de spans.
+
+    Args:
+        capacity (int): Spans que caben en el búfer
+    """
+    def __init__(self, capacity=DEFAULT_TRACE_CAPACITY):
+        self.capacity = capacity
+        self.starts = array('q', bytes(8 * capacity))
+        self.ends = array('q', bytes(8 * capacity))
+        self.name_ids = array('i', bytes(4 * capacity))
+        self.thread_ids = array('i', bytes(4 * capacity))
+        self.names = []
+        self.name_index = {}
+        self.thread_names = []
+        self.thread_index = {}
+        self.count = 0       # Spans empezados desde el inicio (el búfer guarda los últimos)
+        self.stack = []
+        self.origin = perf_counter_ns()
+
+    def name_id(self, name):
+        name_id = self.name_index.get(name)
+        if name_id is None:
+            name_id = self.name_index[name] = len(self.names)
+            self.names.append(name)
+        return name_id
+
+    def thread_id(self):
+        ident = threading.get_ident()
+        thread_id = self.thread_index.get(ident)
+        if thread_id is None:
+            thread_id = self.thread_index[ident] = len(self.thread_names)
+            self.thread_names.append(threading.current_thread().name)
+        return thread_id
+
+    def begin(self, name):
+        """Empieza un span y devuelve su posición en el búfer (para end)."""
+        slot = self.count % self.capacity
+        self.count += 1
+        self.name_ids[slot] = self.name_id(name)
+        self.thread_ids[slot] = self.thread_id()
+        self.ends[slot] = 0
+        self.starts[slot] = perf_counter_ns()
+        return slot
+
+    def end(self, slot):
+        self.ends[slot] = perf_counter_ns()
+
+    # Interfaz de FrameProfiler
+    def begin_frame(self):
+        self.push('frame')
+
+    def push(self, name):
+        self.stack.append(self.begin(name))
+
+    def pop(self):
+        self.end(self.stack.pop())
+
+    def end_frame(self):
+        self.pop()
+
+    def events(self):
+        """Spans terminados que siguen en el búfer, como eventos "X" de Chrome trace."""
+        process_id = os.getpid()
+        first = max(0, self.count - self.capacity)
+        events = [{'name': 'process_name', 'ph': 'M', 'pid': process_id, 'tid': 0,
+                   'args': {'name': 'Dungeon Fighters'}}]
+        events.extend({'name': 'thread_name', 'ph': 'M', 'pid': process_id, 'tid': thread_id,
+                       'args': {'name': thread_name}}
+                      for thread_id, thread_name in enumerate(self.thread_names))
+        for index in range(first, self.count):
+            slot = index % self.capacity
+            end = self.ends[slot]
+            if not end:
+                continue  # Span todavía abierto (por ejemplo, el frame del volcado)
+            start = self.starts[slot]
+            events.append({
+                'name': self.names[self.name_ids[slot]],
+                'ph': 'X',
+                'ts': (start - self.origin) / 1000,
+                'dur': (end - start) / 1000,
+                'pid': process_id,
+                'tid': self.thread_ids[slot],
+            })
+        return events
+
+    def dump(self, path=DEFAULT_TRACE_PATH):
+        """
+        Escribe la traza en JSON de Chrome trace (a un temporal que luego se renombra).
+
+        Returns:
+            int: Spans escritos
+        """
+        events = self.events()
+        temp_path = path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as trace_file:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, trace_file)
+        os.replace(temp_path, path)
+        return len(events) - 1
+
+
+class SectionGroup:
+    """Reparte push/pop y los límites de frame entre varios medidores (perfilador y traza)."""
+    def __init__(self, instruments):
+        self.instruments = tuple(instruments)
+
+    def begin_frame(self):
+        for instrument in self.instruments:
+            instrument.begin_frame()
+
+    def push(self, name):
+        for instrument in self.instruments:
+            instrument.push(name)
+
+    def pop(self):
+        for instrument in reversed(self.instruments):
+            instrument.pop()
+
+    def end_frame(self):
+        for instrument in reversed(self.instruments):
+            instrument.end_frame()
+
+
+def traced(tracer, name, function):
+    """Envuelve una función para que cada llamada sea un span `name`."""
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        slot = tracer.begin(name)
+        try:
+            return function(*args, **kwargs)
+        finally:
+            tracer.end(slot)
+    return wrapper
+
+
+def instrument_methods(tracer, classes, method_names):
+    """Traza los métodos `method_names` definidos en cada clase (span "Clase.método")."""
+    for cls in classes:
+        for method_name in method_names:
+            function = cls.__dict__.get(method_name)
+            if callable(function):
+                setattr(cls, method_name, traced(tracer, f"{cls.__name__}.{method_name}", function))
+
+
+def _subclasses(cls):
+    result = [cls]
+    for subclass in cls.__subclasses__():
+        result.extend(_subclasses(subclass))
+    return result
+
+
+def instrument_fighters(tracer):
+    """Traza los métodos calientes de todos los luchadores, proyectiles y el broadphase."""
+    registry.load_all()  # Las clases que no se hayan importado todavía no se instrumentarían
+    instrument_methods(tracer, _subclasses(Fighter), TRACED_FIGHTER_METHODS)
+    instrument_methods(tracer, (ProjectileManager,), TRACED_PROJECTILE_METHODS)
+    instrument_methods(tracer, (CollisionWorld,), TRACED_WORLD_METHODS)
@@ -7,15 +7,57 @@ Características principales:
 - Pantalla de selección de personajes
 - Visualización de hitboxes con tecla Z
 - Escenario más amplio para mejor combate
+- Modos de arena: 1v1, 2v2 y todos contra todos de 4 u 8 luchadores
+  (python main.py --mode ffa4); P1 y P2 juegan con teclado y el resto son bots
+- Oponente de CPU con dificultad elegible en la selección de personajes (TAB),
+  incluida una IA de búsqueda que simula el combate en otro proceso
+- Perfilador por frame con tiempos por subsistema (tecla F3)
+- Modo traza (python main.py --trace): spans exportables a Chrome trace /
+  Perfetto al salir o con F4
+- Calidad de render adaptativa: si los frames no caben en el presupuesto de
+  60 FPS se desactivan efectos y se recuperan al volver a haber margen
+  (python main.py --quality 0-4 fija un nivel)
+- Escala de render para equipos con poca GPU: el mundo se dibuja en un
+  framebuffer interno más pequeño que se reescala a la ventana
+  (python main.py --render-scale 0.5); la jugabilidad no cambia
+- Escenas (scenes.py) con ganchos de entrada y salida: la arena, los fondos
+  votados y la pantalla de victoria se cargan en segundo plano mientras se
+  juega la escena anterior, así que los cambios de escena no bloquean el frame
+- Arranque por etapas: la ventana muestra una pantalla de carga en cuanto
+  existe y lo que la primera escena no necesita (pantalla de escenarios, IA
+  de búsqueda, personajes) se carga después o bajo demanda
+  (python main.py --profile-startup imprime los tiempos del arranque)
 """
 
+import sys
+from startup_profile import StartupProfile
+
+# Antes que cualquier otra importación para poder medirlas todas (por eso el
+# flag se mira aquí directamente; argparse solo lo documenta)
+startup_profile = StartupProfile(enabled='--profile-startup' in sys.argv[1:])
+
+import argparse
 import pygame
 from pygame import mixer
-from fighters import WarriorFighter, SlimeDemonFighter, AssassinFighter, TankFighter, TrapperFighter
-from character_select import CharacterSelectScreen
-from scenario_select import ScenarioSelectScreen
-import math
-import random
+startup_profile.checkpoint('pygame')
+
+# Modo de arena elegido por línea de comandos. Los valores se comprueban
+# después de la pantalla de carga: las listas válidas (modos de arena, niveles
+# de calidad) viven en módulos que se importan ya con la ventana abierta
+argument_parser = argparse.ArgumentParser(description="Dungeon Fighters")
+argument_parser.add_argument('--mode', default='1v1', metavar='MODO',
+                             help="1v1, 2v2 o todos contra todos (ffa4, ffa8)")
+argument_parser.add_argument('--trace', nargs='?', const=True, default=None, metavar='RUTA',
+                             help="Registrar spans y volcarlos en JSON de Chrome trace al salir o con F4")
+argument_parser.add_argument('--quality', default='auto', metavar='CALIDAD',
+                             help="Calidad de render: auto (adaptativa) o un nivel fijo (0 = alta)")
+argument_parser.add_argument('--render-scale', type=float, default=1.0, metavar='ESCALA',
+                             help="Resolución interna del mundo respecto a la ventana (p. ej. 0.5 o 0.75)")
+argument_parser.add_argument('--profile-startup', action='store_true',
+                             help="Imprimir tiempos de importación, de carga y hasta el primer frame")
+command_line_arguments = argument_parser.parse_known_args()[0]
+ARENA_MODE = command_line_arguments.mode
+QUALITY_MODE = command_line_arguments.quality
 
 # Inicialización de pygame y mixer para audio
 mixer.init()
@@ -30,10 +72,92 @@ ORIGINAL_SCREEN_WIDTH = SCREEN_WIDTH  # Para cálculos de zoom
 game_screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
 pygame.display.set_caption("Dungeon Fighters - Enhanced Edition")
 
+# Configurar fuentes para el texto
+try:
+    countdown_font = pygame.font.Font("assets/fonts/turok.ttf", 80)
+    score_font = pygame.font.Font("assets/fonts/turok.ttf", 30)
+    debug_font = pygame.font.Font("assets/fonts/turok.ttf", 16)
+except:
+    # Fuentes por defecto si no se encuentran las personalizadas
+    countdown_font = pygame.font.Font(None, 80)
+    score_font = pygame.font.Font(None, 30)
+    debug_font = pygame.font.Font(None, 16)
+    print("Usando fuentes por defecto")
+
+# Pantalla de carga: el primer frame sale en cuanto existe la ventana y el
+# resto del arranque se hace detrás
+game_screen.fill((0, 0, 0))
+splash_title = score_font.render("Dungeon Fighters", True, (255, 255, 255))
+game_screen.blit(splash_title, splash_title.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)))
+splash_text = debug_font.render("Cargando...", True, (255, 255, 255))
+game_screen.blit(splash_text, splash_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 40)))
+pygame.display.update()
+startup_profile.first_frame()
+startup_profile.checkpoint('ventana y pantalla de carga')
+
+# Resto del arranque, ya con la pantalla de carga visible
+import random
+from fighters import registry
+from fighters.arena import Arena, ARENA_MODES, spawn_layout
+from fighters.fighter_pool import FighterPool
+from fighters.frame_profiler import FrameProfiler, PANEL_WIDTH
+from fighters import render_quality
+from fighters.render_quality import FramePacer, MAX_QUALITY_LEVEL, to_render
+from fighters.render_queue import RenderQueue, LAYER_BACKGROUND, LAYER_FIGHTERS, LAYER_PROJECTILES
+from fighters.tracing import (SpanTracer, SectionGroup, instrument_fighters, instrument_methods,
+                              DEFAULT_TRACE_PATH)
+from character_select import CharacterSelectScreen
+from scenario_select import ScenarioSelectScreen
+from scenes import Scene, SceneManager
+from fighters.cpu import create_cpu_controller, CPU_DIFFICULTIES, DEFAULT_CPU_DIFFICULTY, CPU_SEARCH
+startup_profile.checkpoint('importaciones')
+
+if ARENA_MODE not in ARENA_MODES:
+    argument_parser.error(f"--mode debe ser uno de: {', '.join(sorted(ARENA_MODES))}")
+if QUALITY_MODE != 'auto' and QUALITY_MODE not in [str(level) for level in range(MAX_QUALITY_LEVEL + 1)]:
+    argument_parser.error(f"--quality debe ser auto o un nivel de 0 a {MAX_QUALITY_LEVEL}")
+TRACE_PATH = DEFAULT_TRACE_PATH if command_line_arguments.trace is True else command_line_arguments.trace
+
+# La escala se fija antes de cargar sprites: se guardan a la resolución interna
+try:
+    render_quality.set_render_scale(command_line_arguments.render_scale)
+except ValueError as error:
+    argument_parser.error(str(error))
+
+# Personajes de characters.json (lo primero que necesita la selección)
+registry.character_entries()
+startup_profile.checkpoint('registro de personajes')
+
+# Modo traza: se instrumenta antes de crear pantallas y luchadores para
+# registrar también la carga de sprites
+game_tracer = None
+if TRACE_PATH:
+    game_tracer = SpanTracer()
+    instrument_fighters(game_tracer)
+    instrument_methods(game_tracer, (CharacterSelectScreen, ScenarioSelectScreen),
+                       ('__init__', 'load_character_previews', 'load_scenarios', 'update', 'draw'))
+
+# Framebuffer interno del mundo (fondo, luchadores y proyectiles); a escala 1
+# es la propia ventana. HUD, textos y hitboxes se dibujan en la ventana
+if render_quality.render_scale == 1.0:
+    scene_surface = game_screen
+else:
+    scene_surface = pygame.Surface((to_render(SCREEN_WIDTH), to_render(SCREEN_HEIGHT))).convert()
+
+# Blits del mundo agrupados por capa: un Surface.blits por capa y frame. Sin
+# agrupar por sprite: con los pocos proyectiles de un combate ordenar cuesta
+# más de lo que ahorra (python -m benchmarks --scenarios render)
+scene_queue = RenderQueue(scene_surface)
+
 # Configuración de framerate
 game_clock = pygame.time.Clock()
 FRAMES_PER_SECOND = 60
 
+# Control de calidad según el coste de cada frame (o nivel fijo con --quality)
+frame_pacer = FramePacer(1000 / FRAMES_PER_SECOND, adaptive=QUALITY_MODE == 'auto')
+if QUALITY_MODE != 'auto':
+    render_quality.set_level(int(QUALITY_MODE))
+
 # Definición de colores usando snake_case
 COLOR_RED = (255, 0, 0)
 COLOR_YELLOW = (255, 255, 0)
@@ -43,20 +167,22 @@ COLOR_BLUE = (0, 0, 255)
 COLOR_ORANGE = (255, 165, 0)
 
 # Variables de estado del juego
-intro_countdown = 3
-last_countdown_update = pygame.time.get_ticks()
-player_scores = [0, 0]  # Puntuaciones de los jugadores [P1, P2]
-is_round_over = False
+team_scores = {team: 0 for team in ARENA_MODES[ARENA_MODE]}  # Rondas ganadas por equipo
+COUNTDOWN_SECONDS = 3
 ROUND_OVER_DURATION = 2000  # Duración en milisegundos antes de la nueva ronda
 
-# Estados del juego
-GAME_STATE_CHARACTER_SELECT = 0
-GAME_STATE_SCENARIO_SELECT = 1
-GAME_STATE_COUNTDOWN = 2
-GAME_STATE_FIGHTING = 3
-GAME_STATE_ROUND_OVER = 4
+# Escenas del juego (el nombre aparece en el perfilador y en las trazas)
+SCENE_CHARACTER_SELECT = 'CHARACTER_SELECT'
+SCENE_SCENARIO_SELECT = 'SCENARIO_SELECT'
+SCENE_COUNTDOWN = 'COUNTDOWN'
+SCENE_FIGHTING = 'FIGHTING'
+SCENE_ROUND_OVER = 'ROUND_OVER'
 
-current_game_state = GAME_STATE_CHARACTER_SELECT
+# Recursos que se cargan en segundo plano (los fondos extendidos se guardan
+# como "fondo:<fichero>", uno por escenario votado)
+ARENA_RESOURCE = 'arena'
+VICTORY_RESOURCE = 'victoria'
+SCENARIO_SCREEN_RESOURCE = 'escenarios'
 
 # Sistema de cámara simple con desplazamiento horizontal
 camera_offset_x = 0
@@ -66,6 +192,14 @@ CAMERA_BORDER_MARGIN = 200  # Margen desde los bordes para mover la cámara
 # Control de visualización de hitboxes
 show_hitboxes = False
 
+# Perfilador por frame (F3); None cuando está desactivado. El cambio se
+# aplica al empezar el siguiente frame para no medir frames a medias
+frame_profiler = None
+profiler_toggle_requested = False
+
+# Medidores de secciones del frame (perfilador y/o traza); None si no hay ninguno
+frame_instruments = game_tracer
+
 # Cargar y configurar música y efectos de sonido
 try:
     pygame.mixer.music.load("assets/audio/music.mp3")
@@ -88,6 +222,7 @@ try:
 except:
     magic_sound_effect = None
     print("No se pudo cargar el efecto de sonido de magia")
+startup_profile.checkpoint('musica y sonidos')
 
 # Cargar imagen de fondo
 try:
@@ -97,42 +232,42 @@ except:
     background_image = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
     background_image.fill((50, 50, 100))  # Azul oscuro como fondo por defecto
     print("No se pudo cargar la imagen de fondo, usando color por defecto")
-
-# Cargar imagen de victoria
-try:
-    victory_image = pygame.image.load("assets/images/icons/victory.png").convert_alpha()
-except:
-    # Crear imagen de victoria por defecto
-    victory_image = pygame.Surface((200, 100))
-    victory_image.fill((255, 215, 0))  # Dorado
-    print("No se pudo cargar la imagen de victoria, usando por defecto")
-
-# Configurar fuentes para el texto
-try:
-    countdown_font = pygame.font.Font("assets/fonts/turok.ttf", 80)
-    score_font = pygame.font.Font("assets/fonts/turok.ttf", 30)
-    debug_font = pygame.font.Font("assets/fonts/turok.ttf", 16)
-except:
-    # Fuentes por defecto si no se encuentran las personalizadas
-    countdown_font = pygame.font.Font(None, 80)
-    score_font = pygame.font.Font(None, 30)
-    debug_font = pygame.font.Font(None, 16)
-    print("Usando fuentes por defecto")
+startup_profile.checkpoint('fondo')
 
 # Inicializar pantalla de selección de personajes
 character_select_screen = CharacterSelectScreen(SCREEN_WIDTH, SCREEN_HEIGHT)
+startup_profile.checkpoint('seleccion de personajes')
 
-# Inicializar pantalla de selección de escenarios
-scenario_select_screen = ScenarioSelectScreen(SCREEN_WIDTH, SCREEN_HEIGHT)
+# Pantalla de selección de escenarios: carga y escala todos los fondos, así
+# que se crea en el hilo de precarga durante la selección de personajes
+# (recurso SCENARIO_SCREEN_RESOURCE de su escena)
+scenario_select_screen = None
 
 # Variable para almacenar el background actual
 current_background_image = None
 
-# Variables para los luchadores (se inicializarán después de la selección)
-fighter_player_1 = None
-fighter_player_2 = None
+# Fondo reescalado en caché (solo se recalcula al cambiar de imagen) y su
+# versión fija y opaca del tamaño de la pantalla (calidad sin parallax)
+scaled_background_source = None
+scaled_background = None
+fixed_background = None
+
+# Arena del combate actual (se crea después de la selección)
+current_arena = None
+round_winner = None
 selected_characters = (None, None)
-round_over_start_time = 0
+search_worker = None  # Proceso de la IA de búsqueda (se lanza la primera vez que se elige)
+fighter_pool = FighterPool()  # Luchadores ya cargados: las revanchas los reinician en vez de crearlos
+
+# Efecto de sonido de ataque por su clave en characters.json ("sound")
+ATTACK_SOUNDS = {
+    'sword': sword_sound_effect,
+    'magic': magic_sound_effect,
+}
+
+# Colores de equipo para el HUD de la arena
+TEAM_COLORS = [(255, 80, 80), (80, 160, 255), (80, 255, 120), (255, 220, 80),
+               (220, 120, 255), (80, 240, 240), (255, 150, 60), (200, 200, 200)]
 
 def draw_text_on_screen(text, font, text_color, x_position, y_position):
     """
@@ -148,21 +283,56 @@ def draw_text_on_screen(text, font, text_color, x_position, y_position):
     text_surface = font.render(str(text), True, text_color)
     game_screen.blit(text_surface, (x_position, y_position))
 
+def build_extended_background(image):
+    """
+    Fondo extendido para permitir movimiento sin mostrar bordes, a la
+    resolución interna. Se puede llamar desde el hilo de precarga.
+    """
+    extended_width = SCREEN_WIDTH + 800  # Fondo más amplio para el movimiento
+    return pygame.transform.scale(image, (to_render(extended_width), to_render(SCREEN_HEIGHT)))
+
+def background_resource(scenario):
+    """Nombre y función de carga del fondo extendido de un escenario (para el precargador)."""
+    image = scenario['image']
+    return f"fondo:{scenario['filename']}", lambda: build_extended_background(image)
+
+def use_background(image, extended=None):
+    """
+    Fija el fondo de la arena (None = fondo por defecto). extended es su
+    versión extendida si ya está precargada; si no, se crea al dibujarla.
+    """
+    global current_background_image, scaled_background_source, scaled_background, fixed_background
+    current_background_image = image
+    if extended is not None:
+        scaled_background_source = image
+        scaled_background = extended
+        fixed_background = None
+
 def draw_game_background():
     """
     Dibuja el fondo del juego con desplazamiento horizontal correcto.
     Utiliza el background seleccionado en el escenario o el fondo por defecto.
     """
-    global current_background_image
+    global scaled_background_source, scaled_background, fixed_background
     # Seleccionar qué imagen de fondo usar
     bg_image = current_background_image if current_background_image else background_image
     
-    # Crear fondo extendido para permitir movimiento sin mostrar bordes
-    extended_width = SCREEN_WIDTH + 800  # Fondo más amplio para el movimiento
-    scaled_background = pygame.transform.scale(bg_image, (extended_width, SCREEN_HEIGHT))
+    # Fondo extendido en caché (precargado al votar el escenario, o creado aquí)
+    if bg_image is not scaled_background_source:
+        scaled_background = build_extended_background(bg_image)
+        scaled_background_source = bg_image
+        fixed_background = None
+    
+    # Calidad reducida: fondo centrado sin parallax, opaco (sin mezcla alfa)
+    if not render_quality.background_parallax:
+        if fixed_background is None:
+            fixed_background = scaled_background.subsurface(
+                (to_render(300), 0, scene_surface.get_width(), scene_surface.get_height())).convert()
+        scene_queue.blit(fixed_background, (0, 0))
+        return
     
-    # Aplicar offset de cámara con parallax sutil
-    bg_x = int(camera_offset_x * 0.2) - 300  # Offset inicial para centrar el fondo
+    # Aplicar offset de cámara con parallax sutil (en píxeles del framebuffer interno)
+    bg_x = to_render(int(camera_offset_x * 0.2) - 300)  # Offset inicial para centrar el fondo
     bg_y = 0
     
     # Asegurar que el fondo siempre cubra toda la pantalla
@@ -170,13 +340,13 @@ def draw_game_background():
     if bg_x > 0:
         bg_x = 0
     # Si el fondo se sale por la derecha, ajustarlo
-    elif bg_x < -(extended_width - SCREEN_WIDTH):
-        bg_x = -(extended_width - SCREEN_WIDTH)
+    elif bg_x < scene_surface.get_width() - scaled_background.get_width():
+        bg_x = scene_surface.get_width() - scaled_background.get_width()
     
     # Dibujar el fondo una sola vez en la posición calculada
-    game_screen.blit(scaled_background, (bg_x, bg_y))
+    scene_queue.blit(scaled_background, (bg_x, bg_y))
 
-def draw_health_bar(current_health, max_health, x_position, y_position):
+def draw_health_bar(current_health, max_health, x_position, y_position, bar_width=400, bar_height=30):
     """
     Dibuja la barra de salud de un jugador.
     
@@ -185,13 +355,12 @@ def draw_health_bar(current_health, max_health, x_position, y_position):
         max_health (int): Salud máxima del jugador
         x_position (int): Posición X de la barra
         y_position (int): Posición Y de la barra
+        bar_width, bar_height (int): Tamaño de la barra (más pequeña en la arena de N luchadores)
     """
     # Calcular proporción de salud restante
     health_ratio = max(current_health / max_health, 0)  # Asegurar que no sea negativo
     
-    # Dimensiones de la barra de salud
-    bar_width = 400
-    bar_height = 30
+    # Grosor del borde de la barra de salud
     border_thickness = 2
     
     # Dibujar borde blanco
@@ -215,22 +384,21 @@ def draw_health_bar(current_health, max_health, x_position, y_position):
     health_rect = pygame.Rect(x_position, y_position, health_width, bar_height)
     pygame.draw.rect(game_screen, health_color, health_rect)
 
-def calculate_camera_follow(fighter1, fighter2):
+def calculate_camera_follow(arena):
     """
     Calcula el seguimiento simple de cámara basado en la posición de los luchadores.
-    La cámara se mueve horizontalmente para mantener a ambos luchadores en pantalla.
+    La cámara se mueve horizontalmente para mantener a los luchadores en pantalla.
     
     Args:
-        fighter1: Primer luchador
-        fighter2: Segundo luchador
+        arena (Arena): Combate actual
     """
     global camera_offset_x
     
-    if not fighter1 or not fighter2:
+    if not arena:
         return
     
-    # Calcular punto medio entre luchadores
-    midpoint_x = (fighter1.collision_rect.centerx + fighter2.collision_rect.centerx) // 2
+    # Calcular punto medio entre los luchadores más alejados
+    midpoint_x = arena.focus_x()
     
     # Calcular posición ideal de cámara para centrar el punto medio
     ideal_camera_x = (SCREEN_WIDTH // 2) - midpoint_x
@@ -243,232 +411,482 @@ def calculate_camera_follow(fighter1, fighter2):
     # Suavizar movimiento de cámara con mejor responsividad
     camera_offset_x += (ideal_camera_x - camera_offset_x) * (CAMERA_FOLLOW_SPEED * 1.5)
 
-def create_fighters_from_selection():
+def create_fighter(character_name, player_number, initial_x, flip_sprite):
     """
-    Crea las instancias de luchadores basadas en la selección de personajes.
+    Crea un luchador del personaje indicado, o reinicia el que ya se creó
+    para ese personaje y jugador en una ronda anterior.
     
-    Returns:
-        tuple: (fighter_1, fighter_2)
+    Args:
+        character_name (str): Nombre de la clase del personaje
+        player_number (int): Número del jugador (1 y 2 usan teclado)
+        initial_x (int): Posición horizontal inicial
+        flip_sprite (bool): Si empieza mirando a la izquierda
     """
-    p1_character, p2_character = character_select_screen.get_selected_characters()
-    
-    # Posiciones iniciales más separadas para el escenario amplio
-    initial_x_p1 = 300  # Más hacia la izquierda
-    initial_x_p2 = 1100  # Más hacia la derecha
+    fighter_class = registry.fighter_class(character_name)
+    attack_sound = ATTACK_SOUNDS.get(registry.get_entry(character_name).sound)
     initial_y = 370  # Posición que permite que el bottom del rect toque el suelo en 550
+    return fighter_pool.acquire(fighter_class, player_number, initial_x, initial_y, flip_sprite, attack_sound)
+
+def create_arena_from_selection():
+    """
+    Crea la arena del modo elegido con los personajes seleccionados para P1 y P2.
+    Si se eligió una dificultad de CPU, P2 lo controla la CPU. El resto de
+    luchadores (2v2 y todos contra todos) son CPU con personaje aleatorio.
     
-    # Crear luchador del jugador 1
-    if p1_character == 'WarriorFighter':
-        fighter_1 = WarriorFighter(1, initial_x_p1, initial_y, False, sword_sound_effect)
-    elif p1_character == 'SlimeDemonFighter':
-        fighter_1 = SlimeDemonFighter(1, initial_x_p1, initial_y, False, magic_sound_effect)
-    elif p1_character == 'AssassinFighter':
-        fighter_1 = AssassinFighter(1, initial_x_p1, initial_y, False, sword_sound_effect)
-    elif p1_character == 'TankFighter':
-        fighter_1 = TankFighter(1, initial_x_p1, initial_y, False, sword_sound_effect)
-    elif p1_character == 'TrapperFighter':
-        fighter_1 = TrapperFighter(1, initial_x_p1, initial_y, False, sword_sound_effect)
-    else:
-        # Por defecto, usar Warrior
-        fighter_1 = WarriorFighter(1, initial_x_p1, initial_y, False, sword_sound_effect)
-    
-    # Crear luchador del jugador 2
-    if p2_character == 'WarriorFighter':
-        fighter_2 = WarriorFighter(2, initial_x_p2, initial_y, True, sword_sound_effect)
-    elif p2_character == 'SlimeDemonFighter':
-        fighter_2 = SlimeDemonFighter(2, initial_x_p2, initial_y, True, magic_sound_effect)
-    elif p2_character == 'AssassinFighter':
-        fighter_2 = AssassinFighter(2, initial_x_p2, initial_y, True, sword_sound_effect)
-    elif p2_character == 'TankFighter':
-        fighter_2 = TankFighter(2, initial_x_p2, initial_y, True, sword_sound_effect)
-    elif p2_character == 'TrapperFighter':
-        fighter_2 = TrapperFighter(2, initial_x_p2, initial_y, True, sword_sound_effect)
-    else:
-        # Por defecto, usar Slime Demon
-        fighter_2 = SlimeDemonFighter(2, initial_x_p2, initial_y, True, magic_sound_effect)
+    Se ejecuta en el hilo de precarga mientras se vota el escenario (recurso
+    ARENA_RESOURCE de la cuenta regresiva): carga sprites y, con la IA de
+    búsqueda, lanza su proceso, así que no debe tocar la escena actual.
     
-    return fighter_1, fighter_2
+    Returns:
+        Arena: Combate listo para empezar
+    """
+    p1_character, p2_character = character_select_screen.get_selected_characters()
+    # Por defecto, Warrior para P1 y Slime Demon para P2
+    character_names = registry.character_names()
+    if p1_character not in character_names:
+        p1_character = 'WarriorFighter'
+    if p2_character not in character_names:
+        p2_character = 'SlimeDemonFighter'
+    
+    global search_worker
+    cpu_difficulty = character_select_screen.get_cpu_difficulty()
+    rule_difficulty = cpu_difficulty if cpu_difficulty in CPU_DIFFICULTIES else DEFAULT_CPU_DIFFICULTY
+    teams = ARENA_MODES[ARENA_MODE]
+    fighters = []
+    for index, (initial_x, flip_sprite) in enumerate(spawn_layout(teams)):
+        player_number = index + 1
+        if player_number == 1:
+            character_name = p1_character
+        elif player_number == 2:
+            character_name = p2_character
+        else:
+            character_name = random.choice(character_names)
+        fighter = create_fighter(character_name, player_number, initial_x, flip_sprite)
+        fighter.team = teams[index]
+        if player_number > 2 or player_number == 2 and cpu_difficulty is not None:
+            fighter.input_source = create_cpu_controller(fighter, rule_difficulty)
+        fighters.append(fighter)
+    
+    # Cada arena trae su propio bus de eventos, broadphase y proyectiles
+    arena = Arena(fighters)
+    if cpu_difficulty == CPU_SEARCH:
+        # La IA de búsqueda toma snapshots de la arena y simula en su propio proceso
+        # (se importa aquí: solo hace falta si alguien la elige)
+        from simulation.search_ai import SearchController, SearchWorker
+        if search_worker is None:
+            search_worker = SearchWorker()
+        fighters[1].input_source = SearchController(arena, 2, search_worker)
+    return arena
+
+def load_scenario_select_screen():
+    """Pantalla de selección de escenarios con todos los fondos cargados (se crea en el hilo de precarga)."""
+    return ScenarioSelectScreen(SCREEN_WIDTH, SCREEN_HEIGHT)
+
+def load_victory_image():
+    """Imagen de victoria (recurso de la escena de fin de ronda, precargado durante el combate)."""
+    try:
+        return pygame.image.load("assets/images/icons/victory.png").convert_alpha()
+    except:
+        # Crear imagen de victoria por defecto
+        victory_image = pygame.Surface((200, 100))
+        victory_image.fill((255, 215, 0))  # Dorado
+        print("No se pudo cargar la imagen de victoria, usando por defecto")
+        return victory_image
 
 def handle_game_input(event):
     """
-    Maneja la entrada del usuario según el estado actual del juego.
+    Maneja las teclas globales y pasa el evento a la escena actual.
     
     Args:
         event: Evento de pygame a procesar
     """
-    global show_hitboxes, current_game_state, is_round_over, intro_countdown
-    global last_countdown_update, fighter_player_1, fighter_player_2
+    global show_hitboxes, profiler_toggle_requested
     
     if event.type == pygame.KEYDOWN:
         # Tecla Z para alternar visualización de hitboxes
         if event.key == pygame.K_z:
             show_hitboxes = not show_hitboxes
         
-        # Manejo específico según estado del juego
-        if current_game_state == GAME_STATE_CHARACTER_SELECT:
-            # Pantalla de selección de personajes
-            if character_select_screen.handle_input(event):
-                # Selección completa, ir a selección de escenarios
-                fighter_player_1, fighter_player_2 = create_fighters_from_selection()
-                scenario_select_screen.reset_selection()
-                current_game_state = GAME_STATE_SCENARIO_SELECT
-        
-        elif current_game_state == GAME_STATE_SCENARIO_SELECT:
-            # Pantalla de selección de escenarios
-            if scenario_select_screen.handle_input(event):
-                # Selección de escenario completa, comenzar cuenta regresiva
-                current_game_state = GAME_STATE_COUNTDOWN
-                intro_countdown = 3
-                last_countdown_update = pygame.time.get_ticks()
+        # Tecla F3 para alternar el perfilador por frame
+        if event.key == pygame.K_F3:
+            profiler_toggle_requested = True
         
-        elif current_game_state == GAME_STATE_ROUND_OVER:
-            # Después de una ronda, permitir ir a selección con Enter
-            if event.key == pygame.K_RETURN:
-                character_select_screen.reset_selection()
-                current_game_state = GAME_STATE_CHARACTER_SELECT
+        # Tecla F4 para volcar la traza (modo --trace)
+        if event.key == pygame.K_F4 and game_tracer:
+            print(f"Traza: {game_tracer.dump(TRACE_PATH)} spans en {TRACE_PATH}")
+    
+    scene_manager.current.handle_event(event)
 
 def update_game_state():
     """
-    Actualiza el estado del juego y maneja transiciones entre estados.
+    Actualiza la escena actual y completa la transición pendiente si sus
+    recursos ya están cargados (la pedida en este frame se dibuja ya en él).
     """
-    global current_game_state, intro_countdown, last_countdown_update
-    global is_round_over, round_over_start_time, player_scores, current_background_image
+    scene = scene_manager.current
+    
+    # Cada escena se mide con su nombre
+    profiler = frame_instruments
+    if profiler:
+        profiler.push(scene.name)
+    scene.update()
+    scene_manager.poll()
+    if profiler:
+        profiler.pop()
+
+def draw_arena_hud(arena):
+    """
+    Dibuja barras de salud y puntuaciones.
+    En 1 contra 1 usa las dos barras grandes; con más luchadores, una barra
+    compacta por luchador con el color de su equipo.
     
-    if current_game_state == GAME_STATE_CHARACTER_SELECT:
-        # Actualizar pantalla de selección
-        character_select_screen.update()
+    Args:
+        arena (Arena): Combate actual
+    """
+    fighters = arena.fighters
+    if len(fighters) == 2:
+        fighter_1, fighter_2 = fighters
+        # Barras de salud
+        draw_health_bar(fighter_1.current_health, fighter_1.max_health, 20, 20)
+        draw_health_bar(fighter_2.current_health, fighter_2.max_health, SCREEN_WIDTH - 420, 20)
+        
+        # Puntuaciones
+        draw_text_on_screen(f"P1: {team_scores[fighter_1.team]}", score_font, COLOR_RED, 20, 60)
+        draw_text_on_screen(f"P2: {team_scores[fighter_2.team]}", score_font, COLOR_RED, SCREEN_WIDTH - 420, 60)
+        return
     
-    elif current_game_state == GAME_STATE_SCENARIO_SELECT:
-        # Actualizar pantalla de selección de escenarios
-        scenario_select_screen.update()
+    slot_width = (SCREEN_WIDTH - 40) // len(fighters)
+    for index, fighter in enumerate(fighters):
+        x_position = 20 + index * slot_width
+        team_color = TEAM_COLORS[(fighter.team - 1) % len(TEAM_COLORS)]
+        draw_health_bar(fighter.current_health, fighter.max_health, x_position, 20, slot_width - 12, 14)
+        draw_text_on_screen(f"P{fighter.player_number} · E{fighter.team}: {team_scores[fighter.team]}",
+                            debug_font, team_color, x_position, 38)
+
+def toggle_frame_profiler():
+    """Activa o desactiva el perfilador por frame (también en la arena actual)."""
+    global frame_profiler, frame_instruments, profiler_toggle_requested
+    frame_profiler = FrameProfiler() if frame_profiler is None else None
+    instruments = [instrument for instrument in (frame_profiler, game_tracer) if instrument]
+    frame_instruments = SectionGroup(instruments) if len(instruments) > 1 else \
+        (instruments[0] if instruments else None)
+    if current_arena:
+        current_arena.profiler = frame_instruments
+    profiler_toggle_requested = False
+
+def draw_arena_actors(arena):
+    """
+    Apunta luchadores y proyectiles del combate en la cola de la escena
+    (medidos en el perfilador si está activo).
     
-    elif current_game_state == GAME_STATE_COUNTDOWN:
-        # Obtener el background seleccionado cuando empieza la cuenta regresiva
-        if current_background_image is None:
-            selected_bg = scenario_select_screen.get_selected_background()
-            if selected_bg:
-                current_background_image = selected_bg['image']
-        # Manejar cuenta regresiva
-        if intro_countdown > 0:
-            current_time = pygame.time.get_ticks()
-            if current_time - last_countdown_update >= 1000:
-                intro_countdown -= 1
-                last_countdown_update = current_time
-        else:
-            current_game_state = GAME_STATE_FIGHTING
-    
-    elif current_game_state == GAME_STATE_FIGHTING:
-        # Actualizar luchadores
-        if fighter_player_1 and fighter_player_2:
-            # Calcular seguimiento de cámara
-            calculate_camera_follow(fighter_player_1, fighter_player_2)
-            
-            # Mover luchadores
-            fighter_player_1.move(SCREEN_WIDTH, SCREEN_HEIGHT, game_screen, fighter_player_2, False)
-            fighter_player_2.move(SCREEN_WIDTH, SCREEN_HEIGHT, game_screen, fighter_player_1, False)
-            
-            # Actualizar animaciones
-            fighter_player_1.update(fighter_player_2)
-            fighter_player_2.update(fighter_player_1)
-            
-            # Victoria solo cuando la animación de muerte se completó
-            if not fighter_player_1.is_alive and fighter_player_1.death_animation_done:
-                player_scores[1] += 1
-                current_game_state = GAME_STATE_ROUND_OVER
-                round_over_start_time = pygame.time.get_ticks()
-            elif not fighter_player_2.is_alive and fighter_player_2.death_animation_done:
-                player_scores[0] += 1
-                current_game_state = GAME_STATE_ROUND_OVER
-                round_over_start_time = pygame.time.get_ticks()
-    
-    elif current_game_state == GAME_STATE_ROUND_OVER:
-        # Esperar antes de permitir nueva ronda
-        if pygame.time.get_ticks() - round_over_start_time > ROUND_OVER_DURATION:
-            # Automáticamente volver a selección de personajes
-            character_select_screen.reset_selection()
-            current_background_image = None  # Resetear el background
-            current_game_state = GAME_STATE_CHARACTER_SELECT
+    Args:
+        arena (Arena): Combate actual
+    """
+    profiler = frame_instruments
+    if profiler:
+        profiler.push('luchadores')
+    scene_queue.set_layer(LAYER_FIGHTERS)
+    for fighter in arena.fighters:
+        fighter.draw(scene_queue, camera_offset_x, show_hitboxes)
+    if profiler:
+        profiler.pop()
+        profiler.push('proyectiles (dibujo)')
+    scene_queue.set_layer(LAYER_PROJECTILES)
+    arena.projectiles.draw(scene_queue, camera_offset_x)
+    if profiler:
+        profiler.pop()
+
+def draw_arena_scene(draw_actors):
+    """
+    Dibuja la arena en la ventana: el mundo se apunta en scene_queue, se
+    vuelca en scene_surface y se reescala a la ventana antes del HUD.
+    
+    Args:
+        draw_actors (bool): Si se dibujan luchadores y proyectiles
+    """
+    profiler = frame_instruments
+    
+    # Dibujar fondo del juego
+    if profiler:
+        profiler.push('fondo')
+    scene_surface.fill((0, 0, 0))
+    scene_queue.set_layer(LAYER_BACKGROUND)
+    draw_game_background()
+    if profiler:
+        profiler.pop()
+    
+    if draw_actors and current_arena:
+        draw_arena_actors(current_arena)
+    
+    # Volcar la escena: un Surface.blits por capa
+    if profiler:
+        profiler.push('blits')
+    scene_queue.flush()
+    if profiler:
+        profiler.pop()
+    
+    # Reescalar el mundo a la ventana una sola vez por frame
+    if scene_surface is not game_screen:
+        if profiler:
+            profiler.push('escalado')
+        pygame.transform.scale(scene_surface, (SCREEN_WIDTH, SCREEN_HEIGHT), game_screen)
+        if profiler:
+            profiler.pop()
+    
+    # Mostrar estadísticas de jugadores
+    if profiler:
+        profiler.push('HUD')
+    if current_arena:
+        draw_arena_hud(current_arena)
+    if profiler:
+        profiler.pop()
 
 def render_game():
     """
-    Renderiza todos los elementos visuales del juego según el estado actual.
+    Renderiza la escena actual y los overlays comunes (carga pendiente y perfilador).
     """
-    # Limpiar pantalla
-    game_screen.fill((0, 0, 0))
+    profiler = frame_instruments
+    
+    scene_manager.current.draw(game_screen)
+    
+    # Transición esperando a que terminen sus cargas (la escena actual sigue)
+    if scene_manager.loading:
+        draw_text_on_screen("Cargando...", debug_font, COLOR_WHITE, SCREEN_WIDTH - 110, SCREEN_HEIGHT - 30)
+    
+    # Overlay del perfilador (debajo del HUD, a la derecha)
+    if frame_profiler:
+        profiler.push('overlay')
+        frame_profiler.status = render_quality.describe()
+        frame_profiler.draw(game_screen, debug_font, SCREEN_WIDTH - PANEL_WIDTH - 10, 80)
+        profiler.pop()
+
+class CharacterSelectScene(Scene):
+    """Selección de personajes y de quién controla a P2."""
+    name = SCENE_CHARACTER_SELECT
+    
+    def prefetch(self):
+        return (SCENE_SCENARIO_SELECT,)
+    
+    def enter(self, previous):
+        global current_arena
+        character_select_screen.reset_selection()
+        use_background(None)
+        # La arena de la ronda anterior no se reutiliza: la siguiente se construye de nuevo
+        current_arena = None
+        self.manager.prefetcher.discard(ARENA_RESOURCE)
+    
+    def handle_event(self, event):
+        if event.type != pygame.KEYDOWN:
+            return
+        if character_select_screen.handle_input(event):
+            # Selección completa: la arena se construye mientras se vota el escenario
+            self.manager.change(SCENE_SCENARIO_SELECT)
+        elif self.manager.loading:
+            # Selección deshecha (ESC) mientras se cargaba la pantalla de escenarios
+            self.manager.cancel()
+    
+    def update(self):
+        character_select_screen.update()
+    
+    def draw(self, surface):
+        surface.fill((0, 0, 0))
+        character_select_screen.draw(surface)
+
+class ScenarioSelectScene(Scene):
+    """Votación del escenario; mientras tanto se cargan la arena y los fondos votados."""
+    name = SCENE_SCENARIO_SELECT
     
-    if current_game_state == GAME_STATE_CHARACTER_SELECT:
-        # Mostrar pantalla de selección de personajes
-        character_select_screen.draw(game_screen)
+    def resources(self):
+        return {SCENARIO_SCREEN_RESOURCE: startup_profile.timed('seleccion de escenarios', load_scenario_select_screen)}
     
-    elif current_game_state == GAME_STATE_SCENARIO_SELECT:
-        # Mostrar pantalla de selección de escenarios
-        scenario_select_screen.draw(game_screen)
+    def prefetch(self):
+        return (SCENE_COUNTDOWN,)
     
-    else:
-        # Dibujar fondo del juego
-        draw_game_background()
-        
-        # Mostrar estadísticas de jugadores
-        if fighter_player_1 and fighter_player_2:
-            # Barras de salud
-            draw_health_bar(fighter_player_1.current_health, fighter_player_1.max_health, 20, 20)
-            draw_health_bar(fighter_player_2.current_health, fighter_player_2.max_health, 
-                          SCREEN_WIDTH - 420, 20)
-            
-            # Puntuaciones
-            draw_text_on_screen(f"P1: {player_scores[0]}", score_font, COLOR_RED, 20, 60)
-            draw_text_on_screen(f"P2: {player_scores[1]}", score_font, COLOR_RED, SCREEN_WIDTH - 420, 60)
+    def enter(self, previous):
+        global scenario_select_screen
+        scenario_select_screen = self.manager.resource(SCENARIO_SCREEN_RESOURCE)
+        scenario_select_screen.reset_selection()
+        scenario_select_screen.cpu_opponent = character_select_screen.get_cpu_difficulty() is not None
+    
+    def handle_event(self, event):
+        if event.type == pygame.KEYDOWN and scenario_select_screen.handle_input(event):
+            # Selección de escenario completa, comenzar cuenta regresiva
+            self.manager.change(SCENE_COUNTDOWN)
+    
+    def update(self):
+        scenario_select_screen.update()
+        # El escenario final es uno de los votados: se precarga el fondo de cada voto confirmado
+        screen = scenario_select_screen
+        votes = (screen.player_1_selection, screen.player_2_selection)
+        for confirmed, scenario_index in zip(screen.selection_confirmed, votes):
+            if confirmed and scenario_index < len(screen.available_scenarios):
+                self.manager.prefetcher.request(*background_resource(screen.available_scenarios[scenario_index]))
+    
+    def draw(self, surface):
+        surface.fill((0, 0, 0))
+        scenario_select_screen.draw(surface)
+
+class CountdownScene(Scene):
+    """Cuenta regresiva sobre la arena ya construida."""
+    name = SCENE_COUNTDOWN
+    
+    def __init__(self):
+        super().__init__()
+        self.seconds_left = COUNTDOWN_SECONDS
+        self.last_update = 0
+    
+    def resources(self):
+        resources = {ARENA_RESOURCE: create_arena_from_selection}
+        scenario = scenario_select_screen.get_selected_background()
+        if scenario:
+            name, loader = background_resource(scenario)
+            resources[name] = loader
+        return resources
+    
+    def enter(self, previous):
+        global current_arena
+        current_arena = self.manager.resource(ARENA_RESOURCE)
+        current_arena.profiler = frame_instruments
+        scenario = scenario_select_screen.get_selected_background()
+        if scenario:
+            use_background(scenario['image'], self.manager.resource(background_resource(scenario)[0]))
+        self.seconds_left = COUNTDOWN_SECONDS
+        self.last_update = pygame.time.get_ticks()
+    
+    def update(self):
+        if self.seconds_left > 0:
+            current_time = pygame.time.get_ticks()
+            if current_time - self.last_update >= 1000:
+                self.seconds_left -= 1
+                self.last_update = current_time
+        else:
+            self.manager.change(SCENE_FIGHTING)
+    
+    def draw(self, surface):
+        draw_arena_scene(False)
+        if self.seconds_left > 0:
+            draw_text_on_screen(str(self.seconds_left), countdown_font, COLOR_RED, 
+                              SCREEN_WIDTH // 2 - 40, SCREEN_HEIGHT // 3)
+        draw_debug_line()
+
+class FightingScene(Scene):
+    """Combate; durante él se precarga la pantalla de victoria."""
+    name = SCENE_FIGHTING
+    
+    def prefetch(self):
+        return (SCENE_ROUND_OVER,)
+    
+    def update(self):
+        global round_winner
+        # Ya hay ganador: el combate queda quieto hasta entrar en el fin de ronda
+        if self.manager.loading:
+            return
         
-        if current_game_state == GAME_STATE_COUNTDOWN:
-            # Mostrar cuenta regresiva
-            if intro_countdown > 0:
-                draw_text_on_screen(str(intro_countdown), countdown_font, COLOR_RED, 
-                                  SCREEN_WIDTH // 2 - 40, SCREEN_HEIGHT // 3)
+        # Calcular seguimiento de cámara
+        calculate_camera_follow(current_arena)
         
-        elif current_game_state == GAME_STATE_FIGHTING:
-            # Dibujar luchadores
-            if fighter_player_1 and fighter_player_2:
-                fighter_player_1.draw(game_screen, camera_offset_x, show_hitboxes)
-                fighter_player_2.draw(game_screen, camera_offset_x, show_hitboxes)
-                
-                # Mostrar hitboxes si está activado
-                if show_hitboxes:
-                    fighter_player_1.draw_hitbox(game_screen, True, camera_offset_x)
-                    fighter_player_2.draw_hitbox(game_screen, True, camera_offset_x)
-                    # Overlay de daño debug sobre cada luchador
-                    now_ms = pygame.time.get_ticks()
-                    for f in [fighter_player_1, fighter_player_2]:
-                        if hasattr(f, 'last_damage_timestamp') and now_ms - f.last_damage_timestamp < 1500:
-                            dmg_text = f"Daño: {f.last_damage_applied}" if f.last_damage_applied > 0 else "Daño: 0"
-                            draw_text_on_screen(dmg_text, debug_font, COLOR_WHITE, f.collision_rect.centerx - 40 + camera_offset_x, f.collision_rect.y - 25)
-                            frame_text = f"Frame atk: {f.frame_index}" if f.is_attacking else ""
-                            if frame_text:
-                                draw_text_on_screen(frame_text, debug_font, COLOR_YELLOW, f.collision_rect.centerx - 50 + camera_offset_x, f.collision_rect.y - 40)
+        # Mover luchadores, actualizar animaciones y proyectiles
+        current_arena.step(SCREEN_WIDTH, SCREEN_HEIGHT, game_screen)
         
-        elif current_game_state == GAME_STATE_ROUND_OVER:
-            # Dibujar luchadores en su estado final
-            if fighter_player_1 and fighter_player_2:
-                fighter_player_1.draw(game_screen, camera_offset_x, show_hitboxes)
-                fighter_player_2.draw(game_screen, camera_offset_x, show_hitboxes)
-            
-            # Mostrar imagen de victoria
-            victory_rect = victory_image.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
-            game_screen.blit(victory_image, victory_rect)
-            
-            # Instrucción para continuar
-            draw_text_on_screen("Presiona ENTER para nueva ronda", score_font, COLOR_WHITE, 
-                              SCREEN_WIDTH // 2 - 200, SCREEN_HEIGHT - 100)
+        # Victoria solo cuando la animación de muerte se completó (0 = caen todos a la vez)
+        round_winner = current_arena.winner()
+        if round_winner is not None:
+            if round_winner:
+                team_scores[round_winner] += 1
+            self.manager.change(SCENE_ROUND_OVER)
+    
+    def draw(self, surface):
+        draw_arena_scene(True)
         
-        # Información de debug
+        # Mostrar hitboxes si está activado (en unidades del mundo, sobre la ventana)
         if show_hitboxes:
-            debug_text = f"Hitboxes: ON | Camera Offset: {camera_offset_x:.1f}"
-            draw_text_on_screen(debug_text, debug_font, COLOR_WHITE, 10, SCREEN_HEIGHT - 30)
+            profiler = frame_instruments
+            if profiler:
+                profiler.push('hitboxes')
+            for fighter in current_arena.fighters:
+                fighter.draw_hitbox(surface, True, camera_offset_x)
+            # Proyectiles, trampas, explosiones y áreas indexadas en este tick
+            current_arena.world.draw_debug(surface, camera_offset_x)
+            # Overlay de daño debug sobre cada luchador
+            now_ms = pygame.time.get_ticks()
+            for f in current_arena.fighters:
+                if f.last_damage_timestamp is not None and now_ms - f.last_damage_timestamp < 1500:
+                    dmg_text = f"Daño: {f.last_damage_applied}" if f.last_damage_applied > 0 else "Daño: 0"
+                    draw_text_on_screen(dmg_text, debug_font, COLOR_WHITE, f.collision_rect.centerx - 40 + camera_offset_x, f.collision_rect.y - 25)
+                    frame_text = f"Frame atk: {f.frame_index}" if f.is_attacking else ""
+                    if frame_text:
+                        draw_text_on_screen(frame_text, debug_font, COLOR_YELLOW, f.collision_rect.centerx - 50 + camera_offset_x, f.collision_rect.y - 40)
+            if profiler:
+                profiler.pop()
+        draw_debug_line()
+
+class RoundOverScene(Scene):
+    """Pantalla de victoria; vuelve a la selección con ENTER o pasado ROUND_OVER_DURATION."""
+    name = SCENE_ROUND_OVER
+    
+    def __init__(self):
+        super().__init__()
+        self.start_time = 0
+        self.victory_image = None
+    
+    def resources(self):
+        return {VICTORY_RESOURCE: load_victory_image}
+    
+    def enter(self, previous):
+        self.victory_image = self.manager.resource(VICTORY_RESOURCE)
+        self.start_time = pygame.time.get_ticks()
+    
+    def handle_event(self, event):
+        # Después de una ronda, permitir ir a selección con Enter
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_RETURN:
+            self.manager.change(SCENE_CHARACTER_SELECT)
+    
+    def update(self):
+        # Esperar antes de volver automáticamente a selección de personajes
+        if pygame.time.get_ticks() - self.start_time > ROUND_OVER_DURATION:
+            self.manager.change(SCENE_CHARACTER_SELECT)
+    
+    def draw(self, surface):
+        # Luchadores en su estado final
+        draw_arena_scene(True)
+        
+        # Mostrar imagen de victoria
+        victory_rect = self.victory_image.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
+        surface.blit(self.victory_image, victory_rect)
+        if ARENA_MODE != '1v1':
+            winner_text = f"Gana el equipo {round_winner}" if round_winner else "Empate"
+            draw_text_on_screen(winner_text, score_font, COLOR_WHITE,
+                                SCREEN_WIDTH // 2 - 100, victory_rect.bottom + 10)
+        
+        # Instrucción para continuar
+        draw_text_on_screen("Presiona ENTER para nueva ronda", score_font, COLOR_WHITE, 
+                          SCREEN_WIDTH // 2 - 200, SCREEN_HEIGHT - 100)
+        draw_debug_line()
+
+def draw_debug_line():
+    """Información de debug de las escenas de arena (con hitboxes activadas)."""
+    if show_hitboxes:
+        debug_text = f"Hitboxes: ON | Camera Offset: {camera_offset_x:.1f} | {render_quality.describe()}"
+        draw_text_on_screen(debug_text, debug_font, COLOR_WHITE, 10, SCREEN_HEIGHT - 30)
+
+# Escenas del juego: la primera no tiene recursos que esperar
+scene_manager = SceneManager([CharacterSelectScene(), ScenarioSelectScene(), CountdownScene(),
+                              FightingScene(), RoundOverScene()])
+scene_manager.start(SCENE_CHARACTER_SELECT)
 
 # Bucle principal del juego
 game_running = True
 while game_running:
     # Mantener framerate constante
     game_clock.tick(FRAMES_PER_SECOND)
+    frame_pacer.begin_frame()
+    
+    # El perfilador se activa o desactiva (F3) solo entre frames
+    if profiler_toggle_requested:
+        toggle_frame_profiler()
+    profiler = frame_instruments
+    if profiler:
+        profiler.begin_frame()
+        profiler.push('eventos')
     
     # Manejar eventos
     for event in pygame.event.get():
@@ -478,13 +896,34 @@ while game_running:
             handle_game_input(event)
     
     # Actualizar estado del juego
+    if profiler:
+        profiler.pop()
+        profiler.push('update_game_state')
     update_game_state()
     
     # Renderizar todo
+    if profiler:
+        profiler.pop()
+        profiler.push('render')
     render_game()
     
     # Actualizar pantalla
+    if profiler:
+        profiler.pop()
+        profiler.push('display.update')
     pygame.display.update()
-
-# Salir de pygame limpiamente
+    if profiler:
+        profiler.pop()
+        profiler.end_frame()
+    frame_pacer.end_frame()
+    startup_profile.ready()
+
+# Volcar la traza al salir
+if game_tracer:
+    print(f"Traza: {game_tracer.dump(TRACE_PATH)} spans en {TRACE_PATH}")
+
+# Salir de pygame limpiamente (la carga en curso puede estar lanzando el proceso de búsqueda)
+scene_manager.prefetcher.shutdown()
+if search_worker is not None:
+    search_worker.close()
 pygame.quit()
\ No newline at end of file
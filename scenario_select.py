@@ -54,6 +54,7 @@ class ScenarioSelectScreen:
         self.player_1_selection = 0
         self.player_2_selection = 0 if len(self.available_scenarios) > 0 else 0
         self.active_player = 1
+        self.cpu_opponent = False  # Si P2 es la CPU, confirma el mismo escenario que P1
         
         # Estados de selección
         self.selection_confirmed = [False, False]
@@ -126,6 +127,9 @@ class ScenarioSelectScreen:
             elif event.key == pygame.K_r:  # Confirmar
                 self.selection_confirmed[0] = True
                 self.active_player = 2
+                if self.cpu_opponent:
+                    self.player_2_selection = self.player_1_selection
+                    self.selection_confirmed[1] = True
                 if self.selection_confirmed[1]:
                     self.finalize_selection()
             elif event.key == pygame.K_ESCAPE and self.selection_confirmed[0]:
@@ -0,0 +1,163 @@
+"""
+Escenas del juego y precarga de recursos en segundo plano.
+
+Cada pantalla del juego (selección de personajes, de escenario, cuenta
+regresiva, combate, fin de ronda) es una Scene con ganchos enter/exit,
+handle_event, update y draw. Además declara:
+
+- resources(): lo que necesita para empezar (nombre -> función que lo
+  carga). SceneManager no entra en la escena hasta que todo está cargado.
+- prefetch(): las escenas que pueden venir después; sus recursos se piden
+  al entrar en esta, para que se carguen mientras se juega.
+
+Los recursos se cargan en un hilo (ResourcePrefetcher) y se guardan por
+nombre. Una transición pedida con change() se completa en el primer frame
+en que los recursos de la escena destino están listos: mientras tanto sigue
+ejecutándose la escena actual, así que un cambio de escena nunca bloquea el
+frame. Las funciones de carga corren fuera del hilo principal: pueden
+cargar y convertir imágenes o construir luchadores, pero no tocar la
+ventana, los eventos ni el estado de la escena actual.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+
+class ResourcePrefetcher:
+    """
+    Carga recursos en un hilo y los guarda por nombre.
+
+    Args:
+        workers (int): Hilos de carga (uno basta: las cargas comparten el GIL)
+    """
+    def __init__(self, workers=1):
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='precarga')
+        self.futures = {}
+
+    def request(self, name, loader):
+        """Encola la carga de un recurso; si ya se pidió con ese nombre no hace nada."""
+        if name not in self.futures:
+            self.futures[name] = self.executor.submit(loader)
+
+    def ready(self, name):
+        future = self.futures.get(name)
+        return future is not None and future.done()
+
+    def get(self, name):
+        """Recurso cargado (espera si todavía no lo está; propaga el error de la carga)."""
+        return self.futures[name].result()
+
+    def discard(self, name):
+        """Olvida un recurso para que la próxima petición lo vuelva a cargar."""
+        self.futures.pop(name, None)
+
+    def shutdown(self, wait=True):
+        """Cancela las cargas pendientes y, con wait, espera a la que esté en curso."""
+        self.executor.shutdown(wait=wait, cancel_futures=True)
+
+
+class Scene:
+    """
+    Escena base: todos los ganchos son opcionales.
+
+    Attributes:
+        name (str): Nombre de la escena (transiciones, perfilador y trazas)
+        manager (SceneManager): Gestor al que pertenece (lo asigna el gestor)
+    """
+    name = 'SCENE'
+
+    def __init__(self):
+        self.manager = None
+
+    def resources(self):
+        """Recursos necesarios para entrar: dict nombre -> función sin argumentos que los carga."""
+        return {}
+
+    def prefetch(self):
+        """Nombres de las escenas cuyos recursos conviene precargar durante esta."""
+        return ()
+
+    def enter(self, previous):
+        """Al entrar (con los recursos ya cargados). previous es la escena anterior o None."""
+
+    def exit(self, following):
+        """Al salir hacia la escena following."""
+
+    def handle_event(self, event):
+        pass
+
+    def update(self):
+        pass
+
+    def draw(self, surface):
+        pass
+
+
+class SceneManager:
+    """
+    Escena actual y transiciones sin bloqueo.
+
+    Args:
+        scenes: Escenas del juego (se identifican por su name)
+        prefetcher (ResourcePrefetcher): Cargador compartido (por defecto uno nuevo)
+    """
+    def __init__(self, scenes, prefetcher=None):
+        self.scenes = {scene.name: scene for scene in scenes}
+        for scene in scenes:
+            scene.manager = self
+        self.prefetcher = prefetcher or ResourcePrefetcher()
+        self.current = None
+        self.pending = None    # Escena a la que se quiere pasar cuando esté cargada
+
+    def request_resources(self, scene_name):
+        """Pide los recursos de una escena (precarga)."""
+        for name, loader in self.scenes[scene_name].resources().items():
+            self.prefetcher.request(name, loader)
+
+    def change(self, scene_name):
+        """Pasa a otra escena en cuanto sus recursos estén cargados (ver poll)."""
+        self.request_resources(scene_name)
+        self.pending = self.scenes[scene_name]
+
+    def cancel(self):
+        """Descarta la transición pendiente (lo que ya se pidió se sigue cargando)."""
+        self.pending = None
+
+    def start(self, scene_name):
+        """Entra en la primera escena esperando a sus recursos (arranque)."""
+        self.change(scene_name)
+        for name in self.pending.resources():
+            self.prefetcher.get(name)
+        self.poll()
+
+    @property
+    def loading(self):
+        """True si hay una transición esperando a que terminen sus cargas."""
+        return self.pending is not None
+
+    def poll(self):
+        """
+        Completa la transición pendiente si sus recursos ya están listos
+        (una vez por frame, después de los eventos y la actualización).
+
+        Returns:
+            bool: True si ha cambiado de escena
+        """
+        scene = self.pending
+        if scene is None:
+            return False
+        prefetcher = self.prefetcher
+        if not all(prefetcher.ready(name) for name in scene.resources()):
+            return False
+        self.pending = None
+        previous = self.current
+        if previous is not None:
+            previous.exit(scene)
+        self.current = scene
+        scene.enter(previous)
+        for scene_name in scene.prefetch():
+            self.request_resources(scene_name)
+        return True
+
+    def resource(self, name):
+        """Recurso cargado por su nombre."""
+        return self.prefetcher.get(name)
@@ -0,0 +1,219 @@
+"""
+Auditoría de asignaciones del bucle caliente.
+
+AllocationAudit tiene la interfaz de FrameProfiler (begin_frame, push, pop,
+end_frame), así que se conecta a Arena.profiler y mide las mismas
+secciones: objetivos, move/update de cada luchador, broadphase y
+proyectiles, más las de dibujo que añade este script.
+
+Durante un frame instala un perfilador (sys.setprofile) que en cada llamada
+y retorno lee sys.getallocatedblocks(): los bloques que aparecen entre dos
+eventos se atribuyen a la sección abierta y a la línea en curso (en una
+llamada, a la línea del llamador). Así se cuentan también los objetos
+temporales que se liberan antes de terminar la sección (un Rect de
+get_attack_area, una lista devuelta y descartada...), que una diferencia de
+snapshots de tracemalloc no ve.
+
+Es una aproximación: cuenta bloques de pymalloc (objetos pequeños), no los
+objetos servidos desde las listas libres de CPython (tuplas pequeñas,
+floats) ni los búferes grandes como los píxeles de una Surface; una
+asignación y una liberación entre los mismos dos eventos se compensan. Los
+enteros grandes (milisegundos, coordenadas > 256) sí cuentan y son
+inevitables en Python.
+
+Uso:
+    python -m simulation.alloc_audit
+    python -m simulation.alloc_audit --ticks 1200 --characters TrapperFighter SlimeDemonFighter
+    python -m simulation.alloc_audit --max-per-tick 40 --top 30
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import random
+import sys
+import types
+from collections import Counter
+
+import pygame
+
+from fighters import sim_clock
+from fighters.arena import Arena
+from fighters.cpu import create_cpu_controller
+from .headless import (init_headless, FIGHTER_CLASSES, CHARACTER_NAMES, SCREEN_WIDTH, SCREEN_HEIGHT,
+                       INITIAL_X_P1, INITIAL_X_P2, INITIAL_Y)
+
+DEFAULT_WARMUP_TICKS = 300
+DEFAULT_AUDIT_TICKS = 600
+DEFAULT_TOP = 20
+
+OUTSIDE_SECTIONS = 'frame'
+
+# Referencias que tiene, dentro del perfilador, el método ligado que CPython
+# crea solo para pasárselo en un evento c_call (llamadas como lista.append(x))
+_TRACER_METHOD_REFS = 3
+
+_allocated_blocks = sys.getallocatedblocks
+_reference_count = sys.getrefcount
+_BuiltinMethodType = types.BuiltinMethodType
+
+
+class AllocationAudit:
+    """
+    Bloques asignados por sección y por línea de código.
+
+    section_blocks: sección -> bloques
+    line_blocks: (sección, fichero, línea, función) -> bloques
+    """
+    def __init__(self):
+        self.section_blocks = Counter()
+        self.line_blocks = Counter()
+        self.stack = []
+        self.section = OUTSIDE_SECTIONS
+        self.frames = 0
+        self.last_blocks = 0
+        # Las llamadas a la propia auditoría (push/pop, inicio y fin de frame) no se cuentan
+        self.own_code = {method.__code__ for method in (AllocationAudit.begin_frame, AllocationAudit.push,
+                                                         AllocationAudit.pop, AllocationAudit.end_frame)}
+
+    def _profile(self, frame, event, arg):
+        blocks = _allocated_blocks() - self.last_blocks
+        if frame.f_code not in self.own_code:
+            if event == 'call':
+                # El perfilador crea el objeto frame de la función llamada; lo
+                # asignado antes de la llamada pertenece a la línea del llamador
+                blocks -= 1
+                frame = frame.f_back or frame
+            elif event == 'c_call' and type(arg) is _BuiltinMethodType and \
+                    _reference_count(arg) <= _TRACER_METHOD_REFS:
+                blocks -= 1
+            if blocks > 0:
+                code = frame.f_code
+                self.section_blocks[self.section] += blocks
+                self.line_blocks[(self.section, code.co_filename, frame.f_lineno, code.co_name)] += blocks
+        self.last_blocks = _allocated_blocks()
+
+    def begin_frame(self):
+        self.frames += 1
+        self.last_blocks = _allocated_blocks()
+        sys.setprofile(self._profile)
+
+    def push(self, name):
+        self.stack.append(name)
+        self.section = name
+
+    def pop(self):
+        self.stack.pop()
+        self.section = self.stack[-1] if self.stack else OUTSIDE_SECTIONS
+
+    def end_frame(self):
+        sys.setprofile(None)
+
+    def per_frame(self, blocks):
+        return blocks / max(self.frames, 1)
+
+    def total_per_frame(self):
+        return self.per_frame(sum(self.section_blocks.values()))
+
+    def worst_lines(self, top=DEFAULT_TOP):
+        """Las `top` líneas que más bloques asignan: (bloques por frame, sección, fichero, línea, función)."""
+        return [(self.per_frame(blocks), section, filename, line, function)
+                for (section, filename, line, function), blocks in self.line_blocks.most_common(top)]
+
+
+def build_arena(characters, rng):
+    """Arena 1 contra 1 entre dos CPU difíciles."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        fighters = (FIGHTER_CLASSES[characters[0]](1, INITIAL_X_P1, INITIAL_Y, False, None),
+                    FIGHTER_CLASSES[characters[1]](2, INITIAL_X_P2, INITIAL_Y, True, None))
+    for fighter in fighters:
+        fighter.input_source = create_cpu_controller(fighter, 'hard', rng.getrandbits(32))
+    return Arena(fighters)
+
+
+def audit_matchup(audit, characters, warmup_ticks, audit_ticks, seed=0):
+    """
+    Simula y dibuja un enfrentamiento; los ticks tras el calentamiento se auditan.
+    Cuando el combate termina vuelve al estado inicial (fuera de la medición).
+    """
+    rng = random.Random(seed)
+    sim_clock.use_simulated_time(0)
+    arena = build_arena(characters, rng)
+    initial_state = arena.snapshot()
+    surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+    try:
+        for tick in range(warmup_ticks + audit_ticks):
+            audited = tick >= warmup_ticks
+            if audited:
+                audit.begin_frame()
+                arena.profiler = audit
+            arena.step(SCREEN_WIDTH, SCREEN_HEIGHT)
+            arena.profiler = None
+            sim_clock.advance_tick()
+            if audited:
+                audit.push('dibujo luchadores')
+            for fighter in arena.fighters:
+                fighter.draw(surface, 0, True)
+            if audited:
+                audit.pop()
+                audit.push('dibujo proyectiles')
+            arena.projectiles.draw(surface, 0)
+            if audited:
+                audit.pop()
+                audit.push('hitboxes')
+            for fighter in arena.fighters:
+                fighter.draw_hitbox(surface, True, 0)
+            if audited:
+                audit.pop()
+                audit.end_frame()
+            if arena.winner() is not None:
+                arena.restore(initial_state)
+    finally:
+        sys.setprofile(None)
+        arena.clear()
+        sim_clock.use_real_time()
+
+
+def default_matchups():
+    """Cada personaje contra el siguiente (todos atacan y reciben ataques de todos los tipos de ataque)."""
+    return [(name, CHARACTER_NAMES[(index + 1) % len(CHARACTER_NAMES)])
+            for index, name in enumerate(CHARACTER_NAMES)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Auditoría de asignaciones por sección y por tick")
+    parser.add_argument('--characters', nargs=2, choices=CHARACTER_NAMES, default=None,
+                        help="Un único enfrentamiento (por defecto, cada personaje contra el siguiente)")
+    parser.add_argument('--warmup-ticks', type=int, default=DEFAULT_WARMUP_TICKS)
+    parser.add_argument('--ticks', type=int, default=DEFAULT_AUDIT_TICKS, help="Ticks auditados por enfrentamiento")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--top', type=int, default=DEFAULT_TOP, help="Líneas a mostrar")
+    parser.add_argument('--max-per-tick', type=float, default=None,
+                        help="Fallar si la media de bloques por tick supera este valor")
+    args = parser.parse_args()
+
+    init_headless()
+    audit = AllocationAudit()
+    matchups = [tuple(args.characters)] if args.characters else default_matchups()
+    for characters in matchups:
+        audit_matchup(audit, characters, args.warmup_ticks, args.ticks, args.seed)
+        print(f"{characters[0]} vs {characters[1]}: {args.ticks} ticks auditados")
+
+    print(f"\nBloques asignados por tick ({audit.frames} ticks):")
+    for section, blocks in audit.section_blocks.most_common():
+        print(f"  {section:<22} {audit.per_frame(blocks):8.2f}")
+    print(f"  {'total':<22} {audit.total_per_frame():8.2f}")
+
+    print("\nLíneas que más asignan (bloques por tick):")
+    for per_tick, section, filename, line, function in audit.worst_lines(args.top):
+        location = f"{os.path.relpath(filename)}:{line}"
+        print(f"  {per_tick:8.2f}  {location:<40} {function:<32} [{section}]")
+
+    if args.max_per_tick is not None and audit.total_per_frame() > args.max_per_tick:
+        print(f"\nFALLO: {audit.total_per_frame():.2f} bloques por tick (máximo {args.max_per_tick:g})")
+        raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
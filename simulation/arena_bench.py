@@ -0,0 +1,119 @@
+"""
+Benchmark de la arena de N luchadores (fighters.arena) con renderizado.
+
+Ejecuta combates de la arena con todos los luchadores controlados por la
+política aleatoria y mide, frame a frame, el coste de simular (Arena.step)
+y de dibujar luchadores y proyectiles sobre una superficie del tamaño de la
+pantalla. Cuando un combate termina se empieza otro con personajes nuevos
+(la carga de sprites no se mide).
+
+El presupuesto de un frame a 60 FPS es de 16.7 ms: el benchmark falla si el
+percentil 99 de simulación + dibujo lo supera.
+
+Uso:
+    python -m simulation.arena_bench
+    python -m simulation.arena_bench --mode ffa8 --frames 3600 --seed 1
+    python -m simulation.arena_bench --mode 2v2 --no-render
+    python -m simulation.arena_bench --characters TrapperFighter SlimeDemonFighter
+"""
+
+import argparse
+import random
+import time
+
+import pygame
+
+from fighters import sim_clock
+from fighters.arena import Arena, ARENA_MODES, spawn_layout
+from .headless import init_headless, FIGHTER_CLASSES, SCREEN_WIDTH, SCREEN_HEIGHT, INITIAL_Y
+from .policies import RandomPolicyInput
+
+FRAME_BUDGET_MS = 1000 / 60
+
+
+def build_arena(mode, seed, match_id, characters=None):
+    """Arena del modo indicado con personajes aleatorios controlados por la política aleatoria."""
+    rng = random.Random(seed * 1000003 + match_id)
+    teams = ARENA_MODES[mode]
+    characters = list(characters or FIGHTER_CLASSES)
+    fighters = []
+    for index, (initial_x, flip_sprite) in enumerate(spawn_layout(teams)):
+        fighter_class = FIGHTER_CLASSES[rng.choice(characters)]
+        fighter = fighter_class(index + 1, initial_x, INITIAL_Y, flip_sprite, None)
+        fighter.team = teams[index]
+        fighter.input_source = RandomPolicyInput(seed, match_id * len(teams) + index, 0)
+        fighters.append(fighter)
+    return Arena(fighters)
+
+
+def _percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def run_benchmark(mode, frames, seed, render, characters=None):
+    """
+    Mide `frames` frames de la arena.
+
+    Returns:
+        dict: tiempos por frame (ms) de simulación y dibujo, combates jugados y
+        máximo de proyectiles activos
+    """
+    surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    sim_clock.use_simulated_time(0)
+    match_id = 0
+    arena = build_arena(mode, seed, match_id, characters)
+    step_ms, draw_ms = [], []
+    peak_projectiles = 0
+    for _ in range(frames):
+        start = time.perf_counter()
+        arena.step(SCREEN_WIDTH, SCREEN_HEIGHT)
+        middle = time.perf_counter()
+        if render:
+            surface.fill((50, 50, 100))
+            for fighter in arena.fighters:
+                fighter.draw(surface, 0)
+            arena.projectiles.draw(surface, 0)
+        end = time.perf_counter()
+        step_ms.append((middle - start) * 1000)
+        draw_ms.append((end - middle) * 1000)
+        peak_projectiles = max(peak_projectiles, len(arena.projectiles))
+        sim_clock.advance_tick()
+
+        if arena.winner() is not None:
+            arena.clear()
+            match_id += 1
+            arena = build_arena(mode, seed, match_id, characters)
+    arena.clear()
+    sim_clock.use_real_time()
+    return {'step_ms': step_ms, 'draw_ms': draw_ms, 'matches': match_id + 1, 'peak_projectiles': peak_projectiles}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de la arena de N luchadores")
+    parser.add_argument('--mode', choices=sorted(ARENA_MODES), default='ffa8')
+    parser.add_argument('--frames', type=int, default=3600, help="Frames medidos (3600 = 1 minuto a 60 FPS)")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--no-render', action='store_true', help="Medir solo la simulación")
+    parser.add_argument('--characters', nargs='+', choices=sorted(FIGHTER_CLASSES),
+                        help="Personajes posibles (por ejemplo solo los de proyectiles)")
+    args = parser.parse_args()
+
+    init_headless()
+    result = run_benchmark(args.mode, args.frames, args.seed, not args.no_render, args.characters)
+    frame_ms = [step + draw for step, draw in zip(result['step_ms'], result['draw_ms'])]
+    mean_step = sum(result['step_ms']) / len(frame_ms)
+    mean_draw = sum(result['draw_ms']) / len(frame_ms)
+    p99 = _percentile(frame_ms, 0.99)
+    print(f"Modo {args.mode}: {len(ARENA_MODES[args.mode])} luchadores, {len(frame_ms)} frames, "
+          f"{result['matches']} combates, hasta {result['peak_projectiles']} proyectiles")
+    print(f"  simulación {mean_step:6.2f} ms/frame | dibujo {mean_draw:6.2f} ms/frame")
+    print(f"  frame medio {mean_step + mean_draw:6.2f} ms | p99 {p99:6.2f} ms | "
+          f"máximo {max(frame_ms):6.2f} ms | presupuesto {FRAME_BUDGET_MS:.2f} ms")
+    within_budget = p99 <= FRAME_BUDGET_MS
+    print("Presupuesto de 60 FPS OK" if within_budget else "Presupuesto de 60 FPS SUPERADO")
+    raise SystemExit(0 if within_budget else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,152 @@
+"""
+Comprobación y benchmark del broadphase de colisiones (fighters.spatial_hash).
+
+Genera escenas sintéticas con luchadores (hurtboxes de 80x160) y
+proyectiles (20x20) repartidos por el escenario, los mueve en cada tick y
+resuelve qué luchadores toca cada proyectil de dos formas:
+- fuerza bruta: Rect.collidelistall contra todas las hurtboxes
+- hash espacial: CollisionWorld.fighters_touching
+
+Verifica que ambas dan los mismos resultados e informa del coste por
+entidad y tick, que con el hash debe mantenerse plano al crecer la escena.
+
+Uso:
+    python -m simulation.broadphase_bench
+    python -m simulation.broadphase_bench --counts 100 1000 5000 --ticks 20
+"""
+
+import argparse
+import random
+import time
+
+import pygame
+
+from fighters.spatial_hash import CollisionWorld, SpatialHash, STAGE_WIDTH, STAGE_HEIGHT
+
+FIGHTER_WIDTH = 80
+FIGHTER_HEIGHT = 160
+PROJECTILE_SIZE = 20
+
+# Un luchador por cada FIGHTER_RATIO proyectiles
+FIGHTER_RATIO = 10
+
+
+class _Body:
+    """Luchador sintético: solo la hurtbox que usa el broadphase."""
+    __slots__ = ('collision_rect',)
+
+    def __init__(self, rect):
+        self.collision_rect = rect
+
+
+def build_scene(count, rng):
+    """Proyectiles y luchadores sintéticos con velocidades aleatorias."""
+    fighters = tuple(_Body(pygame.Rect(rng.randrange(STAGE_WIDTH - FIGHTER_WIDTH),
+                                       rng.randrange(STAGE_HEIGHT - FIGHTER_HEIGHT),
+                                       FIGHTER_WIDTH, FIGHTER_HEIGHT))
+                     for _ in range(max(2, count // FIGHTER_RATIO)))
+    projectiles = [pygame.Rect(rng.randrange(STAGE_WIDTH), rng.randrange(STAGE_HEIGHT),
+                               PROJECTILE_SIZE, PROJECTILE_SIZE) for _ in range(count)]
+    velocities = [(rng.randint(-8, 8), rng.randint(-8, 8)) for _ in range(count)]
+    return fighters, projectiles, velocities
+
+
+def _advance(projectiles, velocities):
+    """Mueve los proyectiles y los devuelve al escenario por el lado contrario."""
+    for rect, (velocity_x, velocity_y) in zip(projectiles, velocities):
+        rect.x = (rect.x + velocity_x) % STAGE_WIDTH
+        rect.y = (rect.y + velocity_y) % STAGE_HEIGHT
+
+
+def brute_force_tick(fighters, projectiles):
+    """Hurtboxes tocadas por cada proyectil comparando contra todas."""
+    hurtboxes = [fighter.collision_rect for fighter in fighters]
+    return [[fighters[index] for index in rect.collidelistall(hurtboxes)] for rect in projectiles]
+
+
+def broadphase_tick(world, fighters, projectiles):
+    """Hurtboxes tocadas por cada proyectil consultando el hash espacial."""
+    world.begin_tick(fighters)
+    for rect in projectiles:
+        world.add(rect, rect, 2)
+    return [world.fighters_touching(rect) for rect in projectiles]
+
+
+def check(count, ticks, seed):
+    """Devuelve el primer tick en el que hash y fuerza bruta difieren (o None)."""
+    rng = random.Random(seed)
+    fighters, projectiles, velocities = build_scene(count, rng)
+    world = CollisionWorld()
+    for tick in range(ticks):
+        expected = brute_force_tick(fighters, projectiles)
+        found = broadphase_tick(world, fighters, projectiles)
+        if any(set(map(id, a)) != set(map(id, b)) for a, b in zip(expected, found)):
+            return tick
+        _advance(projectiles, velocities)
+    return None
+
+
+def benchmark(count, ticks, seed, cell_size):
+    """Coste medio por entidad y tick (µs) con fuerza bruta y con el hash."""
+    rng = random.Random(seed)
+    fighters, projectiles, velocities = build_scene(count, rng)
+    world = CollisionWorld(cell_size=cell_size)
+    entities = count + len(fighters)
+
+    brute_time = 0.0
+    hash_time = 0.0
+    for _ in range(ticks):
+        start = time.perf_counter()
+        brute_force_tick(fighters, projectiles)
+        brute_time += time.perf_counter() - start
+        start = time.perf_counter()
+        broadphase_tick(world, fighters, projectiles)
+        hash_time += time.perf_counter() - start
+        _advance(projectiles, velocities)
+    scale = 1e6 / (ticks * entities)
+    return brute_time * scale, hash_time * scale
+
+
+def benchmark_batch(count, ticks, seed, cell_size):
+    """Coste por consulta (µs) de SpatialHash.query_many sobre los propios proyectiles."""
+    rng = random.Random(seed)
+    _, projectiles, velocities = build_scene(count, rng)
+    index = SpatialHash(cell_size=cell_size)
+    elapsed = 0.0
+    for _ in range(ticks):
+        start = time.perf_counter()
+        index.clear()
+        for rect in projectiles:
+            index.insert(rect, rect)
+        index.query_many(projectiles)
+        elapsed += time.perf_counter() - start
+        _advance(projectiles, velocities)
+    return elapsed * 1e6 / (ticks * count)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Comprobación y benchmark del broadphase de colisiones")
+    parser.add_argument('--counts', type=int, nargs='+', default=[100, 500, 1000, 2500, 5000],
+                        help="Número de proyectiles por escena (luchadores = proyectiles / 10)")
+    parser.add_argument('--ticks', type=int, default=20, help="Ticks medidos por escena")
+    parser.add_argument('--cell-size', type=int, default=100, help="Lado de las celdas del hash")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    failures = 0
+    for count in args.counts:
+        divergence = check(count, min(args.ticks, 5), args.seed)
+        if divergence is not None:
+            failures += 1
+            print(f"{count:>6} proyectiles: DIVERGENCIA con fuerza bruta en el tick {divergence}")
+            continue
+        brute_us, hash_us = benchmark(count, args.ticks, args.seed, args.cell_size)
+        batch_us = benchmark_batch(count, args.ticks, args.seed, args.cell_size)
+        print(f"{count:>6} proyectiles: fuerza bruta {brute_us:7.2f} µs/entidad | "
+              f"hash {hash_us:6.2f} µs/entidad | proyectil vs proyectil {batch_us:6.2f} µs/consulta")
+    print("Comprobación OK" if failures == 0 else "Comprobación FALLIDA")
+    raise SystemExit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+"""
+Comprobación de que los luchadores de un combate headless se liberan al terminar.
+
+Juega combates con run_match sin FighterPool (como validate() del motor
+vectorizado) con el recolector de ciclos desactivado y comprueba con
+weakref que ambos luchadores, y con ellos sus sprites, desaparecen en cuanto
+se suelta el combate. Si quedara algún ciclo de referencias (por ejemplo
+Fighter.collision_world -> CollisionWorld -> luchadores) solo lo liberaría
+una recolección de la generación 2 y la memoria crecería combate a combate.
+
+Uso:
+    python -m simulation.collection_check
+    python -m simulation.collection_check --matches 3 --max-ticks 1200
+"""
+
+import argparse
+import contextlib
+import gc
+import io
+import weakref
+
+from .headless import HeadlessMatch, CHARACTER_NAMES
+
+DEFAULT_MAX_TICKS = 600
+
+
+def _play(p1_name, p2_name, seed, match_id, max_ticks):
+    """Juega un combate y devuelve referencias débiles a sus luchadores."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        match = HeadlessMatch(p1_name, p2_name, seed, match_id)
+    match.run(max_ticks)
+    return weakref.ref(match.fighter_1), weakref.ref(match.fighter_2)
+
+
+def check_collection(matches, seed, max_ticks=DEFAULT_MAX_TICKS):
+    """
+    Combates de todos los enfrentamientos sin recolector de ciclos.
+
+    Returns:
+        list[tuple]: (enfrentamiento, id de combate, clases de los luchadores que siguen vivos)
+    """
+    leaks = []
+    was_enabled = gc.isenabled()
+    gc.collect()
+    gc.disable()
+    try:
+        match_id = 0
+        for p1_name in CHARACTER_NAMES:
+            for p2_name in CHARACTER_NAMES:
+                for _ in range(matches):
+                    refs = _play(p1_name, p2_name, seed, match_id, max_ticks)
+                    alive = [type(fighter).__name__ for fighter in (ref() for ref in refs) if fighter is not None]
+                    if alive:
+                        leaks.append(((p1_name, p2_name), match_id, alive))
+                    match_id += 1
+    finally:
+        if was_enabled:
+            gc.enable()
+    return leaks
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Comprobación de liberación de luchadores")
+    parser.add_argument('--matches', type=int, default=1, help="Combates por enfrentamiento")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--max-ticks', type=int, default=DEFAULT_MAX_TICKS)
+    args = parser.parse_args()
+
+    leaks = check_collection(args.matches, args.seed, args.max_ticks)
+    for (p1_name, p2_name), match_id, alive in leaks:
+        print(f"{p1_name} vs {p2_name} (combate {match_id}): siguen vivos {', '.join(alive)}")
+    played = len(CHARACTER_NAMES) ** 2 * args.matches
+    print(f"{played - len(leaks)}/{played} combates liberan sus luchadores sin gc.collect() "
+          + ("OK" if not leaks else "FALLIDO"))
+    raise SystemExit(0 if not leaks else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+"""
+Comprobación de los oponentes de CPU (fighters.cpu).
+
+Juega combates headless de cada dificultad de la CPU contra la política
+aleatoria con todos los personajes y mide el coste de cada llamada al
+controlador. Informa del porcentaje de victorias por dificultad (debe crecer
+de fácil a difícil) y falla si el coste por tick supera el presupuesto.
+
+Uso:
+    python -m simulation.cpu_check
+    python -m simulation.cpu_check --matches 4 --difficulties hard
+"""
+
+import argparse
+import time
+
+from fighters.cpu import CPU_DIFFICULTIES, CPU_DIFFICULTY_ORDER, create_cpu_controller
+from fighters.fighter_pool import FighterPool
+from .headless import HeadlessMatch, CHARACTER_NAMES
+
+# Presupuesto por llamada al controlador (milisegundos)
+CPU_BUDGET_MS = 0.5
+
+
+class _TimedInput:
+    """Envuelve una fuente de entrada y acumula el tiempo de cada llamada."""
+    def __init__(self, input_source, samples):
+        self.input_source = input_source
+        self.samples = samples
+
+    def __call__(self, fighter, target):
+        start = time.perf_counter()
+        mask = self.input_source(fighter, target)
+        self.samples.append(time.perf_counter() - start)
+        return mask
+
+
+def run_difficulty(difficulty, matches, seed):
+    """
+    Combates de la CPU (P1) contra la política aleatoria (P2) en todos los enfrentamientos.
+
+    Returns:
+        dict: victorias, combates y tiempos por llamada (segundos)
+    """
+    wins = 0
+    played = 0
+    samples = []
+    pool = FighterPool()
+    for cpu_character in CHARACTER_NAMES:
+        for opponent_character in CHARACTER_NAMES:
+            for match_index in range(matches):
+                match_id = played
+                match = HeadlessMatch(cpu_character, opponent_character, seed, match_id, pool)
+                controller = create_cpu_controller(match.fighter_1, difficulty, seed * 7919 + match_id)
+                match.fighter_1.input_source = _TimedInput(controller, samples)
+                result = match.run()
+                wins += result['winner'] == 1
+                played += 1
+    return {'wins': wins, 'matches': played, 'samples': samples}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Comprobación de los oponentes de CPU")
+    parser.add_argument('--matches', type=int, default=2, help="Combates por enfrentamiento y dificultad")
+    parser.add_argument('--difficulties', nargs='+', choices=CPU_DIFFICULTY_ORDER, default=list(CPU_DIFFICULTY_ORDER))
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    within_budget = True
+    for difficulty in args.difficulties:
+        result = run_difficulty(difficulty, args.matches, args.seed)
+        samples = sorted(result['samples'])
+        mean_ms = sum(samples) / len(samples) * 1000
+        p99_ms = samples[min(len(samples) - 1, int(len(samples) * 0.99))] * 1000
+        within_budget &= p99_ms <= CPU_BUDGET_MS
+        print(f"{CPU_DIFFICULTIES[difficulty]['name']:>8}: {result['wins']}/{result['matches']} victorias "
+              f"({100 * result['wins'] / result['matches']:5.1f}%) contra la política aleatoria | "
+              f"{mean_ms * 1000:6.1f} µs/tick de media, p99 {p99_ms * 1000:6.1f} µs, "
+              f"máximo {samples[-1] * 1e6:6.1f} µs")
+    print(f"Presupuesto de {CPU_BUDGET_MS} ms por tick " + ("OK" if within_budget else "SUPERADO"))
+    raise SystemExit(0 if within_budget else 1)
+
+
+if __name__ == '__main__':
+    main()
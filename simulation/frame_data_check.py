@@ -0,0 +1,119 @@
+"""
+Comprobación de la frame data (fighters.frame_data) contra el motor real.
+
+Juega combates headless de todos los enfrentamientos y anota el frame_index
+del atacante en cada impacto que el motor registra: golpes de contacto
+(Fighter.apply_attack_hit), trampas y flechas del Trapper (trigger_attack) y
+el sacrificio del Slime Demon. Falla si algún impacto ocurre en un frame que
+la tabla no considera alcanzable, o si un frame de impacto concreto de la
+tabla (once_at, multi, trampa, proyectil) no aparece en ningún combate.
+
+Uso:
+    python -m simulation.frame_data_check
+    python -m simulation.frame_data_check --matches 8 --seed 3
+"""
+
+import argparse
+import contextlib
+import io
+from collections import defaultdict
+
+from fighters.base_fighter import Fighter
+from fighters.character_data import HIT_ONCE_AT, HIT_MULTI, HIT_TRAP, HIT_PROJECTILE
+from fighters.fighter_pool import FighterPool
+from .headless import HeadlessMatch, FIGHTER_CLASSES, CHARACTER_NAMES
+
+# Tipos de impacto con frames concretos: cada uno debe observarse en algún combate
+EXACT_HITS = (HIT_ONCE_AT, HIT_MULTI, HIT_TRAP, HIT_PROJECTILE)
+
+
+@contextlib.contextmanager
+def record_hit_frames(observed):
+    """
+    Anota en `observed[(clase, ataque)]` el frame_index de cada impacto
+    registrado mientras dura el bloque (restaura los métodos al salir).
+    """
+    trapper = FIGHTER_CLASSES['TrapperFighter']
+    slime_demon = FIGHTER_CLASSES['SlimeDemonFighter']
+
+    def record(fighter):
+        observed[(type(fighter).__name__, fighter.current_attack_type)].add(fighter.frame_index)
+
+    def recorded(method):
+        def wrapper(self, *args, **kwargs):
+            record(self)
+            return method(self, *args, **kwargs)
+        return wrapper
+
+    def recorded_explosion(method):
+        # Se llama en cada tick desde el frame de impacto y solo explota una vez
+        def wrapper(self, *args, **kwargs):
+            triggered = self.attack3_explosion_triggered
+            result = method(self, *args, **kwargs)
+            if not triggered and self.attack3_explosion_triggered:
+                record(self)
+            return result
+        return wrapper
+
+    originals = [(Fighter, 'apply_attack_hit', Fighter.apply_attack_hit, recorded),
+                 (trapper, 'trigger_attack', trapper.trigger_attack, recorded),
+                 (slime_demon, 'trigger_attack3_explosion', slime_demon.trigger_attack3_explosion,
+                  recorded_explosion)]
+    for owner, name, method, wrap in originals:
+        setattr(owner, name, wrap(method))
+    try:
+        yield observed
+    finally:
+        for owner, name, method, _ in originals:
+            setattr(owner, name, method)
+
+
+def check_frame_data(matches, seed):
+    """
+    Returns:
+        tuple: (impactos fuera de la tabla, frames de la tabla nunca vistos, impactos observados)
+    """
+    observed = defaultdict(set)
+    pool = FighterPool()
+    match_id = 0
+    with record_hit_frames(observed), contextlib.redirect_stdout(io.StringIO()):
+        for p1_name in CHARACTER_NAMES:
+            for p2_name in CHARACTER_NAMES:
+                for _ in range(matches):
+                    HeadlessMatch(p1_name, p2_name, seed, match_id, pool).run()
+                    match_id += 1
+        frame_data = {name: FIGHTER_CLASSES[name](1, 300, 370, False, None).frame_data
+                      for name in CHARACTER_NAMES}
+
+    outside, unseen = [], []
+    for name in CHARACTER_NAMES:
+        for attack in frame_data[name].attacks[1:]:
+            frames = observed.get((name, attack.attack_type), set())
+            outside.extend((name, attack.attack_type, frame) for frame in sorted(frames)
+                           if not attack.can_hit_at(frame))
+            if attack.hit_kind in EXACT_HITS:
+                unseen.extend((name, attack.attack_type, frame) for frame in attack.hit_frames
+                              if frame not in frames)
+    return outside, unseen, observed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Comprobación de la frame data contra el motor")
+    parser.add_argument('--matches', type=int, default=4, help="Combates por enfrentamiento")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    outside, unseen, observed = check_frame_data(args.matches, args.seed)
+    for (name, attack_type), frames in sorted(observed.items()):
+        print(f"  {name:<18} ataque {attack_type}: impactos en los frames {sorted(frames)}")
+    for name, attack_type, frame in outside:
+        print(f"{name} ataque {attack_type}: impacto en el frame {frame}, fuera de la tabla")
+    for name, attack_type, frame in unseen:
+        print(f"{name} ataque {attack_type}: el frame de impacto {frame} de la tabla no se alcanzó")
+    ok = not outside and not unseen
+    print("Comprobación " + ("OK" if ok else "FALLIDA"))
+    raise SystemExit(0 if ok else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,127 @@
+"""
+Ejecución headless de combates usando las clases Fighter reales.
+
+Inicializa pygame con drivers "dummy" (sin ventana ni audio), activa el
+reloj simulado y avanza el combate tick a tick con fighters.arena.Arena,
+igual que el bucle principal de main.py: move() de ambos luchadores, luego
+update() y por último los proyectiles.
+"""
+
+import os
+import random
+
+import pygame
+
+from fighters import sim_clock
+from fighters.registry import FighterClasses, character_names
+from fighters.arena import Arena
+from fighters.combat_events import CombatStats
+from .policies import RandomPolicyInput
+
+# Dimensiones del escenario (mismas que main.py)
+SCREEN_WIDTH = 1400
+SCREEN_HEIGHT = 600
+
+# Posiciones iniciales (mismas que create_fighters_from_selection en main.py)
+INITIAL_X_P1 = 300
+INITIAL_X_P2 = 1100
+INITIAL_Y = 370
+
+# Duración máxima por defecto de un combate simulado (60 segundos)
+DEFAULT_MAX_TICKS = 3600
+
+# Nombre de clase -> clase (cada personaje se importa la primera vez que se usa)
+FIGHTER_CLASSES = FighterClasses()
+CHARACTER_NAMES = character_names()
+
+
+def init_headless():
+    """Inicializa pygame sin ventana visible ni dispositivo de audio."""
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+    if not pygame.get_init():
+        pygame.init()
+    if pygame.display.get_surface() is None:
+        # convert_alpha() necesita un modo de video activo
+        pygame.display.set_mode((1, 1))
+
+
+class HeadlessMatch:
+    """
+    Combate 1 contra 1 entre luchadores reales sin renderizado.
+
+    Las entradas se asignan con Fighter.input_source; por defecto se usa la
+    política aleatoria determinista compartida con el motor vectorizado.
+
+    Con un FighterPool los luchadores se reutilizan de combates anteriores
+    (reiniciados, con el mismo resultado que recién creados); el combate
+    anterior que los usara deja de ser válido.
+    """
+    def __init__(self, p1_class_name, p2_class_name, seed=0, match_id=0, pool=None):
+        init_headless()
+        random.seed(seed * 1000003 + match_id)
+        sim_clock.use_simulated_time(0)
+
+        self.tick = 0
+        self.winner = None
+        if pool is None:
+            self.fighter_1 = FIGHTER_CLASSES[p1_class_name](1, INITIAL_X_P1, INITIAL_Y, False, None)
+            self.fighter_2 = FIGHTER_CLASSES[p2_class_name](2, INITIAL_X_P2, INITIAL_Y, True, None)
+        else:
+            self.fighter_1 = pool.acquire(FIGHTER_CLASSES[p1_class_name], 1, INITIAL_X_P1, INITIAL_Y, False)
+            self.fighter_2 = pool.acquire(FIGHTER_CLASSES[p2_class_name], 2, INITIAL_X_P2, INITIAL_Y, True)
+        self.fighter_1.input_source = RandomPolicyInput(seed, match_id, 0)
+        self.fighter_2.input_source = RandomPolicyInput(seed, match_id, 1)
+
+        # Arena de dos luchadores con bus de eventos, broadphase y proyectiles
+        # propios del combate, y estadísticas derivadas de sus eventos
+        self.arena = Arena((self.fighter_1, self.fighter_2))
+        self.event_bus = self.arena.event_bus
+        self.projectiles = self.arena.projectiles
+        self.stats = CombatStats(self.event_bus)
+
+    def step(self):
+        """
+        Avanza un tick del combate.
+
+        Returns:
+            bool: True si el combate ha terminado
+        """
+        fighter_1, fighter_2 = self.fighter_1, self.fighter_2
+        self.arena.step(SCREEN_WIDTH, SCREEN_HEIGHT)
+        self.stats.consume()
+        sim_clock.advance_tick()
+        self.tick += 1
+
+        # Regla de victoria de 1 contra 1 (la misma del motor vectorizado): la
+        # animación de muerte debe completarse y, si ambos terminan a la vez, gana P2
+        if not fighter_1.is_alive and fighter_1.death_animation_done:
+            self.winner = 2
+        elif not fighter_2.is_alive and fighter_2.death_animation_done:
+            self.winner = 1
+        return self.winner is not None
+
+    def run(self, max_ticks=DEFAULT_MAX_TICKS):
+        """
+        Ejecuta el combate hasta que termine o se alcance max_ticks y suelta
+        los proyectiles y referencias de la arena (Arena.clear()).
+
+        Returns:
+            dict: winner (0 = empate por tiempo), ticks, salud final de ambos y
+            estadísticas de combate por player_number
+        """
+        while self.tick < max_ticks:
+            if self.step():
+                break
+        self.arena.clear()
+        return {
+            'winner': self.winner or 0,
+            'ticks': self.tick,
+            'health': (self.fighter_1.current_health, self.fighter_2.current_health),
+            'stats': self.stats.as_dict(),
+        }
+
+
+def run_match(p1_class_name, p2_class_name, seed=0, match_id=0, max_ticks=DEFAULT_MAX_TICKS, pool=None):
+    """Atajo para crear y ejecutar un HeadlessMatch."""
+    return HeadlessMatch(p1_class_name, p2_class_name, seed, match_id, pool).run(max_ticks)
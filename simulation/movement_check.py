@@ -0,0 +1,348 @@
+"""
+Comprobación y micro-benchmark del núcleo de movimiento (fighters.movement).
+
+Contiene las implementaciones de move() anteriores a la unificación como
+referencia congelada (la del Fighter base y la copia compartida por Tank y
+Trapper) y verifica, con secuencias de entrada aleatorias, que el núcleo
+común produce trayectorias idénticas tick a tick para cada personaje.
+También compara el motor de efectos de estado (fighters.status_effects) con
+los contadores de quemadura/sangrado originales.
+
+Uso:
+    python -m simulation.movement_check --trials 20 --ticks 600
+    python -m simulation.movement_check --benchmark --ticks 20000
+"""
+
+import argparse
+import math
+import random
+import time
+
+from fighters import sim_clock
+from fighters.controls import (INPUT_NONE, INPUT_LEFT, INPUT_RIGHT, INPUT_JUMP, INPUT_SHIELD,
+                               INPUT_ATTACKS)
+from fighters.movement import AIR_CONTROL_NORMALIZED, move_fighter
+from fighters.status_effects import StatusEffects, STATUS_BURN, STATUS_BLEEDING, STATUS_DEFINITIONS
+from fighters.projectiles import ProjectileManager
+from fighters.spatial_hash import CollisionWorld
+from .headless import init_headless, FIGHTER_CLASSES, SCREEN_WIDTH, SCREEN_HEIGHT, INITIAL_Y
+
+# Campos comparados en cada tick
+STATE_FIELDS = (
+    'vertical_velocity', 'is_jumping', 'is_running', 'flip_sprite', 'is_attacking',
+    'current_attack_type', 'attack_cooldown_timer', 'shield_active', 'shield_health',
+    'damage_taken', 'current_action', 'frame_index',
+)
+
+
+def legacy_move_normalized(self, screen_width, screen_height, target, round_over, input_mask):
+    """
+    Fighter.move original (escudo y normalización diagonal).
+
+    Los efectos de estado se procesan con el motor común en ambas
+    referencias; sus contadores originales se comprueban en check_status_effects.
+    """
+    MOVEMENT_SPEED = self.get_movement_speed()
+    GRAVITY_FORCE = 2
+    JUMP_STRENGTH = self.jump_strength
+    horizontal_delta = 0
+    vertical_delta = 0
+    self.is_running = False
+    if not self.is_attacking:
+        self.current_attack_type = 0
+    if not self.is_attacking and self.is_alive and not round_over:
+        if input_mask & INPUT_LEFT:
+            horizontal_delta = -MOVEMENT_SPEED
+            self.is_running = True
+        if input_mask & INPUT_RIGHT:
+            horizontal_delta = MOVEMENT_SPEED
+            self.is_running = True
+        if input_mask & INPUT_JUMP and not self.is_jumping:
+            self.vertical_velocity = JUMP_STRENGTH
+            self.is_jumping = True
+        if input_mask & INPUT_SHIELD:
+            if not self.shield_active and self.shield_cooldown_timer <= 0:
+                self.shield_active = True
+                self.shield_health = self.shield_max_health
+        else:
+            self.shield_active = False
+        if not self.shield_active:
+            for attack_type, attack_bit in enumerate(INPUT_ATTACKS, start=1):
+                if input_mask & attack_bit:
+                    self.execute_attack(target)
+                    self.current_attack_type = attack_type
+                    break
+    self.vertical_velocity += GRAVITY_FORCE
+    vertical_delta += self.vertical_velocity
+    if horizontal_delta != 0 and vertical_delta != 0:
+        magnitude = math.sqrt(horizontal_delta**2 + vertical_delta**2)
+        normalized_horizontal = (horizontal_delta / magnitude) * MOVEMENT_SPEED if magnitude > 0 else 0
+        horizontal_delta = normalized_horizontal
+        vertical_delta = self.vertical_velocity
+    if self.collision_rect.left + horizontal_delta < 0:
+        horizontal_delta = -self.collision_rect.left
+    if self.collision_rect.right + horizontal_delta > screen_width:
+        horizontal_delta = screen_width - self.collision_rect.right
+    ground_level = screen_height - 50
+    if self.collision_rect.bottom + vertical_delta > ground_level:
+        self.vertical_velocity = 0
+        self.is_jumping = False
+        vertical_delta = ground_level - self.collision_rect.bottom
+    if target.collision_rect.centerx > self.collision_rect.centerx:
+        self.flip_sprite = False
+    else:
+        self.flip_sprite = True
+    self.status_effects.process(self)
+    self.collision_rect.x += horizontal_delta
+    self.collision_rect.y += vertical_delta
+
+
+def legacy_move_direct(self, screen_width, screen_height, target, round_over, input_mask):
+    """TankFighter.move / TrapperFighter.move originales (sin escudo ni normalización)."""
+    MOVEMENT_SPEED = self.get_movement_speed()
+    GRAVITY_FORCE = 2
+    JUMP_STRENGTH = self.jump_strength
+    horizontal_delta = 0
+    vertical_delta = 0
+    self.is_running = False
+    if not self.is_attacking:
+        self.current_attack_type = 0
+    if not self.is_attacking and self.is_alive and not round_over:
+        if input_mask & INPUT_LEFT:
+            horizontal_delta = -MOVEMENT_SPEED
+            self.is_running = True
+        if input_mask & INPUT_RIGHT:
+            horizontal_delta = MOVEMENT_SPEED
+            self.is_running = True
+        if input_mask & INPUT_JUMP and not self.is_jumping:
+            self.vertical_velocity = JUMP_STRENGTH
+            self.is_jumping = True
+        for attack_type, attack_bit in enumerate(INPUT_ATTACKS, start=1):
+            if input_mask & attack_bit:
+                self.execute_attack(target)
+                self.current_attack_type = attack_type
+                break
+    self.vertical_velocity += GRAVITY_FORCE
+    vertical_delta += self.vertical_velocity
+    if self.collision_rect.left + horizontal_delta < 0:
+        horizontal_delta = -self.collision_rect.left
+    if self.collision_rect.right + horizontal_delta > screen_width:
+        horizontal_delta = screen_width - self.collision_rect.right
+    ground_level = screen_height - 50
+    if self.collision_rect.bottom + vertical_delta > ground_level:
+        self.vertical_velocity = 0
+        self.is_jumping = False
+        vertical_delta = ground_level - self.collision_rect.bottom
+    if target.collision_rect.centerx > self.collision_rect.centerx:
+        self.flip_sprite = False
+    else:
+        self.flip_sprite = True
+    self.status_effects.process(self)
+    self.collision_rect.x += horizontal_delta
+    self.collision_rect.y += vertical_delta
+
+
+def legacy_move_for(fighter):
+    """Implementación original de move() que correspondía a la clase del luchador."""
+    if fighter.movement_profile.air_control == AIR_CONTROL_NORMALIZED:
+        return legacy_move_normalized
+    return legacy_move_direct
+
+
+def _state(fighter, target):
+    rect = fighter.collision_rect
+    return ((tuple(rect), tuple(target.collision_rect), fighter.status_effects.snapshot())
+            + tuple(getattr(fighter, name) for name in STATE_FIELDS))
+
+
+def random_masks(rng, ticks, include_attacks=True):
+    """Secuencia de máscaras aleatorias mantenidas unos ticks (como un jugador)."""
+    bits = [INPUT_LEFT, INPUT_RIGHT, INPUT_JUMP, INPUT_SHIELD]
+    if include_attacks:
+        bits += list(INPUT_ATTACKS)
+    masks, mask = [], INPUT_NONE
+    while len(masks) < ticks:
+        mask = INPUT_NONE
+        for bit in bits:
+            if rng.random() < 0.3:
+                mask |= bit
+        masks.extend([mask] * rng.randint(1, 12))
+    return masks[:ticks]
+
+
+class _Pair:
+    """Luchador + oponente quieto, con estado inicial restaurable."""
+    def __init__(self, class_name):
+        self.fighter = FIGHTER_CLASSES[class_name](1, 300, INITIAL_Y, False, None)
+        self.target = FIGHTER_CLASSES['WarriorFighter'](2, 1100, INITIAL_Y, True, None)
+        self.collision_world = CollisionWorld()
+        self.projectiles = ProjectileManager(world=self.collision_world)
+        for fighter in (self.fighter, self.target):
+            fighter.collision_world = self.collision_world
+            fighter.projectiles = self.projectiles
+        self.fighter_snapshot = self.fighter.snapshot()
+        self.target_snapshot = self.target.snapshot()
+
+    def begin_tick(self):
+        self.collision_world.begin_tick((self.fighter, self.target))
+
+    def reset(self, fighter_x, target_x, burn, bleeding):
+        self.fighter.restore(self.fighter_snapshot)
+        self.target.restore(self.target_snapshot)
+        self.projectiles.clear()
+        self.collision_world.clear()
+        self.fighter.collision_rect.x = fighter_x
+        self.target.collision_rect.x = target_x
+        if burn:
+            self.fighter.apply_status_effect(STATUS_BURN, *burn)
+        if bleeding:
+            self.fighter.apply_status_effect(STATUS_BLEEDING, *bleeding)
+
+
+def check_class(class_name, trials, ticks, seed):
+    """
+    Ejecuta `trials` secuencias aleatorias con la implementación original y el
+    núcleo común en paralelo y devuelve el primer tick divergente (o None).
+    """
+    legacy_pair, kernel_pair = _Pair(class_name), _Pair(class_name)
+    legacy = legacy_move_for(legacy_pair.fighter)
+    rng = random.Random(seed)
+    for trial in range(trials):
+        masks = random_masks(rng, ticks)
+        setup = (rng.randint(0, SCREEN_WIDTH - 100), rng.randint(0, SCREEN_WIDTH - 100),
+                 (rng.randint(1, 12), rng.randint(60, 300)) if rng.random() < 0.5 else None,
+                 (rng.randint(1, 12), rng.randint(60, 300)) if rng.random() < 0.5 else None)
+        round_over_from = rng.randint(ticks // 2, ticks * 2)
+        legacy_pair.reset(*setup)
+        kernel_pair.reset(*setup)
+        kernel_pair.fighter.input_source = lambda fighter, target, masks=masks: masks[sim_clock.get_simulated_tick()]
+
+        sim_clock.use_simulated_time(0)
+        for tick in range(ticks):
+            round_over = tick >= round_over_from
+            legacy(legacy_pair.fighter, SCREEN_WIDTH, SCREEN_HEIGHT, legacy_pair.target, round_over, masks[tick])
+            kernel_pair.fighter.move(SCREEN_WIDTH, SCREEN_HEIGHT, None, kernel_pair.target, round_over)
+            legacy_pair.begin_tick()
+            kernel_pair.begin_tick()
+            legacy_pair.fighter.update(legacy_pair.target)
+            kernel_pair.fighter.update(kernel_pair.target)
+            legacy_pair.projectiles.update()
+            kernel_pair.projectiles.update()
+            if _state(legacy_pair.fighter, legacy_pair.target) != _state(kernel_pair.fighter, kernel_pair.target):
+                return trial, tick
+            sim_clock.advance_tick()
+    return None
+
+
+class _LegacyDot:
+    """Contador original de process_burn_effect / process_bleeding_effect."""
+    def __init__(self, damage, duration, interval):
+        self.remaining, self.timer, self.interval, self.counter = damage, duration, interval, 0
+
+    def process(self):
+        """Avanza un tick y devuelve el daño aplicado."""
+        damage = 0
+        if self.timer > 0:
+            self.counter += 1
+            if self.counter >= self.interval:
+                damage = max(1, self.remaining // (self.timer // self.interval)) if self.timer >= self.interval else self.remaining
+                if damage > 0:
+                    self.remaining -= damage
+                self.counter = 0
+            self.timer -= 1
+            if self.timer <= 0 or self.remaining <= 0:
+                self.timer = 0
+                self.remaining = 0
+        return damage
+
+
+class _DamageLog:
+    """Dueño mínimo para StatusEffects: registra el daño recibido por tick."""
+    def __init__(self):
+        self.damage = 0
+
+    def apply_damage(self, amount):
+        self.damage += amount
+
+
+def check_status_effects(trials, seed):
+    """
+    Compara el daño por tick del motor de efectos con los contadores
+    originales, reaplicando el efecto (reemplazo) en ticks aleatorios.
+    Devuelve el primer (tipo, secuencia, tick) divergente o None.
+    """
+    rng = random.Random(seed)
+    for kind in (STATUS_BURN, STATUS_BLEEDING):
+        interval = STATUS_DEFINITIONS[kind][0]
+        for trial in range(trials):
+            owner = _DamageLog()
+            effects = StatusEffects()
+            legacy = _LegacyDot(0, 0, interval)
+            for tick in range(900):
+                if rng.random() < 0.01:
+                    damage, duration = rng.randint(1, 40), rng.randint(1, 400)
+                    effects.apply(kind, damage, duration)
+                    legacy = _LegacyDot(damage, duration, interval)
+                owner.damage = 0
+                effects.process(owner)
+                if owner.damage != legacy.process():
+                    return kind, trial, tick
+    return None
+
+
+def benchmark_class(class_name, ticks, seed):
+    """Tiempo por llamada (µs) de move() original vs núcleo común, sin ataques."""
+    pair = _Pair(class_name)
+    masks = random_masks(random.Random(seed), ticks, include_attacks=False)
+    legacy = legacy_move_for(pair.fighter)
+    fighter, target = pair.fighter, pair.target
+    sim_clock.use_simulated_time(0)
+
+    start = time.perf_counter()
+    for mask in masks:
+        legacy(fighter, SCREEN_WIDTH, SCREEN_HEIGHT, target, False, mask)
+    legacy_time = time.perf_counter() - start
+
+    pair.reset(300, 1100, None, None)
+    profile = fighter.movement_profile
+    start = time.perf_counter()
+    for mask in masks:
+        move_fighter(fighter, profile, fighter.get_movement_speed(), mask, target, SCREEN_WIDTH, SCREEN_HEIGHT, False)
+    kernel_time = time.perf_counter() - start
+    return legacy_time / ticks * 1e6, kernel_time / ticks * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Comprobación del núcleo de movimiento común")
+    parser.add_argument('--trials', type=int, default=10, help="Secuencias aleatorias por personaje")
+    parser.add_argument('--ticks', type=int, default=600, help="Ticks por secuencia")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--benchmark', action='store_true', help="Medir el coste por llamada de move()")
+    args = parser.parse_args()
+
+    init_headless()
+    failures = 0
+    for class_name in FIGHTER_CLASSES:
+        if args.benchmark:
+            legacy_us, kernel_us = benchmark_class(class_name, args.ticks, args.seed)
+            print(f"{class_name:>18}: original {legacy_us:6.2f} µs/tick | núcleo {kernel_us:6.2f} µs/tick")
+            continue
+        divergence = check_class(class_name, args.trials, args.ticks, args.seed)
+        if divergence is None:
+            print(f"{class_name:>18}: {args.trials} secuencias x {args.ticks} ticks idénticas")
+        else:
+            failures += 1
+            print(f"{class_name:>18}: DIVERGENCIA en secuencia {divergence[0]}, tick {divergence[1]}")
+    if not args.benchmark:
+        divergence = check_status_effects(args.trials, args.seed)
+        if divergence is None:
+            print(f"{'efectos de estado':>18}: {args.trials} secuencias por tipo idénticas")
+        else:
+            failures += 1
+            print(f"{'efectos de estado':>18}: DIVERGENCIA en {divergence[0]}, secuencia {divergence[1]}, tick {divergence[2]}")
+        print("Comprobación OK" if failures == 0 else "Comprobación FALLIDA")
+        raise SystemExit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()
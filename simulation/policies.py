@@ -0,0 +1,120 @@
+"""
+Políticas de entrada deterministas para simulaciones.
+
+La política aleatoria se define con un hash (splitmix64) de
+(semilla, combate, bloque de ticks, lado), de modo que el motor de
+objetos y el motor vectorizado generan exactamente las mismas entradas
+para la misma semilla sin necesidad de almacenarlas.
+"""
+
+import numpy as np
+
+from fighters.controls import (INPUT_NONE, INPUT_LEFT, INPUT_RIGHT, INPUT_JUMP,
+                               INPUT_SHIELD, INPUT_ATTACKS)
+from fighters import sim_clock
+
+# Ticks que se mantiene cada decisión de la política aleatoria
+POLICY_HOLD_TICKS = 8
+
+_MASK_64 = 0xFFFFFFFFFFFFFFFF
+
+
+def _splitmix64(value):
+    """Hash splitmix64 sobre enteros de Python."""
+    z = (value + 0x9E3779B97F4A7C15) & _MASK_64
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASK_64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASK_64
+    return z ^ (z >> 31)
+
+
+def _splitmix64_array(values):
+    """Hash splitmix64 vectorizado sobre arrays uint64."""
+    z = values + np.uint64(0x9E3779B97F4A7C15)
+    z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return z ^ (z >> np.uint64(31))
+
+
+def _decode_mask(hashed, own_center_x, opponent_center_x):
+    """Traduce un hash a una máscara de entrada (versión escalar)."""
+    mask = INPUT_NONE
+    direction = hashed & 3
+    if direction == 3:
+        # Acercarse al oponente
+        direction = 2 if opponent_center_x > own_center_x else 1
+    if direction == 1:
+        mask |= INPUT_LEFT
+    elif direction == 2:
+        mask |= INPUT_RIGHT
+    if (hashed >> 8) & 15 == 0:
+        mask |= INPUT_JUMP
+    if (hashed >> 12) & 7 == 0:
+        mask |= INPUT_SHIELD
+    attack = (hashed >> 16) & 7
+    if attack < 3:
+        mask |= INPUT_ATTACKS[attack]
+    return mask
+
+
+def random_policy_mask(seed, match_id, tick, side, own_center_x, opponent_center_x):
+    """
+    Máscara de la política aleatoria para un luchador en un tick.
+
+    Args:
+        seed (int): Semilla compartida de la simulación
+        match_id (int): Índice del combate dentro del lote
+        tick (int): Tick actual del combate
+        side (int): 0 para el jugador 1, 1 para el jugador 2
+        own_center_x (int): centerx del luchador
+        opponent_center_x (int): centerx del oponente
+    """
+    block = tick // POLICY_HOLD_TICKS
+    hashed = _splitmix64(_splitmix64(_splitmix64(seed) ^ match_id) ^ (block * 2 + side))
+    return _decode_mask(hashed, own_center_x, opponent_center_x)
+
+
+def random_policy_masks(seed, match_ids, tick, side, own_center_x, opponent_center_x):
+    """
+    Versión vectorizada de random_policy_mask para K combates a la vez.
+
+    Returns:
+        np.ndarray: Máscaras uint8 de forma (K,)
+    """
+    block = tick // POLICY_HOLD_TICKS
+    seed_hash = np.uint64(_splitmix64(seed))
+    hashed = _splitmix64_array(seed_hash ^ match_ids.astype(np.uint64))
+    hashed = _splitmix64_array(hashed ^ np.uint64(block * 2 + side))
+
+    direction = (hashed & np.uint64(3)).astype(np.int8)
+    toward = np.where(opponent_center_x > own_center_x, 2, 1).astype(np.int8)
+    direction = np.where(direction == 3, toward, direction)
+
+    mask = np.zeros(match_ids.shape, dtype=np.uint8)
+    mask |= np.where(direction == 1, INPUT_LEFT, 0).astype(np.uint8)
+    mask |= np.where(direction == 2, INPUT_RIGHT, 0).astype(np.uint8)
+    mask |= np.where(((hashed >> np.uint64(8)) & np.uint64(15)) == 0, INPUT_JUMP, 0).astype(np.uint8)
+    mask |= np.where(((hashed >> np.uint64(12)) & np.uint64(7)) == 0, INPUT_SHIELD, 0).astype(np.uint8)
+    attack = ((hashed >> np.uint64(16)) & np.uint64(7)).astype(np.int8)
+    for attack_index, attack_bit in enumerate(INPUT_ATTACKS):
+        mask |= np.where(attack == attack_index, attack_bit, 0).astype(np.uint8)
+    return mask
+
+
+class RandomPolicyInput:
+    """
+    Fuente de entrada para Fighter.input_source basada en la política aleatoria.
+    Con el reloj simulado el tick se lee de sim_clock; con el reloj real (bots
+    de la arena en main.py) se deriva de los milisegundos transcurridos.
+    """
+    def __init__(self, seed, match_id, side):
+        self.seed = seed
+        self.match_id = match_id
+        self.side = side
+
+    def __call__(self, fighter, target):
+        tick = sim_clock.get_simulated_tick()
+        if tick is None:
+            tick = sim_clock.get_ticks() * sim_clock.SIMULATED_FPS // 1000
+        return random_policy_mask(self.seed, self.match_id, tick,
+                                  self.side, fighter.collision_rect.centerx,
+                                  target.collision_rect.centerx)
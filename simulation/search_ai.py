@@ -0,0 +1,381 @@
+"""
+IA de búsqueda: elige su entrada simulando por adelantado el combate.
+
+En cada decisión se toma un snapshot del combate (Arena.snapshot), se
+restaura en una arena propia con los mismos personajes (SearchSandbox) y se
+prueba cada acción candidata con rollouts: la acción (una máscara INPUT_*) se
+mantiene HOLD_TICKS ticks y después el luchador y sus rivales siguen con la
+CPU por reglas hasta completar HORIZON_TICKS. La recompensa es el daño hecho
+menos el daño recibido (más un bono por KO). Las acciones se reparten los
+rollouts con UCB1, es decir, la raíz de un MCTS con rollouts aleatorios: la
+fuerza de la IA crece con los ticks simulados por segundo.
+
+La búsqueda corre en un proceso aparte (python -m simulation.search_ai
+--worker) con su propio reloj simulado, de modo que el bucle de render nunca
+espera: SearchController envía el snapshot, sigue devolviendo la última
+acción elegida (o la CPU por reglas hasta tener la primera) y recoge el
+resultado cuando llega. Cada búsqueda tiene un presupuesto estricto en
+milisegundos que se comprueba en cada tick simulado.
+
+Uso (evaluación contra la CPU por reglas):
+    python -m simulation.search_ai
+    python -m simulation.search_ai --matches 4 --budget-ms 40 --opponent hard
+"""
+
+import argparse
+import math
+import os
+import subprocess
+import sys
+import time
+import weakref
+from multiprocessing.connection import Listener, Client
+
+from fighters import sim_clock
+from fighters.arena import Arena
+from fighters.controls import (INPUT_NONE, INPUT_LEFT, INPUT_RIGHT, INPUT_JUMP, INPUT_SHIELD,
+                               INPUT_ATTACK1, INPUT_ATTACK2, INPUT_ATTACK3)
+from fighters.cpu import create_cpu_controller, CPU_DIFFICULTY_ORDER
+from fighters.fighter_pool import FighterPool
+from .headless import (init_headless, HeadlessMatch, FIGHTER_CLASSES, CHARACTER_NAMES,
+                       SCREEN_WIDTH, SCREEN_HEIGHT, INITIAL_Y, DEFAULT_MAX_TICKS)
+
+# Acciones candidatas (máscaras mantenidas durante HOLD_TICKS)
+SEARCH_ACTIONS = (
+    INPUT_NONE, INPUT_LEFT, INPUT_RIGHT, INPUT_JUMP, INPUT_LEFT | INPUT_JUMP, INPUT_RIGHT | INPUT_JUMP,
+    INPUT_SHIELD, INPUT_ATTACK1, INPUT_ATTACK2, INPUT_ATTACK3,
+)
+
+HOLD_TICKS = 6            # Ticks que se mantiene cada acción (y cada cuánto se decide)
+HORIZON_TICKS = 40        # Ticks simulados por rollout
+DEFAULT_BUDGET_MS = 50    # Presupuesto por decisión (3 frames a 60 FPS)
+ROLLOUT_DIFFICULTY = 'normal'  # CPU por reglas que juega el resto del rollout
+
+KO_BONUS = 50             # Recompensa (en puntos de vida) por derribar a un enemigo
+REWARD_SCALE = 20.0       # Escala de la recompensa para UCB1
+EXPLORATION = 1.0         # Constante de exploración de UCB1
+
+
+# Raíz del proyecto (para lanzar el proceso de búsqueda como módulo)
+_REPOSITORY_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def arena_spec(arena):
+    """Personajes de una arena: (clase, player_number, equipo) por luchador."""
+    return tuple((type(fighter).__name__, fighter.player_number, fighter.team) for fighter in arena.fighters)
+
+
+def _start_tick(time_ms):
+    """Primer tick simulado cuyo tiempo (ticks_to_ms) no es anterior a time_ms."""
+    return -(-time_ms * sim_clock.SIMULATED_FPS // 1000)
+
+
+class _ScriptedInput:
+    """Fuente de entrada del luchador buscado: la acción candidata y después la CPU por reglas."""
+    def __init__(self, policy):
+        self.policy = policy
+        self.action = INPUT_NONE
+        self.ticks_left = 0
+
+    def __call__(self, fighter, target):
+        if self.ticks_left > 0:
+            self.ticks_left -= 1
+            return self.action
+        return self.policy(fighter, target)
+
+
+class SearchSandbox:
+    """
+    Arena privada en la que se restauran los snapshots y se simulan los rollouts.
+    Usa el reloj simulado global, así que debe vivir en su propio proceso.
+
+    Args:
+        spec: Resultado de arena_spec() de la arena real
+        seed (int): Semilla de las CPU por reglas de los rollouts
+    """
+    def __init__(self, spec, seed=0):
+        init_headless()
+        sim_clock.use_simulated_time(0)
+        fighters = []
+        for class_name, player_number, team in spec:
+            fighter = FIGHTER_CLASSES[class_name](player_number, SCREEN_WIDTH // 2, INITIAL_Y, False, None)
+            fighter.team = team
+            fighter.input_source = _ScriptedInput(
+                create_cpu_controller(fighter, ROLLOUT_DIFFICULTY, seed + player_number))
+            fighters.append(fighter)
+        self.arena = Arena(fighters)
+
+    def search(self, snapshot, player_number, budget_ms=DEFAULT_BUDGET_MS, max_rollouts=None,
+               horizon=HORIZON_TICKS):
+        """
+        Busca la mejor acción para un luchador desde un snapshot.
+
+        Returns:
+            tuple: (máscara elegida o None si no dio tiempo a ningún rollout,
+            rollouts completados, ticks simulados)
+        """
+        deadline = time.perf_counter() + budget_ms / 1000
+        arena = self.arena
+        fighters = arena.fighters
+        searched = next(fighter for fighter in fighters if fighter.player_number == player_number)
+        actions = SEARCH_ACTIONS if searched.movement_profile.shield_input else \
+            tuple(action for action in SEARCH_ACTIONS if action != INPUT_SHIELD)
+        start_tick = _start_tick(snapshot['time_ms'])
+        health_before = [fighter_snapshot['current_health'] for fighter_snapshot in snapshot['fighters']]
+        alive_before = [fighter_snapshot['is_alive'] for fighter_snapshot in snapshot['fighters']]
+        scripted = searched.input_source
+
+        visits = [0] * len(actions)
+        totals = [0.0] * len(actions)
+        rollouts = 0
+        simulated_ticks = 0
+        while max_rollouts is None or rollouts < max_rollouts:
+            # UCB1: primero cada acción una vez, después la de mayor cota superior
+            if rollouts < len(actions):
+                choice = rollouts
+            else:
+                log_total = math.log(rollouts)
+                choice = max(range(len(actions)), key=lambda index: totals[index] / visits[index] +
+                             EXPLORATION * math.sqrt(log_total / visits[index]))
+
+            arena.restore(snapshot)
+            sim_clock.use_simulated_time(start_tick)
+            for fighter in fighters:
+                fighter.input_source.policy.ticks_until_decision = 0
+                fighter.input_source.ticks_left = 0
+            scripted.action = actions[choice]
+            scripted.ticks_left = HOLD_TICKS
+
+            completed = True
+            for _ in range(horizon):
+                if time.perf_counter() > deadline:
+                    completed = False
+                    break
+                arena.step(SCREEN_WIDTH, SCREEN_HEIGHT)
+                sim_clock.advance_tick()
+                simulated_ticks += 1
+            if not completed:
+                break
+
+            reward = 0.0
+            for index, fighter in enumerate(fighters):
+                loss = health_before[index] - fighter.current_health
+                knocked_out = alive_before[index] and not fighter.is_alive
+                if fighter is searched:
+                    reward -= loss + KO_BONUS * knocked_out
+                elif fighter.team != searched.team:
+                    reward += loss + KO_BONUS * knocked_out
+            visits[choice] += 1
+            totals[choice] += reward / REWARD_SCALE
+            rollouts += 1
+
+        tried = [index for index in range(len(actions)) if visits[index]]
+        if not tried:
+            return None, 0, simulated_ticks
+        best = max(tried, key=lambda index: totals[index] / visits[index])
+        return actions[best], rollouts, simulated_ticks
+
+
+def _worker_main(host, port):
+    """Bucle del proceso de búsqueda: atiende setup / search hasta que se cierra la conexión."""
+    connection = Client((host, port), authkey=bytes.fromhex(os.environ['SEARCH_AI_AUTHKEY']))
+    spec = None
+    sandbox = None
+    while True:
+        try:
+            message = connection.recv()
+        except EOFError:
+            break
+        if message is None:
+            break
+        if message[0] == 'setup':
+            # Solo se conserva la arena privada del combate actual (cada luchador carga sus sprites)
+            if message[1] != spec:
+                spec = message[1]
+                if sandbox is not None:
+                    sandbox.arena.clear()
+                    sandbox = None
+                sandbox = SearchSandbox(spec)
+        elif message[0] == 'search':
+            _, request_id, snapshot, player_number, budget_ms, max_rollouts = message
+            start = time.perf_counter()
+            mask, rollouts, simulated_ticks = sandbox.search(snapshot, player_number, budget_ms, max_rollouts)
+            connection.send((request_id, mask, rollouts, simulated_ticks, time.perf_counter() - start))
+    connection.close()
+
+
+class SearchWorker:
+    """
+    Proceso de búsqueda. Se lanza como módulo (no con multiprocessing) para que
+    no vuelva a ejecutar el script principal del juego al arrancar.
+    """
+    def __init__(self):
+        authkey = os.urandom(16)
+        listener = Listener(('localhost', 0), authkey=authkey)
+        host, port = listener.address
+        # El proceso de búsqueda nunca abre ventana ni audio
+        environment = dict(os.environ, SEARCH_AI_AUTHKEY=authkey.hex(),
+                           SDL_VIDEODRIVER='dummy', SDL_AUDIODRIVER='dummy')
+        self.process = subprocess.Popen(
+            [sys.executable, '-m', 'simulation.search_ai', '--worker', host, str(port)],
+            env=environment, cwd=_REPOSITORY_ROOT, stdout=subprocess.DEVNULL)
+        self.connection = listener.accept()
+        listener.close()
+        self.next_request_id = 1
+
+    def setup(self, spec):
+        """Prepara (o reutiliza) la arena privada para estos personajes."""
+        self.connection.send(('setup', spec))
+
+    def request(self, snapshot, player_number, budget_ms, max_rollouts=None):
+        """Encola una búsqueda y devuelve su identificador."""
+        request_id = self.next_request_id
+        self.next_request_id += 1
+        self.connection.send(('search', request_id, snapshot, player_number, budget_ms, max_rollouts))
+        return request_id
+
+    def poll(self, request_id):
+        """Resultado de la búsqueda si ya llegó (sin esperar); descarta resultados antiguos."""
+        while self.connection.poll():
+            result = self.connection.recv()
+            if result[0] == request_id:
+                return result
+        return None
+
+    def wait(self, request_id):
+        """Espera el resultado de una búsqueda."""
+        while True:
+            result = self.connection.recv()
+            if result[0] == request_id:
+                return result
+
+    def close(self):
+        """Detiene el proceso de búsqueda."""
+        try:
+            self.connection.send(None)
+            self.connection.close()
+        except OSError:
+            pass
+        try:
+            self.process.wait(timeout=2)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+
+
+class SearchController:
+    """
+    Fuente de entrada (Fighter.input_source) respaldada por la búsqueda.
+
+    Args:
+        arena (Arena): Combate real del que se toman los snapshots
+        player_number (int): Luchador controlado
+        worker (SearchWorker): Proceso de búsqueda (se puede compartir entre combates)
+        budget_ms (float): Presupuesto de cada búsqueda
+        blocking (bool): Esperar cada resultado (evaluación headless reproducible
+            respecto a la latencia; en el juego debe ser False)
+    """
+    def __init__(self, arena, player_number, worker, budget_ms=DEFAULT_BUDGET_MS, blocking=False,
+                 max_rollouts=None):
+        # Referencia débil: el luchador guarda este controlador y la arena al
+        # luchador, así que una referencia fuerte crearía un ciclo con sus sprites
+        self.arena_ref = weakref.ref(arena)
+        self.player_number = player_number
+        self.worker = worker
+        self.budget_ms = budget_ms
+        self.blocking = blocking
+        self.max_rollouts = max_rollouts
+        fighter = next(fighter for fighter in arena.fighters if fighter.player_number == player_number)
+        self.fallback = create_cpu_controller(fighter, 'hard')
+        self.mask = None            # Última acción elegida (None hasta el primer resultado)
+        self.pending = None         # Búsqueda en curso
+        self.ticks_since_request = HOLD_TICKS
+        # Estadísticas para medir la velocidad de simulación
+        self.searches = 0
+        self.rollouts = 0
+        self.simulated_ticks = 0
+        self.search_seconds = 0.0
+        worker.setup(arena_spec(arena))
+
+    def apply(self, result):
+        _, mask, rollouts, simulated_ticks, search_seconds = result
+        self.pending = None
+        self.searches += 1
+        self.rollouts += rollouts
+        self.simulated_ticks += simulated_ticks
+        self.search_seconds += search_seconds
+        if mask is not None:
+            self.mask = mask
+
+    def __call__(self, fighter, target):
+        if self.pending is not None:
+            result = self.worker.poll(self.pending)
+            if result is not None:
+                self.apply(result)
+        self.ticks_since_request += 1
+        if self.pending is None and self.ticks_since_request >= HOLD_TICKS:
+            self.ticks_since_request = 0
+            self.pending = self.worker.request(self.arena_ref().snapshot(), self.player_number,
+                                               self.budget_ms, self.max_rollouts)
+            if self.blocking:
+                self.apply(self.worker.wait(self.pending))
+        if self.mask is None:
+            return self.fallback(fighter, target)
+        return self.mask
+
+
+def evaluate(matches, budget_ms, opponent, seed):
+    """
+    Combates de la IA de búsqueda (P1) contra la CPU por reglas (P2) en todos los enfrentamientos.
+
+    Returns:
+        dict: victorias, derrotas, combates y estadísticas de búsqueda
+    """
+    worker = SearchWorker()
+    totals = {'wins': 0, 'losses': 0, 'matches': 0, 'searches': 0, 'rollouts': 0, 'simulated_ticks': 0,
+              'search_seconds': 0.0}
+    pool = FighterPool()
+    try:
+        for p1_character in CHARACTER_NAMES:
+            for p2_character in CHARACTER_NAMES:
+                for match_index in range(matches):
+                    match = HeadlessMatch(p1_character, p2_character, seed, totals['matches'], pool)
+                    controller = SearchController(match.arena, 1, worker, budget_ms, blocking=True)
+                    match.fighter_1.input_source = controller
+                    match.fighter_2.input_source = create_cpu_controller(match.fighter_2, opponent,
+                                                                         seed * 7919 + totals['matches'])
+                    result = match.run(DEFAULT_MAX_TICKS)
+                    totals['wins'] += result['winner'] == 1
+                    totals['losses'] += result['winner'] == 2
+                    totals['matches'] += 1
+                    for name in ('searches', 'rollouts', 'simulated_ticks', 'search_seconds'):
+                        totals[name] += getattr(controller, name)
+    finally:
+        worker.close()
+    return totals
+
+
+def main():
+    parser = argparse.ArgumentParser(description="IA de búsqueda por rollouts (evaluación y proceso de búsqueda)")
+    parser.add_argument('--worker', nargs=2, metavar=('HOST', 'PORT'), help=argparse.SUPPRESS)
+    parser.add_argument('--matches', type=int, default=1, help="Combates por enfrentamiento")
+    parser.add_argument('--budget-ms', type=float, default=DEFAULT_BUDGET_MS, help="Presupuesto por decisión")
+    parser.add_argument('--opponent', choices=CPU_DIFFICULTY_ORDER, default='hard',
+                        help="Dificultad de la CPU por reglas rival")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    if args.worker:
+        _worker_main(args.worker[0], int(args.worker[1]))
+        return
+
+    totals = evaluate(args.matches, args.budget_ms, args.opponent, args.seed)
+    print(f"Búsqueda ({args.budget_ms:g} ms por decisión) contra la CPU {args.opponent}: "
+          f"{totals['wins']} victorias, {totals['losses']} derrotas en {totals['matches']} combates")
+    searches = max(totals['searches'], 1)
+    print(f"  {totals['rollouts'] / searches:.1f} rollouts y {totals['simulated_ticks'] / searches:.0f} "
+          f"ticks simulados por decisión | "
+          f"{totals['simulated_ticks'] / max(totals['search_seconds'], 1e-9):,.0f} ticks simulados por segundo")
+
+
+if __name__ == '__main__':
+    main()
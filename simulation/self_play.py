@@ -0,0 +1,395 @@
+"""
+Generador de datos de entrenamiento por self-play.
+
+Juega combates headless bot contra bot (CPU por reglas de cualquier
+dificultad o la política aleatoria) con las clases Fighter reales y guarda,
+por cada tick y cada luchador, la tupla (características del estado, acción,
+recompensa) en shards .npy con un array estructurado (SAMPLE_DTYPE).
+
+- Calendario de semillas compartido: el combate global i usa siempre los
+  mismos personajes, bots y semillas (match_schedule), sin importar qué
+  proceso lo juegue ni en qué orden.
+- Shards: el shard k contiene los combates [k * m, (k + 1) * m). Cada
+  proceso escribe su shard en bloques de chunk_rows filas (ShardWriter), así
+  que la memoria no crece con el tamaño del shard. El fichero se escribe como
+  .tmp y se renombra al cerrarse: un shard visible siempre está completo.
+- Manifiesto reanudable: manifest.json registra la configuración y los
+  shards terminados; se reescribe de forma atómica tras cada shard. Al
+  relanzar el mismo comando solo se juegan los shards que faltan.
+
+Características (STATE_FEATURE_NAMES): las de FIGHTER_FEATURE_NAMES del
+luchador, las del rival y la distancia horizontal entre ambos. La acción es
+la máscara INPUT_* que devolvió su fuente de entrada en ese tick y la
+recompensa, la vida quitada menos la vida perdida (en fracciones de 100)
+más REWARD_KO al derribar al rival (o menos, al caer).
+
+Uso:
+    python -m simulation.self_play --output selfplay --shards 8
+    python -m simulation.self_play --output selfplay --shards 100 --workers 2 --matches-per-shard 25
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import time
+
+import numpy as np
+
+from fighters.controls import INPUT_NONE
+from fighters.cpu import create_cpu_controller, CPU_DIFFICULTY_ORDER
+from fighters.fighter_pool import FighterPool
+from .headless import init_headless, HeadlessMatch, CHARACTER_NAMES, DEFAULT_MAX_TICKS
+from .policies import RandomPolicyInput
+
+MANIFEST_NAME = 'manifest.json'
+MANIFEST_FORMAT = 1
+DEFAULT_MATCHES_PER_SHARD = 10
+DEFAULT_CHUNK_ROWS = 4096
+
+# Bots que pueden controlar a cada lado ('random' = política aleatoria)
+SELF_PLAY_BOTS = ('random',) + CPU_DIFFICULTY_ORDER
+
+REWARD_KO = 1.0
+
+# Campos de Fighter que describen a un luchador (en este orden)
+FIGHTER_FEATURE_NAMES = (
+    'character', 'center_x', 'bottom', 'vertical_velocity', 'facing_left',
+    'current_health', 'shield_health', 'shield_active', 'shield_cooldown_timer',
+    'attack_cooldown_timer', 'is_attacking', 'current_attack_type',
+    'is_jumping', 'is_hit', 'is_alive',
+)
+STATE_FEATURE_NAMES = tuple(f'own_{name}' for name in FIGHTER_FEATURE_NAMES) + \
+    tuple(f'opponent_{name}' for name in FIGHTER_FEATURE_NAMES) + ('distance_x',)
+
+SAMPLE_DTYPE = np.dtype([
+    ('features', np.float32, (len(STATE_FEATURE_NAMES),)),
+    ('action', np.uint8),
+    ('reward', np.float32),
+    ('done', np.uint8),
+    ('match', np.uint32),
+    ('tick', np.uint16),
+    ('player', np.uint8),
+])
+
+# Anchura reservada para el número de filas en la cabecera .npy, que se
+# reescribe al cerrar el shard sin mover los datos
+_ROWS_WIDTH = 12
+_NPY_MAGIC = b'\x93NUMPY\x01\x00'
+
+
+def fighter_features(fighter):
+    """Valores de FIGHTER_FEATURE_NAMES para un luchador."""
+    rect = fighter.collision_rect
+    return (
+        CHARACTER_NAMES.index(type(fighter).__name__), rect.centerx, rect.bottom,
+        fighter.vertical_velocity, fighter.flip_sprite,
+        fighter.current_health, fighter.shield_health, fighter.shield_active,
+        fighter.shield_cooldown_timer, fighter.attack_cooldown_timer,
+        fighter.is_attacking, fighter.current_attack_type or 0,
+        fighter.is_jumping, fighter.is_hit, fighter.is_alive,
+    )
+
+
+def state_features(fighter, opponent):
+    """Vector STATE_FEATURE_NAMES visto desde `fighter`."""
+    return fighter_features(fighter) + fighter_features(opponent) + \
+        (opponent.collision_rect.centerx - fighter.collision_rect.centerx,)
+
+
+def match_schedule(seed, match_index):
+    """
+    Personajes, bots y semillas del combate global `match_index`.
+
+    Returns:
+        dict: characters (P1, P2), bots (P1, P2) y bot_seeds (P1, P2)
+    """
+    rng = random.Random(seed * 1000003 + match_index)
+    matchup = match_index % (len(CHARACTER_NAMES) ** 2)
+    return {
+        'characters': (CHARACTER_NAMES[matchup // len(CHARACTER_NAMES)],
+                       CHARACTER_NAMES[matchup % len(CHARACTER_NAMES)]),
+        'bots': (rng.choice(SELF_PLAY_BOTS), rng.choice(SELF_PLAY_BOTS)),
+        'bot_seeds': (rng.getrandbits(32), rng.getrandbits(32)),
+    }
+
+
+def _npy_header(dtype, rows):
+    """Cabecera .npy 1.0 de longitud fija (alineada a 64 bytes) para `rows` filas."""
+    header = "{'descr': %r, 'fortran_order': False, 'shape': (%*d,), }" % (
+        np.lib.format.dtype_to_descr(dtype), _ROWS_WIDTH, rows)
+    padding = -(len(_NPY_MAGIC) + 2 + len(header) + 1) % 64
+    header = (header + ' ' * padding + '\n').encode('latin1')
+    return _NPY_MAGIC + len(header).to_bytes(2, 'little') + header
+
+
+class ShardWriter:
+    """
+    Escritura en streaming de un shard .npy.
+
+    Las filas se acumulan en un búfer de chunk_rows filas que se vuelca al
+    fichero temporal al llenarse. close() reescribe la cabecera con el total
+    de filas, sincroniza a disco y renombra el fichero a su nombre final.
+
+    Args:
+        path (str): Ruta final del shard
+        dtype (np.dtype): Tipo de cada fila
+        chunk_rows (int): Filas del búfer en memoria
+    """
+    def __init__(self, path, dtype=SAMPLE_DTYPE, chunk_rows=DEFAULT_CHUNK_ROWS):
+        self.path = path
+        self.temp_path = path + '.tmp'
+        self.dtype = dtype
+        self.buffer = np.zeros(chunk_rows, dtype=dtype)
+        self.buffered = 0
+        self.rows = 0
+        self.file = open(self.temp_path, 'wb')
+        self.file.write(_npy_header(dtype, 0))
+
+    def append(self, features, action, reward, done, match, tick, player):
+        row = self.buffer[self.buffered]
+        row['features'] = features
+        row['action'] = action
+        row['reward'] = reward
+        row['done'] = done
+        row['match'] = match
+        row['tick'] = tick
+        row['player'] = player
+        self.buffered += 1
+        if self.buffered == len(self.buffer):
+            self.flush_chunk()
+
+    def flush_chunk(self):
+        """Vuelca al fichero las filas del búfer."""
+        if self.buffered:
+            self.file.write(self.buffer[:self.buffered].tobytes())
+            self.rows += self.buffered
+            self.buffered = 0
+
+    def close(self):
+        """Completa el shard y lo hace visible con un renombrado atómico."""
+        self.flush_chunk()
+        self.file.seek(0)
+        self.file.write(_npy_header(self.dtype, self.rows))
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        self.file.close()
+        os.replace(self.temp_path, self.path)
+        return self.rows
+
+    def abort(self):
+        """Descarta el shard a medio escribir."""
+        self.file.close()
+        if os.path.exists(self.temp_path):
+            os.remove(self.temp_path)
+
+
+class _RecordedInput:
+    """Envuelve una fuente de entrada y recuerda la última máscara devuelta."""
+    def __init__(self, input_source):
+        self.input_source = input_source
+        self.last_mask = INPUT_NONE
+
+    def __call__(self, fighter, target):
+        self.last_mask = self.input_source(fighter, target)
+        return self.last_mask
+
+
+def _create_bot(fighter, bot, bot_seed, seed, match_index, side):
+    if bot == 'random':
+        return RandomPolicyInput(seed, match_index, side)
+    return create_cpu_controller(fighter, bot, bot_seed)
+
+
+def play_match(writer, seed, match_index, max_ticks=DEFAULT_MAX_TICKS, pool=None):
+    """
+    Juega el combate global `match_index` y escribe dos filas por tick (una por luchador).
+    Con un FighterPool reutiliza los luchadores de los combates anteriores.
+
+    Returns:
+        dict: winner y ticks del combate
+    """
+    schedule = match_schedule(seed, match_index)
+    match = HeadlessMatch(*schedule['characters'], seed, match_index, pool)
+    fighters = (match.fighter_1, match.fighter_2)
+    recorders = []
+    for side, fighter in enumerate(fighters):
+        bot = _create_bot(fighter, schedule['bots'][side], schedule['bot_seeds'][side], seed, match_index, side)
+        fighter.input_source = _RecordedInput(bot)
+        recorders.append(fighter.input_source)
+
+    while match.tick < max_ticks:
+        tick = match.tick
+        states = (state_features(fighters[0], fighters[1]), state_features(fighters[1], fighters[0]))
+        health_before = [fighter.current_health for fighter in fighters]
+        alive_before = [fighter.is_alive for fighter in fighters]
+        done = match.step() or match.tick >= max_ticks
+        for side, fighter in enumerate(fighters):
+            opponent = fighters[1 - side]
+            reward = ((health_before[1 - side] - opponent.current_health) -
+                      (health_before[side] - fighter.current_health)) / 100.0
+            if alive_before[1 - side] and not opponent.is_alive:
+                reward += REWARD_KO
+            if alive_before[side] and not fighter.is_alive:
+                reward -= REWARD_KO
+            writer.append(states[side], recorders[side].last_mask, reward, done, match_index, tick, side + 1)
+        if done:
+            break
+    match.arena.clear()
+    return {'winner': match.winner or 0, 'ticks': match.tick}
+
+
+def shard_path(directory, shard_index):
+    return os.path.join(directory, f'shard-{shard_index:05d}.npy')
+
+
+def generate_shard(task):
+    """
+    Genera un shard completo (se ejecuta en los procesos del pool).
+
+    Returns:
+        tuple: (shard_index, entrada del manifiesto)
+    """
+    directory, shard_index, settings, chunk_rows = task
+    matches_per_shard = settings['matches_per_shard']
+    writer = ShardWriter(shard_path(directory, shard_index), chunk_rows=chunk_rows)
+    start = time.perf_counter()
+    wins = [0, 0, 0]
+    ticks = 0
+    pool = FighterPool()  # Los sprites de cada personaje se cargan una vez por shard
+    try:
+        for match_index in range(shard_index * matches_per_shard, (shard_index + 1) * matches_per_shard):
+            result = play_match(writer, settings['seed'], match_index, settings['max_ticks'], pool)
+            wins[result['winner']] += 1
+            ticks += result['ticks']
+    except BaseException:
+        writer.abort()
+        raise
+    rows = writer.close()
+    return shard_index, {
+        'file': os.path.basename(writer.path),
+        'rows': rows,
+        'matches': matches_per_shard,
+        'ticks': ticks,
+        'wins': wins,
+        'seconds': round(time.perf_counter() - start, 3),
+    }
+
+
+class Manifest:
+    """
+    Progreso reanudable de una generación (manifest.json).
+
+    La configuración se guarda junto a los shards terminados; relanzar con
+    otra configuración sobre el mismo directorio es un error en lugar de
+    mezclar datos incompatibles.
+    """
+    def __init__(self, directory, settings):
+        self.path = os.path.join(directory, MANIFEST_NAME)
+        self.settings = settings
+        self.shards = {}
+        if os.path.exists(self.path):
+            with open(self.path, 'r', encoding='utf-8') as manifest_file:
+                data = json.load(manifest_file)
+            if data['settings'] != settings:
+                raise ValueError(f"{self.path} se generó con otra configuración: {data['settings']}")
+            self.shards = {int(index): entry for index, entry in data['shards'].items()
+                           if os.path.exists(os.path.join(directory, entry['file']))}
+
+    def add(self, shard_index, entry):
+        self.shards[shard_index] = entry
+        self.save()
+
+    def save(self):
+        """Escribe el manifiesto en un temporal y lo renombra (nunca queda a medias)."""
+        data = {
+            'format': MANIFEST_FORMAT,
+            'settings': self.settings,
+            'shards': {str(index): self.shards[index] for index in sorted(self.shards)},
+        }
+        temp_path = self.path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as manifest_file:
+            json.dump(data, manifest_file, indent=2, sort_keys=True)
+            manifest_file.flush()
+            os.fsync(manifest_file.fileno())
+        os.replace(temp_path, self.path)
+
+
+def _worker_init():
+    init_headless()
+
+
+def generate(directory, shards, matches_per_shard=DEFAULT_MATCHES_PER_SHARD, seed=0,
+             max_ticks=DEFAULT_MAX_TICKS, chunk_rows=DEFAULT_CHUNK_ROWS, workers=None, report=None):
+    """
+    Genera los shards [0, shards) que falten en `directory`.
+
+    Returns:
+        Manifest: Manifiesto con todos los shards terminados
+    """
+    os.makedirs(directory, exist_ok=True)
+    settings = {
+        'seed': seed,
+        'matches_per_shard': matches_per_shard,
+        'max_ticks': max_ticks,
+        'bots': list(SELF_PLAY_BOTS),
+        'features': list(STATE_FEATURE_NAMES),
+        'dtype': str(np.lib.format.dtype_to_descr(SAMPLE_DTYPE)),
+    }
+    manifest = Manifest(directory, settings)
+    pending = [(directory, shard_index, settings, chunk_rows) for shard_index in range(shards)
+               if shard_index not in manifest.shards]
+    workers = min(workers or os.cpu_count() or 1, max(len(pending), 1))
+    if workers > 1:
+        with multiprocessing.Pool(workers, initializer=_worker_init) as pool:
+            for shard_index, entry in pool.imap_unordered(generate_shard, pending):
+                manifest.add(shard_index, entry)
+                if report:
+                    report(shard_index, entry)
+    else:
+        for task in pending:
+            shard_index, entry = generate_shard(task)
+            manifest.add(shard_index, entry)
+            if report:
+                report(shard_index, entry)
+    return manifest
+
+
+def load_shards(directory):
+    """Abre (como memmap) los shards terminados según el manifiesto, en orden."""
+    with open(os.path.join(directory, MANIFEST_NAME), 'r', encoding='utf-8') as manifest_file:
+        data = json.load(manifest_file)
+    return [np.load(os.path.join(directory, data['shards'][index]['file']), mmap_mode='r')
+            for index in sorted(data['shards'], key=int)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Datos de entrenamiento por self-play en shards .npy")
+    parser.add_argument('--output', required=True, help="Directorio de shards y manifiesto")
+    parser.add_argument('--shards', type=int, default=8, help="Shards totales (se reanudan los que falten)")
+    parser.add_argument('--matches-per-shard', type=int, default=DEFAULT_MATCHES_PER_SHARD)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--max-ticks', type=int, default=DEFAULT_MAX_TICKS)
+    parser.add_argument('--chunk-rows', type=int, default=DEFAULT_CHUNK_ROWS, help="Filas en memoria por proceso")
+    parser.add_argument('--workers', type=int, default=None, help="Procesos (por defecto, todos los núcleos)")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+
+    def report(shard_index, entry):
+        print(f"shard {shard_index:5d}: {entry['rows']:8d} filas, {entry['matches']} combates, "
+              f"{entry['ticks'] / entry['seconds']:,.0f} ticks/s")
+
+    try:
+        manifest = generate(args.output, args.shards, args.matches_per_shard, args.seed, args.max_ticks,
+                            args.chunk_rows, args.workers, report)
+    except ValueError as error:
+        raise SystemExit(str(error))
+    rows = sum(entry['rows'] for entry in manifest.shards.values())
+    print(f"{len(manifest.shards)}/{args.shards} shards, {rows:,} filas en {args.output} "
+          f"({time.perf_counter() - start:.1f} s)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,255 @@
+"""
+Prueba de resistencia (soak) de muchas rondas seguidas.
+
+Reproduce el ciclo de una sesión larga de main.py: en cada ronda se
+construyen luchadores nuevos (con sus sprites), se crea su Arena, la CPU
+juega el combate hasta el final (dibujando sobre una superficie fuera de
+pantalla) y la arena se libera, como en ROUND_OVER -> CHARACTER_SELECT.
+
+Cada `sample_every` rondas registra:
+- RSS del proceso (/proc/self/statm), tras devolver al sistema el montículo
+  libre con malloc_trim cuando hay glibc
+- pygame.Surface vivas (referenciadas desde los objetos de gc.get_objects())
+- objetos seguidos por el recolector y recolecciones por generación
+- memoria de Python según tracemalloc
+
+Tras las rondas de calentamiento (cachés de tablas y de ficheros llenas) se
+toma la referencia; al final se compara con la mediana de las últimas
+muestras y la prueba falla si el RSS, las superficies vivas o los objetos
+crecen más que sus umbrales. tracemalloc informa de las líneas que más han
+crecido desde la referencia.
+
+Uso:
+    python -m simulation.soak --rounds 200
+    python -m simulation.soak --minutes 720 --rounds 1000000 --output soak.json
+    python -m simulation.soak --rounds 50 --no-tracemalloc --render-every 0
+"""
+
+import argparse
+import contextlib
+import ctypes
+import ctypes.util
+import gc
+import io
+import json
+import os
+import random
+import resource
+import statistics
+import time
+import tracemalloc
+
+import pygame
+
+from fighters import sim_clock
+from fighters.arena import Arena
+from fighters.cpu import create_cpu_controller, CPU_DIFFICULTY_ORDER
+from .headless import (init_headless, FIGHTER_CLASSES, CHARACTER_NAMES, SCREEN_WIDTH, SCREEN_HEIGHT,
+                       INITIAL_X_P1, INITIAL_X_P2, INITIAL_Y, DEFAULT_MAX_TICKS)
+
+DEFAULT_ROUNDS = 200
+DEFAULT_WARMUP_ROUNDS = 20
+DEFAULT_SAMPLE_EVERY = 10
+DEFAULT_RENDER_EVERY = 4        # Dibujar uno de cada N ticks (0 = nunca)
+
+# Crecimiento máximo desde la referencia tras el calentamiento
+DEFAULT_MAX_RSS_GROWTH_MB = 64
+DEFAULT_MAX_SURFACE_GROWTH = 50
+DEFAULT_MAX_OBJECT_GROWTH = 20000
+
+TAIL_SAMPLES = 3                # Muestras finales cuya mediana se compara con la referencia
+TOP_ALLOCATORS = 10
+
+_PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+
+
+def _load_malloc_trim():
+    try:
+        return ctypes.CDLL(ctypes.util.find_library('c')).malloc_trim
+    except (OSError, AttributeError, TypeError):
+        return None  # Sin glibc (Windows, macOS, musl)
+
+
+_malloc_trim = _load_malloc_trim()
+
+
+def resident_memory_mb():
+    """RSS actual del proceso; sin /proc, el máximo que ha alcanzado."""
+    try:
+        with open('/proc/self/statm', 'r') as statm:
+            return int(statm.read().split()[1]) * _PAGE_SIZE / 2 ** 20
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def live_surface_count():
+    """
+    Superficies referenciadas desde objetos que sigue el recolector.
+
+    pygame.Surface no es un contenedor del gc y no aparece en gc.get_objects();
+    se cuentan (sin repetir) las que cuelgan de listas, dicts, instancias...
+    """
+    surface_ids = set()
+    for item in gc.get_objects():
+        for referent in gc.get_referents(item):
+            if isinstance(referent, pygame.Surface):
+                surface_ids.add(id(referent))
+    return len(surface_ids)
+
+
+def take_sample(round_index, start_time):
+    gc.collect()
+    if _malloc_trim is not None:
+        # glibc conserva montículo libre tras cargar sprites grandes; sin devolverlo
+        # al sistema el RSS refleja el pico de la ronda y no la memoria retenida
+        _malloc_trim(0)
+    traced_mb = tracemalloc.get_traced_memory()[0] / 2 ** 20 if tracemalloc.is_tracing() else None
+    return {
+        'round': round_index,
+        'seconds': round(time.perf_counter() - start_time, 1),
+        'rss_mb': round(resident_memory_mb(), 1),
+        'surfaces': live_surface_count(),
+        'gc_objects': len(gc.get_objects()),
+        'gc_counts': gc.get_count(),
+        'gc_collections': [generation['collections'] for generation in gc.get_stats()],
+        'traced_mb': None if traced_mb is None else round(traced_mb, 2),
+    }
+
+
+def play_round(rng, surface, render_every, max_ticks=DEFAULT_MAX_TICKS):
+    """
+    Una ronda completa con luchadores nuevos y la CPU a ambos lados.
+
+    Returns:
+        dict: personajes, ganador y ticks
+    """
+    characters = (rng.choice(CHARACTER_NAMES), rng.choice(CHARACTER_NAMES))
+    sim_clock.use_simulated_time(0)
+    with contextlib.redirect_stdout(io.StringIO()):
+        fighters = (FIGHTER_CLASSES[characters[0]](1, INITIAL_X_P1, INITIAL_Y, False, None),
+                    FIGHTER_CLASSES[characters[1]](2, INITIAL_X_P2, INITIAL_Y, True, None))
+    for fighter in fighters:
+        fighter.input_source = create_cpu_controller(fighter, rng.choice(CPU_DIFFICULTY_ORDER),
+                                                     rng.getrandbits(32))
+    arena = Arena(fighters)
+    winner = None
+    tick = 0
+    while tick < max_ticks and winner is None:
+        arena.step(SCREEN_WIDTH, SCREEN_HEIGHT)
+        sim_clock.advance_tick()
+        tick += 1
+        if render_every and tick % render_every == 0:
+            surface.fill((0, 0, 0))
+            for fighter in fighters:
+                fighter.draw(surface, 0)
+            arena.projectiles.draw(surface, 0)
+        winner = arena.winner()
+    arena.clear()
+    return {'characters': characters, 'winner': winner or 0, 'ticks': tick}
+
+
+def growth(samples, reference, key):
+    """Crecimiento de `key` entre la referencia y la mediana de las últimas muestras."""
+    tail = [sample[key] for sample in samples[-TAIL_SAMPLES:]]
+    return statistics.median(tail) - reference[key]
+
+
+def run_soak(rounds, warmup_rounds=DEFAULT_WARMUP_ROUNDS, sample_every=DEFAULT_SAMPLE_EVERY,
+             render_every=DEFAULT_RENDER_EVERY, seed=0, minutes=None, trace_memory=True, report=None):
+    """
+    Juega rondas hasta `rounds` o hasta agotar `minutes`.
+
+    Returns:
+        dict: muestras, muestra de referencia, rondas jugadas y las líneas de
+        tracemalloc que más crecieron (si estaba activo)
+    """
+    init_headless()
+    if trace_memory:
+        tracemalloc.start()
+    rng = random.Random(seed)
+    surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+    start_time = time.perf_counter()
+    deadline = start_time + minutes * 60 if minutes else None
+    samples = [take_sample(0, start_time)]
+    reference = None
+    reference_snapshot = None
+    played = 0
+    try:
+        while played < rounds and (deadline is None or time.perf_counter() < deadline):
+            play_round(rng, surface, render_every)
+            played += 1
+            if played == warmup_rounds or played % sample_every == 0:
+                sample = take_sample(played, start_time)
+                samples.append(sample)
+                if report:
+                    report(sample)
+                if played == warmup_rounds:
+                    reference = sample
+                    if trace_memory:
+                        reference_snapshot = tracemalloc.take_snapshot()
+        top_allocators = []
+        if reference_snapshot is not None:
+            # Sin las asignaciones de la propia medición (muestras, tracemalloc)
+            own_frames = (tracemalloc.Filter(False, __file__), tracemalloc.Filter(False, tracemalloc.__file__))
+            statistics_by_line = tracemalloc.take_snapshot().filter_traces(own_frames).compare_to(
+                reference_snapshot.filter_traces(own_frames), 'lineno')
+            top_allocators = [str(stat) for stat in statistics_by_line[:TOP_ALLOCATORS]]
+    finally:
+        if trace_memory:
+            tracemalloc.stop()
+        sim_clock.use_real_time()
+    return {'samples': samples, 'reference': reference, 'rounds': played, 'top_allocators': top_allocators}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Prueba de resistencia de muchas rondas")
+    parser.add_argument('--rounds', type=int, default=DEFAULT_ROUNDS)
+    parser.add_argument('--minutes', type=float, default=None, help="Parar al cumplir esta duración")
+    parser.add_argument('--warmup-rounds', type=int, default=DEFAULT_WARMUP_ROUNDS)
+    parser.add_argument('--sample-every', type=int, default=DEFAULT_SAMPLE_EVERY, help="Rondas entre muestras")
+    parser.add_argument('--render-every', type=int, default=DEFAULT_RENDER_EVERY,
+                        help="Dibujar uno de cada N ticks (0 = sin dibujo)")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--no-tracemalloc', action='store_true', help="Sin tracemalloc (más rápido)")
+    parser.add_argument('--max-rss-growth-mb', type=float, default=DEFAULT_MAX_RSS_GROWTH_MB)
+    parser.add_argument('--max-surface-growth', type=int, default=DEFAULT_MAX_SURFACE_GROWTH)
+    parser.add_argument('--max-object-growth', type=int, default=DEFAULT_MAX_OBJECT_GROWTH)
+    parser.add_argument('--output', default=None, help="Guardar las muestras en JSON")
+    args = parser.parse_args()
+
+    def report(sample):
+        traced = f" | tracemalloc {sample['traced_mb']:8.2f} MB" if sample['traced_mb'] is not None else ""
+        print(f"ronda {sample['round']:6d} ({sample['seconds']:8.1f} s) | RSS {sample['rss_mb']:8.1f} MB | "
+              f"{sample['surfaces']:6d} superficies | {sample['gc_objects']:8d} objetos | "
+              f"gc {sample['gc_collections']}{traced}")
+
+    result = run_soak(args.rounds, args.warmup_rounds, args.sample_every, args.render_every, args.seed,
+                      args.minutes, not args.no_tracemalloc, report)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as output_file:
+            json.dump(result, output_file, indent=2)
+
+    reference = result['reference']
+    if reference is None or len(result['samples']) < TAIL_SAMPLES + 2:
+        print(f"{result['rounds']} rondas: no hay suficientes muestras tras el calentamiento para evaluar")
+        return
+    checks = (
+        ('RSS (MB)', growth(result['samples'], reference, 'rss_mb'), args.max_rss_growth_mb),
+        ('superficies vivas', growth(result['samples'], reference, 'surfaces'), args.max_surface_growth),
+        ('objetos del gc', growth(result['samples'], reference, 'gc_objects'), args.max_object_growth),
+    )
+    if result['top_allocators']:
+        print(f"\nLíneas que más crecieron desde la ronda {reference['round']} (tracemalloc):")
+        for line in result['top_allocators']:
+            print(f"  {line}")
+    print(f"\n{result['rounds']} rondas; crecimiento desde la ronda {reference['round']}:")
+    failed = False
+    for name, value, limit in checks:
+        print(f"  {name:<18} {value:+10.1f} (máximo {limit:g})" + ("  SUPERADO" if value > limit else ""))
+        failed |= value > limit
+    print("Soak " + ("FALLIDO" if failed else "OK"))
+    raise SystemExit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,448 @@
+"""
+Búsqueda automática de constantes de balance.
+
+Evalúa combinaciones de parámetros con el motor vectorizado y busca las que
+acercan todos los enfrentamientos a un 50% de victorias. Soporta búsqueda en
+rejilla, aleatoria y bayesiana (proceso gaussiano + mejora esperada), reparte
+las evaluaciones entre procesos y guarda cada punto evaluado en una caché
+JSONL, de modo que al relanzar el mismo comando se reanuda donde se quedó.
+
+Uso:
+    python -m simulation.tuning --method random --budget 40 --matches 200
+    python -m simulation.tuning --method bayes --budget 30 \\
+        --param TankFighter.massive_knockback_force=100:220 \\
+        --param SlimeDemonFighter.sacrifice_ratio=0.3:0.7
+"""
+
+import argparse
+import copy
+import hashlib
+import itertools
+import json
+import math
+import multiprocessing
+import os
+
+import numpy as np
+
+from .headless import CHARACTER_NAMES, DEFAULT_MAX_TICKS
+from .vector_engine import VectorWorld, build_character_table
+
+DEFAULT_CACHE_PATH = 'tuning_cache.jsonl'
+
+# Parámetros ajustables: nombre "Clase.atributo" (el mismo que en el código)
+# -> tipo y rango de búsqueda por defecto. El valor actual se lee de la
+# tabla compilada de characters.json (current_parameters)
+TUNABLE_PARAMETERS = {
+    'TankFighter.massive_knockback_force': {'type': int, 'range': (80, 240)},
+    'TrapperFighter.max_traps': {'type': int, 'range': (1, 5)},
+    'TrapperFighter.trap_cooldown': {'type': int, 'range': (60, 600)},
+    'TrapperFighter.projectile_speed': {'type': float, 'range': (6.0, 20.0)},
+    'AssassinFighter.combo_window': {'type': int, 'range': (300, 2000)},
+    'SlimeDemonFighter.lava_drop_damage': {'type': int, 'range': (2, 8)},
+    'SlimeDemonFighter.sacrifice_ratio': {'type': float, 'range': (0.25, 0.75)},
+}
+
+# Dónde vive cada parámetro en la tabla del motor vectorizado: columna de
+# CharacterTable y tipo de ataque (None en las columnas por personaje)
+_TABLE_FIELDS = {
+    'TankFighter.massive_knockback_force': ('knockback', 3),
+    'TrapperFighter.max_traps': ('max_traps', None),
+    'TrapperFighter.trap_cooldown': ('trap_cooldown', None),
+    'TrapperFighter.projectile_speed': ('projectile_speed', None),
+    'AssassinFighter.combo_window': ('combo_window', None),
+    'SlimeDemonFighter.lava_drop_damage': ('drop_damage', None),
+    'SlimeDemonFighter.sacrifice_ratio': ('sacrifice_ratio', None),
+}
+
+
+def _table_index(table, name):
+    """Columna e índice de un parámetro en la tabla."""
+    column_name, attack_type = _TABLE_FIELDS[name]
+    char_id = table.names.index(name.split('.')[0])
+    return getattr(table, column_name), char_id if attack_type is None else (char_id, attack_type)
+
+
+def current_parameters(table, names):
+    """Valores actuales de los parámetros según la tabla de personajes."""
+    params = {}
+    for name in names:
+        column, index = _table_index(table, name)
+        params[name] = TUNABLE_PARAMETERS[name]['type'](column[index].item())
+    return params
+
+
+def apply_parameters(table, params):
+    """
+    Devuelve una copia de la tabla de personajes con los parámetros aplicados.
+
+    Args:
+        table (CharacterTable): Tabla base (no se modifica)
+        params (dict): "Clase.atributo" -> valor
+    """
+    tuned = copy.deepcopy(table)
+    for name, value in params.items():
+        column, index = _table_index(tuned, name)
+        column[index] = value
+    # Las ranuras de trampas del motor dependen del máximo de max_traps
+    tuned.max_trap_slots = max(1, int(tuned.max_traps.max()))
+    return tuned
+
+
+def table_fingerprint(table):
+    """
+    Hash de la tabla de personajes compilada. Forma parte de la clave de la
+    caché: tras cambiar characters.json o las reglas del motor, los puntos
+    evaluados con la tabla anterior dejan de reutilizarse.
+    """
+    digest = hashlib.sha256()
+    for name, value in sorted(vars(table).items()):
+        digest.update(name.encode())
+        if isinstance(value, np.ndarray):
+            digest.update(f"{value.dtype}{value.shape}".encode())
+            digest.update(np.ascontiguousarray(value).tobytes())
+        else:
+            digest.update(repr(value).encode())
+    return digest.hexdigest()[:16]
+
+
+def matchup_pairs():
+    """Pares no ordenados de personajes distintos."""
+    return list(itertools.combinations(range(len(CHARACTER_NAMES)), 2))
+
+
+def evaluate(params, matches=200, seed=0, max_ticks=DEFAULT_MAX_TICKS):
+    """
+    Simula todos los enfrentamientos (ambos lados) con los parámetros dados.
+
+    Returns:
+        dict: loss (error cuadrático medio respecto al 50%) y tasa de
+        victoria del primer personaje de cada par
+    """
+    table = apply_parameters(build_character_table(), params)
+    ordered = [(a, b) for a, b in matchup_pairs()] + [(b, a) for a, b in matchup_pairs()]
+    char_ids = np.repeat(np.array(ordered, dtype=np.int64), matches, axis=0)
+    winners = VectorWorld(char_ids, seed, table).run(max_ticks)['winner'].reshape(len(ordered), matches)
+
+    # Los empates cuentan como media victoria para cada lado
+    score_p1 = ((winners == 1) + 0.5 * (winners == 0)).mean(axis=1)
+    pair_count = len(matchup_pairs())
+    rates = {}
+    for index, (a, b) in enumerate(matchup_pairs()):
+        rate = (score_p1[index] + (1.0 - score_p1[index + pair_count])) / 2
+        rates[f"{CHARACTER_NAMES[a]} vs {CHARACTER_NAMES[b]}"] = float(rate)
+    deviations = np.array(list(rates.values())) - 0.5
+    return {
+        'loss': float(np.mean(deviations ** 2)),
+        'max_deviation': float(np.abs(deviations).max()),
+        'rates': rates,
+    }
+
+
+class EvaluationCache:
+    """
+    Caché persistente (JSONL, una línea por punto) de evaluaciones.
+
+    Cada línea se escribe y sincroniza a disco en cuanto termina su
+    evaluación, de modo que una interrupción pierde como mucho los puntos
+    en curso. Solo se reutilizan las entradas con los mismos `settings`
+    (combates, semilla, ticks y huella de la tabla de personajes).
+    """
+    def __init__(self, path, settings):
+        self.path = path
+        self.settings = settings
+        self.entries = {}
+        if path and os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as cache_file:
+                for line in cache_file:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        # Última línea truncada por una interrupción
+                        continue
+                    self.entries[entry['key']] = entry
+
+    def key(self, params):
+        return json.dumps({'params': params, **self.settings}, sort_keys=True)
+
+    def get(self, params):
+        return self.entries.get(self.key(params))
+
+    def history(self, names):
+        """Puntos ya evaluados con esta configuración y este espacio de parámetros."""
+        result = []
+        for entry in self.entries.values():
+            if all(entry.get(setting) == value for setting, value in self.settings.items()) and \
+                    set(entry['params']) == set(names):
+                result.append(entry)
+        return result
+
+    def add(self, params, result):
+        entry = {'key': self.key(params), 'params': params, **self.settings, **result}
+        self.entries[entry['key']] = entry
+        if self.path:
+            with open(self.path, 'a', encoding='utf-8') as cache_file:
+                cache_file.write(json.dumps(entry, sort_keys=True) + '\n')
+                cache_file.flush()
+                os.fsync(cache_file.fileno())
+        return entry
+
+
+class SearchSpace:
+    """Espacio de búsqueda normalizado a [0, 1]^d."""
+    def __init__(self, ranges):
+        self.names = sorted(ranges)
+        self.ranges = ranges
+
+    def to_params(self, unit_point):
+        params = {}
+        for name, value in zip(self.names, unit_point):
+            low, high = self.ranges[name]
+            raw = low + float(np.clip(value, 0.0, 1.0)) * (high - low)
+            if TUNABLE_PARAMETERS[name]['type'] is int:
+                params[name] = int(round(raw))
+            else:
+                params[name] = round(raw, 4)
+        return params
+
+    def to_unit(self, params):
+        point = []
+        for name in self.names:
+            low, high = self.ranges[name]
+            point.append((params[name] - low) / (high - low) if high > low else 0.0)
+        return np.array(point)
+
+    def grid(self, points_per_axis):
+        axis = np.linspace(0.0, 1.0, points_per_axis)
+        for unit_point in itertools.product(axis, repeat=len(self.names)):
+            yield self.to_params(unit_point)
+
+    def random(self, rng, count):
+        for _ in range(count):
+            yield self.to_params(rng.random(len(self.names)))
+
+    def size(self):
+        """Número de puntos distintos del espacio (None si algún eje es continuo)."""
+        size = 1
+        for name in self.names:
+            if TUNABLE_PARAMETERS[name]['type'] is not int:
+                return None
+            low, high = self.ranges[name]
+            size *= abs(high - low) + 1
+        return size
+
+    def clip(self, params):
+        """Lleva cada valor a su rango (por ejemplo, el valor actual con un --param más estrecho)."""
+        clipped = {}
+        for name in self.names:
+            low, high = sorted(self.ranges[name])
+            clipped[name] = min(max(params[name], low), high)
+        return clipped
+
+
+def _rbf_kernel(a, b, length_scale):
+    distances = ((a[:, None, :] - b[None, :, :]) ** 2).sum(axis=2)
+    return np.exp(-0.5 * distances / length_scale ** 2)
+
+
+def _fit_gaussian_process(points, values, noise=1e-2):
+    """Ajusta un GP con kernel RBF eligiendo la escala por verosimilitud marginal."""
+    mean, std = values.mean(), values.std() or 1.0
+    targets = (values - mean) / std
+    best = None
+    for length_scale in (0.1, 0.2, 0.35, 0.6, 1.0):
+        kernel = _rbf_kernel(points, points, length_scale) + noise * np.eye(len(points))
+        try:
+            cholesky = np.linalg.cholesky(kernel)
+        except np.linalg.LinAlgError:
+            continue
+        alpha = np.linalg.solve(cholesky.T, np.linalg.solve(cholesky, targets))
+        log_likelihood = -0.5 * targets @ alpha - np.log(np.diag(cholesky)).sum()
+        if best is None or log_likelihood > best[0]:
+            best = (log_likelihood, length_scale, cholesky, alpha)
+    _, length_scale, cholesky, alpha = best
+
+    def predict(candidates):
+        cross = _rbf_kernel(candidates, points, length_scale)
+        predicted = cross @ alpha
+        solved = np.linalg.solve(cholesky, cross.T)
+        variance = np.maximum(1.0 - (solved ** 2).sum(axis=0), 1e-12)
+        return predicted * std + mean, np.sqrt(variance) * std
+    return predict
+
+
+def _expected_improvement(predicted, sigma, best_value):
+    """Mejora esperada para minimización."""
+    improvement = best_value - predicted
+    z = improvement / sigma
+    cdf = 0.5 * (1.0 + np.vectorize(math.erf)(z / math.sqrt(2.0)))
+    pdf = np.exp(-0.5 * z ** 2) / math.sqrt(2.0 * math.pi)
+    return improvement * cdf + sigma * pdf
+
+
+def propose_bayesian(space, history, count, rng, candidates=2048):
+    """
+    Propone `count` puntos nuevos con EI sobre un GP ajustado al historial.
+    Para lotes se usa "constant liar": cada propuesta se añade al historial
+    con el mejor valor observado antes de elegir la siguiente.
+    """
+    points = [space.to_unit(entry['params']) for entry in history]
+    values = [entry['loss'] for entry in history]
+    best_point = points[int(np.argmin(values))]
+    proposals = []
+    for _ in range(count):
+        predict = _fit_gaussian_process(np.array(points), np.array(values))
+        pool = np.vstack([
+            rng.random((candidates, len(space.names))),
+            np.clip(best_point + rng.normal(0.0, 0.08, (candidates // 4, len(space.names))), 0.0, 1.0),
+        ])
+        predicted, sigma = predict(pool)
+        choice = pool[int(np.argmax(_expected_improvement(predicted, sigma, min(values))))]
+        params = space.to_params(choice)
+        proposals.append(params)
+        points.append(space.to_unit(params))
+        values.append(min(values))
+    return proposals
+
+
+def _evaluate_task(task):
+    params, matches, seed, max_ticks = task
+    return params, evaluate(params, matches, seed, max_ticks)
+
+
+def _worker_init():
+    # Cada proceso carga los sprites una sola vez para construir la tabla
+    build_character_table()
+
+
+class Tuner:
+    """Coordina la búsqueda, la caché y el pool de procesos."""
+    def __init__(self, ranges, matches=200, seed=0, max_ticks=DEFAULT_MAX_TICKS,
+                 workers=None, cache_path=DEFAULT_CACHE_PATH):
+        self.space = SearchSpace(ranges)
+        self.matches = matches
+        self.seed = seed
+        self.max_ticks = max_ticks
+        self.workers = workers or os.cpu_count() or 1
+        self.cache = EvaluationCache(cache_path, {'matches': matches, 'seed': seed, 'max_ticks': max_ticks,
+                                                  'table': table_fingerprint(build_character_table())})
+        self.pool = None
+
+    def __enter__(self):
+        if self.workers > 1:
+            self.pool = multiprocessing.Pool(self.workers, initializer=_worker_init)
+        return self
+
+    def __exit__(self, *exc_info):
+        if self.pool:
+            self.pool.terminate()
+            self.pool.join()
+
+    def evaluate_many(self, param_list, report=None):
+        """Evalúa los puntos que no estén en caché y devuelve todas las entradas."""
+        pending, seen = [], set()
+        for params in param_list:
+            key = self.cache.key(params)
+            if self.cache.get(params) is None and key not in seen:
+                seen.add(key)
+                pending.append((params, self.matches, self.seed, self.max_ticks))
+        if pending:
+            results = self.pool.imap_unordered(_evaluate_task, pending) if self.pool \
+                else map(_evaluate_task, pending)
+            for params, result in results:
+                entry = self.cache.add(params, result)
+                if report:
+                    report(entry)
+        return [self.cache.get(params) for params in param_list]
+
+    def run(self, method='random', budget=40, grid_points=3, initial_points=None, report=None):
+        """
+        Ejecuta la búsqueda hasta evaluar `budget` puntos (contando los de la caché).
+
+        Returns:
+            dict: Mejor entrada encontrada
+        """
+        rng = np.random.default_rng(self.seed)
+        if method == 'grid':
+            self.evaluate_many(list(itertools.islice(self.space.grid(grid_points), budget)), report)
+        elif method == 'random':
+            self.evaluate_many(list(self.space.random(rng, budget)), report)
+        elif method == 'bayes':
+            # Un espacio discreto pequeño no da para más puntos distintos que su tamaño
+            space_size = self.space.size()
+            if space_size is not None:
+                budget = min(budget, space_size)
+            initial_points = initial_points or max(2 * len(self.space.names), 4)
+            defaults = self.space.clip(current_parameters(build_character_table(), self.space.names))
+            self.evaluate_many([defaults] + list(self.space.random(rng, initial_points - 1)), report)
+            history = self.cache.history(self.space.names)
+            while len(history) < budget:
+                batch = min(self.workers, budget - len(history))
+                proposals = propose_bayesian(self.space, history, batch, rng)
+                if all(self.cache.get(params) for params in proposals):
+                    # Propuestas ya evaluadas (espacio discreto agotado cerca del óptimo)
+                    proposals = list(self.space.random(rng, batch))
+                self.evaluate_many(proposals, report)
+                evaluated = len(history)
+                history = self.cache.history(self.space.names)
+                if len(history) == evaluated:
+                    # Ninguna propuesta nueva en toda la ronda: no insistir
+                    break
+        else:
+            raise ValueError(f"Método de búsqueda desconocido: {method}")
+        return min(self.cache.history(self.space.names), key=lambda entry: entry['loss'])
+
+
+def parse_parameter(text):
+    """Convierte "Clase.atributo=min:max" en (nombre, (min, max))."""
+    name, _, bounds = text.partition('=')
+    if name not in TUNABLE_PARAMETERS:
+        raise argparse.ArgumentTypeError(
+            f"Parámetro desconocido: {name}. Opciones: {', '.join(TUNABLE_PARAMETERS)}")
+    if not bounds:
+        return name, TUNABLE_PARAMETERS[name]['range']
+    low, _, high = bounds.partition(':')
+    cast = TUNABLE_PARAMETERS[name]['type']
+    return name, (cast(low), cast(high))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Ajuste automático de constantes de balance")
+    parser.add_argument('--method', choices=('grid', 'random', 'bayes'), default='random')
+    parser.add_argument('--budget', type=int, default=40, help="Puntos a evaluar (incluida la caché)")
+    parser.add_argument('--grid-points', type=int, default=3, help="Valores por eje en la rejilla")
+    parser.add_argument('--matches', type=int, default=200, help="Combates por enfrentamiento y lado")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--max-ticks', type=int, default=DEFAULT_MAX_TICKS)
+    parser.add_argument('--workers', type=int, default=None, help="Procesos (por defecto, todos los núcleos)")
+    parser.add_argument('--cache', default=DEFAULT_CACHE_PATH, help="Fichero JSONL de caché")
+    parser.add_argument('--param', action='append', type=parse_parameter, default=None,
+                        metavar='CLASE.ATRIBUTO[=MIN:MAX]', help="Parámetro a ajustar (repetible)")
+    parser.add_argument('--output', default=None, help="Guardar el mejor punto en JSON")
+    args = parser.parse_args()
+
+    ranges = dict(args.param) if args.param else \
+        {name: spec['range'] for name, spec in TUNABLE_PARAMETERS.items()}
+
+    def report(entry):
+        print(f"loss {entry['loss']:.4f} máx desv {entry['max_deviation']:.3f} {entry['params']}")
+
+    with Tuner(ranges, args.matches, args.seed, args.max_ticks, args.workers, args.cache) as tuner:
+        best = tuner.run(args.method, args.budget, args.grid_points, report=report)
+
+    print("\nMejor configuración:")
+    for name, value in sorted(best['params'].items()):
+        print(f"  {name} = {value}")
+    print(f"loss {best['loss']:.4f}, desviación máxima {best['max_deviation']:.3f}")
+    for matchup, rate in best['rates'].items():
+        print(f"  {matchup:<40} {rate:.3f}")
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as output_file:
+            json.dump(best, output_file, indent=2, sort_keys=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,1111 @@
+"""
+Motor de simulación vectorizado (struct-of-arrays) con NumPy.
+
+Mantiene K combates simultáneos en arrays de NumPy (posiciones, velocidades,
+salud, escudo, cooldowns, efectos de estado, índices de animación y
+proyectiles) y los avanza todos a la vez en cada tick. Reproduce las reglas
+del motor de objetos (las clases Fighter) tick a tick, incluyendo el orden
+move() -> update() de main.py, de modo que con la misma semilla y la misma
+política los resultados coinciden combate a combate. La única excepción es
+la lluvia de lava del Slime Demon, cuyo azar usa el generador de NumPy y se
+valida de forma estadística.
+
+Uso:
+    python -m simulation.vector_engine --matches 100000
+    python -m simulation.vector_engine --validate --matches 40
+"""
+
+import argparse
+import functools
+import time
+
+import numpy as np
+
+from fighters.controls import (INPUT_LEFT, INPUT_RIGHT, INPUT_JUMP, INPUT_SHIELD,
+                               INPUT_ATTACK1, INPUT_ATTACK2, INPUT_ATTACK3)
+from fighters.sim_clock import ticks_to_ms
+from fighters import character_data, status_effects
+from .headless import (init_headless, FIGHTER_CLASSES, CHARACTER_NAMES, run_match,
+                       SCREEN_WIDTH, INITIAL_X_P1, INITIAL_X_P2, DEFAULT_MAX_TICKS)
+from .policies import random_policy_masks
+
+# Constantes físicas compartidas por todos los luchadores
+GROUND_LEVEL = 550
+GRAVITY_FORCE = 2
+DEFAULT_JUMP_STRENGTH = -30
+ANIMATION_FRAME_DURATION = 50   # ms entre frames de animación de los luchadores
+BURN_INTERVAL = status_effects.STATUS_DEFINITIONS[status_effects.STATUS_BURN][0]
+BLEEDING_INTERVAL = status_effects.STATUS_DEFINITIONS[status_effects.STATUS_BLEEDING][0]
+
+# Índices de acción (mismos que Fighter.current_action)
+ACTION_IDLE, ACTION_RUN, ACTION_JUMP = 0, 1, 2
+ACTION_HIT, ACTION_DEATH = 6, 7
+
+# Reglas de impacto por ataque
+HIT_NONE = 0        # El ataque no hace daño por contacto
+HIT_ONCE_FROM = 1   # Un impacto a partir de un frame
+HIT_ONCE_AT = 2     # Un impacto exactamente en un frame
+HIT_MULTI = 3       # Varios impactos en frames concretos
+HIT_TRAP = 4        # Coloca una trampa en un frame (Trapper)
+HIT_ARROW = 5       # Dispara un proyectil en un frame (Trapper)
+HIT_RAIN = 6        # Lluvia de gotas de lava (Slime Demon)
+HIT_EXPLOSION = 7   # Auto-sacrificio en área (Slime Demon)
+
+# Anclaje horizontal y modo de altura de las áreas de ataque
+ANCHOR_FRONT = 0      # Desde centerx hacia donde mira
+ANCHOR_CENTER = 1     # Centrada en centerx
+ANCHOR_FRONT_GAP = 2  # Frontal con separación (gap) respecto a centerx
+HEIGHT_FIXED = 0
+HEIGHT_TO_GROUND = 1  # Altura hasta el suelo + 20 (Warrior, Slime Demon)
+
+# Efectos de estado
+STATUS_NONE, STATUS_BURN, STATUS_BLEEDING = 0, 1, 2
+
+# Capacidad de proyectiles por luchador
+MAX_MULTI_HITS = 4
+ARROW_SLOTS = 8
+DROP_SLOTS = 12
+
+# Trampas del Trapper
+TRAP_WIDTH = 60
+TRAP_ANIMATION_SPEED = 6
+TRAP_ACTIVE_TIME = 10000
+TRAP_DETECTION_RADIUS = 50
+TRAP_STATE_FREE, TRAP_STATE_LANDING, TRAP_STATE_LANDED, TRAP_STATE_DETONATING = 0, 1, 2, 3
+
+# Proyectiles del Trapper
+ARROW_SIZE = 30
+ARROW_ANIMATION_SPEED = 8
+ARROW_STATE_FREE, ARROW_STATE_FLYING, ARROW_STATE_LANDING = 0, 1, 2
+
+# Gotas de lava del Slime Demon
+DROP_SIZE = 20
+DROP_EXPLOSION_SIZE = 60
+DROP_SPAWN_Y = 50
+
+# Explosión del ataque 3 del Slime Demon
+EXPLOSION_WIDTH = 520
+EXPLOSION_HEIGHT = 360
+
+
+# Tipos de impacto y anclajes de characters.json -> códigos del motor
+_HIT_CODES = {
+    character_data.HIT_NONE: HIT_NONE,
+    character_data.HIT_ONCE_FROM: HIT_ONCE_FROM,
+    character_data.HIT_ONCE_AT: HIT_ONCE_AT,
+    character_data.HIT_MULTI: HIT_MULTI,
+    character_data.HIT_TRAP: HIT_TRAP,
+    character_data.HIT_PROJECTILE: HIT_ARROW,
+    character_data.HIT_RAIN: HIT_RAIN,
+    character_data.HIT_SACRIFICE: HIT_EXPLOSION,
+}
+_ANCHOR_CODES = {
+    character_data.ANCHOR_FRONT: ANCHOR_FRONT,
+    character_data.ANCHOR_CENTER: ANCHOR_CENTER,
+    character_data.ANCHOR_FRONT_GAP: ANCHOR_FRONT_GAP,
+}
+_STATUS_CODES = {'burn': STATUS_BURN, 'bleeding': STATUS_BLEEDING}
+
+
+def _attack_rules(compiled):
+    """Traduce las tablas compiladas de un personaje (CompiledCharacter) a códigos del motor."""
+    attacks = {}
+    for attack_type in (1, 2, 3):
+        attack = {
+            'hit': _HIT_CODES[compiled.hit_kind[attack_type]],
+            'frame': compiled.hit_frame[attack_type],
+            'damage': compiled.damage[attack_type],
+            'knockback': compiled.knockback[attack_type],
+            'status_last_only': compiled.status_on_last_hit[attack_type],
+        }
+        status = compiled.status[attack_type]
+        if status:
+            attack['status'] = (_STATUS_CODES[status[0]], status[1], status[2])
+        if compiled.hit_frames[attack_type]:
+            attack['multi'] = list(zip(compiled.hit_frames[attack_type], compiled.hit_damages[attack_type]))
+        area = compiled.area[attack_type]
+        if area is not None:
+            width, height, y_offset, anchor, gap, centered = area
+            attack['area'] = (width, height or 0, y_offset, _ANCHOR_CODES[anchor], gap, centered,
+                              HEIGHT_TO_GROUND if height is None else HEIGHT_FIXED)
+        attacks[attack_type] = attack
+    return attacks
+
+
+def _assassin_rules(fighter):
+    return {
+        'shield_cooldown': True,
+        'combo_window': fighter.combo_window, 'combo_cooldown': fighter.fast_attack_cooldown,
+    }
+
+
+def _base_rules(fighter):
+    # Sin código propio: Fighter.move/update base (Warrior, Tank)
+    return {
+        'shield_cooldown': True,
+    }
+
+
+def _trapper_rules(fighter):
+    # execute_attack se llama con current_attack_type == 0: siempre cooldown a distancia
+    return {
+        'shield_cooldown': True,
+        'max_traps': fighter.max_traps, 'trap_cooldown': fighter.trap_cooldown,
+        'projectile_speed': fighter.projectile_speed,
+        'trap_land_frames': len(fighter.trap_land_sprites),
+        'trap_detonate_frames': len(fighter.trap_detonate_sprites),
+        'arrow_land_frames': len(fighter.projectile_land_sprites),
+        'trap_stun_ticks': fighter.trap_stun_ticks,
+    }
+
+
+def _slime_demon_rules(fighter):
+    return {
+        # SlimeDemonFighter.update no actualiza el escudo y tiene su propio post_update_hook
+        'slime_update': True, 'shield_cooldown': False,
+        'drop_damage': fighter.lava_drop_damage, 'sacrifice_ratio': fighter.sacrifice_ratio,
+    }
+
+
+# Diferencias de código de cada clase (move/update propios); las reglas de
+# ataque se leen de characters.json a través de Fighter.character_table
+CHARACTER_RULES = {
+    'WarriorFighter': _base_rules,
+    'SlimeDemonFighter': _slime_demon_rules,
+    'AssassinFighter': _assassin_rules,
+    'TankFighter': _base_rules,
+    'TrapperFighter': _trapper_rules,
+}
+
+
+class CharacterTable:
+    """
+    Tablas planas de parámetros por personaje, indexadas por id de personaje
+    (posición en CHARACTER_NAMES) y, para los ataques, por tipo de ataque (1-3).
+    """
+    def __init__(self, names, stats):
+        self.names = list(names)
+        count = len(names)
+
+        def column(key, default=0, dtype=np.int64):
+            return np.array([entry.get(key, default) for entry in stats], dtype=dtype)
+
+        self.max_health = column('max_health')
+        self.speed = column('speed')
+        self.jump_strength = column('jump_strength', DEFAULT_JUMP_STRENGTH)
+        self.gravity = column('gravity', GRAVITY_FORCE)
+        self.width = column('width')
+        self.height = column('height')
+        self.normalize_diagonal = column('normalize_diagonal', False, bool)
+        self.shield_input = column('shield_input', False, bool)
+        self.bleeding_immune = column('bleeding_immune', False, bool)
+        self.slime_update = column('slime_update', False, bool)
+        self.shield_cooldown = column('shield_cooldown', False, bool)
+        self.shield_max_health = column('shield_max_health')
+        self.shield_cooldown_max = column('shield_cooldown_max')
+        self.attack_end_cooldown = column('attack_end_cooldown')
+        self.has_start_cooldown = np.array(['start_cooldown' in entry for entry in stats])
+        self.start_cooldown = column('start_cooldown')
+        self.combo_window = column('combo_window', -1)
+        self.combo_cooldown = column('combo_cooldown')
+        self.max_traps = column('max_traps')
+        self.trap_cooldown = column('trap_cooldown')
+        self.projectile_speed = column('projectile_speed', 0, np.float64)
+        self.trap_land_frames = column('trap_land_frames')
+        self.trap_detonate_frames = column('trap_detonate_frames')
+        self.arrow_land_frames = column('arrow_land_frames')
+        self.trap_stun_ticks = column('trap_stun_ticks')
+        self.drop_damage = column('drop_damage')
+        self.sacrifice_ratio = column('sacrifice_ratio', 0.0, np.float64)
+        self.anim_len = np.array([entry['anim_len'] for entry in stats], dtype=np.int64)
+
+        # Tablas de ataques (columna 0 = sin ataque)
+        shape = (count, 4)
+        self.hit_kind = np.zeros(shape, np.int64)
+        self.hit_frame = np.zeros(shape, np.int64)
+        self.damage = np.zeros(shape, np.int64)
+        self.knockback = np.zeros(shape, np.int64)
+        self.status_kind = np.zeros(shape, np.int64)
+        self.status_damage = np.zeros(shape, np.int64)
+        self.status_duration = np.zeros(shape, np.int64)
+        self.area_width = np.zeros(shape, np.int64)
+        self.area_height = np.zeros(shape, np.int64)
+        self.area_dy = np.zeros(shape, np.int64)
+        self.area_anchor = np.zeros(shape, np.int64)
+        self.area_height_mode = np.zeros(shape, np.int64)
+        self.area_gap = np.zeros(shape, np.int64)
+        self.area_centered = np.zeros(shape, bool)
+        self.status_last_only = np.zeros(shape, bool)
+        self.multi_frame = np.full((count, 4, MAX_MULTI_HITS), -1, np.int64)
+        self.multi_damage = np.zeros((count, 4, MAX_MULTI_HITS), np.int64)
+        self.multi_last = np.zeros(shape, np.int64)
+
+        for char_id, entry in enumerate(stats):
+            for attack_type, attack in entry['attacks'].items():
+                self.hit_kind[char_id, attack_type] = attack['hit']
+                self.hit_frame[char_id, attack_type] = attack.get('frame', 0)
+                self.damage[char_id, attack_type] = attack.get('damage', 0)
+                self.knockback[char_id, attack_type] = attack.get('knockback', 0)
+                status = attack.get('status', (STATUS_NONE, 0, 0))
+                self.status_kind[char_id, attack_type] = status[0]
+                self.status_damage[char_id, attack_type] = status[1]
+                self.status_duration[char_id, attack_type] = status[2]
+                self.status_last_only[char_id, attack_type] = attack.get('status_last_only', False)
+                if 'area' in attack:
+                    width, height, dy, anchor, gap, centered, height_mode = attack['area']
+                    self.area_gap[char_id, attack_type] = gap
+                    self.area_centered[char_id, attack_type] = centered
+                    self.area_width[char_id, attack_type] = width
+                    self.area_height[char_id, attack_type] = height
+                    self.area_dy[char_id, attack_type] = dy
+                    self.area_anchor[char_id, attack_type] = anchor
+                    self.area_height_mode[char_id, attack_type] = height_mode
+                for hit_index, (frame, damage) in enumerate(attack.get('multi', [])):
+                    self.multi_frame[char_id, attack_type, hit_index] = frame
+                    self.multi_damage[char_id, attack_type, hit_index] = damage
+                self.multi_last[char_id, attack_type] = len(attack.get('multi', [])) - 1
+
+        self.max_trap_slots = max(1, int(self.max_traps.max()))
+
+
+@functools.lru_cache(maxsize=None)
+def build_character_table():
+    """
+    Construye la tabla de personajes a partir de instancias reales.
+
+    Las estadísticas y reglas de impacto se leen de la tabla compilada de
+    cada luchador (Fighter.character_table, que depende de las longitudes de
+    animación, por lo que hay que cargar sus sprites una vez en modo
+    headless); CHARACTER_RULES añade las diferencias de código de cada clase.
+    """
+    init_headless()
+    stats = []
+    for name in CHARACTER_NAMES:
+        fighter = FIGHTER_CLASSES[name](1, INITIAL_X_P1, 370, False, None)
+        compiled = fighter.character_table
+        entry = {
+            'max_health': compiled.max_health,
+            'speed': compiled.movement_speed,
+            'jump_strength': compiled.jump_strength,
+            'gravity': compiled.movement_profile.gravity,
+            'normalize_diagonal': compiled.movement_profile.normalize_diagonal,
+            'shield_input': compiled.movement_profile.shield_input,
+            'bleeding_immune': status_effects.STATUS_BLEEDING in compiled.status_immunities,
+            'width': compiled.hitbox_width,
+            'height': compiled.hitbox_height,
+            'shield_max_health': compiled.shield_max_health,
+            'shield_cooldown_max': compiled.shield_cooldown,
+            'attack_end_cooldown': compiled.attack_end_cooldown,
+            'anim_len': list(compiled.animation_lengths),
+            'attacks': _attack_rules(compiled),
+        }
+        if compiled.start_cooldown is not None:
+            entry['start_cooldown'] = compiled.start_cooldown
+        entry.update(CHARACTER_RULES[name](fighter))
+        stats.append(entry)
+    return CharacterTable(CHARACTER_NAMES, stats)
+
+
+def _round_half_away(values):
+    """
+    Redondeo de pygame.Rect al asignar floats a un atributo (mitades lejos de
+    cero). El constructor pygame.Rect(...) en cambio trunca hacia cero.
+    """
+    return np.where(values >= 0, np.floor(values + 0.5), np.ceil(values - 0.5)).astype(np.int64)
+
+
+def _overlap(ax, ay, aw, ah, bx, by, bw, bh):
+    """Equivalente vectorizado de pygame.Rect.colliderect."""
+    return (ax < bx + bw) & (ax + aw > bx) & (ay < by + bh) & (ay + ah > by)
+
+
+# Campos por luchador: nombre -> (dtype, valor inicial)
+_FIGHTER_FIELDS = {
+    'x': (np.int64, 0), 'y': (np.int64, 0), 'vy': (np.int64, 0),
+    'jumping': (bool, False), 'running': (bool, False),
+    'attacking': (bool, False), 'attack_type': (np.int64, 0), 'attack_cooldown': (np.int64, 0),
+    'attack_has_hit': (bool, False), 'hit_record': (np.int64, 0), 'attack_counter': (np.int64, 0),
+    'last_attack_ms': (np.int64, 0),
+    'is_hit': (bool, False), 'flip': (bool, False),
+    'damage_taken': (np.int64, 0), 'alive': (bool, True), 'death_done': (bool, False),
+    'action': (np.int64, 0), 'frame': (np.int64, 0), 'anim_last_ms': (np.int64, 0),
+    'shield_active': (bool, False), 'shield_health': (np.int64, 0), 'shield_cooldown': (np.int64, 0),
+    'burn_remaining': (np.int64, 0), 'burn_timer': (np.int64, 0), 'burn_counter': (np.int64, 0),
+    'bleeding_remaining': (np.int64, 0), 'bleeding_timer': (np.int64, 0), 'bleeding_counter': (np.int64, 0),
+    'stun_left': (np.int64, 0),
+    'last_trap_ms': (np.int64, 0), 'rain_spawned': (bool, False), 'explosion_triggered': (bool, False),
+}
+
+
+class VectorWorld:
+    """
+    K combates 1 contra 1 avanzados en paralelo.
+
+    Todos los campos de estado son arrays con forma (2, K) (un renglón por
+    lado) o (2, K, S) para las ranuras de proyectiles. Los combates
+    terminados se compactan periódicamente para que el coste por tick sea
+    proporcional a los combates activos.
+    """
+    def __init__(self, char_ids, seed=0, table=None):
+        """
+        Args:
+            char_ids: Array (K, 2) con el id de personaje de cada lado
+            seed (int): Semilla compartida con el motor de objetos
+            table (CharacterTable): Tabla de personajes (por defecto la real)
+        """
+        self.table = table if table is not None else build_character_table()
+        self.seed = seed
+        self.rng = np.random.default_rng(seed)
+        char_ids = np.asarray(char_ids, dtype=np.int64)
+        total = char_ids.shape[0]
+
+        self.tick = 0
+        self.match_ids = np.arange(total, dtype=np.int64)
+        self.char = np.ascontiguousarray(char_ids.T)
+
+        self.state = {name: np.full((2, total), value, dtype)
+                      for name, (dtype, value) in _FIGHTER_FIELDS.items()}
+        table = self.table
+        self.state['x'][0] = INITIAL_X_P1
+        self.state['x'][1] = INITIAL_X_P2
+        self.state['y'] = GROUND_LEVEL - table.height[self.char]
+        self.state['flip'][1] = True
+
+        trap_slots = table.max_trap_slots
+        self.slots = {
+            'trap_state': np.zeros((2, total, trap_slots), np.int64),
+            'trap_x': np.zeros((2, total, trap_slots), np.int64),
+            'trap_counter': np.zeros((2, total, trap_slots), np.int64),
+            'trap_anim': np.zeros((2, total, trap_slots), np.int64),
+            'trap_created_ms': np.zeros((2, total, trap_slots), np.int64),
+            'trap_order': np.zeros((2, total, trap_slots), np.int64),
+            'arrow_state': np.zeros((2, total, ARROW_SLOTS), np.int64),
+            'arrow_x': np.zeros((2, total, ARROW_SLOTS), np.float64),
+            'arrow_y': np.zeros((2, total, ARROW_SLOTS), np.float64),
+            'arrow_vx': np.zeros((2, total, ARROW_SLOTS), np.float64),
+            'arrow_vy': np.zeros((2, total, ARROW_SLOTS), np.float64),
+            'arrow_counter': np.zeros((2, total, ARROW_SLOTS), np.int64),
+            'arrow_anim': np.zeros((2, total, ARROW_SLOTS), np.int64),
+            'arrow_has_hit': np.zeros((2, total, ARROW_SLOTS), bool),
+            'drop_active': np.zeros((2, total, DROP_SLOTS), bool),
+            'drop_x': np.zeros((2, total, DROP_SLOTS), np.int64),
+            'drop_y': np.zeros((2, total, DROP_SLOTS), np.float64),
+            'drop_speed': np.zeros((2, total, DROP_SLOTS), np.float64),
+        }
+        self.trap_sequence = 0
+
+        # Resultados indexados por id de combate original
+        self.winner = np.zeros(total, np.int64)
+        self.ticks = np.zeros(total, np.int64)
+        self.final_health = np.zeros((total, 2), np.int64)
+        self.finished = np.zeros(total, bool)
+
+    # ------------------------------------------------------------------
+    # Utilidades de estado
+    # ------------------------------------------------------------------
+    def _center_x(self, side):
+        return self.state['x'][side] + self.table.width[self.char[side]] // 2
+
+    def _center_y(self, side):
+        return self.state['y'][side] + self.table.height[self.char[side]] // 2
+
+    def _health(self, side):
+        return np.maximum(self.table.max_health[self.char[side]] - self.state['damage_taken'][side], 0)
+
+    def _compact(self, keep):
+        """Elimina los combates terminados de todos los arrays de estado."""
+        self.match_ids = self.match_ids[keep]
+        self.char = np.ascontiguousarray(self.char[:, keep])
+        for name, values in self.state.items():
+            self.state[name] = np.ascontiguousarray(values[:, keep])
+        for name, values in self.slots.items():
+            self.slots[name] = np.ascontiguousarray(values[:, keep])
+
+    # ------------------------------------------------------------------
+    # Daño y efectos de estado
+    # ------------------------------------------------------------------
+    def _apply_damage(self, side, damage, mask):
+        """Equivalente vectorizado de Fighter.apply_damage (incluye el escudo)."""
+        st = self.state
+        mask = mask & (damage > 0) & st['alive'][side]
+        if not mask.any():
+            return
+        shielded = mask & st['shield_active'][side]
+        shield_health = st['shield_health'][side]
+        shield_damage = (damage * 3) // 4
+        character_damage = damage - shield_damage
+        breaks = shielded & (shield_damage >= shield_health)
+        character_damage = np.where(breaks, character_damage + shield_damage - shield_health, character_damage)
+        st['shield_health'][side] = np.where(breaks, 0, np.where(shielded, shield_health - shield_damage, shield_health))
+        st['shield_active'][side] &= ~breaks
+        shield_cooldown_max = self.table.shield_cooldown_max[self.char[side]]
+        st['shield_cooldown'][side] = np.where(breaks, shield_cooldown_max, st['shield_cooldown'][side])
+        total = np.where(shielded, character_damage, damage)
+        st['damage_taken'][side] = np.where(mask, st['damage_taken'][side] + total, st['damage_taken'][side])
+        st['alive'][side] &= ~(mask & (self._health(side) <= 0))
+
+    def _apply_status(self, side, kind, damage, duration, mask):
+        """Aplica quemadura o sangrado (reemplaza el efecto previo como en StatusEffects)."""
+        st = self.state
+        mask = mask & (damage > 0) & (duration > 0)
+        bleeding_immune = self.table.bleeding_immune[self.char[side]]
+        for status_kind, prefix in ((STATUS_BURN, 'burn'), (STATUS_BLEEDING, 'bleeding')):
+            apply = mask & (kind == status_kind)
+            if status_kind == STATUS_BLEEDING:
+                apply &= ~bleeding_immune
+            if apply.any():
+                st[prefix + '_remaining'][side] = np.where(apply, damage, st[prefix + '_remaining'][side])
+                st[prefix + '_timer'][side] = np.where(apply, duration, st[prefix + '_timer'][side])
+                st[prefix + '_counter'][side] = np.where(apply, 0, st[prefix + '_counter'][side])
+
+    def _process_dot(self, side, prefix, interval, mask):
+        """Equivalente de StatusEffects.process para un efecto con daño periódico."""
+        st = self.state
+        timer = st[prefix + '_timer'][side]
+        active = mask & (timer > 0)
+        if not active.any():
+            return
+        remaining = st[prefix + '_remaining'][side]
+        counter = np.where(active, st[prefix + '_counter'][side] + 1, st[prefix + '_counter'][side])
+        tick_now = active & (counter >= interval)
+        intervals_left = np.maximum(timer // interval, 1)
+        per_interval = np.where(timer >= interval, np.maximum(1, remaining // intervals_left), remaining)
+        deal = tick_now & (per_interval > 0)
+        self._apply_damage(side, per_interval, deal)
+        remaining = np.where(deal, remaining - per_interval, remaining)
+        counter = np.where(tick_now, 0, counter)
+        timer = np.where(active, timer - 1, timer)
+        expired = active & ((timer <= 0) | (remaining <= 0))
+        st[prefix + '_timer'][side] = np.where(expired, 0, timer)
+        st[prefix + '_remaining'][side] = np.where(expired, 0, remaining)
+        st[prefix + '_counter'][side] = counter
+
+    # ------------------------------------------------------------------
+    # move()
+    # ------------------------------------------------------------------
+    def _move(self, side, now_ms):
+        st, table = self.state, self.table
+        other = 1 - side
+        char = self.char[side]
+        own_cx = self._center_x(side)
+        other_cx = self._center_x(other)
+        mask = random_policy_masks(self.seed, self.match_ids, self.tick, side, own_cx, other_cx)
+
+        attacking = st['attacking'][side]
+        st['running'][side] = False
+        st['attack_type'][side] = np.where(attacking, st['attack_type'][side], 0)
+        stun_left = st['stun_left'][side]
+        can_act = ~attacking & st['alive'][side] & (stun_left == 0)
+
+        speed = table.speed[char].astype(np.float64)
+        left = can_act & ((mask & INPUT_LEFT) != 0)
+        right = can_act & ((mask & INPUT_RIGHT) != 0)
+        horizontal = np.where(right, speed, np.where(left, -speed, 0.0))
+        st['running'][side] = left | right
+
+        jump = can_act & ((mask & INPUT_JUMP) != 0) & ~st['jumping'][side]
+        st['vy'][side] = np.where(jump, table.jump_strength[char], st['vy'][side])
+        st['jumping'][side] |= jump
+
+        # Escudo (solo los personajes que usan Fighter.move base)
+        shield_input = can_act & table.shield_input[char]
+        held = (mask & INPUT_SHIELD) != 0
+        activate = shield_input & held & ~st['shield_active'][side] & (st['shield_cooldown'][side] <= 0)
+        st['shield_health'][side] = np.where(activate, table.shield_max_health[char], st['shield_health'][side])
+        st['shield_active'][side] = (st['shield_active'][side] | activate) & ~(shield_input & ~held)
+
+        # Ataques (bloqueados con el escudo activo)
+        requested = np.where((mask & INPUT_ATTACK1) != 0, 1,
+                             np.where((mask & INPUT_ATTACK2) != 0, 2,
+                                      np.where((mask & INPUT_ATTACK3) != 0, 3, 0)))
+        pressed = can_act & ~st['shield_active'][side] & (requested > 0)
+        if pressed.any():
+            self._execute_attack(side, pressed, now_ms)
+            st['attack_type'][side] = np.where(pressed, requested, st['attack_type'][side])
+
+        # Gravedad y normalización diagonal
+        st['vy'][side] += table.gravity[char]
+        vertical = st['vy'][side].copy()
+        normalize = table.normalize_diagonal[char] & (horizontal != 0) & (vertical != 0)
+        magnitude = np.sqrt(horizontal ** 2 + vertical ** 2)
+        horizontal = np.where(normalize, horizontal / np.where(normalize, magnitude, 1.0) * speed, horizontal)
+
+        # Límites horizontales
+        x = st['x'][side]
+        right_edge = x + table.width[char]
+        horizontal = np.where(x + horizontal < 0, -x, horizontal)
+        horizontal = np.where(right_edge + horizontal > SCREEN_WIDTH, SCREEN_WIDTH - right_edge, horizontal)
+
+        # Suelo
+        bottom = st['y'][side] + table.height[char]
+        grounded = bottom + vertical > GROUND_LEVEL
+        st['vy'][side] = np.where(grounded, 0, st['vy'][side])
+        st['jumping'][side] &= ~grounded
+        vertical = np.where(grounded, GROUND_LEVEL - bottom, vertical)
+
+        # Mirar al oponente
+        st['flip'][side] = ~(other_cx > own_cx)
+
+        # Efectos de estado procesados en move() (quemadura, sangrado, aturdimiento)
+        everyone = np.ones_like(can_act)
+        self._process_dot(side, 'burn', BURN_INTERVAL, everyone)
+        self._process_dot(side, 'bleeding', BLEEDING_INTERVAL, everyone)
+        st['stun_left'][side] = np.maximum(stun_left - 1, 0)
+
+        st['x'][side] = _round_half_away(x + horizontal)
+        st['y'][side] += vertical
+
+    def _execute_attack(self, side, pressed, now_ms):
+        st, table = self.state, self.table
+        char = self.char[side]
+        start = pressed & (st['attack_cooldown'][side] == 0)
+        if not start.any():
+            return
+        st['attacking'][side] |= start
+        st['attack_has_hit'][side] &= ~start
+        st['attack_counter'][side] = np.where(start, 0, st['attack_counter'][side])
+        st['hit_record'][side] = np.where(start, 0, st['hit_record'][side])
+
+        # Cooldown inicial propio de cada clase (Assassin depende del combo)
+        in_combo = (now_ms - st['last_attack_ms'][side]) < table.combo_window[char]
+        combo = table.combo_window[char] >= 0
+        start_cooldown = np.where(combo & in_combo, table.combo_cooldown[char], table.start_cooldown[char])
+        set_cooldown = start & table.has_start_cooldown[char]
+        st['attack_cooldown'][side] = np.where(set_cooldown, start_cooldown, st['attack_cooldown'][side])
+        st['last_attack_ms'][side] = np.where(start & combo, now_ms, st['last_attack_ms'][side])
+
+    # ------------------------------------------------------------------
+    # update()
+    # ------------------------------------------------------------------
+    def _update(self, side, now_ms):
+        st, table = self.state, self.table
+        char = self.char[side]
+        is_slime = table.slime_update[char]
+
+        health = self._health(side)
+        dead = health <= 0
+        st['alive'][side] &= ~dead
+        attacking = st['attacking'][side]
+        attack_type = st['attack_type'][side]
+        in_attack = ~dead & ~st['is_hit'][side] & attacking
+
+        action = np.where(st['jumping'][side], ACTION_JUMP,
+                          np.where(st['running'][side], ACTION_RUN, ACTION_IDLE))
+        attack_action = np.where((attack_type >= 1) & (attack_type <= 3), attack_type + 2, st['action'][side])
+        # El Slime Demon muestra idle durante la lluvia (ataque 2)
+        attack_action = np.where(is_slime & (attack_type == 2), ACTION_IDLE, attack_action)
+        action = np.where(in_attack, attack_action, action)
+        action = np.where(~dead & st['is_hit'][side], ACTION_HIT, action)
+        action = np.where(dead, ACTION_DEATH, action)
+
+        # Fin de la lluvia del Slime Demon por contador de frames
+        rain_end = in_attack & is_slime & (attack_type == 2) & \
+            (st['attack_counter'][side] >= table.anim_len[char, 4])
+        if rain_end.any():
+            st['attacking'][side] &= ~rain_end
+            st['attack_cooldown'][side] = np.where(rain_end, table.attack_end_cooldown[char], st['attack_cooldown'][side])
+            st['attack_has_hit'][side] &= ~rain_end
+            st['rain_spawned'][side] &= ~rain_end
+        st['attack_counter'][side] += in_attack
+
+        changed = action != st['action'][side]
+        st['action'][side] = action
+        st['frame'][side] = np.where(changed, 0, st['frame'][side])
+        st['anim_last_ms'][side] = np.where(changed, now_ms, st['anim_last_ms'][side])
+
+        advance = (now_ms - st['anim_last_ms'][side]) > ANIMATION_FRAME_DURATION
+        st['frame'][side] += advance
+        st['anim_last_ms'][side] = np.where(advance, now_ms, st['anim_last_ms'][side])
+        collide = advance & st['attacking'][side]
+        if collide.any():
+            self._check_collision(side, collide, now_ms)
+
+        # Fin de animación
+        length = table.anim_len[char, action]
+        over = st['frame'][side] >= length
+        alive = st['alive'][side]
+        finished_death = over & ~alive
+        st['frame'][side] = np.where(finished_death, length - 1, np.where(over, 0, st['frame'][side]))
+        st['death_done'][side] |= finished_death
+        restart = over & alive
+        attack_end = restart & (((action >= 3) & (action <= 5) & ~is_slime) |
+                                (((action == 3) | (action == 5)) & is_slime))
+        hit_end = restart & (action == ACTION_HIT)
+        st['attacking'][side] &= ~(attack_end | hit_end)
+        st['attack_cooldown'][side] = np.where(attack_end | hit_end, table.attack_end_cooldown[char], st['attack_cooldown'][side])
+        st['attack_has_hit'][side] &= ~attack_end
+        st['attack_counter'][side] = np.where(attack_end & ~is_slime, 0, st['attack_counter'][side])
+        st['is_hit'][side] &= ~hit_end
+
+        st['attack_cooldown'][side] -= st['attack_cooldown'][side] > 0
+        shield_tick = table.shield_cooldown[char] & (st['shield_cooldown'][side] > 0)
+        st['shield_cooldown'][side] -= shield_tick
+
+        # SlimeDemonFighter.post_update_hook
+        if is_slime.any():
+            self._slime_hook(side, is_slime & st['alive'][side])
+
+    def _attack_area(self, side, attack_type):
+        st, table = self.state, self.table
+        char = self.char[side]
+        width = table.area_width[char, attack_type]
+        anchor = table.area_anchor[char, attack_type]
+        center_x = self._center_x(side)
+        flip = st['flip'][side]
+        area_x = np.where(flip, center_x - width, center_x)
+        area_x = np.where(anchor == ANCHOR_CENTER, center_x - width // 2, area_x)
+        gap = table.area_gap[char, attack_type]
+        area_x = np.where(anchor == ANCHOR_FRONT_GAP, np.where(flip, center_x - width - gap, center_x + gap), area_x)
+        height = table.area_height[char, attack_type]
+        area_y = np.where(table.area_centered[char, attack_type], self._center_y(side) - height // 2, st['y'][side])
+        area_y = area_y + table.area_dy[char, attack_type]
+        height = np.where(table.area_height_mode[char, attack_type] == HEIGHT_TO_GROUND,
+                          GROUND_LEVEL - area_y + 20, height)
+        return area_x, area_y, width, height
+
+    def _knockback(self, attacker, force, mask):
+        st, table = self.state, self.table
+        target = 1 - attacker
+        x = np.where(st['flip'][attacker], st['x'][target] - force, st['x'][target] + force)
+        right_limit = SCREEN_WIDTH - table.width[self.char[target]]
+        x = np.where(x < 0, 0, np.where(x > right_limit, right_limit, x))
+        st['x'][target] = np.where(mask, x, st['x'][target])
+
+    def _hit_target(self, attacker, damage, mask):
+        """Daño directo + marca de golpe en el oponente."""
+        target = 1 - attacker
+        self._apply_damage(target, damage, mask)
+        self.state['is_hit'][target] |= mask
+
+    def _check_collision(self, side, mask, now_ms):
+        st, table = self.state, self.table
+        other = 1 - side
+        char = self.char[side]
+        mask = mask & st['alive'][side] & st['alive'][other]
+        if not mask.any():
+            return
+        attack_type = st['attack_type'][side]
+        kind = table.hit_kind[char, attack_type]
+        frame = st['frame'][side]
+        hit_frame = table.hit_frame[char, attack_type]
+
+        area_x, area_y, area_w, area_h = self._attack_area(side, attack_type)
+        overlaps = _overlap(area_x, area_y, area_w, area_h,
+                            st['x'][other], st['y'][other],
+                            table.width[self.char[other]], table.height[self.char[other]])
+        not_hit = ~st['attack_has_hit'][side]
+
+        single = mask & overlaps & not_hit & (
+            ((kind == HIT_ONCE_FROM) & (frame >= hit_frame)) |
+            ((kind == HIT_ONCE_AT) & (frame == hit_frame)))
+        if single.any():
+            self._hit_target(side, table.damage[char, attack_type], single)
+            st['attack_has_hit'][side] |= single
+            self._apply_status(other, table.status_kind[char, attack_type],
+                               table.status_damage[char, attack_type],
+                               table.status_duration[char, attack_type], single)
+            self._knockback(side, table.knockback[char, attack_type], single & (table.knockback[char, attack_type] > 0))
+
+        multi = mask & overlaps & (kind == HIT_MULTI)
+        if multi.any():
+            frames = table.multi_frame[char, attack_type]
+            matches = (frames == frame[:, None]) & \
+                ((st['hit_record'][side][:, None] >> np.arange(MAX_MULTI_HITS)) & 1 == 0)
+            hit_any = multi & matches.any(axis=1)
+            hit_index = np.argmax(matches, axis=1)
+            damage = np.take_along_axis(table.multi_damage[char, attack_type], hit_index[:, None], axis=1)[:, 0]
+            self._hit_target(side, damage, hit_any)
+            st['hit_record'][side] |= np.where(hit_any, 1 << hit_index, 0)
+            last = hit_any & ((hit_index == table.multi_last[char, attack_type]) |
+                              ~table.status_last_only[char, attack_type])
+            self._apply_status(other, table.status_kind[char, attack_type],
+                               table.status_damage[char, attack_type],
+                               table.status_duration[char, attack_type], last)
+
+        place_trap = mask & not_hit & (kind == HIT_TRAP) & (frame == hit_frame)
+        if place_trap.any():
+            self._place_trap(side, place_trap, now_ms)
+            st['attack_has_hit'][side] |= place_trap
+
+        fire = mask & not_hit & (kind == HIT_ARROW) & (frame == hit_frame)
+        if fire.any():
+            self._fire_arrow(side, fire)
+            st['attack_has_hit'][side] |= fire
+
+    # ------------------------------------------------------------------
+    # Trampas y proyectiles del Trapper
+    # ------------------------------------------------------------------
+    def _place_trap(self, side, mask, now_ms):
+        st, sl, table = self.state, self.slots, self.table
+        char = self.char[side]
+        mask = mask & ((now_ms - st['last_trap_ms'][side]) >= table.trap_cooldown[char])
+        if not mask.any():
+            return
+        trap_state = sl['trap_state'][side]
+        order = sl['trap_order'][side]
+        active = trap_state != TRAP_STATE_FREE
+        # Retirar la trampa más antigua si se alcanzó el máximo
+        full = mask & (active.sum(axis=1) >= table.max_traps[char])
+        oldest = np.argmin(np.where(active, order, np.iinfo(np.int64).max), axis=1)
+        rows = np.nonzero(full)[0]
+        trap_state[rows, oldest[rows]] = TRAP_STATE_FREE
+
+        # Ocupar la primera ranura libre dentro de max_traps
+        slot_index = np.arange(trap_state.shape[1])
+        free = (trap_state == TRAP_STATE_FREE) & (slot_index < table.max_traps[char][:, None])
+        slot = np.argmax(free, axis=1)
+        rows = np.nonzero(mask & free.any(axis=1))[0]
+        slot = slot[rows]
+        self.trap_sequence += 1
+        trap_x = self._center_x(side) + np.where(st['flip'][side], -50, 50)
+        trap_state[rows, slot] = TRAP_STATE_LANDING
+        sl['trap_x'][side][rows, slot] = trap_x[rows]
+        sl['trap_counter'][side][rows, slot] = 0
+        sl['trap_anim'][side][rows, slot] = 0
+        sl['trap_created_ms'][side][rows, slot] = now_ms
+        order[rows, slot] = self.trap_sequence
+        st['last_trap_ms'][side] = np.where(mask, now_ms, st['last_trap_ms'][side])
+
+    def _update_traps(self, side, now_ms):
+        st, sl, table = self.state, self.slots, self.table
+        other = 1 - side
+        char = self.char[side][:, None]
+        trap_state = sl['trap_state'][side]
+        active = trap_state != TRAP_STATE_FREE
+        if not active.any():
+            return
+        counter = sl['trap_counter'][side]
+        anim = sl['trap_anim'][side]
+        counter += active
+        step = active & (counter >= TRAP_ANIMATION_SPEED)
+        counter[step] = 0
+        anim += step
+
+        landing = trap_state == TRAP_STATE_LANDING
+        landed = trap_state == TRAP_STATE_LANDED
+        detonating = trap_state == TRAP_STATE_DETONATING
+
+        to_landed = landing & (anim >= table.trap_land_frames[char])
+        expired = landed & ((now_ms - sl['trap_created_ms'][side]) > TRAP_ACTIVE_TIME)
+        target_cx = self._center_x(other)[:, None]
+        target_bottom = (st['y'][other] + table.height[self.char[other]])[:, None]
+        stepped = landed & ~expired & \
+            (np.abs(target_cx - (sl['trap_x'][side] + TRAP_WIDTH // 2)) <= TRAP_DETECTION_RADIUS) & \
+            (np.abs(target_bottom - GROUND_LEVEL) < 10)
+        done = detonating & (anim >= table.trap_detonate_frames[char])
+
+        trap_state[to_landed] = TRAP_STATE_LANDED
+        anim[to_landed] = 0
+        trap_state[expired | done] = TRAP_STATE_FREE
+        trap_state[stepped] = TRAP_STATE_DETONATING
+        anim[stepped] = 0
+
+        # Cada trampa pisada aplica su daño (8 del ataque 2) por separado y aturde
+        damage = table.damage[self.char[side], 2]
+        stun_ticks = table.trap_stun_ticks[self.char[side]]
+        for slot in range(trap_state.shape[1]):
+            triggered = stepped[:, slot]
+            if triggered.any():
+                self._hit_target(side, damage, triggered)
+                stun_left = st['stun_left'][other]
+                st['stun_left'][other] = np.where(triggered, np.maximum(stun_left, stun_ticks), stun_left)
+
+    def _fire_arrow(self, side, mask):
+        sl, table = self.slots, self.table
+        other = 1 - side
+        char = self.char[side]
+        start_x = self._center_x(side).astype(np.float64)
+        start_y = (self._center_y(side) - 20).astype(np.float64)
+        dx = self._center_x(other) - start_x
+        dy = self._center_y(other) - start_y
+        distance = np.sqrt(dx ** 2 + dy ** 2)
+        mask = mask & (distance > 0)
+        free = sl['arrow_state'][side] == ARROW_STATE_FREE
+        rows = np.nonzero(mask & free.any(axis=1))[0]
+        if rows.size == 0:
+            return
+        slot = np.argmax(free, axis=1)[rows]
+        speed = table.projectile_speed[char][rows]
+        sl['arrow_state'][side][rows, slot] = ARROW_STATE_FLYING
+        sl['arrow_x'][side][rows, slot] = start_x[rows]
+        sl['arrow_y'][side][rows, slot] = start_y[rows]
+        sl['arrow_vx'][side][rows, slot] = dx[rows] / distance[rows] * speed
+        sl['arrow_vy'][side][rows, slot] = dy[rows] / distance[rows] * speed
+        sl['arrow_counter'][side][rows, slot] = 0
+        sl['arrow_anim'][side][rows, slot] = 0
+        sl['arrow_has_hit'][side][rows, slot] = False
+
+    def _update_arrows(self, side):
+        st, sl, table = self.state, self.slots, self.table
+        other = 1 - side
+        arrow_state = sl['arrow_state'][side]
+        active = arrow_state != ARROW_STATE_FREE
+        if not active.any():
+            return
+        x = sl['arrow_x'][side]
+        y = sl['arrow_y'][side]
+        x += np.where(active, sl['arrow_vx'][side], 0.0)
+        y += np.where(active, sl['arrow_vy'][side], 0.0)
+
+        half = ARROW_SIZE // 2
+        target_char = self.char[other]
+        hits = active & ~sl['arrow_has_hit'][side] & _overlap(
+            np.trunc(x - half).astype(np.int64), np.trunc(y - half).astype(np.int64), ARROW_SIZE, ARROW_SIZE,
+            st['x'][other][:, None], st['y'][other][:, None],
+            table.width[target_char][:, None], table.height[target_char][:, None])
+        damage = table.damage[self.char[side], 3]
+        for slot in range(arrow_state.shape[1]):
+            if hits[:, slot].any():
+                self._hit_target(side, damage, hits[:, slot])
+        sl['arrow_has_hit'][side] |= hits
+        stop = hits.copy()
+
+        remaining = active & ~hits
+        out = remaining & ((x < -100) | (x > SCREEN_WIDTH + 100) | (y < -100) | (y > GROUND_LEVEL + 100))
+        remaining &= ~out
+        lands = remaining & (arrow_state == ARROW_STATE_FLYING) & (y >= GROUND_LEVEL - 10)
+        stop |= lands
+        arrow_state[hits | lands] = ARROW_STATE_LANDING
+        sl['arrow_anim'][side][hits | lands] = 0
+        sl['arrow_vx'][side][stop] = 0.0
+        sl['arrow_vy'][side][stop] = 0.0
+
+        animate = remaining & (arrow_state == ARROW_STATE_LANDING)
+        counter = sl['arrow_counter'][side]
+        anim = sl['arrow_anim'][side]
+        counter += animate
+        step = animate & (counter >= ARROW_ANIMATION_SPEED)
+        counter[step] = 0
+        anim += step
+        finished = animate & (anim >= table.arrow_land_frames[self.char[side]][:, None])
+        arrow_state[out | finished] = ARROW_STATE_FREE
+
+    # ------------------------------------------------------------------
+    # Slime Demon: lluvia de lava y explosión
+    # ------------------------------------------------------------------
+    def _slime_hook(self, side, mask):
+        st, table = self.state, self.table
+        char = self.char[side]
+        attacking = st['attacking'][side]
+        attack_type = st['attack_type'][side]
+        spawn = mask & attacking & (attack_type == 2) & (st['frame'][side] == 0) & ~st['rain_spawned'][side]
+        if spawn.any():
+            self._spawn_drops(side, spawn)
+            st['rain_spawned'][side] |= spawn
+
+        exploding = mask & attacking & (attack_type == 3)
+        trigger = exploding & ~st['explosion_triggered'][side] & \
+            (st['frame'][side] >= table.hit_frame[char, 3])
+        if trigger.any():
+            health = self._health(side)
+            sacrifice = (health * table.sacrifice_ratio[char]).astype(np.int64)
+            trigger &= (health > 0) & (sacrifice > 0)
+            self._apply_damage(side, sacrifice, trigger)
+            other = 1 - side
+            center_x = self._center_x(side)
+            bottom = st['y'][side] + table.height[char]
+            inside = trigger & st['alive'][other] & _overlap(
+                center_x - EXPLOSION_WIDTH // 2, bottom - EXPLOSION_HEIGHT, EXPLOSION_WIDTH, EXPLOSION_HEIGHT,
+                st['x'][other], st['y'][other], table.width[self.char[other]], table.height[self.char[other]])
+            self._hit_target(side, sacrifice, inside)
+            st['explosion_triggered'][side] |= trigger
+        reset = mask & ~exploding & ~attacking
+        st['explosion_triggered'][side] &= ~reset
+
+    def _spawn_drops(self, side, mask):
+        sl = self.slots
+        other = 1 - side
+        rows = np.nonzero(mask)[0]
+        counts = self.rng.integers(1, 4, size=rows.size)
+        target_cx = self._center_x(other)
+        for drop_number in range(3):
+            spawn_rows = rows[counts > drop_number]
+            if spawn_rows.size == 0:
+                break
+            free = ~sl['drop_active'][side][spawn_rows]
+            spawn_rows = spawn_rows[free.any(axis=1)]
+            slot = np.argmax(~sl['drop_active'][side][spawn_rows], axis=1)
+            offset = self.rng.integers(-100, 101, size=spawn_rows.size)
+            sl['drop_active'][side][spawn_rows, slot] = True
+            sl['drop_x'][side][spawn_rows, slot] = np.clip(target_cx[spawn_rows] + offset, 50, SCREEN_WIDTH - 50)
+            sl['drop_y'][side][spawn_rows, slot] = DROP_SPAWN_Y
+            sl['drop_speed'][side][spawn_rows, slot] = self.rng.uniform(7, 11, size=spawn_rows.size)
+
+    def _update_drops(self, side, mask):
+        st, sl, table = self.state, self.slots, self.table
+        active = sl['drop_active'][side] & mask[:, None]
+        if not active.any():
+            return
+        other = 1 - side
+        y = sl['drop_y'][side]
+        y += np.where(active, sl['drop_speed'][side], 0.0)
+        x = sl['drop_x'][side]
+        target_char = self.char[other]
+        target_x = st['x'][other][:, None]
+        target_y = st['y'][other][:, None]
+        target_w = table.width[target_char][:, None]
+        target_h = table.height[target_char][:, None]
+        drop_y = np.floor(y).astype(np.int64)
+        touches = _overlap(x, drop_y, DROP_SIZE, DROP_SIZE, target_x, target_y, target_w, target_h)
+        explodes = active & (touches | (y + DROP_SIZE >= GROUND_LEVEL))
+        half_offset = DROP_SIZE // 2 - DROP_EXPLOSION_SIZE // 2
+        inside = explodes & _overlap(x + half_offset, np.floor(y + half_offset).astype(np.int64),
+                                     DROP_EXPLOSION_SIZE, DROP_EXPLOSION_SIZE,
+                                     target_x, target_y, target_w, target_h)
+        damage = table.drop_damage[self.char[side]]
+        for slot in range(inside.shape[1]):
+            if inside[:, slot].any():
+                self._hit_target(side, damage, inside[:, slot])
+        sl['drop_active'][side] &= ~explodes
+
+    # ------------------------------------------------------------------
+    # Bucle principal
+    # ------------------------------------------------------------------
+    def step(self):
+        """Avanza un tick todos los combates activos."""
+        now_ms = ticks_to_ms(self.tick)
+        self._move(0, now_ms)
+        self._move(1, now_ms)
+        self._update(0, now_ms)
+        self._update(1, now_ms)
+        self._update_projectiles(now_ms)
+        self.tick += 1
+
+        st = self.state
+        p1_done = ~st['alive'][0] & st['death_done'][0]
+        p2_done = ~st['alive'][1] & st['death_done'][1]
+        done = (p1_done | p2_done) & ~self.finished[self.match_ids]
+        if done.any():
+            self._record(done)
+            self.winner[self.match_ids[done]] = np.where(p1_done, 2, 1)[done]
+            # Los combates terminados siguen en los arrays (congelados en la
+            # animación de muerte) hasta que compactar compense
+            finished = self.finished[self.match_ids]
+            if finished.sum() * 4 >= finished.size:
+                self._compact(~finished)
+
+    def _update_projectiles(self, now_ms):
+        """ProjectileManager.update: todos los proyectiles tras el update de ambos luchadores."""
+        everyone = np.ones(self.char[0].shape, bool)
+        for side in (0, 1):
+            if (self.table.max_traps[self.char[side]] > 0).any():
+                self._update_traps(side, now_ms)
+                self._update_arrows(side)
+            # Las gotas siguen cayendo aunque el Slime haya caído
+            self._update_drops(side, everyone)
+
+    def _record(self, mask):
+        """Guarda duración y salud final de los combates seleccionados."""
+        ids = self.match_ids[mask]
+        self.ticks[ids] = self.tick
+        self.final_health[ids, 0] = self._health(0)[mask]
+        self.final_health[ids, 1] = self._health(1)[mask]
+        self.finished[ids] = True
+
+    def run(self, max_ticks=DEFAULT_MAX_TICKS):
+        """
+        Ejecuta todos los combates hasta que terminen o se alcance max_ticks.
+
+        Returns:
+            dict: Arrays winner (0 = empate), ticks y health (K, 2)
+        """
+        while self.tick < max_ticks and not self.finished.all():
+            self.step()
+        pending = ~self.finished[self.match_ids]
+        if pending.any():
+            self._record(pending)
+        return {'winner': self.winner, 'ticks': self.ticks, 'health': self.final_health}
+
+
+def simulate(p1_name, p2_name, matches, seed=0, max_ticks=DEFAULT_MAX_TICKS, table=None):
+    """Simula `matches` combates del mismo enfrentamiento con el motor vectorizado."""
+    table = table if table is not None else build_character_table()
+    ids = np.empty((matches, 2), np.int64)
+    ids[:, 0] = table.names.index(p1_name)
+    ids[:, 1] = table.names.index(p2_name)
+    return VectorWorld(ids, seed, table).run(max_ticks)
+
+
+def validate(matches=20, seed=0, max_ticks=DEFAULT_MAX_TICKS, matchups=None):
+    """
+    Compara el motor vectorizado con el motor de objetos usando las mismas semillas.
+
+    Para enfrentamientos sin Slime Demon se exige coincidencia combate a
+    combate (ganador, duración y salud final). Con Slime Demon (lluvia
+    aleatoria) se comparan tasas de victoria y duración media.
+
+    Returns:
+        list[dict]: Un informe por enfrentamiento
+    """
+    table = build_character_table()
+    matchups = matchups or [(a, b) for a in CHARACTER_NAMES for b in CHARACTER_NAMES]
+    reports = []
+    for p1_name, p2_name in matchups:
+        vector = simulate(p1_name, p2_name, matches, seed, max_ticks, table)
+        objects = [run_match(p1_name, p2_name, seed, match_id, max_ticks) for match_id in range(matches)]
+        object_winners = np.array([result['winner'] for result in objects])
+        object_ticks = np.array([result['ticks'] for result in objects])
+        object_health = np.array([result['health'] for result in objects])
+        exact = (vector['winner'] == object_winners) & (vector['ticks'] == object_ticks) & \
+            (vector['health'] == object_health).all(axis=1)
+        stochastic = 'SlimeDemonFighter' in (p1_name, p2_name)
+        object_rate = float((object_winners == 1).mean())
+        vector_rate = float((vector['winner'] == 1).mean())
+        # Tolerancia de ~3 errores estándar de la diferencia de proporciones
+        spread = max(object_rate * (1 - object_rate), 0.05)
+        tolerance = 3 * (2 * spread / matches) ** 0.5
+        statistical_ok = abs(object_rate - vector_rate) <= tolerance and \
+            abs(object_ticks.mean() - vector['ticks'].mean()) <= 0.25 * object_ticks.mean()
+        reports.append({
+            'matchup': (p1_name, p2_name),
+            'exact_matches': int(exact.sum()),
+            'matches': matches,
+            'p1_win_rate': (object_rate, vector_rate),
+            'mean_ticks': (float(object_ticks.mean()), float(vector['ticks'].mean())),
+            'stochastic': stochastic,
+            'ok': statistical_ok if stochastic else bool(exact.all()),
+        })
+    return reports
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Motor vectorizado de combates (NumPy)")
+    parser.add_argument('--matches', type=int, default=10000, help="Combates por enfrentamiento")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--max-ticks', type=int, default=DEFAULT_MAX_TICKS)
+    parser.add_argument('--p1', default=None, help="Clase del jugador 1 (por defecto todas)")
+    parser.add_argument('--p2', default=None, help="Clase del jugador 2 (por defecto todas)")
+    parser.add_argument('--validate', action='store_true', help="Comparar con el motor de objetos")
+    args = parser.parse_args()
+
+    p1_names = [args.p1] if args.p1 else CHARACTER_NAMES
+    p2_names = [args.p2] if args.p2 else CHARACTER_NAMES
+    matchups = [(a, b) for a in p1_names for b in p2_names]
+
+    if args.validate:
+        all_ok = True
+        for report in validate(args.matches, args.seed, args.max_ticks, matchups):
+            all_ok &= report['ok']
+            print(f"{report['matchup'][0]:>18} vs {report['matchup'][1]:<18} "
+                  f"exactos {report['exact_matches']}/{report['matches']} | "
+                  f"P1 gana obj {report['p1_win_rate'][0]:.2f} vec {report['p1_win_rate'][1]:.2f} | "
+                  f"ticks obj {report['mean_ticks'][0]:.0f} vec {report['mean_ticks'][1]:.0f}"
+                  f"{' (estocástico)' if report['stochastic'] else ''}")
+        print("Validación OK" if all_ok else "Validación FALLIDA")
+        raise SystemExit(0 if all_ok else 1)
+
+    table = build_character_table()
+    total_matches = 0
+    start = time.perf_counter()
+    for p1_name, p2_name in matchups:
+        result = simulate(p1_name, p2_name, args.matches, args.seed, args.max_ticks, table)
+        total_matches += args.matches
+        print(f"{p1_name:>18} vs {p2_name:<18} P1 {np.mean(result['winner'] == 1):.3f} "
+              f"P2 {np.mean(result['winner'] == 2):.3f} empate {np.mean(result['winner'] == 0):.3f} "
+              f"ticks medios {result['ticks'].mean():.0f}")
+    elapsed = time.perf_counter() - start
+    print(f"{total_matches} combates en {elapsed:.1f}s ({total_matches / elapsed:.0f} combates/s)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,147 @@
+"""
+Perfil del arranque del juego (python main.py --profile-startup).
+
+StartupProfile mide el arranque por etapas: cada checkpoint() apunta el
+tiempo transcurrido desde el anterior (importaciones, ventana, sonidos,
+pantallas...), y first_frame() / ready() el tiempo desde el inicio hasta el
+primer frame dibujado y hasta el primer frame de la escena inicial, que es
+cuando el juego ya responde a las teclas. Las cargas diferidas (las que se
+hacen en el hilo de precarga, envueltas con timed()) se imprimen al
+terminar si el informe ya se mostró.
+
+ImportTimer mide las importaciones con el formato de python -X importtime
+(microsegundos propios y acumulados, con sangría por nivel), pero solo las
+que pasan por la sentencia import mientras está instalado: los módulos que
+ya estaban cargados no aparecen.
+"""
+
+import builtins
+import importlib.util
+import sys
+import threading
+import time
+
+
+class ImportTimer:
+    """Tiempos de las importaciones nuevas, en el orden en que terminan (como -X importtime)."""
+    def __init__(self):
+        self.records = []    # (nivel, propio µs, acumulado µs, módulo)
+        self.local = threading.local()
+        self.original_import = None
+
+    def install(self):
+        self.original_import = builtins.__import__
+        builtins.__import__ = self.timed_import
+
+    def uninstall(self):
+        if self.original_import is not None:
+            builtins.__import__ = self.original_import
+            self.original_import = None
+
+    def timed_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        original_import = self.original_import or builtins.__import__
+        if level:
+            package = globals.get('__package__') if globals else None
+            try:
+                name_to_check = importlib.util.resolve_name('.' * level + name, package)
+            except (ImportError, ValueError):
+                name_to_check = name
+        else:
+            name_to_check = name
+        if name_to_check in sys.modules:
+            if not fromlist:
+                return original_import(name, globals, locals, fromlist, level)
+            # from paquete import submódulo: se mide como la importación del submódulo
+            submodules = [f"{name_to_check}.{item}" for item in fromlist
+                          if item != '*' and f"{name_to_check}.{item}" not in sys.modules]
+        else:
+            submodules = ()
+        module_count = len(sys.modules)
+
+        # Pila de tiempos de los hijos por hilo (el hilo de precarga también importa)
+        children = getattr(self.local, 'children', None)
+        if children is None:
+            children = self.local.children = []
+        children.append(0)
+        start = time.perf_counter_ns()
+        try:
+            return original_import(name, globals, locals, fromlist, level)
+        finally:
+            cumulative = (time.perf_counter_ns() - start) // 1000
+            child_time = children.pop()
+            if children:
+                children[-1] += cumulative
+            if len(sys.modules) > module_count:
+                loaded = [submodule for submodule in submodules if submodule in sys.modules]
+                label = ', '.join(loaded) if loaded else name_to_check
+                self.records.append((len(children), cumulative - child_time, cumulative, label))
+
+    def format(self):
+        lines = ["import time: self [us] | cumulative | imported package"]
+        lines.extend(f"import time: {own:>9} | {cumulative:>10} | {'  ' * depth}{label}"
+                     for depth, own, cumulative, label in self.records)
+        return '\n'.join(lines)
+
+
+class StartupProfile:
+    """
+    Etapas del arranque y tiempo hasta el primer frame.
+
+    Args:
+        enabled (bool): Si se miden las importaciones y se imprime el informe
+    """
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.start = time.perf_counter()
+        self.last_checkpoint = self.start
+        self.stages = []           # (etapa, ms)
+        self.deferred = []         # (carga diferida, ms)
+        self.first_frame_ms = None
+        self.ready_ms = None
+        self.import_timer = ImportTimer() if enabled else None
+        if self.import_timer:
+            self.import_timer.install()
+
+    def elapsed_ms(self):
+        return (time.perf_counter() - self.start) * 1000
+
+    def checkpoint(self, name):
+        """Cierra una etapa del arranque: lo transcurrido desde el checkpoint anterior."""
+        now = time.perf_counter()
+        self.stages.append((name, (now - self.last_checkpoint) * 1000))
+        self.last_checkpoint = now
+
+    def timed(self, name, loader):
+        """Envuelve una carga diferida para medirla (en el hilo en que se ejecute)."""
+        def timed_loader():
+            start = time.perf_counter()
+            try:
+                return loader()
+            finally:
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                self.deferred.append((name, elapsed_ms))
+                if self.enabled and self.ready_ms is not None:
+                    print(f"[arranque] diferido: {name} {elapsed_ms:.1f} ms")
+        return timed_loader
+
+    def first_frame(self):
+        """Llamar justo después del primer display.update()."""
+        if self.first_frame_ms is None:
+            self.first_frame_ms = self.elapsed_ms()
+
+    def ready(self):
+        """Llamar tras el primer frame de la escena inicial; imprime el informe con --profile-startup."""
+        if self.ready_ms is not None:
+            return
+        self.ready_ms = self.elapsed_ms()
+        if self.enabled:
+            self.import_timer.uninstall()
+            print(self.format())
+
+    def format(self):
+        lines = [self.import_timer.format(), "", "Arranque (ms por etapa; los dos últimos, desde el inicio de main.py):"]
+        lines.extend(f"  {name:<34} {elapsed_ms:8.1f}" for name, elapsed_ms in self.stages)
+        lines.extend(f"  diferido: {name:<24} {elapsed_ms:8.1f}" for name, elapsed_ms in self.deferred)
+        lines.append(f"  {'primer frame':<34} {self.first_frame_ms or 0:8.1f}")
+        lines.append(f"  {'escena inicial interactiva':<34} {self.ready_ms:8.1f}")
+        return '\n'.join(lines)